@@ -0,0 +1,6 @@
+"""
+Support code for test_waste_management_api.py.
+
+The test script stays the entry point; modules in this package hold the
+reusable pieces (HTTP transport, metrics, load modes) that it wires up.
+"""
@@ -0,0 +1,61 @@
+"""
+Small helpers for talking to the API, shared by the test script and the
+harness modules: test data, status assertions and token extraction.
+
+Anything taking `r` only needs an object with an `http` attribute
+(TestRunner, VirtualUser, a seeder worker).
+"""
+
+import random
+import string
+
+
+def random_phone():
+    # Cameroon-style +2376XXXXXXXX
+    return "+2376" + "".join(random.choice(string.digits) for _ in range(7))
+
+def random_email():
+    return "test_" + "".join(random.choice(string.ascii_lowercase) for _ in range(8)) + "@example.com"
+
+def assert_status(resp, expected, name=""):
+    if resp.status_code != expected:
+        try:
+            body = resp.json()
+        except Exception:
+            body = resp.text
+        raise AssertionError(f"{name} expected {expected}, got {resp.status_code}, body={body}")
+
+def extract_tokens_and_user(data):
+    """
+    Tries to be flexible with token/user field names.
+    """
+    if not isinstance(data, dict):
+        raise AssertionError("Login response is not a JSON object")
+
+    access = data.get("accessToken") or data.get("access_token") or data.get("token")
+    refresh = data.get("refreshToken") or data.get("refresh_token")
+    user = data.get("user") or data.get("profile") or {}
+
+    if not access:
+        raise AssertionError(f"Could not find access token in response: {data}")
+    if not refresh:
+        # Some implementations may not send refresh token on login; we allow None
+        refresh = None
+
+    user_id = user.get("id") or user.get("userId") or user.get("user_id")
+    return access, refresh, user_id, user
+
+def auth_headers(token):
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def login(r, phone, password, name="login"):
+    """
+    (access, refresh, user_id, user). Goes through the transport's token
+    cache when it has one, so a still-valid token is reused.
+    """
+    cache = getattr(r.http, "token_cache", None)
+    if cache is not None:
+        return cache.get(r.http, phone, password, name)
+    resp = r.http.post("/auth/login", json={"phone": phone, "password": password})
+    assert_status(resp, 200, name)
+    return extract_tokens_and_user(resp.json())
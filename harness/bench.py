@@ -0,0 +1,210 @@
+"""
+Named benchmark scenarios with a stored baseline and a statistical gate.
+
+Each scenario is a zero-argument callable returning an HTTP status, timed
+sequentially for a fixed number of iterations after a warm-up. Raw samples
+are kept (not just summaries) so a later run can be compared properly:
+
+  - a bootstrap confidence interval for the change in p99, resampling both
+    runs, is what the gate uses: a scenario regresses when the whole
+    interval is above zero *and* the point estimate is more than
+    `threshold` slower than the baseline;
+  - a one-sided Mann-Whitney U test reports whether the distribution as a
+    whole shifted slower, which catches broad slowdowns that p99 alone,
+    being noisy, may not.
+
+The baseline is a versioned JSON file; a file written by an incompatible
+format version is refused rather than misread.
+"""
+
+import json
+import math
+import random
+import subprocess
+import time
+from datetime import datetime
+
+BASELINE_FORMAT = 1
+
+
+def run_scenarios(calls, iterations, warmup):
+    """
+    Time every scenario in `calls` ({name: callable}). Returns
+    {name: {"samples": [seconds, ...], "errors": int}}; failed calls, in
+    the warm-up too, count as errors and are left out of the samples.
+    """
+    results = {}
+    for name, call in calls.items():
+        samples, errors = [], 0
+        for _ in range(warmup):
+            ok, _ = _timed(call)
+            errors += not ok
+        for _ in range(iterations):
+            ok, elapsed = _timed(call)
+            if ok:
+                samples.append(elapsed)
+            else:
+                errors += 1
+        results[name] = {"samples": samples, "errors": errors}
+        print(f"  {name:25} {len(samples)} samples, p50 {quantile(samples, 0.5) * 1000:.1f} ms,"
+              f" p99 {quantile(samples, 0.99) * 1000:.1f} ms, {errors} errors")
+    return results
+
+
+def _timed(call):
+    """
+    (succeeded, seconds) for one call; a raised exception, such as a
+    dropped connection, is a failure like an error status.
+    """
+    start = time.perf_counter()
+    try:
+        status = call()
+    except Exception:
+        status = 0
+    return 200 <= status < 400, time.perf_counter() - start
+
+
+# ========================
+# STATISTICS
+# ========================
+
+def quantile(samples, q):
+    """
+    Nearest-rank quantile (the same definition LatencyHistogram uses).
+    """
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(1, math.ceil(len(ordered) * q)) - 1]
+
+
+def bootstrap_diff_ci(base, new, q, confidence, resamples, rng):
+    """
+    Confidence interval for quantile_q(new) - quantile_q(base).
+    """
+    diffs = sorted(
+        quantile(rng.choices(new, k=len(new)), q) - quantile(rng.choices(base, k=len(base)), q)
+        for _ in range(resamples)
+    )
+    tail = (1 - confidence) / 2
+    return diffs[int(tail * (resamples - 1))], diffs[int((1 - tail) * (resamples - 1))]
+
+
+def mann_whitney_slower(base, new):
+    """
+    One-sided Mann-Whitney U test that `new` tends to be slower than
+    `base`: (U for new, p-value), normal approximation with tie correction.
+    """
+    n1, n2 = len(new), len(base)
+    if not n1 or not n2:
+        return 0.0, 1.0
+    combined = sorted([(x, 0) for x in new] + [(x, 1) for x in base])
+    ranks_new = 0.0
+    tie_term = 0
+    i = 0
+    while i < len(combined):
+        j = i
+        while j < len(combined) and combined[j][0] == combined[i][0]:
+            j += 1
+        rank = (i + j + 1) / 2  # average of 1-based ranks i+1 .. j
+        ranks_new += rank * sum(1 for k in range(i, j) if combined[k][1] == 0)
+        tie_term += (j - i) ** 3 - (j - i)
+        i = j
+    u = ranks_new - n1 * (n1 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return u, 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / math.sqrt(variance)
+    return u, 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def compare(baseline, results, confidence=0.95, threshold=0.10, resamples=2000, seed=1):
+    """
+    One row per scenario present in both runs.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for name, current in results.items():
+        base = baseline["scenarios"].get(name)
+        if base is None or not base["samples"] or not current["samples"]:
+            rows.append({"scenario": name, "verdict": "no baseline"})
+            continue
+        b, c = base["samples"], current["samples"]
+        base_p99, new_p99 = quantile(b, 0.99), quantile(c, 0.99)
+        low, high = bootstrap_diff_ci(b, c, 0.99, confidence, resamples, rng)
+        _, p_value = mann_whitney_slower(b, c)
+        relative = (new_p99 - base_p99) / base_p99 if base_p99 else 0.0
+        if low > 0 and relative > threshold:
+            verdict = "REGRESSION"
+        elif high < 0:
+            verdict = "faster"
+        else:
+            verdict = "ok"
+        rows.append({
+            "scenario": name,
+            "base_p50": quantile(b, 0.5),
+            "new_p50": quantile(c, 0.5),
+            "base_p99": base_p99,
+            "new_p99": new_p99,
+            "p99_change": relative,
+            "p99_ci": (low, high),
+            "shift_p_value": p_value,
+            "errors": current["errors"],
+            "verdict": verdict,
+        })
+    return rows
+
+
+# ========================
+# BASELINE FILE
+# ========================
+
+def _git_revision():
+    try:
+        out = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5)
+        return out.stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def save_baseline(path, results, **meta):
+    with open(path, "w") as f:
+        json.dump({
+            "format": BASELINE_FORMAT,
+            "created": datetime.utcnow().isoformat(),
+            "revision": _git_revision(),
+            **meta,
+            "scenarios": results,
+        }, f)
+
+
+def load_baseline(path):
+    with open(path) as f:
+        data = json.load(f)
+    if data.get("format") != BASELINE_FORMAT:
+        raise ValueError(
+            f"{path} has baseline format {data.get('format')}, this harness writes {BASELINE_FORMAT}; "
+            "record a new baseline with --save-baseline"
+        )
+    return data
+
+
+def print_comparison(rows, baseline, confidence):
+    print(f"\n========== BENCH vs baseline {baseline.get('revision') or '?'} ({baseline['created'][:19]}) ==========")
+    print(
+        f"{'scenario':22} {'p50 ms':>15} {'p99 ms':>17} {'Δp99':>7}"
+        f" {f'{confidence:.0%} CI Δp99 ms':>20} {'shift p':>8}  verdict"
+    )
+    for r in rows:
+        if "base_p99" not in r:
+            print(f"{r['scenario']:22} {'':>15} {'':>17} {'':>7} {'':>20} {'':>8}  {r['verdict']}")
+            continue
+        low, high = r["p99_ci"]
+        print(
+            f"{r['scenario']:22} {r['base_p50'] * 1000:>7.1f}→{r['new_p50'] * 1000:<7.1f}"
+            f" {r['base_p99'] * 1000:>8.1f}→{r['new_p99'] * 1000:<8.1f} {r['p99_change']:>+7.0%}"
+            f" {f'[{low * 1000:+.1f}, {high * 1000:+.1f}]':>20} {r['shift_p_value']:>8.3f}  {r['verdict']}"
+            + (f" ({r['errors']} errors)" if r["errors"] else "")
+        )
+    print("=" * 60)
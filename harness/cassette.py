@@ -0,0 +1,189 @@
+"""
+Record/replay cassettes: run the harness with no server at all.
+
+Recording hooks HttpClient after each response body has been read, so
+nothing about a live run changes. Replay mounts ReplayAdapter on the
+session, so timings, metrics and reports flow through exactly the same
+code as against a real server; only the bytes come from the cassette.
+
+File layout (compact, and indexed so replay reads bodies lazily):
+
+    MAGIC
+    zlib(body) zlib(body) ...                  one blob per exchange
+    zlib(JSON index)                           [[method, target, status, ttfb_us,
+                                                 total_us, offset, length, headers], ...]
+    <u64 index offset> MAGIC
+
+Requests are matched by method and path plus query string, in recorded
+order; when that misses (ids or dates in the URL changed) the endpoint
+template is used instead. A request made more often than it was recorded
+wraps around to the first recording, so a short recording can drive a
+long load run.
+"""
+
+import json
+import struct
+import threading
+import time
+import zlib
+from io import BytesIO
+from urllib.parse import urlsplit
+
+from requests import Response
+from requests.adapters import BaseAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from harness.transport import endpoint_template
+
+MAGIC = b"WMCASS1\n"
+_TRAILER = struct.Struct("<Q")
+
+# Hop-by-hop or per-response headers that make no sense to replay
+_SKIP_HEADERS = {"connection", "keep-alive", "date", "transfer-encoding", "content-length", "content-encoding"}
+
+
+def _target(url):
+    parts = urlsplit(url)
+    return parts.path + (f"?{parts.query}" if parts.query else "")
+
+
+class CassetteWriter:
+    """
+    HttpClient recorder: set `http.recorder = writer`; close() writes the index.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.index = []
+        self._lock = threading.Lock()
+        self._f = open(path, "wb")
+        self._f.write(MAGIC)
+
+    def record(self, resp, ttfb_s, total_s):
+        body = zlib.compress(resp.content)
+        headers = {k: v for k, v in resp.headers.items() if k.lower() not in _SKIP_HEADERS}
+        with self._lock:
+            offset = self._f.tell()
+            self._f.write(body)
+            self.index.append([
+                resp.request.method, _target(resp.request.url), resp.status_code,
+                int((ttfb_s or 0) * 1_000_000), int(total_s * 1_000_000),
+                offset, len(body), headers,
+            ])
+
+    def close(self):
+        with self._lock:
+            if self._f.closed:
+                return
+            index_offset = self._f.tell()
+            self._f.write(zlib.compress(json.dumps(self.index, separators=(",", ":")).encode()))
+            self._f.write(_TRAILER.pack(index_offset) + MAGIC)
+            self._f.close()
+
+
+class Cassette:
+    def __init__(self, path):
+        self.path = path
+        with open(path, "rb") as f:
+            if f.read(len(MAGIC)) != MAGIC:
+                raise ValueError(f"{path} is not a cassette")
+            f.seek(-(_TRAILER.size + len(MAGIC)), 2)
+            tail = f.read()
+            if tail[_TRAILER.size:] != MAGIC:
+                raise ValueError(f"{path} is incomplete (the recording run did not finish)")
+            (index_offset,) = _TRAILER.unpack(tail[:_TRAILER.size])
+            f.seek(index_offset)
+            self.index = json.loads(zlib.decompress(f.read()[:-len(tail)]))
+        self._f = open(path, "rb")
+        self._lock = threading.Lock()
+
+        self._exact, self._templated = {}, {}
+        for i, (method, target, *_rest) in enumerate(self.index):
+            self._exact.setdefault((method, target), []).append(i)
+            self._templated.setdefault((method, endpoint_template(urlsplit(target).path)), []).append(i)
+        self._served = {}
+
+    def __len__(self):
+        return len(self.index)
+
+    def _next(self, table, key):
+        entries = table.get(key)
+        if not entries:
+            return None
+        n = self._served.get((id(table), key), 0)
+        self._served[(id(table), key)] = n + 1
+        return self.index[entries[n % len(entries)]]
+
+    def lookup(self, method, url):
+        """
+        (status, headers, body, ttfb_s, total_s), or None if nothing matches.
+        """
+        target = _target(url)
+        with self._lock:
+            entry = (
+                self._next(self._exact, (method, target))
+                or self._next(self._templated, (method, endpoint_template(urlsplit(target).path)))
+            )
+            if entry is None:
+                return None
+            _, _, status, ttfb_us, total_us, offset, length, headers = entry
+            self._f.seek(offset)
+            body = zlib.decompress(self._f.read(length))
+        return status, headers, body, ttfb_us / 1_000_000, total_us / 1_000_000
+
+    def close(self):
+        self._f.close()
+
+
+class _DelayedBody(BytesIO):
+    """
+    Response body that takes `delay` seconds to start arriving, so replayed
+    TTFB and total time split the way they did when recorded.
+    """
+
+    def __init__(self, body, delay):
+        super().__init__(body)
+        self.delay = delay
+
+    def read(self, *args):
+        if self.delay:
+            time.sleep(self.delay)
+            self.delay = 0
+        return super().read(*args)
+
+
+class ReplayAdapter(BaseAdapter):
+    """
+    Serves every request from a Cassette. With latency_scale > 0 each reply
+    reproduces its recorded time to first byte and total time (scaled).
+    Unmatched requests get a 501 explaining what was missing.
+    """
+
+    def __init__(self, cassette, latency_scale=0.0):
+        super().__init__()
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+
+    def send(self, request, stream=False, timeout=None, verify=True, cert=None, proxies=None):
+        found = self.cassette.lookup(request.method, request.url)
+        if found is None:
+            status, headers, ttfb_s, total_s = 501, {"Content-Type": "application/json"}, 0.0, 0.0
+            body = json.dumps({"message": f"No recorded response for {request.method} {_target(request.url)}"}).encode()
+        else:
+            status, headers, body, ttfb_s, total_s = found
+        if self.latency_scale:
+            time.sleep(ttfb_s * self.latency_scale)
+
+        resp = Response()
+        resp.status_code = status
+        resp.headers = CaseInsensitiveDict(headers)
+        resp.encoding = get_encoding_from_headers(resp.headers)
+        resp.raw = _DelayedBody(body, max(total_s - ttfb_s, 0.0) * self.latency_scale)
+        resp.url = request.url
+        resp.request = request
+        resp.connection = self
+        return resp
+
+    def close(self):
+        pass
@@ -0,0 +1,57 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+Client for the Waste Management API (1.0), generated from its OpenAPI spec.
+
+    http = HttpClient(base_url, pool_size=50)       # harness.transport
+    client = Client(http)
+    auth = client.auth.login(LoginDto(phone=phone, password=password))
+    me = client.with_token(auth.access_token)      # same pooled transport
+    page = me.pickups.find_all(limit=50)           # Record: page.data, page.meta.next_cursor
+    bins = await AsyncClient(client.transport).bins.find_nearby(lat=4.05, lng=9.77)
+
+Resource groups (auth, users, households, agents, pickups, alerts, bins,
+subscriptions, education, surveys, stats, files, health) are imported on
+first attribute access. Responses with a schema decode into the __slots__
+models in harness.client.models, the rest into Records; 4xx/5xx raise
+ApiError.
+"""
+
+from harness.client._runtime import ApiError, BaseClient, Record, Transport
+from harness.client.models import (
+    RegisterHouseholdDto,
+    LoginDto,
+    RefreshTokenDto,
+    ChangePasswordDto,
+    TokenPairDto,
+    AuthUserDto,
+    AuthResponseDto,
+    BinCapacityReadingDto,
+    UpdateBinCapacitiesDto,
+    HealthCheckResponse,
+)
+
+RESOURCES = {
+    "auth": ("harness.client.auth", "Auth", "AsyncAuth"),
+    "users": ("harness.client.users", "Users", "AsyncUsers"),
+    "households": ("harness.client.households", "Households", "AsyncHouseholds"),
+    "agents": ("harness.client.agents", "Agents", "AsyncAgents"),
+    "pickups": ("harness.client.pickups", "Pickups", "AsyncPickups"),
+    "alerts": ("harness.client.alerts", "Alerts", "AsyncAlerts"),
+    "bins": ("harness.client.bins", "Bins", "AsyncBins"),
+    "subscriptions": ("harness.client.subscriptions", "Subscriptions", "AsyncSubscriptions"),
+    "education": ("harness.client.education", "Education", "AsyncEducation"),
+    "surveys": ("harness.client.surveys", "Surveys", "AsyncSurveys"),
+    "stats": ("harness.client.stats", "Stats", "AsyncStats"),
+    "files": ("harness.client.files", "Files", "AsyncFiles"),
+    "health": ("harness.client.health", "Health", "AsyncHealth"),
+}
+
+
+class Client(BaseClient):
+    _resources = RESOURCES
+
+
+class AsyncClient(BaseClient):
+    _resources = RESOURCES
+    _is_async = True
@@ -0,0 +1,264 @@
+"""
+Runtime for the generated client in this package (not generated itself):
+the pooled transport, JSON encoding and decoding, the Model base class of
+the generated models, Record for responses the spec has no schema for, and
+the lazily populated client classes.
+
+JSON goes through orjson when it is installed (bytes in, bytes out, no
+charset sniffing) and falls back to the standard library otherwise. Each
+response body is decoded exactly once, straight from resp.content.
+"""
+
+import functools
+import importlib
+import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+if orjson is not None:
+    loads = orjson.loads
+    dumps = orjson.dumps
+else:
+    loads = json.loads
+
+    def dumps(obj):
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+_JSON = "application/json"
+
+
+class ApiError(Exception):
+    """
+    A 4xx/5xx answer; `body` is the decoded error body (Nest's
+    {"statusCode", "message", "error"}) or the raw text.
+    """
+
+    def __init__(self, method, endpoint, status, body):
+        super().__init__(f"{method} {endpoint} -> {status}: {body}")
+        self.method = method
+        self.endpoint = endpoint
+        self.status = status
+        self.body = body
+
+
+# ========================
+# MODELS
+# ========================
+
+class Model:
+    """
+    Base of the generated models. Subclasses declare __slots__ (snake_case
+    attributes) and generate from_dict/to_dict mapping them to the
+    camelCase JSON keys.
+    """
+
+    __slots__ = ()
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return all(getattr(self, name) == getattr(other, name) for name in self.__slots__)
+
+
+def model_or_none(cls, value):
+    return None if value is None else cls.from_dict(value)
+
+
+def models_or_none(cls, value):
+    return None if value is None else [cls.from_dict(item) for item in value]
+
+
+def dump(value):
+    if isinstance(value, Model):
+        return value.to_dict()
+    if isinstance(value, list):
+        return [dump(item) for item in value]
+    return value
+
+
+@functools.lru_cache(maxsize=1024)
+def _json_key(name):
+    head, *rest = name.split("_")
+    return head + "".join(part[:1].upper() + part[1:] for part in rest)
+
+
+def _wrap(value):
+    if isinstance(value, dict):
+        return Record(value)
+    if isinstance(value, list):
+        return [_wrap(item) for item in value]
+    return value
+
+
+class Record:
+    """
+    Read-only view of a JSON object the spec declares no schema for.
+    `rec.scheduled_date` reads the "scheduledDate" key, `rec["scheduledDate"]`
+    works too, and nested objects come back as Records when read; nothing is
+    converted up front. to_dict() returns the decoded object itself.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data):
+        self._data = data
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        data = self._data
+        key = _json_key(name)
+        if key in data:
+            return _wrap(data[key])
+        if name in data:
+            return _wrap(data[name])
+        raise AttributeError(f"{name!r} not in response (keys: {', '.join(data)})")
+
+    def __getitem__(self, key):
+        return _wrap(self._data[key])
+
+    def get(self, key, default=None):
+        return _wrap(self._data[key]) if key in self._data else default
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __eq__(self, other):
+        return isinstance(other, Record) and other._data == self._data
+
+    def __repr__(self):
+        return f"Record({self._data!r})"
+
+    def to_dict(self):
+        return self._data
+
+
+def decode(data, model=None):
+    if model is None:
+        return _wrap(data)
+    if isinstance(data, list):
+        return [model.from_dict(item) for item in data]
+    if isinstance(data, dict):
+        return model.from_dict(data)
+    return data
+
+
+# ========================
+# TRANSPORT
+# ========================
+
+class Transport:
+    """
+    The one pooled harness.transport.HttpClient behind any number of Client
+    and AsyncClient instances, whatever token each carries. Async calls run
+    the same blocking request on a thread pool of `workers` (match it to the
+    HttpClient's pool_size), so both variants share the pool's connections,
+    timings, token cache and cassette.
+    """
+
+    def __init__(self, http, workers=10):
+        self.http = http
+        self.workers = workers
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def call(self, method, path, endpoint, token=None, params=None, body=None, files=None, model=None):
+        kwargs = {}
+        headers = {"Authorization": f"Bearer {token}"} if token else {}
+        if params:
+            kwargs["params"] = {key: value for key, value in params.items() if value is not None}
+        if body is not None:
+            headers["Content-Type"] = _JSON
+            kwargs["data"] = dumps(dump(body))
+        if files is not None:
+            kwargs["files"] = files
+        resp = self.http.request(method, path, endpoint=endpoint, headers=headers, **kwargs)
+
+        content = resp.content
+        try:
+            data = loads(content) if content else None
+        except ValueError:
+            data = resp.text
+        if resp.status_code >= 400:
+            raise ApiError(method, endpoint, resp.status_code, data)
+        return decode(data, model)
+
+    async def acall(self, *args, **kwargs):
+        import asyncio  # only async callers pay for it
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._pool(), functools.partial(self.call, *args, **kwargs))
+
+    def _pool(self):
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="api-client")
+            return self._executor
+
+    def close(self):
+        if self._executor is not None:
+            self._executor.shutdown()
+        self.http.close()
+
+
+# ========================
+# CLIENTS
+# ========================
+
+class BaseClient:
+    """
+    Resource groups (client.pickups, client.auth, ...) are looked up in
+    `_resources` ({name: (module, sync class, async class)}) and imported
+    on first access, then kept on the instance.
+    """
+
+    _resources = {}
+    _is_async = False
+
+    def __init__(self, transport, token=None):
+        if not isinstance(transport, Transport):
+            transport = Transport(transport)
+        self.transport = transport
+        self.token = token
+
+    def with_token(self, token):
+        """
+        A client for another user over the same transport.
+        """
+        return type(self)(self.transport, token)
+
+    def __getattr__(self, name):
+        try:
+            module, sync_name, async_name = self._resources[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        cls = getattr(importlib.import_module(module), async_name if self._is_async else sync_name)
+        resource = cls(self.transport, self.token)
+        self.__dict__[name] = resource
+        return resource
+
+    def __dir__(self):
+        return [*super().__dir__(), *self._resources]
+
+
+class Resource:
+    __slots__ = ("_transport", "_token")
+
+    def __init__(self, transport, token=None):
+        self._transport = transport
+        self._token = token
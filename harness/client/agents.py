@@ -0,0 +1,55 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/agents operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Agents(Resource):
+    __slots__ = ()
+
+    def get_my_profile(self) -> Record | list[Record]:
+        """GET /agents/me: Get my agent profile"""
+        return self._transport.call("GET", "/agents/me", "/agents/me", self._token)
+
+    def update_my_profile(self, body: dict | None = None) -> Record | list[Record]:
+        """PUT /agents/me: Update my agent profile"""
+        return self._transport.call("PUT", "/agents/me", "/agents/me", self._token, body=body)
+
+    def get_my_stats(self) -> Record | list[Record]:
+        """GET /agents/me/stats: Get my agent statistics"""
+        return self._transport.call("GET", "/agents/me/stats", "/agents/me/stats", self._token)
+
+    def update_kyc_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /agents/{id}/kyc: Update agent KYC status (Admin only)"""
+        return self._transport.call("PATCH", f"/agents/{id}/kyc", "/agents/{id}/kyc", self._token, body=body)
+
+
+class AsyncAgents(Resource):
+    __slots__ = ()
+
+    async def get_my_profile(self) -> Record | list[Record]:
+        """GET /agents/me: Get my agent profile"""
+        return await self._transport.acall("GET", "/agents/me", "/agents/me", self._token)
+
+    async def update_my_profile(self, body: dict | None = None) -> Record | list[Record]:
+        """PUT /agents/me: Update my agent profile"""
+        return await self._transport.acall("PUT", "/agents/me", "/agents/me", self._token, body=body)
+
+    async def get_my_stats(self) -> Record | list[Record]:
+        """GET /agents/me/stats: Get my agent statistics"""
+        return await self._transport.acall("GET", "/agents/me/stats", "/agents/me/stats", self._token)
+
+    async def update_kyc_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /agents/{id}/kyc: Update agent KYC status (Admin only)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/agents/{id}/kyc",
+            "/agents/{id}/kyc",
+            self._token,
+            body=body,
+        )
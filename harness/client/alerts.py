@@ -0,0 +1,145 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/alerts operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Alerts(Resource):
+    __slots__ = ()
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /alerts: Create alert"""
+        return self._transport.call("POST", "/alerts", "/alerts", self._token, body=body)
+
+    def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        status: str | None = None,
+        type: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts: Get all alerts"""
+        return self._transport.call(
+            "GET",
+            "/alerts",
+            "/alerts",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "status": status, "type": type},
+        )
+
+    def find_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius: float | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts/nearby: Nearest alerts to a point, optionally within a radius (meters)"""
+        return self._transport.call(
+            "GET",
+            "/alerts/nearby",
+            "/alerts/nearby",
+            self._token,
+            params={"lat": lat, "lng": lng, "radius": radius, "limit": limit},
+        )
+
+    def find_within(
+        self,
+        *,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts/within: Alerts inside a bounding box (map viewport)"""
+        return self._transport.call(
+            "GET",
+            "/alerts/within",
+            "/alerts/within",
+            self._token,
+            params={"minLat": min_lat, "minLng": min_lng, "maxLat": max_lat, "maxLng": max_lng, "limit": limit},
+        )
+
+    def find_one(self, id: str) -> Record | list[Record]:
+        """GET /alerts/{id}: Get alert by ID"""
+        return self._transport.call("GET", f"/alerts/{id}", "/alerts/{id}", self._token)
+
+    def update_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /alerts/{id}: Update alert status (Admin/HYSACAM/Council)"""
+        return self._transport.call("PATCH", f"/alerts/{id}", "/alerts/{id}", self._token, body=body)
+
+
+class AsyncAlerts(Resource):
+    __slots__ = ()
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /alerts: Create alert"""
+        return await self._transport.acall("POST", "/alerts", "/alerts", self._token, body=body)
+
+    async def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        status: str | None = None,
+        type: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts: Get all alerts"""
+        return await self._transport.acall(
+            "GET",
+            "/alerts",
+            "/alerts",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "status": status, "type": type},
+        )
+
+    async def find_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius: float | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts/nearby: Nearest alerts to a point, optionally within a radius (meters)"""
+        return await self._transport.acall(
+            "GET",
+            "/alerts/nearby",
+            "/alerts/nearby",
+            self._token,
+            params={"lat": lat, "lng": lng, "radius": radius, "limit": limit},
+        )
+
+    async def find_within(
+        self,
+        *,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /alerts/within: Alerts inside a bounding box (map viewport)"""
+        return await self._transport.acall(
+            "GET",
+            "/alerts/within",
+            "/alerts/within",
+            self._token,
+            params={"minLat": min_lat, "minLng": min_lng, "maxLat": max_lat, "maxLng": max_lng, "limit": limit},
+        )
+
+    async def find_one(self, id: str) -> Record | list[Record]:
+        """GET /alerts/{id}: Get alert by ID"""
+        return await self._transport.acall("GET", f"/alerts/{id}", "/alerts/{id}", self._token)
+
+    async def update_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /alerts/{id}: Update alert status (Admin/HYSACAM/Council)"""
+        return await self._transport.acall("PATCH", f"/alerts/{id}", "/alerts/{id}", self._token, body=body)
@@ -0,0 +1,119 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/auth operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+from harness.client.models import (
+    AuthResponseDto,
+    ChangePasswordDto,
+    LoginDto,
+    RefreshTokenDto,
+    RegisterHouseholdDto,
+    TokenPairDto,
+)
+
+
+class Auth(Resource):
+    __slots__ = ()
+
+    def register(self, body: RegisterHouseholdDto | dict) -> AuthResponseDto:
+        """POST /auth/register: Register a new household user"""
+        return self._transport.call(
+            "POST",
+            "/auth/register",
+            "/auth/register",
+            self._token,
+            body=body,
+            model=AuthResponseDto,
+        )
+
+    def login(self, body: LoginDto | dict) -> AuthResponseDto:
+        """POST /auth/login: Login with phone and password"""
+        return self._transport.call(
+            "POST",
+            "/auth/login",
+            "/auth/login",
+            self._token,
+            body=body,
+            model=AuthResponseDto,
+        )
+
+    def refresh(self, body: RefreshTokenDto | dict) -> TokenPairDto:
+        """POST /auth/refresh: Refresh access token"""
+        return self._transport.call(
+            "POST",
+            "/auth/refresh",
+            "/auth/refresh",
+            self._token,
+            body=body,
+            model=TokenPairDto,
+        )
+
+    def logout(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /auth/logout: Logout user"""
+        return self._transport.call("POST", "/auth/logout", "/auth/logout", self._token, body=body)
+
+    def change_password(self, body: ChangePasswordDto | dict) -> Record | list[Record]:
+        """PATCH /auth/change-password: Change user password"""
+        return self._transport.call(
+            "PATCH",
+            "/auth/change-password",
+            "/auth/change-password",
+            self._token,
+            body=body,
+        )
+
+
+class AsyncAuth(Resource):
+    __slots__ = ()
+
+    async def register(self, body: RegisterHouseholdDto | dict) -> AuthResponseDto:
+        """POST /auth/register: Register a new household user"""
+        return await self._transport.acall(
+            "POST",
+            "/auth/register",
+            "/auth/register",
+            self._token,
+            body=body,
+            model=AuthResponseDto,
+        )
+
+    async def login(self, body: LoginDto | dict) -> AuthResponseDto:
+        """POST /auth/login: Login with phone and password"""
+        return await self._transport.acall(
+            "POST",
+            "/auth/login",
+            "/auth/login",
+            self._token,
+            body=body,
+            model=AuthResponseDto,
+        )
+
+    async def refresh(self, body: RefreshTokenDto | dict) -> TokenPairDto:
+        """POST /auth/refresh: Refresh access token"""
+        return await self._transport.acall(
+            "POST",
+            "/auth/refresh",
+            "/auth/refresh",
+            self._token,
+            body=body,
+            model=TokenPairDto,
+        )
+
+    async def logout(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /auth/logout: Logout user"""
+        return await self._transport.acall("POST", "/auth/logout", "/auth/logout", self._token, body=body)
+
+    async def change_password(self, body: ChangePasswordDto | dict) -> Record | list[Record]:
+        """PATCH /auth/change-password: Change user password"""
+        return await self._transport.acall(
+            "PATCH",
+            "/auth/change-password",
+            "/auth/change-password",
+            self._token,
+            body=body,
+        )
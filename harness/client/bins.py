@@ -0,0 +1,134 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/bins operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+from harness.client.models import UpdateBinCapacitiesDto
+
+
+class Bins(Resource):
+    __slots__ = ()
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /bins: Create bin (Admin only)"""
+        return self._transport.call("POST", "/bins", "/bins", self._token, body=body)
+
+    def find_all(self) -> Record | list[Record]:
+        """GET /bins: Get all bins"""
+        return self._transport.call("GET", "/bins", "/bins", self._token)
+
+    def find_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius: float | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /bins/nearby: Nearest bins to a point, optionally within a radius (meters)"""
+        return self._transport.call(
+            "GET",
+            "/bins/nearby",
+            "/bins/nearby",
+            self._token,
+            params={"lat": lat, "lng": lng, "radius": radius, "limit": limit},
+        )
+
+    def find_within(
+        self,
+        *,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /bins/within: Bins inside a bounding box (map viewport)"""
+        return self._transport.call(
+            "GET",
+            "/bins/within",
+            "/bins/within",
+            self._token,
+            params={"minLat": min_lat, "minLng": min_lng, "maxLat": max_lat, "maxLng": max_lng, "limit": limit},
+        )
+
+    def update_capacities(self, body: UpdateBinCapacitiesDto | dict) -> Record | list[Record]:
+        """PATCH /bins/capacity: Batch capacity level / last emptied update from bin sensors (Admin/HYSACAM)"""
+        return self._transport.call("PATCH", "/bins/capacity", "/bins/capacity", self._token, body=body)
+
+    def find_one(self, id: str) -> Record | list[Record]:
+        """GET /bins/{id}: Get bin by ID"""
+        return self._transport.call("GET", f"/bins/{id}", "/bins/{id}", self._token)
+
+    def update(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /bins/{id}: Update bin (Admin/HYSACAM)"""
+        return self._transport.call("PATCH", f"/bins/{id}", "/bins/{id}", self._token, body=body)
+
+
+class AsyncBins(Resource):
+    __slots__ = ()
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /bins: Create bin (Admin only)"""
+        return await self._transport.acall("POST", "/bins", "/bins", self._token, body=body)
+
+    async def find_all(self) -> Record | list[Record]:
+        """GET /bins: Get all bins"""
+        return await self._transport.acall("GET", "/bins", "/bins", self._token)
+
+    async def find_nearby(
+        self,
+        *,
+        lat: float,
+        lng: float,
+        radius: float | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /bins/nearby: Nearest bins to a point, optionally within a radius (meters)"""
+        return await self._transport.acall(
+            "GET",
+            "/bins/nearby",
+            "/bins/nearby",
+            self._token,
+            params={"lat": lat, "lng": lng, "radius": radius, "limit": limit},
+        )
+
+    async def find_within(
+        self,
+        *,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /bins/within: Bins inside a bounding box (map viewport)"""
+        return await self._transport.acall(
+            "GET",
+            "/bins/within",
+            "/bins/within",
+            self._token,
+            params={"minLat": min_lat, "minLng": min_lng, "maxLat": max_lat, "maxLng": max_lng, "limit": limit},
+        )
+
+    async def update_capacities(self, body: UpdateBinCapacitiesDto | dict) -> Record | list[Record]:
+        """PATCH /bins/capacity: Batch capacity level / last emptied update from bin sensors (Admin/HYSACAM)"""
+        return await self._transport.acall(
+            "PATCH",
+            "/bins/capacity",
+            "/bins/capacity",
+            self._token,
+            body=body,
+        )
+
+    async def find_one(self, id: str) -> Record | list[Record]:
+        """GET /bins/{id}: Get bin by ID"""
+        return await self._transport.acall("GET", f"/bins/{id}", "/bins/{id}", self._token)
+
+    async def update(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /bins/{id}: Update bin (Admin/HYSACAM)"""
+        return await self._transport.acall("PATCH", f"/bins/{id}", "/bins/{id}", self._token, body=body)
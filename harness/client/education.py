@@ -0,0 +1,89 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/education operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Education(Resource):
+    __slots__ = ()
+
+    def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        audience: str | None = None,
+        language: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /education: Get educational content"""
+        return self._transport.call(
+            "GET",
+            "/education",
+            "/education",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "audience": audience, "language": language},
+        )
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /education: Create educational content (Admin only)"""
+        return self._transport.call("POST", "/education", "/education", self._token, body=body)
+
+    def find_one(self, id: str) -> Record | list[Record]:
+        """GET /education/{id}: Get educational content by ID"""
+        return self._transport.call("GET", f"/education/{id}", "/education/{id}", self._token)
+
+    def update(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PUT /education/{id}: Update educational content (Admin only)"""
+        return self._transport.call("PUT", f"/education/{id}", "/education/{id}", self._token, body=body)
+
+    def remove(self, id: str) -> Record | list[Record]:
+        """DELETE /education/{id}: Delete educational content (Admin only)"""
+        return self._transport.call("DELETE", f"/education/{id}", "/education/{id}", self._token)
+
+
+class AsyncEducation(Resource):
+    __slots__ = ()
+
+    async def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        audience: str | None = None,
+        language: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /education: Get educational content"""
+        return await self._transport.acall(
+            "GET",
+            "/education",
+            "/education",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "audience": audience, "language": language},
+        )
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /education: Create educational content (Admin only)"""
+        return await self._transport.acall("POST", "/education", "/education", self._token, body=body)
+
+    async def find_one(self, id: str) -> Record | list[Record]:
+        """GET /education/{id}: Get educational content by ID"""
+        return await self._transport.acall("GET", f"/education/{id}", "/education/{id}", self._token)
+
+    async def update(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PUT /education/{id}: Update educational content (Admin only)"""
+        return await self._transport.acall(
+            "PUT",
+            f"/education/{id}",
+            "/education/{id}",
+            self._token,
+            body=body,
+        )
+
+    async def remove(self, id: str) -> Record | list[Record]:
+        """DELETE /education/{id}: Delete educational content (Admin only)"""
+        return await self._transport.acall("DELETE", f"/education/{id}", "/education/{id}", self._token)
@@ -0,0 +1,39 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/files operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from harness.client._runtime import Record, Resource
+
+
+class Files(Resource):
+    __slots__ = ()
+
+    def upload_file(self, file: Any) -> Record | list[Record]:
+        """POST /files/upload: Upload file"""
+        return self._transport.call(
+            "POST",
+            "/files/upload",
+            "/files/upload",
+            self._token,
+            files={"file": file},
+        )
+
+
+class AsyncFiles(Resource):
+    __slots__ = ()
+
+    async def upload_file(self, file: Any) -> Record | list[Record]:
+        """POST /files/upload: Upload file"""
+        return await self._transport.acall(
+            "POST",
+            "/files/upload",
+            "/files/upload",
+            self._token,
+            files={"file": file},
+        )
@@ -0,0 +1,40 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/health operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+from harness.client.models import HealthCheckResponse
+
+
+class Health(Resource):
+    __slots__ = ()
+
+    def check(self) -> HealthCheckResponse:
+        """GET /health: Health check"""
+        return self._transport.call("GET", "/health", "/health", self._token, model=HealthCheckResponse)
+
+    def runtime(self) -> Record | list[Record]:
+        """GET /health/runtime: Event-loop delay since the previous call, memory, response cache and uptime (Admin)"""
+        return self._transport.call("GET", "/health/runtime", "/health/runtime", self._token)
+
+
+class AsyncHealth(Resource):
+    __slots__ = ()
+
+    async def check(self) -> HealthCheckResponse:
+        """GET /health: Health check"""
+        return await self._transport.acall(
+            "GET",
+            "/health",
+            "/health",
+            self._token,
+            model=HealthCheckResponse,
+        )
+
+    async def runtime(self) -> Record | list[Record]:
+        """GET /health/runtime: Event-loop delay since the previous call, memory, response cache and uptime (Admin)"""
+        return await self._transport.acall("GET", "/health/runtime", "/health/runtime", self._token)
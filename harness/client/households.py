@@ -0,0 +1,41 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/households operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Households(Resource):
+    __slots__ = ()
+
+    def get_my_profile(self) -> Record | list[Record]:
+        """GET /households/me: Get my household profile"""
+        return self._transport.call("GET", "/households/me", "/households/me", self._token)
+
+    def update_my_profile(self, body: dict | None = None) -> Record | list[Record]:
+        """PUT /households/me: Update my household profile"""
+        return self._transport.call("PUT", "/households/me", "/households/me", self._token, body=body)
+
+    def get_my_stats(self) -> Record | list[Record]:
+        """GET /households/me/stats: Get my household statistics"""
+        return self._transport.call("GET", "/households/me/stats", "/households/me/stats", self._token)
+
+
+class AsyncHouseholds(Resource):
+    __slots__ = ()
+
+    async def get_my_profile(self) -> Record | list[Record]:
+        """GET /households/me: Get my household profile"""
+        return await self._transport.acall("GET", "/households/me", "/households/me", self._token)
+
+    async def update_my_profile(self, body: dict | None = None) -> Record | list[Record]:
+        """PUT /households/me: Update my household profile"""
+        return await self._transport.acall("PUT", "/households/me", "/households/me", self._token, body=body)
+
+    async def get_my_stats(self) -> Record | list[Record]:
+        """GET /households/me/stats: Get my household statistics"""
+        return await self._transport.acall("GET", "/households/me/stats", "/households/me/stats", self._token)
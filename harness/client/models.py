@@ -0,0 +1,247 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+Request and response schemas of the API as __slots__ classes.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Model, dump, model_or_none, models_or_none
+
+
+class RegisterHouseholdDto(Model):
+    __slots__ = ("name", "email", "phone", "password", "address", "quarter")
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        phone: str,
+        password: str,
+        email: str | None = None,
+        address: str | None = None,
+        quarter: str | None = None,
+    ):
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.password = password
+        self.address = address
+        self.quarter = quarter
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RegisterHouseholdDto:
+        self = cls.__new__(cls)
+        self.name = data.get("name")
+        self.email = data.get("email")
+        self.phone = data.get("phone")
+        self.password = data.get("password")
+        self.address = data.get("address")
+        self.quarter = data.get("quarter")
+        return self
+
+    def to_dict(self) -> dict:
+        data = {"name": self.name, "phone": self.phone, "password": self.password}
+        if self.email is not None:
+            data["email"] = self.email
+        if self.address is not None:
+            data["address"] = self.address
+        if self.quarter is not None:
+            data["quarter"] = self.quarter
+        return data
+
+
+class LoginDto(Model):
+    __slots__ = ("phone", "password")
+
+    def __init__(self, *, phone: str, password: str):
+        self.phone = phone
+        self.password = password
+
+    @classmethod
+    def from_dict(cls, data: dict) -> LoginDto:
+        self = cls.__new__(cls)
+        self.phone = data.get("phone")
+        self.password = data.get("password")
+        return self
+
+    def to_dict(self) -> dict:
+        return {"phone": self.phone, "password": self.password}
+
+
+class RefreshTokenDto(Model):
+    __slots__ = ("refresh_token",)
+
+    def __init__(self, *, refresh_token: str):
+        self.refresh_token = refresh_token
+
+    @classmethod
+    def from_dict(cls, data: dict) -> RefreshTokenDto:
+        self = cls.__new__(cls)
+        self.refresh_token = data.get("refreshToken")
+        return self
+
+    def to_dict(self) -> dict:
+        return {"refreshToken": self.refresh_token}
+
+
+class ChangePasswordDto(Model):
+    __slots__ = ("current_password", "new_password")
+
+    def __init__(self, *, current_password: str, new_password: str):
+        self.current_password = current_password
+        self.new_password = new_password
+
+    @classmethod
+    def from_dict(cls, data: dict) -> ChangePasswordDto:
+        self = cls.__new__(cls)
+        self.current_password = data.get("currentPassword")
+        self.new_password = data.get("newPassword")
+        return self
+
+    def to_dict(self) -> dict:
+        return {"currentPassword": self.current_password, "newPassword": self.new_password}
+
+
+class TokenPairDto(Model):
+    __slots__ = ("access_token", "refresh_token")
+
+    def __init__(self, *, access_token: str, refresh_token: str):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+
+    @classmethod
+    def from_dict(cls, data: dict) -> TokenPairDto:
+        self = cls.__new__(cls)
+        self.access_token = data.get("accessToken")
+        self.refresh_token = data.get("refreshToken")
+        return self
+
+    def to_dict(self) -> dict:
+        return {"accessToken": self.access_token, "refreshToken": self.refresh_token}
+
+
+class AuthUserDto(Model):
+    __slots__ = ("id", "name", "email", "phone", "role")
+
+    def __init__(self, *, id: str, name: str, phone: str, role: str, email: str | None = None):
+        self.id = id
+        self.name = name
+        self.email = email
+        self.phone = phone
+        self.role = role
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AuthUserDto:
+        self = cls.__new__(cls)
+        self.id = data.get("id")
+        self.name = data.get("name")
+        self.email = data.get("email")
+        self.phone = data.get("phone")
+        self.role = data.get("role")
+        return self
+
+    def to_dict(self) -> dict:
+        data = {"id": self.id, "name": self.name, "phone": self.phone, "role": self.role}
+        if self.email is not None:
+            data["email"] = self.email
+        return data
+
+
+class AuthResponseDto(Model):
+    __slots__ = ("access_token", "refresh_token", "user")
+
+    def __init__(self, *, access_token: str, refresh_token: str, user: AuthUserDto):
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.user = user
+
+    @classmethod
+    def from_dict(cls, data: dict) -> AuthResponseDto:
+        self = cls.__new__(cls)
+        self.access_token = data.get("accessToken")
+        self.refresh_token = data.get("refreshToken")
+        self.user = model_or_none(AuthUserDto, data.get("user"))
+        return self
+
+    def to_dict(self) -> dict:
+        return {"accessToken": self.access_token, "refreshToken": self.refresh_token, "user": dump(self.user)}
+
+
+class BinCapacityReadingDto(Model):
+    __slots__ = ("id", "capacity_level", "last_emptied_at")
+
+    def __init__(self, *, id: str, capacity_level: str | None = None, last_emptied_at: str | None = None):
+        self.id = id
+        self.capacity_level = capacity_level
+        self.last_emptied_at = last_emptied_at
+
+    @classmethod
+    def from_dict(cls, data: dict) -> BinCapacityReadingDto:
+        self = cls.__new__(cls)
+        self.id = data.get("id")
+        self.capacity_level = data.get("capacityLevel")
+        self.last_emptied_at = data.get("lastEmptiedAt")
+        return self
+
+    def to_dict(self) -> dict:
+        data = {"id": self.id}
+        if self.capacity_level is not None:
+            data["capacityLevel"] = self.capacity_level
+        if self.last_emptied_at is not None:
+            data["lastEmptiedAt"] = self.last_emptied_at
+        return data
+
+
+class UpdateBinCapacitiesDto(Model):
+    __slots__ = ("readings",)
+
+    def __init__(self, *, readings: list[BinCapacityReadingDto]):
+        self.readings = readings
+
+    @classmethod
+    def from_dict(cls, data: dict) -> UpdateBinCapacitiesDto:
+        self = cls.__new__(cls)
+        self.readings = models_or_none(BinCapacityReadingDto, data.get("readings"))
+        return self
+
+    def to_dict(self) -> dict:
+        return {"readings": dump(self.readings)}
+
+
+class HealthCheckResponse(Model):
+    __slots__ = ("status", "info", "error", "details")
+
+    def __init__(
+        self,
+        *,
+        status: str | None = None,
+        info: dict | None = None,
+        error: dict | None = None,
+        details: dict | None = None,
+    ):
+        self.status = status
+        self.info = info
+        self.error = error
+        self.details = details
+
+    @classmethod
+    def from_dict(cls, data: dict) -> HealthCheckResponse:
+        self = cls.__new__(cls)
+        self.status = data.get("status")
+        self.info = data.get("info")
+        self.error = data.get("error")
+        self.details = data.get("details")
+        return self
+
+    def to_dict(self) -> dict:
+        data = {}
+        if self.status is not None:
+            data["status"] = self.status
+        if self.info is not None:
+            data["info"] = self.info
+        if self.error is not None:
+            data["error"] = self.error
+        if self.details is not None:
+            data["details"] = self.details
+        return data
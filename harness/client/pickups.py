@@ -0,0 +1,197 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/pickups operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Pickups(Resource):
+    __slots__ = ()
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /pickups: Create pickup request (Household)"""
+        return self._transport.call("POST", "/pickups", "/pickups", self._token, body=body)
+
+    def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /pickups: Get all pickups"""
+        return self._transport.call(
+            "GET",
+            "/pickups",
+            "/pickups",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "scope": scope, "status": status},
+        )
+
+    def find_available(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /pickups/available: Get available pickups (Agent)"""
+        return self._transport.call(
+            "GET",
+            "/pickups/available",
+            "/pickups/available",
+            self._token,
+            params={"cursor": cursor, "limit": limit},
+        )
+
+    def find_one(self, id: str) -> Record | list[Record]:
+        """GET /pickups/{id}: Get pickup by ID"""
+        return self._transport.call("GET", f"/pickups/{id}", "/pickups/{id}", self._token)
+
+    def accept(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/accept: Accept pickup request (Agent)"""
+        return self._transport.call(
+            "PATCH",
+            f"/pickups/{id}/accept",
+            "/pickups/{id}/accept",
+            self._token,
+            body=body,
+        )
+
+    def start(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/start: Start pickup (Agent)"""
+        return self._transport.call(
+            "PATCH",
+            f"/pickups/{id}/start",
+            "/pickups/{id}/start",
+            self._token,
+            body=body,
+        )
+
+    def complete(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/complete: Complete pickup (Agent)"""
+        return self._transport.call(
+            "PATCH",
+            f"/pickups/{id}/complete",
+            "/pickups/{id}/complete",
+            self._token,
+            body=body,
+        )
+
+    def cancel(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/cancel: Cancel pickup (Household)"""
+        return self._transport.call(
+            "PATCH",
+            f"/pickups/{id}/cancel",
+            "/pickups/{id}/cancel",
+            self._token,
+            body=body,
+        )
+
+    def rate(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """POST /pickups/{id}/rating: Rate completed pickup (Household)"""
+        return self._transport.call(
+            "POST",
+            f"/pickups/{id}/rating",
+            "/pickups/{id}/rating",
+            self._token,
+            body=body,
+        )
+
+
+class AsyncPickups(Resource):
+    __slots__ = ()
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /pickups: Create pickup request (Household)"""
+        return await self._transport.acall("POST", "/pickups", "/pickups", self._token, body=body)
+
+    async def find_all(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+        scope: str | None = None,
+        status: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /pickups: Get all pickups"""
+        return await self._transport.acall(
+            "GET",
+            "/pickups",
+            "/pickups",
+            self._token,
+            params={"cursor": cursor, "limit": limit, "scope": scope, "status": status},
+        )
+
+    async def find_available(
+        self,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /pickups/available: Get available pickups (Agent)"""
+        return await self._transport.acall(
+            "GET",
+            "/pickups/available",
+            "/pickups/available",
+            self._token,
+            params={"cursor": cursor, "limit": limit},
+        )
+
+    async def find_one(self, id: str) -> Record | list[Record]:
+        """GET /pickups/{id}: Get pickup by ID"""
+        return await self._transport.acall("GET", f"/pickups/{id}", "/pickups/{id}", self._token)
+
+    async def accept(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/accept: Accept pickup request (Agent)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/pickups/{id}/accept",
+            "/pickups/{id}/accept",
+            self._token,
+            body=body,
+        )
+
+    async def start(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/start: Start pickup (Agent)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/pickups/{id}/start",
+            "/pickups/{id}/start",
+            self._token,
+            body=body,
+        )
+
+    async def complete(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/complete: Complete pickup (Agent)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/pickups/{id}/complete",
+            "/pickups/{id}/complete",
+            self._token,
+            body=body,
+        )
+
+    async def cancel(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /pickups/{id}/cancel: Cancel pickup (Household)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/pickups/{id}/cancel",
+            "/pickups/{id}/cancel",
+            self._token,
+            body=body,
+        )
+
+    async def rate(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """POST /pickups/{id}/rating: Rate completed pickup (Household)"""
+        return await self._transport.acall(
+            "POST",
+            f"/pickups/{id}/rating",
+            "/pickups/{id}/rating",
+            self._token,
+            body=body,
+        )
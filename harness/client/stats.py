@@ -0,0 +1,63 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/stats operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Stats(Resource):
+    __slots__ = ()
+
+    def get_overview(self) -> Record | list[Record]:
+        """GET /stats/overview: Get platform overview statistics"""
+        return self._transport.call("GET", "/stats/overview", "/stats/overview", self._token)
+
+    def get_pickup_stats(self, *, from_: str, to: str) -> Record | list[Record]:
+        """GET /stats/pickups: Get pickup statistics"""
+        return self._transport.call(
+            "GET",
+            "/stats/pickups",
+            "/stats/pickups",
+            self._token,
+            params={"from": from_, "to": to},
+        )
+
+    def get_agent_performance(self) -> Record | list[Record]:
+        """GET /stats/agents/performance: Get agent performance statistics"""
+        return self._transport.call(
+            "GET",
+            "/stats/agents/performance",
+            "/stats/agents/performance",
+            self._token,
+        )
+
+
+class AsyncStats(Resource):
+    __slots__ = ()
+
+    async def get_overview(self) -> Record | list[Record]:
+        """GET /stats/overview: Get platform overview statistics"""
+        return await self._transport.acall("GET", "/stats/overview", "/stats/overview", self._token)
+
+    async def get_pickup_stats(self, *, from_: str, to: str) -> Record | list[Record]:
+        """GET /stats/pickups: Get pickup statistics"""
+        return await self._transport.acall(
+            "GET",
+            "/stats/pickups",
+            "/stats/pickups",
+            self._token,
+            params={"from": from_, "to": to},
+        )
+
+    async def get_agent_performance(self) -> Record | list[Record]:
+        """GET /stats/agents/performance: Get agent performance statistics"""
+        return await self._transport.acall(
+            "GET",
+            "/stats/agents/performance",
+            "/stats/agents/performance",
+            self._token,
+        )
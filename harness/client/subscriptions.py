@@ -0,0 +1,45 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/subscriptions operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Subscriptions(Resource):
+    __slots__ = ()
+
+    def find_all(self, *, household_id: str) -> Record | list[Record]:
+        """GET /subscriptions: Get subscriptions"""
+        return self._transport.call(
+            "GET",
+            "/subscriptions",
+            "/subscriptions",
+            self._token,
+            params={"householdId": household_id},
+        )
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /subscriptions: Create subscription (Admin only)"""
+        return self._transport.call("POST", "/subscriptions", "/subscriptions", self._token, body=body)
+
+
+class AsyncSubscriptions(Resource):
+    __slots__ = ()
+
+    async def find_all(self, *, household_id: str) -> Record | list[Record]:
+        """GET /subscriptions: Get subscriptions"""
+        return await self._transport.acall(
+            "GET",
+            "/subscriptions",
+            "/subscriptions",
+            self._token,
+            params={"householdId": household_id},
+        )
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /subscriptions: Create subscription (Admin only)"""
+        return await self._transport.acall("POST", "/subscriptions", "/subscriptions", self._token, body=body)
@@ -0,0 +1,97 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/surveys operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Surveys(Resource):
+    __slots__ = ()
+
+    def find_all(self, *, target_group: str, active: bool) -> Record | list[Record]:
+        """GET /surveys: Get all surveys"""
+        return self._transport.call(
+            "GET",
+            "/surveys",
+            "/surveys",
+            self._token,
+            params={"targetGroup": target_group, "active": active},
+        )
+
+    def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /surveys: Create survey (Admin only)"""
+        return self._transport.call("POST", "/surveys", "/surveys", self._token, body=body)
+
+    def submit_response(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """POST /surveys/{id}/responses: Submit survey response"""
+        return self._transport.call(
+            "POST",
+            f"/surveys/{id}/responses",
+            "/surveys/{id}/responses",
+            self._token,
+            body=body,
+        )
+
+    def get_responses(
+        self,
+        id: str,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /surveys/{id}/responses: Get survey responses (Admin/HYSACAM/Council)"""
+        return self._transport.call(
+            "GET",
+            f"/surveys/{id}/responses",
+            "/surveys/{id}/responses",
+            self._token,
+            params={"cursor": cursor, "limit": limit},
+        )
+
+
+class AsyncSurveys(Resource):
+    __slots__ = ()
+
+    async def find_all(self, *, target_group: str, active: bool) -> Record | list[Record]:
+        """GET /surveys: Get all surveys"""
+        return await self._transport.acall(
+            "GET",
+            "/surveys",
+            "/surveys",
+            self._token,
+            params={"targetGroup": target_group, "active": active},
+        )
+
+    async def create(self, body: dict | None = None) -> Record | list[Record]:
+        """POST /surveys: Create survey (Admin only)"""
+        return await self._transport.acall("POST", "/surveys", "/surveys", self._token, body=body)
+
+    async def submit_response(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """POST /surveys/{id}/responses: Submit survey response"""
+        return await self._transport.acall(
+            "POST",
+            f"/surveys/{id}/responses",
+            "/surveys/{id}/responses",
+            self._token,
+            body=body,
+        )
+
+    async def get_responses(
+        self,
+        id: str,
+        *,
+        cursor: str | None = None,
+        limit: float | None = None,
+    ) -> Record | list[Record]:
+        """GET /surveys/{id}/responses: Get survey responses (Admin/HYSACAM/Council)"""
+        return await self._transport.acall(
+            "GET",
+            f"/surveys/{id}/responses",
+            "/surveys/{id}/responses",
+            self._token,
+            params={"cursor": cursor, "limit": limit},
+        )
@@ -0,0 +1,79 @@
+# Generated by harness.clientgen from docs-json.json; do not edit, rerun the generator.
+
+"""
+/users operations; see harness.client for how to get at them.
+"""
+
+from __future__ import annotations
+
+from harness.client._runtime import Record, Resource
+
+
+class Users(Resource):
+    __slots__ = ()
+
+    def find_all(
+        self,
+        *,
+        page: float | None = None,
+        limit: float | None = None,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /users: Get all users (Admin only)"""
+        return self._transport.call(
+            "GET",
+            "/users",
+            "/users",
+            self._token,
+            params={"page": page, "limit": limit, "isActive": is_active, "role": role},
+        )
+
+    def find_one(self, id: str) -> Record | list[Record]:
+        """GET /users/{id}: Get user by ID (Admin only)"""
+        return self._transport.call("GET", f"/users/{id}", "/users/{id}", self._token)
+
+    def update_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /users/{id}/status: Update user status (Admin only)"""
+        return self._transport.call(
+            "PATCH",
+            f"/users/{id}/status",
+            "/users/{id}/status",
+            self._token,
+            body=body,
+        )
+
+
+class AsyncUsers(Resource):
+    __slots__ = ()
+
+    async def find_all(
+        self,
+        *,
+        page: float | None = None,
+        limit: float | None = None,
+        is_active: bool | None = None,
+        role: str | None = None,
+    ) -> Record | list[Record]:
+        """GET /users: Get all users (Admin only)"""
+        return await self._transport.acall(
+            "GET",
+            "/users",
+            "/users",
+            self._token,
+            params={"page": page, "limit": limit, "isActive": is_active, "role": role},
+        )
+
+    async def find_one(self, id: str) -> Record | list[Record]:
+        """GET /users/{id}: Get user by ID (Admin only)"""
+        return await self._transport.acall("GET", f"/users/{id}", "/users/{id}", self._token)
+
+    async def update_status(self, id: str, body: dict | None = None) -> Record | list[Record]:
+        """PATCH /users/{id}/status: Update user status (Admin only)"""
+        return await self._transport.acall(
+            "PATCH",
+            f"/users/{id}/status",
+            "/users/{id}/status",
+            self._token,
+            body=body,
+        )
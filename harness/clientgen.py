@@ -0,0 +1,376 @@
+"""
+Generate the Python API client in harness/client from the OpenAPI spec.
+
+    python -m harness.clientgen                                  # docs-json.json -> harness/client
+    python -m harness.clientgen --spec http://localhost:3000/api/docs-json
+
+The output is one module per resource group (the first path segment after
+the API prefix: auth, pickups, alerts, ...) holding a blocking class and an
+async twin, a models module with one __slots__ class per schema, and an
+__init__ that wires the groups into Client/AsyncClient for lazy import.
+harness/client/_runtime.py is hand-written and left alone.
+
+Schemas come from components.schemas plus inline object responses (named
+after the operation). Operations whose response the spec does not describe
+return Records; body-less POST/PUT/PATCH operations still take an optional
+`body`, since most Nest DTOs are not annotated for Swagger.
+"""
+
+import argparse
+import json
+import keyword
+import os
+import re
+import sys
+import textwrap
+from collections import namedtuple
+
+import requests
+
+DEFAULT_SPEC = "docs-json.json"
+DEFAULT_OUT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "client")
+DEFAULT_PREFIX = "/api/v1"
+PACKAGE = "harness.client"
+
+HEADER = "# Generated by harness.clientgen from {source}; do not edit, rerun the generator.\n"
+
+Operation = namedtuple("Operation", [
+    "resource", "name", "method", "path", "summary",
+    "path_params", "query_params", "body", "response",
+])
+# kind is "json", "multipart" or None; schema is a model name or None
+Body = namedtuple("Body", ["kind", "schema", "required"])
+Param = namedtuple("Param", ["key", "name", "location", "type", "required"])
+
+_SCALARS = {"string": "str", "number": "float", "integer": "int", "boolean": "bool", "object": "dict"}
+
+
+def q(text):
+    return json.dumps(text)
+
+
+def wrap_args(head, args, tail, indent):
+    """
+    `head(arg, arg):` on one line, or one argument per line when too long.
+    """
+    line = f"{indent}{head}({', '.join(args)}){tail}"
+    if len(line) <= 110:
+        return [line]
+    return [f"{indent}{head}(", *(f"{indent}    {arg}," for arg in args), f"{indent}){tail}"]
+
+
+def import_lines(module, names):
+    line = f"from {module} import {', '.join(names)}"
+    if len(line) <= 110:
+        return [line]
+    return [f"from {module} import (", *(f"    {name}," for name in names), ")"]
+
+
+def snake(name):
+    name = re.sub(r"[^0-9a-zA-Z]+", "_", name)
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", name).lower().strip("_")
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def pascal(name):
+    return "".join(part[:1].upper() + part[1:] for part in re.split(r"[^0-9a-zA-Z]+", name) if part)
+
+
+def load_spec(source):
+    if source.startswith(("http://", "https://")):
+        resp = requests.get(source, timeout=30)
+        resp.raise_for_status()
+        return resp.json()
+    with open(source) as f:
+        return json.load(f)
+
+
+def _ref_name(schema):
+    return schema["$ref"].rsplit("/", 1)[-1]
+
+
+def python_type(schema, models):
+    if not schema:
+        return "Any"
+    if "$ref" in schema:
+        return _ref_name(schema) if _ref_name(schema) in models else "dict"
+    if schema.get("type") == "array":
+        return f"list[{python_type(schema.get('items'), models)}]"
+    return _SCALARS.get(schema.get("type"), "Any")
+
+
+# ========================
+# SPEC -> OPERATIONS
+# ========================
+
+def _json_schema(content):
+    for media, value in (content or {}).items():
+        if media.startswith("application/json"):
+            return value.get("schema")
+    return None
+
+
+def collect(spec, prefix=DEFAULT_PREFIX):
+    """
+    (operations, schemas): schemas are {name: object schema}, the
+    components plus one per inline object response.
+    """
+    schemas = {
+        name: schema for name, schema in spec.get("components", {}).get("schemas", {}).items()
+        if schema.get("type", "object") == "object" and schema.get("properties")
+    }
+    operations = []
+    for full_path, methods in spec["paths"].items():
+        path = full_path[len(prefix):] if full_path.startswith(prefix) else full_path
+        resource = snake(path.strip("/").split("/")[0])
+        for method, op in methods.items():
+            controller, _, handler = op.get("operationId", "").partition("_")
+            name = snake(handler or f"{method}_{path}")
+            params = [
+                Param(p["name"], snake(p["name"]), p["in"], p.get("schema", {}), p.get("required", False))
+                for p in op.get("parameters", [])
+            ]
+
+            body = None
+            request_body = op.get("requestBody")
+            if request_body:
+                content = request_body.get("content", {})
+                schema = _json_schema(content)
+                if schema is not None:
+                    body = Body("json", _ref_name(schema) if "$ref" in schema else None,
+                                request_body.get("required", False))
+                elif "multipart/form-data" in content:
+                    body = Body("multipart", None, request_body.get("required", False))
+            elif method in ("post", "put", "patch"):
+                body = Body("json", None, False)
+
+            response = None
+            for status, answer in sorted(op.get("responses", {}).items()):
+                if not status.startswith("2"):
+                    continue
+                schema = _json_schema(answer.get("content"))
+                if schema and "$ref" in schema:
+                    response = _ref_name(schema)
+                elif schema and schema.get("type") == "object" and schema.get("properties"):
+                    response = pascal(controller.replace("Controller", "")) + pascal(handler) + "Response"
+                    schemas[response] = schema
+                break
+
+            operations.append(Operation(
+                resource, name, method.upper(), path, op.get("summary", ""),
+                [p for p in params if p.location == "path"],
+                [p for p in params if p.location == "query"],
+                body, response,
+            ))
+    return operations, schemas
+
+
+# ========================
+# RENDERING
+# ========================
+
+def _with_typing(lines):
+    """
+    Join a module, importing typing.Any only when an annotation uses it.
+    """
+    text = "\n".join(lines)
+    future = "from __future__ import annotations\n"
+    if re.search(r"\bAny\b", text):
+        text = text.replace(future, future + "\nfrom typing import Any\n", 1)
+    return text
+
+
+def render_models(schemas, source):
+    lines = [
+        HEADER.format(source=source),
+        '"""\nRequest and response schemas of the API as __slots__ classes.\n"""\n',
+        "from __future__ import annotations\n",
+        "from harness.client._runtime import Model, dump, model_or_none, models_or_none\n",
+    ]
+    for name, schema in schemas.items():
+        props = schema["properties"]
+        required = set(schema.get("required", []))
+        fields = [(key, snake(key), props[key]) for key in props]
+        ordered = [f for f in fields if f[0] in required] + [f for f in fields if f[0] not in required]
+
+        lines.append(f"\nclass {name}(Model):")
+        if schema.get("description"):
+            lines.append(f'    """\n    {schema["description"]}\n    """\n')
+        slots = ", ".join(q(attr) for _, attr, _ in fields)
+        lines.append(f"    __slots__ = ({slots}{',' if len(fields) == 1 else ''})\n")
+
+        args = [
+            f"{attr}: {python_type(s, schemas)}" + ("" if key in required else " | None = None")
+            for key, attr, s in ordered
+        ]
+        lines.extend(wrap_args("def __init__", ["self", "*", *args], ":", "    "))
+        lines.extend(f"        self.{attr} = {attr}" for _, attr, _ in fields)
+
+        lines.append("\n    @classmethod")
+        lines.append(f"    def from_dict(cls, data: dict) -> {name}:")
+        lines.append("        self = cls.__new__(cls)")
+        for key, attr, s in fields:
+            value = f"data.get({q(key)})"
+            if "$ref" in s and _ref_name(s) in schemas:
+                value = f"model_or_none({_ref_name(s)}, {value})"
+            elif s.get("type") == "array" and "$ref" in s.get("items", {}) and _ref_name(s["items"]) in schemas:
+                value = f"models_or_none({_ref_name(s['items'])}, {value})"
+            lines.append(f"        self.{attr} = {value}")
+        lines.append("        return self")
+
+        def out(attr, s):
+            nested = "$ref" in s or (s.get("type") == "array" and "$ref" in s.get("items", {}))
+            return f"dump(self.{attr})" if nested else f"self.{attr}"
+
+        lines.append("\n    def to_dict(self) -> dict:")
+        always = "{" + ", ".join(f"{q(key)}: {out(attr, s)}" for key, attr, s in fields if key in required) + "}"
+        if required.issuperset(props):
+            lines.append(f"        return {always}\n")
+            continue
+        lines.append(f"        data = {always}")
+        for key, attr, s in fields:
+            if key not in required:
+                lines.append(f"        if self.{attr} is not None:")
+                lines.append(f"            data[{q(key)}] = {out(attr, s)}")
+        lines.append("        return data\n")
+    return _with_typing(lines)
+
+
+def _signature(op, schemas):
+    args = [f"{p.name}: str" for p in op.path_params]
+    if op.body and op.body.kind == "multipart":
+        args.append("file: Any")
+    elif op.body and op.body.schema in schemas:
+        args.append(f"body: {op.body.schema} | dict" + ("" if op.body.required else " | None = None"))
+    elif op.body:
+        args.append("body: dict | None = None")
+    query = sorted(op.query_params, key=lambda p: not p.required)
+    if query:
+        args.append("*")
+        args.extend(
+            f"{p.name}: {python_type(p.type, schemas)}" + ("" if p.required else " | None = None") for p in query
+        )
+    returns = op.response if op.response in schemas else "Record | list[Record]"
+    return ["self", *args], returns
+
+
+def _call_args(op, schemas):
+    path = op.path
+    for p in op.path_params:
+        path = path.replace("{" + p.key + "}", "{" + p.name + "}")
+    args = [q(op.method), f"f{q(path)}" if op.path_params else q(path), q(op.path), "self._token"]
+    if op.query_params:
+        args.append("params={" + ", ".join(f"{q(p.key)}: {p.name}" for p in op.query_params) + "}")
+    if op.body and op.body.kind == "multipart":
+        args.append('files={"file": file}')
+    elif op.body:
+        args.append("body=body")
+    if op.response in schemas:
+        args.append(f"model={op.response}")
+    return args
+
+
+def render_resource(resource, ops, schemas, source):
+    cls = pascal(resource)
+    used = sorted({op.response for op in ops if op.response in schemas}
+                  | {op.body.schema for op in ops if op.body and op.body.schema in schemas})
+    lines = [
+        HEADER.format(source=source),
+        f'"""\n/{resource} operations; see {PACKAGE} for how to get at them.\n"""\n',
+        "from __future__ import annotations\n",
+        "from harness.client._runtime import Record, Resource",
+    ]
+    if used:
+        lines.extend(import_lines(f"{PACKAGE}.models", used))
+    lines.append("")
+
+    for prefix, call, awaits in (("", "call", ""), ("Async", "acall", "await ")):
+        lines.append(f"\nclass {prefix}{cls}(Resource):")
+        lines.append("    __slots__ = ()")
+        for op in ops:
+            signature, returns = _signature(op, schemas)
+            lines.append("")
+            head = f"{'async ' if awaits else ''}def {op.name}"
+            lines.extend(wrap_args(head, signature, f" -> {returns}:", "    "))
+            summary = op.summary.replace('"', "'")
+            lines.append(f'        """{op.method} {op.path}' + (f": {summary}" if summary else "") + '"""')
+            lines.extend(wrap_args(f"return {awaits}self._transport.{call}", _call_args(op, schemas), "", "        "))
+        lines.append("")
+    return _with_typing(lines)
+
+
+def render_init(spec, resources, schemas, source):
+    info = spec.get("info", {})
+    groups = textwrap.fill(
+        f"Resource groups ({', '.join(resources)}) are imported on first attribute access."
+        f" Responses with a schema decode into the __slots__ models in {PACKAGE}.models,"
+        " the rest into Records; 4xx/5xx raise ApiError.",
+        width=76,
+    )
+    models = "\n".join(import_lines(f"{PACKAGE}.models", list(schemas)))
+    table = "\n".join(
+        f'    "{name}": ("{PACKAGE}.{name}", "{pascal(name)}", "Async{pascal(name)}"),' for name in resources
+    )
+    return f'''{HEADER.format(source=source)}
+"""
+Client for the {info.get("title", "API")} ({info.get("version", "")}), generated from its OpenAPI spec.
+
+    http = HttpClient(base_url, pool_size=50)       # harness.transport
+    client = Client(http)
+    auth = client.auth.login(LoginDto(phone=phone, password=password))
+    me = client.with_token(auth.access_token)      # same pooled transport
+    page = me.pickups.find_all(limit=50)           # Record: page.data, page.meta.next_cursor
+    bins = await AsyncClient(client.transport).bins.find_nearby(lat=4.05, lng=9.77)
+
+{groups}
+"""
+
+from harness.client._runtime import ApiError, BaseClient, Record, Transport
+{models}
+
+RESOURCES = {{
+{table}
+}}
+
+
+class Client(BaseClient):
+    _resources = RESOURCES
+
+
+class AsyncClient(BaseClient):
+    _resources = RESOURCES
+    _is_async = True
+'''
+
+
+def generate(spec, out, source, prefix=DEFAULT_PREFIX):
+    operations, schemas = collect(spec, prefix)
+    resources = {}
+    for op in operations:
+        resources.setdefault(op.resource, []).append(op)
+
+    os.makedirs(out, exist_ok=True)
+    files = {"__init__.py": render_init(spec, resources, schemas, source), "models.py": render_models(schemas, source)}
+    for resource, ops in resources.items():
+        files[f"{resource}.py"] = render_resource(resource, ops, schemas, source)
+    for name, text in files.items():
+        with open(os.path.join(out, name), "w") as f:
+            f.write(text)
+    return operations, schemas, sorted(files)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="generate harness/client from the OpenAPI spec")
+    parser.add_argument("--spec", default=DEFAULT_SPEC, help="spec file or URL (e.g. <BASE_URL>/api/docs-json)")
+    parser.add_argument("--out", default=DEFAULT_OUT, help="package directory to write")
+    parser.add_argument("--prefix", default=DEFAULT_PREFIX, help="path prefix already in the client's base URL")
+    args = parser.parse_args(argv)
+
+    spec = load_spec(args.spec)
+    source = os.path.basename(args.spec) if not args.spec.startswith("http") else args.spec
+    operations, schemas, files = generate(spec, args.out, source, args.prefix)
+    print(f"{len(operations)} operations, {len(schemas)} models -> {args.out} ({', '.join(files)})")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
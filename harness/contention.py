@@ -0,0 +1,105 @@
+"""
+Contention benchmark for PATCH /pickups/{id}/accept.
+
+M pickups are seeded by one household, then K agents are released at the
+same instant and each tries to accept every pickup in the same order, so
+they collide on every row. A correct server lets exactly one accept per
+pickup succeed; any pickup with more than one 200 was double-assigned.
+"""
+
+import threading
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+from harness.api import auth_headers
+from harness.client import Client
+from harness.metrics import MetricsRegistry
+
+AcceptAttempt = namedtuple("AcceptAttempt", ["agent", "pickup_id", "status"])
+
+
+def seed_pickups(http, household_token, count):
+    pickups = Client(http, household_token).pickups
+    tomorrow = (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d")
+    return [
+        pickups.create({
+            "scheduledDate": tomorrow,
+            "timeWindow": "08:00-10:00",
+            "notes": f"Contention benchmark pickup {i}",
+            "wasteType": "MIXED",
+        }).id
+        for i in range(count)
+    ]
+
+
+def _hammer(http, agent, token, pickup_ids, barrier):
+    attempts = []
+    barrier.wait()
+    for pickup_id in pickup_ids:
+        try:
+            status = http.patch(f"/pickups/{pickup_id}/accept", headers=auth_headers(token)).status_code
+        except Exception:
+            status = 0
+        attempts.append(AcceptAttempt(agent, pickup_id, status))
+    return attempts
+
+
+def run_accept_contention(http, household_token, agent_tokens, pickups):
+    """
+    Returns a result dict; agent_tokens may repeat the same token when only
+    one agent account is available (double-assignment is then still
+    visible as more than one 200 for the same pickup).
+    """
+    pickup_ids = seed_pickups(http, household_token, pickups)
+
+    accept_metrics = MetricsRegistry()
+
+    def only_accepts(timing):
+        if timing.endpoint == "/pickups/{id}/accept":
+            accept_metrics.record(timing)
+
+    agents = len(agent_tokens)
+    barrier = threading.Barrier(agents)
+    http.listeners.append(only_accepts)
+    try:
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=agents) as pool:
+            futures = [
+                pool.submit(_hammer, http, i, token, pickup_ids, barrier)
+                for i, token in enumerate(agent_tokens)
+            ]
+            attempts = [a for f in futures for a in f.result()]
+        wall_s = time.perf_counter() - start
+    finally:
+        http.listeners.remove(only_accepts)
+
+    wins = Counter(a.pickup_id for a in attempts if a.status == 200)
+    claimed = len(wins)
+
+    return {
+        "pickups": pickups,
+        "agents": agents,
+        "attempts": len(attempts),
+        "accepted": sum(1 for a in attempts if a.status == 200),
+        "rejected": sum(1 for a in attempts if a.status == 400),
+        "errors": sum(1 for a in attempts if a.status not in (200, 400)),
+        "unclaimed": pickups - claimed,
+        "double_assigned": sum(1 for n in wins.values() if n > 1),
+        "wall_s": wall_s,
+        "attempts_per_s": len(attempts) / wall_s if wall_s else 0.0,
+        "accepts_per_s": claimed / wall_s if wall_s else 0.0,
+        "latency": accept_metrics,
+    }
+
+
+def print_contention_summary(result):
+    print("\n========== ACCEPT CONTENTION ==========")
+    print(f"Pickups: {result['pickups']}, Agents: {result['agents']}, Wall time: {result['wall_s']:.2f}s")
+    print(f"Attempts: {result['attempts']} ({result['attempts_per_s']:.1f}/s)")
+    print(f"Accepted (200): {result['accepted']}, Rejected (400): {result['rejected']}, Other: {result['errors']}")
+    print(f"Pickups claimed per second: {result['accepts_per_s']:.1f}")
+    print(f"Unclaimed pickups: {result['unclaimed']}")
+    print(f"Double-assigned pickups: {result['double_assigned']}")
+    result["latency"].print_summary()
@@ -0,0 +1,195 @@
+"""
+Streaming JSONL event log and the offline aggregator that reads it back.
+
+One compact JSON object per line:
+
+    {"t": "run", ...}                                        run metadata
+    {"t": "req", "m", "e", "s", "c", "f", "d", "b", "at"}    one per HTTP request (+ "st": Server-Timing)
+    {"t": "test", "n", "ok", "msg", "d"}                     one per smoke test (ok null = skipped)
+    {"t": "flow", "u", "n", "ok", "msg", "d"}                one per load-mode flow
+    {"t": "res", "at", "requests", "server", "loop", "pg"}   one per resource sample
+    {"t": "soak", "window", "start_s", "p95", "rss_mb", ...} one per soak window
+
+EventSink is cheap to call from hot paths: it only enqueues a tuple, and a
+background thread does the JSON encoding and buffered (optionally gzip)
+writes. The queue is bounded, so a writer that falls behind slows the
+producers down instead of letting memory grow. read_events() streams the
+file back one event at a time, so a report over millions of requests runs
+in constant memory.
+"""
+
+import gzip
+import json
+import queue
+import threading
+
+from harness.load import FlowOutcome, LoadSummary
+from harness.metrics import MetricsRegistry
+from harness.resources import print_resource_summary
+from harness.servertiming import ServerTimingStats
+from harness.soak import drift_report, print_soak_summary
+from harness.transport import RequestTiming
+
+QUEUE_SIZE = 100_000
+BATCH_SIZE = 1_000
+
+_STOP = object()
+
+
+def _open(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", compresslevel=6)
+    return open(path, mode, buffering=1 << 20)
+
+
+class EventSink:
+    def __init__(self, path, **run_info):
+        self.path = path
+        self.written = 0
+        self._queue = queue.Queue(maxsize=QUEUE_SIZE)
+        self._f = _open(path, "w")
+        self._thread = threading.Thread(target=self._write_loop, name="event-sink", daemon=True)
+        self._thread.start()
+        self._queue.put({"t": "run", **run_info})
+
+    # Producers: keep these to a single put
+
+    def request(self, timing):
+        """
+        HttpClient listener.
+        """
+        self._queue.put(timing)
+
+    def test(self, name, ok, msg, duration_s=None):
+        self._queue.put({"t": "test", "n": name, "ok": ok, "msg": msg, "d": duration_s})
+
+    def flow(self, outcome):
+        self._queue.put(outcome)
+
+    def resources(self, sample):
+        self._queue.put({"t": "res", **sample})
+
+    def soak(self, window):
+        self._queue.put({"t": "soak", **window})
+
+    def close(self):
+        self._queue.put(_STOP)
+        self._thread.join()
+        self._f.close()
+
+    # Writer thread
+
+    def _write_loop(self):
+        while True:
+            batch = [self._queue.get()]
+            try:
+                while len(batch) < BATCH_SIZE:
+                    batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                pass
+            stop = batch[-1] is _STOP
+            if stop:
+                batch.pop()
+            if batch:
+                self._f.write("".join(json.dumps(_encode(e), separators=(",", ":")) + "\n" for e in batch))
+                self.written += len(batch)
+            if stop:
+                return
+
+
+def _encode(event):
+    if isinstance(event, RequestTiming):
+        encoded = {
+            "t": "req", "m": event.method, "e": event.endpoint, "s": event.status,
+            "c": round(event.connect_s, 6), "f": None if event.ttfb_s is None else round(event.ttfb_s, 6),
+            "d": round(event.total_s, 6), "b": event.bytes, "at": round(event.started_at, 6),
+        }
+        if event.server_timing:
+            encoded["st"] = event.server_timing
+        return encoded
+    if isinstance(event, FlowOutcome):
+        return {"t": "flow", "u": event.user, "n": event.flow, "ok": event.ok, "msg": event.message,
+                "d": round(event.duration_s, 6)}
+    return event
+
+
+# ========================
+# AGGREGATION
+# ========================
+
+def read_events(path):
+    with _open(path, "r") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class EventReport:
+    """
+    Everything the live summaries print, rebuilt from an event log in one
+    pass: fixed-size latency histograms per endpoint, counts per test and
+    per load flow, and only the first few distinct failure messages.
+    """
+
+    def __init__(self):
+        self.run = {}
+        self.metrics = MetricsRegistry()
+        self.server_timing = ServerTimingStats()
+        self.tests = {}  # name -> [passed, failed, skipped, last message]
+        self.flows = LoadSummary()
+        self.resources = []  # one small dict per sampler interval
+        self.soak = []  # one per soak window
+        self.events = 0
+
+    @classmethod
+    def from_file(cls, path):
+        report = cls()
+        for event in read_events(path):
+            report.add(event)
+        return report
+
+    def add(self, event):
+        self.events += 1
+        kind = event["t"]
+        if kind == "req":
+            timing = RequestTiming(
+                event["m"], event["e"], event["s"], event["c"], event["f"], event["d"], event["b"], event["at"],
+                event.get("st"),
+            )
+            self.metrics.record(timing)
+            self.server_timing.record(timing)
+        elif kind == "test":
+            row = self.tests.setdefault(event["n"], [0, 0, 0, ""])
+            row[0 if event["ok"] else 2 if event["ok"] is None else 1] += 1
+            if not event["ok"]:
+                row[3] = event["msg"]
+        elif kind == "flow":
+            self.flows.add(FlowOutcome(event["u"], event["n"], event["ok"], event["msg"], event["d"]))
+        elif kind == "res":
+            self.resources.append(event)
+        elif kind == "soak":
+            self.soak.append(event)
+        elif kind == "run":
+            self.run = event
+
+    def print_summary(self):
+        print(f"\n========== EVENT LOG: {self.events} events ==========")
+        for key, value in self.run.items():
+            if key != "t":
+                print(f"{key}: {value}")
+        if self.tests:
+            print(f"\n{'test':45} {'pass':>6} {'fail':>6} {'skip':>6}")
+            for name, (passed, failed, skipped, msg) in self.tests.items():
+                print(f"{name:45} {passed:>6} {failed:>6} {skipped:>6}" + (f"  -> {msg[:80]}" if msg else ""))
+        if self.flows.count:
+            self.flows.print_table()
+        self.metrics.print_summary()
+        self.server_timing.print_summary()
+        print_resource_summary(self.resources)
+        if self.soak:
+            print_soak_summary(drift_report(self.soak))
+
+    def failed(self):
+        if self.soak and drift_report(self.soak)["drifting"]:
+            return True
+        return any(row[1] for row in self.tests.values()) or self.flows.failures > 0
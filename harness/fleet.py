@@ -0,0 +1,374 @@
+"""
+Multi-process load fleet: one coordinator, N worker processes each driving
+its share of the virtual users, metrics merged live through shared memory.
+
+A single harness process runs out of CPU (JSON, TLS, the GIL) long before
+the API does. The fleet forks `processes` workers; each runs an ordinary
+load or scenario run for its slice of the users and records every request
+into its own slab of one SharedMemory block:
+
+    header      request/error/flow counters, first/last request time
+    endpoints   MAX_ENDPOINTS entries: "METHOD /template", connection
+                counters and, per status class and for TTFB, the index
+                of a histogram slot (0 = none yet)
+    histograms  HISTOGRAM_SLOTS LatencyHistogram layouts: count, total,
+                min, max, then BUCKET_COUNT bucket counters
+
+Every slab has exactly one writer (its worker; threads inside it take a
+local lock), and entries are published by bumping a counter after they are
+filled in, so the coordinator reads without any cross-process locking. A
+live read can be a request behind; the final one, taken after the workers
+have exited, is exact. Merging slabs is adding bucket counts, the same
+operation MetricsRegistry.merge does, so the report is the usual one.
+
+Workers also return their job's result (a LoadSummary, ScenarioResults,
+...) to the coordinator through a queue for the caller to merge. Workers
+print nothing; the coordinator prints one progress line per interval.
+"""
+
+import contextlib
+import os
+import queue
+import threading
+import time
+from array import array
+from collections import namedtuple
+from multiprocessing import get_context, shared_memory
+
+from harness.histogram import BUCKET_COUNT, LatencyHistogram, MAX_US, bucket_index
+from harness.metrics import EndpointMetrics, MetricsRegistry, status_class
+
+MAX_ENDPOINTS = 64
+HISTOGRAM_SLOTS = 160
+KEY_BYTES = 128
+KINDS = ("1xx", "2xx", "3xx", "4xx", "5xx", "error", "ttfb")
+
+# Header words
+_REQUESTS, _ERRORS, _FLOWS_OK, _FLOWS_FAILED, _ENDPOINTS, _SLOTS, _DROPPED = range(7)
+_FIRST_STARTED, _LAST_FINISHED = 14, 15  # float64
+_HEADER_WORDS = 16
+
+# Endpoint entry: key, then words
+_NEW_CONNECTIONS, _CONNECT_US, _KIND_SLOTS = 0, 1, 2
+_ENTRY_WORDS = _KIND_SLOTS + len(KINDS)
+_ENTRY_BYTES = KEY_BYTES + 8 * _ENTRY_WORDS
+
+# Histogram slot words
+_COUNT, _TOTAL_US, _MIN_US, _MAX_US, _BUCKETS = range(5)
+_SLOT_WORDS = _BUCKETS + BUCKET_COUNT
+
+_ENTRIES_AT = 8 * _HEADER_WORDS
+_SLOTS_AT = _ENTRIES_AT + MAX_ENDPOINTS * _ENTRY_BYTES
+SLAB_BYTES = _SLOTS_AT + 8 * HISTOGRAM_SLOTS * _SLOT_WORDS
+
+FleetShare = namedtuple("FleetShare", ["worker", "workers", "first_user", "users"])
+FleetRun = namedtuple("FleetRun", ["metrics", "results", "errors", "wall_s"])
+
+
+class _Slab:
+    def __init__(self, buf, index):
+        slab = buf[index * SLAB_BYTES:(index + 1) * SLAB_BYTES]
+        self.header = slab[:_ENTRIES_AT].cast("Q")
+        self.times = slab[:_ENTRIES_AT].cast("d")
+        self.entries = slab[_ENTRIES_AT:_SLOTS_AT]
+        self.slots = slab[_SLOTS_AT:].cast("Q")
+        self._views = [self.header, self.times, self.entries, self.slots, slab]
+
+    def entry(self, i):
+        at = i * _ENTRY_BYTES
+        key = bytes(self.entries[at:at + KEY_BYTES]).rstrip(b"\0").decode()
+        return key, self.entries[at + KEY_BYTES:at + _ENTRY_BYTES].cast("Q")
+
+    def histogram(self, slot):
+        base = slot * _SLOT_WORDS
+        view = self.slots[base:base + _SLOT_WORDS]
+        h = LatencyHistogram()
+        h.counts = array("Q", view[_BUCKETS:].tobytes())
+        h.count = sum(h.counts)  # consistent with the buckets even mid-write
+        h.total_us = view[_TOTAL_US]
+        h.min_us = view[_MIN_US]
+        h.max_us = view[_MAX_US]
+        return h
+
+    def release(self):
+        for view in self._views:
+            view.release()
+
+
+# ========================
+# WORKER SIDE
+# ========================
+
+class WorkerMetrics:
+    """
+    One worker's writer: an HttpClient listener (`record`) and a load-flow
+    callback (`flow`) filing into the worker's slab.
+    """
+
+    def __init__(self, name, index):
+        # Forked workers share the coordinator's resource tracker, so the
+        # block stays registered once and is unlinked by the coordinator.
+        self._shm = shared_memory.SharedMemory(name=name)
+        self._slab = _Slab(self._shm.buf, index)
+        self._entries = {}  # "METHOD endpoint" -> entry words
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        header = self._slab.header
+        cls = status_class(timing.status)
+        with self._lock:
+            header[_REQUESTS] += 1
+            if cls in ("error", "5xx"):
+                header[_ERRORS] += 1
+            entry = self._entry(f"{timing.method} {timing.endpoint}")
+            if entry is None:
+                header[_DROPPED] += 1
+                return
+            self._record_us(entry, cls, int(timing.total_s * 1_000_000))
+            if timing.ttfb_s is not None:
+                self._record_us(entry, "ttfb", int(timing.ttfb_s * 1_000_000))
+            if timing.connect_s:
+                entry[_CONNECT_US] += int(timing.connect_s * 1_000_000)
+                entry[_NEW_CONNECTIONS] += 1
+
+            times = self._slab.times
+            finished = timing.started_at + timing.total_s
+            if not times[_FIRST_STARTED] or timing.started_at < times[_FIRST_STARTED]:
+                times[_FIRST_STARTED] = timing.started_at
+            if finished > times[_LAST_FINISHED]:
+                times[_LAST_FINISHED] = finished
+
+    def flow(self, outcome):
+        with self._lock:
+            self._slab.header[_FLOWS_OK if outcome.ok else _FLOWS_FAILED] += 1
+
+    def _entry(self, key):
+        entry = self._entries.get(key)
+        if entry is not None:
+            return entry
+        header = self._slab.header
+        i = header[_ENDPOINTS]
+        if i == MAX_ENDPOINTS:
+            return None
+        at = i * _ENTRY_BYTES
+        self._slab.entries[at:at + KEY_BYTES] = key.encode()[:KEY_BYTES].ljust(KEY_BYTES, b"\0")
+        entry = self._entries[key] = self._slab.entries[at + KEY_BYTES:at + _ENTRY_BYTES].cast("Q")
+        header[_ENDPOINTS] = i + 1  # publish only once the key is written
+        return entry
+
+    def _record_us(self, entry, kind, us):
+        word = _KIND_SLOTS + KINDS.index(kind)
+        slot = entry[word]
+        header = self._slab.header
+        if not slot:
+            if header[_SLOTS] == HISTOGRAM_SLOTS:
+                header[_DROPPED] += 1
+                return
+            header[_SLOTS] += 1
+            slot = entry[word] = header[_SLOTS]
+        v = self._slab.slots
+        base = (slot - 1) * _SLOT_WORDS
+        us = min(max(us, 0), MAX_US)
+        if not v[base + _COUNT] or us < v[base + _MIN_US]:
+            v[base + _MIN_US] = us
+        if us > v[base + _MAX_US]:
+            v[base + _MAX_US] = us
+        v[base + _TOTAL_US] += us
+        v[base + _BUCKETS + bucket_index(us)] += 1
+        v[base + _COUNT] += 1
+
+    def close(self):
+        self._entries.clear()
+        self._slab.release()
+        self._shm.close()
+
+
+# ========================
+# COORDINATOR SIDE
+# ========================
+
+class SharedMetrics:
+    """
+    The SharedMemory block holding every worker's slab, and the merged
+    views of it.
+    """
+
+    def __init__(self, workers):
+        self.workers = workers
+        self.shm = shared_memory.SharedMemory(create=True, size=SLAB_BYTES * workers)
+        self._slabs = [_Slab(self.shm.buf, i) for i in range(workers)]
+
+    @property
+    def name(self):
+        return self.shm.name
+
+    def totals(self):
+        words = (_REQUESTS, _ERRORS, _FLOWS_OK, _FLOWS_FAILED, _DROPPED)
+        return [sum(slab.header[w] for slab in self._slabs) for w in words]
+
+    def latency(self):
+        """
+        Every request of every worker in one histogram.
+        """
+        merged = LatencyHistogram()
+        for slab in self._slabs:
+            for i in range(slab.header[_ENDPOINTS]):
+                _, entry = slab.entry(i)
+                for word in range(_KIND_SLOTS, _KIND_SLOTS + len(KINDS) - 1):  # all but ttfb
+                    if entry[word]:
+                        merged.merge(slab.histogram(entry[word] - 1))
+        return merged
+
+    def registry(self):
+        """
+        Everything recorded so far as one MetricsRegistry.
+        """
+        registry = MetricsRegistry()
+        for slab in self._slabs:
+            part = MetricsRegistry()
+            for i in range(slab.header[_ENDPOINTS]):
+                key, entry = slab.entry(i)
+                method, _, endpoint = key.partition(" ")
+                m = part.endpoints[(method, endpoint)] = EndpointMetrics()
+                for kind, word in zip(KINDS, range(_KIND_SLOTS, _ENTRY_WORDS)):
+                    if not entry[word]:
+                        continue
+                    h = slab.histogram(entry[word] - 1)
+                    if kind == "ttfb":
+                        m.ttfb = h
+                    else:
+                        m.by_status[kind] = h
+                m.new_connections = entry[_NEW_CONNECTIONS]
+                m.connect_us = entry[_CONNECT_US]
+            if slab.header[_REQUESTS]:
+                part.first_started_at = slab.times[_FIRST_STARTED]
+                part.last_finished_at = slab.times[_LAST_FINISHED]
+            registry.merge(part)
+        return registry
+
+    def close(self):
+        for slab in self._slabs:
+            slab.release()
+        self.shm.close()
+        self.shm.unlink()
+
+
+def shares(users, workers):
+    """
+    Split `users` into contiguous slices, one per worker, sizes differing
+    by at most one.
+    """
+    first = 0
+    for worker in range(workers):
+        n = users // workers + (worker < users % workers)
+        yield FleetShare(worker, workers, first, n)
+        first += n
+
+
+def _worker_main(job, share, name, results, args):
+    metrics = WorkerMetrics(name, share.worker)
+    try:
+        with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+            result = job(share, metrics, *args)
+        results.put((share.worker, result, None))
+    except BaseException as e:
+        results.put((share.worker, None, f"{type(e).__name__}: {e}"))
+    finally:
+        metrics.close()
+
+
+def run_fleet(job, users, processes, *args, interval=2.0):
+    """
+    Run `job(share, metrics, *args)` in `processes` forked workers, each
+    given its FleetShare of `users`; the job must add `metrics.record` to
+    its HttpClient's listeners (and may pass `metrics.flow` as a load
+    on_outcome). Prints a merged progress line every `interval` seconds
+    and returns a FleetRun: the merged MetricsRegistry, the jobs' return
+    values in worker order, {worker: error} for workers that raised or
+    exited without a result, and the wall time.
+    """
+    processes = max(1, min(processes, users))
+    shared = SharedMetrics(processes)
+    ctx = get_context("fork")
+    results = ctx.Queue()
+    procs = [
+        ctx.Process(target=_worker_main, args=(job, share, shared.name, results, args), name=f"fleet-{share.worker}")
+        for share in shares(users, processes)
+    ]
+    returned, errors = {}, {}
+    # workers found exited with code 0 but no result at the previous check
+    quiet = set()
+    start = time.perf_counter()
+    previous = (0, LatencyHistogram(), start)
+    try:
+        for p in procs:
+            p.start()
+        while len(returned) + len(errors) < processes:
+            try:
+                _record(results.get(timeout=interval), returned, errors)
+            except queue.Empty:
+                # a worker can post its result and exit right after the get
+                # times out: take what is queued before judging exit codes
+                while True:
+                    try:
+                        _record(results.get_nowait(), returned, errors)
+                    except queue.Empty:
+                        break
+                for i, p in enumerate(procs):
+                    if p.exitcode is None or i in returned or i in errors:
+                        continue
+                    if p.exitcode != 0:
+                        # died without reporting (killed, out of memory)
+                        errors[i] = f"exited with code {p.exitcode}"
+                    elif i in quiet:
+                        # a clean exit whose result never arrived (e.g. it failed to pickle)
+                        errors[i] = "exited without a result"
+                    else:
+                        quiet.add(i)
+                previous = _print_progress(shared, processes - len(returned) - len(errors), previous, start)
+        for p in procs:
+            p.join()
+        return FleetRun(shared.registry(), [returned[i] for i in sorted(returned)], errors, time.perf_counter() - start)
+    finally:
+        for p in procs:
+            if p.is_alive():
+                p.terminate()
+        shared.close()
+
+
+def _record(item, returned, errors):
+    worker, result, error = item
+    if error is None:
+        returned[worker] = result
+    else:
+        errors[worker] = error
+
+
+def _print_progress(shared, running, previous, start):
+    """
+    One line: totals so far, and rate and percentiles over the last interval.
+    """
+    requests, errors, flows_ok, flows_failed, dropped = shared.totals()
+    latency = shared.latency()
+    last_requests, last_latency, last_at = previous
+    now = time.perf_counter()
+
+    window = LatencyHistogram()
+    window.counts = array("Q", (a - b for a, b in zip(latency.counts, last_latency.counts)))
+    window.count = sum(window.counts)
+    window.max_us = latency.max_us
+    rate = (requests - last_requests) / (now - last_at)
+    print(
+        f"[{now - start:7.1f}s] {running} running  {requests} requests ({rate:.0f}/s)"
+        f"  errors {errors / requests if requests else 0:.1%}"
+        f"  p50 {window.percentile(50) * 1000:.1f} ms  p99 {window.percentile(99) * 1000:.1f} ms"
+        f"  flows {flows_ok} ok / {flows_failed} failed" + (f"  ({dropped} dropped)" if dropped else ""),
+        flush=True,
+    )
+    return requests, latency, now
+
+
+def print_fleet_errors(errors):
+    for worker, error in sorted(errors.items()):
+        print(f"Worker {worker} failed: {error}")
+
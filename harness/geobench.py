@@ -0,0 +1,112 @@
+"""
+Geo workload: what the agent map screen asks for, full list vs spatial queries.
+
+Query points are drawn around the seeded cities (an agent somewhere in
+Douala or Yaoundé), and each one is sent as:
+
+  - the full bin list the map used to download on every open,
+  - the k nearest bins, the bins within a radius, and the bins in a
+    viewport-sized box around the agent (the GiST-backed endpoints),
+  - the nearest alerts, when a token is given.
+
+Latency goes into a LatencyHistogram per query kind, alongside the response
+size and how many rows came back, so the cost of shipping the whole table
+is visible next to the answer the screen actually needed.
+"""
+
+import math
+import random
+
+from harness.api import assert_status, auth_headers
+from harness.histogram import LatencyHistogram
+from harness.seed import CITIES, KM_PER_DEGREE, city_point
+
+
+def count_bins(http):
+    resp = http.get("/bins")
+    assert_status(resp, 200, "bins")
+    return len(resp.json())
+
+
+def geo_queries(rng, cities, k, radius_m, viewport_km):
+    """
+    {kind: (path, params)} for one random agent position.
+    """
+    lat, lng = city_point(rng, rng.choice(cities))
+    half_lat = viewport_km / 2 / KM_PER_DEGREE
+    half_lng = viewport_km / 2 / (KM_PER_DEGREE * math.cos(math.radians(lat)))
+    return {
+        "full list": ("/bins", {}),
+        f"nearest {k}": ("/bins/nearby", {"lat": lat, "lng": lng, "limit": k}),
+        f"within {radius_m:.0f} m": ("/bins/nearby", {"lat": lat, "lng": lng, "radius": radius_m, "limit": 500}),
+        f"viewport {viewport_km:g} km": ("/bins/within", {
+            "minLat": lat - half_lat, "minLng": lng - half_lng,
+            "maxLat": lat + half_lat, "maxLng": lng + half_lng,
+        }),
+        "alerts nearest": ("/alerts/nearby", {"lat": lat, "lng": lng, "limit": k}),
+    }
+
+
+def run_geo_workload(http, requests, cities=tuple(CITIES), k=20, radius_m=1000.0, viewport_km=2.0,
+                     token=None, full_list_every=10, seed=0):
+    """
+    `requests` agent positions; the full list is only fetched for every
+    `full_list_every`-th one (it is the slow part). Alerts need `token`.
+    Returns {kind: {"latency": LatencyHistogram, "bytes": int, "rows": int}},
+    bytes and rows being per-response means.
+    """
+    rng = random.Random(seed)
+    results = {}
+    headers = auth_headers(token)
+    timings = []
+    http.listeners.append(timings.append)
+    try:
+        for i in range(requests):
+            for kind, (path, params) in geo_queries(rng, cities, k, radius_m, viewport_km).items():
+                if kind == "full list" and i % full_list_every:
+                    continue
+                if path.startswith("/alerts") and not token:
+                    continue
+                timings.clear()
+                resp = http.get(path, params=params, headers=headers)
+                assert_status(resp, 200, f"{kind} ({path})")
+                r = results.setdefault(kind, {"latency": LatencyHistogram(), "bytes": 0, "rows": 0})
+                r["latency"].record(timings[-1].total_s)
+                r["bytes"] += timings[-1].bytes
+                r["rows"] += len(resp.json())
+    finally:
+        http.listeners.remove(timings.append)
+    for r in results.values():
+        r["bytes"] //= max(r["latency"].count, 1)
+        r["rows"] //= max(r["latency"].count, 1)
+    return results
+
+
+def geo_bench_report(bins, results):
+    return {
+        "bins": bins,
+        "queries": {
+            kind: {
+                "count": r["latency"].count,
+                "mean": r["latency"].mean(),
+                "p50": r["latency"].percentile(50),
+                "p99": r["latency"].percentile(99),
+                "response_bytes": r["bytes"],
+                "rows": r["rows"],
+                "histogram": r["latency"].to_dict(),
+            }
+            for kind, r in results.items()
+        },
+    }
+
+
+def print_geo_bench(bins, results):
+    print(f"\n========== GEO QUERIES OVER {bins} BINS (ms) ==========")
+    print(f"{'query':22} {'count':>6} {'p50':>8} {'p99':>8} {'rows':>7} {'bytes':>10}")
+    for kind, r in results.items():
+        h = r["latency"]
+        print(
+            f"{kind:22} {h.count:>6} {h.percentile(50) * 1000:>8.1f} {h.percentile(99) * 1000:>8.1f}"
+            f" {r['rows']:>7} {r['bytes']:>10}"
+        )
+    print("=" * 60)
@@ -0,0 +1,125 @@
+"""
+Fixed-memory latency histogram with HDR-style log-linear buckets.
+
+Values are recorded in whole microseconds. Below 2**SUB_BITS every value
+has its own bucket; above that each power-of-two range is split into
+2**(SUB_BITS - 1) equal buckets, so the relative error of any reported
+value stays under 1 / 2**(SUB_BITS - 1) (about 0.8%) all the way up to
+MAX_US. Two histograms merge by adding their bucket counts, which is what
+lets threads, processes or separate runs be combined after the fact.
+"""
+
+import math
+from array import array
+
+SUB_BITS = 8
+MAX_US = 3_600_000_000  # one hour; anything slower is clamped
+
+_SUB_COUNT = 1 << SUB_BITS
+_HALF = _SUB_COUNT >> 1
+
+
+def bucket_index(us):
+    if us < _SUB_COUNT:
+        return us
+    shift = us.bit_length() - SUB_BITS
+    top = us >> shift
+    return _SUB_COUNT + (shift - 1) * _HALF + (top - _HALF)
+
+
+def bucket_bounds(index):
+    """
+    Inclusive [low, high] microsecond range covered by a bucket.
+    """
+    if index < _SUB_COUNT:
+        return index, index
+    k = index - _SUB_COUNT
+    shift = k // _HALF + 1
+    top = k % _HALF + _HALF
+    return top << shift, ((top + 1) << shift) - 1
+
+
+BUCKET_COUNT = bucket_index(MAX_US) + 1
+
+
+class LatencyHistogram:
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self):
+        self.counts = array("Q", bytes(8 * BUCKET_COUNT))
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, seconds):
+        self.record_us(int(seconds * 1_000_000))
+
+    def record_us(self, us, n=1):
+        us = min(max(us, 0), MAX_US)
+        self.counts[bucket_index(us)] += n
+        if self.count == 0 or us < self.min_us:
+            self.min_us = us
+        if us > self.max_us:
+            self.max_us = us
+        self.count += n
+        self.total_us += us * n
+
+    def merge(self, other):
+        if other.count == 0:
+            return self
+        counts = self.counts
+        for i, c in enumerate(other.counts):
+            if c:
+                counts[i] += c
+        if self.count == 0 or other.min_us < self.min_us:
+            self.min_us = other.min_us
+        self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+        return self
+
+    def percentile(self, p):
+        """
+        Latency in seconds at percentile p (0-100). Reports the upper edge
+        of the bucket holding the target rank, capped at the exact max.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, math.ceil(self.count * p / 100))
+        seen = 0
+        for i, c in enumerate(self.counts):
+            if c:
+                seen += c
+                if seen >= rank:
+                    return min(bucket_bounds(i)[1], self.max_us) / 1_000_000
+        return self.max_us / 1_000_000
+
+    def mean(self):
+        return self.total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def to_dict(self):
+        """
+        Sparse, JSON-friendly form: only non-empty buckets are kept.
+        """
+        return {
+            "sub_bits": SUB_BITS,
+            "count": self.count,
+            "total_us": self.total_us,
+            "min_us": self.min_us,
+            "max_us": self.max_us,
+            "buckets": {str(i): c for i, c in enumerate(self.counts) if c},
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("sub_bits", SUB_BITS) != SUB_BITS:
+            raise ValueError(f"Histogram was recorded with sub_bits={data['sub_bits']}, expected {SUB_BITS}")
+        h = cls()
+        for i, c in data["buckets"].items():
+            h.counts[int(i)] = c
+        h.count = data["count"]
+        h.total_us = data["total_us"]
+        h.min_us = data["min_us"]
+        h.max_us = data["max_us"]
+        return h
@@ -0,0 +1,125 @@
+"""
+Client-side conditional GET cache.
+
+The API answers its public bin, education and survey reads with ETag and
+Last-Modified validators (and `Cache-Control: public, no-cache`). With a
+ConditionalCache on an HttpClient, a GET whose response was seen before is
+sent with If-None-Match / If-Modified-Since; a 304 then costs a status line
+instead of the body, and the cached body is handed to the caller as a
+normal 200. Listeners still see the 304, so the latency tables show
+revalidations as their own "3xx" row.
+
+Entries are keyed by URL, query parameters and Authorization header, and
+evicted least recently used first past `max_entries` or `max_bytes`.
+"""
+
+import threading
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ConditionalCache:
+    def __init__(self, max_entries, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.requests = 0
+        self.not_modified = 0
+        self.stored = 0
+        self.evictions = 0
+        self.bytes_saved = 0
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def conditional(self, url, kwargs):
+        """
+        Called before a GET; returns the cache key and the request kwargs,
+        with validators added when the response is cached.
+        """
+        headers = kwargs.get("headers") or {}
+        key = (url, repr(sorted((kwargs.get("params") or {}).items())), headers.get("Authorization"))
+        with self._lock:
+            self.requests += 1
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+        if entry is None or "If-None-Match" in headers or "If-Modified-Since" in headers:
+            return key, kwargs
+        validators = {}
+        if entry["etag"]:
+            validators["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            validators["If-Modified-Since"] = entry["last_modified"]
+        return key, dict(kwargs, headers=dict(headers, **validators))
+
+    def complete(self, key, resp):
+        """
+        Called with the response to a conditional() request: a 304 is
+        filled in from the cache and returned as a 200, a 200 carrying
+        validators is stored.
+        """
+        if resp.status_code == 304:
+            with self._lock:
+                entry = self._entries.get(key)
+            if entry is None:
+                return resp
+            resp.status_code = 200
+            resp.reason = "OK (revalidated)"
+            resp._content = entry["content"]
+            resp.encoding = entry["encoding"]
+            if entry["content_type"]:
+                resp.headers["Content-Type"] = entry["content_type"]
+            with self._lock:
+                self.not_modified += 1
+                self.bytes_saved += len(entry["content"])
+            return resp
+        if resp.status_code != 200 or "no-store" in resp.headers.get("Cache-Control", ""):
+            return resp
+        etag, last_modified = resp.headers.get("ETag"), resp.headers.get("Last-Modified")
+        if not etag and not last_modified:
+            return resp
+        content = resp.content
+        if len(content) > self.max_bytes:
+            return resp
+        with self._lock:
+            self._drop(key)
+            self._entries[key] = {
+                "etag": etag,
+                "last_modified": last_modified,
+                "content": content,
+                "encoding": resp.encoding,
+                "content_type": resp.headers.get("Content-Type"),
+            }
+            self._bytes += len(content)
+            self.stored += 1
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                self._drop(next(iter(self._entries)))
+                self.evictions += 1
+        return resp
+
+    def _drop(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry["content"])
+
+    def summary(self):
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "not_modified": self.not_modified,
+                "hit_ratio": self.not_modified / self.requests if self.requests else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "stored": self.stored,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+            }
+
+    def print_summary(self):
+        s = self.summary()
+        print(
+            f"HTTP cache: {s['requests']} GETs, {s['not_modified']} answered 304 ({s['hit_ratio']:.1%}),"
+            f" {s['bytes_saved'] / 1024:.1f} KiB not transferred; {s['entries']} entries"
+            f" ({s['bytes'] / 1024:.1f} KiB), {s['evictions']} evicted"
+        )
@@ -0,0 +1,157 @@
+"""
+Concurrent load mode: many synthetic users driving the test_* flows at once.
+
+The flows are plain blocking functions written against TestRunner, so each
+one runs on a thread pool while an asyncio event loop schedules users and
+caps how many are in flight. Every VirtualUser carries its own context, so
+tokens and ids never leak between users the way runner.context would.
+"""
+
+import asyncio
+import contextlib
+import os
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+FlowOutcome = namedtuple("FlowOutcome", ["user", "flow", "ok", "message", "duration_s"])
+
+
+class LoadSummary:
+    """
+    Running per-flow totals. Memory depends on the number of flows and
+    users, not on how many outcomes have been added.
+    """
+
+    def __init__(self):
+        self.by_flow = {}  # flow -> [ok, failed, total duration, max duration]
+        self.errors = Counter()
+        self.users = set()
+        self.failed_users = set()
+        self.count = 0
+        self.failures = 0
+
+    def add(self, outcome):
+        row = self.by_flow.setdefault(outcome.flow, [0, 0, 0.0, 0.0])
+        row[0 if outcome.ok else 1] += 1
+        row[2] += outcome.duration_s
+        row[3] = max(row[3], outcome.duration_s)
+        self.users.add(outcome.user)
+        self.count += 1
+        if not outcome.ok:
+            self.failures += 1
+            self.failed_users.add(outcome.user)
+            self.errors[(outcome.flow, outcome.message[:120])] += 1
+
+    def merge(self, other):
+        """
+        Fold in another summary, e.g. a fleet worker's; user indexes must
+        not overlap.
+        """
+        for name, (ok, failed, total, worst) in other.by_flow.items():
+            row = self.by_flow.setdefault(name, [0, 0, 0.0, 0.0])
+            row[0] += ok
+            row[1] += failed
+            row[2] += total
+            row[3] = max(row[3], worst)
+        self.errors.update(other.errors)
+        self.users |= other.users
+        self.failed_users |= other.failed_users
+        self.count += other.count
+        self.failures += other.failures
+        return self
+
+    def completed_users(self):
+        return len(self.users - self.failed_users)
+
+    def print_table(self):
+        print(f"{'flow':35} {'ok':>6} {'fail':>6} {'avg s':>8} {'max s':>8}")
+        for name, (ok, failed, total, worst) in self.by_flow.items():
+            print(f"{name:35} {ok:>6} {failed:>6} {total / (ok + failed):>8.2f} {worst:>8.2f}")
+        if self.errors:
+            print("\nTop failures:")
+            for (flow, msg), count in self.errors.most_common(10):
+                print(f"  {count:>5} x {flow}: {msg}")
+
+
+class VirtualUser:
+    """
+    Stand-in for TestRunner inside a load run: the flows only touch
+    `r.context` and `r.http`, so that is all a virtual user provides.
+    """
+
+    def __init__(self, index, http, context=None):
+        self.index = index
+        self.http = http
+        self.context = dict(context or {})
+
+
+def run_flow(user, name, func):
+    start = time.perf_counter()
+    try:
+        func(user)
+        return FlowOutcome(user.index, name, True, "", time.perf_counter() - start)
+    except AssertionError as e:
+        msg = str(e) or "Assertion failed"
+    except Exception as e:
+        msg = f"Unexpected error: {e}"
+    return FlowOutcome(user.index, name, False, msg, time.perf_counter() - start)
+
+
+async def _run_user(user, flows, loop, pool, sem, start_delay, summary, on_outcome):
+    if start_delay:
+        await asyncio.sleep(start_delay)
+    async with sem:
+        for name, func in flows:
+            outcome = await loop.run_in_executor(pool, run_flow, user, name, func)
+            summary.add(outcome)
+            if on_outcome is not None:
+                on_outcome(outcome)
+            if not outcome.ok:
+                # Later flows depend on what earlier ones put in the context.
+                break
+
+
+async def run_load(flows, users, concurrency, http, base_context=None, ramp_up=0.0, on_outcome=None, first_user=0):
+    """
+    Run `flows` ([(name, func), ...]) in order for `users` virtual users,
+    numbered from `first_user`, with at most `concurrency` users active at
+    a time. Users are started evenly over `ramp_up` seconds. Every
+    FlowOutcome is folded into the returned LoadSummary and passed to
+    on_outcome (e.g. an event sink).
+    """
+    loop = asyncio.get_running_loop()
+    sem = asyncio.Semaphore(concurrency)
+    summary = LoadSummary()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        await asyncio.gather(*(
+            _run_user(
+                VirtualUser(first_user + i, http, base_context),
+                flows, loop, pool, sem,
+                ramp_up * i / users if users else 0.0,
+                summary, on_outcome,
+            )
+            for i in range(users)
+        ))
+    return summary
+
+
+def run_load_quietly(flows, users, concurrency, http, base_context=None, ramp_up=0.0, on_outcome=None, first_user=0):
+    """
+    Blocking wrapper around run_load. The flows print every response body,
+    which is noise at load-test volume, so stdout is discarded for the run.
+    Returns (summary, wall_time_s).
+    """
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        summary = asyncio.run(run_load(flows, users, concurrency, http, base_context, ramp_up, on_outcome, first_user))
+    return summary, time.perf_counter() - start
+
+
+def print_load_summary(summary, users, concurrency, wall_s):
+    print("\n========== LOAD SUMMARY ==========")
+    print(f"Users: {users}, Concurrency: {concurrency}, Wall time: {wall_s:.2f}s")
+    summary.print_table()
+    completed = summary.completed_users()
+    print(f"\nUsers completing every flow: {completed}/{users} ({completed / wall_s:.2f} users/s)")
+    print("==================================")
@@ -0,0 +1,176 @@
+"""
+Per-endpoint latency metrics built on LatencyHistogram.
+
+MetricsRegistry is an HttpClient listener: it files every RequestTiming
+under (method, endpoint template) and status class ("2xx", "4xx", "5xx",
+"error" for requests that never got a response). Memory is fixed per
+endpoint no matter how many requests are recorded, and registries merge,
+so per-thread or per-process registries can be combined into one report.
+"""
+
+import json
+import threading
+
+from harness.histogram import LatencyHistogram
+
+PERCENTILES = (50, 90, 99, 99.9)
+
+
+def status_class(status):
+    if not status:
+        return "error"
+    return f"{status // 100}xx"
+
+
+class EndpointMetrics:
+    __slots__ = ("by_status", "ttfb", "new_connections", "connect_us")
+
+    def __init__(self):
+        self.by_status = {}
+        self.ttfb = LatencyHistogram()
+        self.new_connections = 0
+        self.connect_us = 0
+
+    def latency(self):
+        """
+        Total latency across every status class.
+        """
+        merged = LatencyHistogram()
+        for h in self.by_status.values():
+            merged.merge(h)
+        return merged
+
+    def merge(self, other):
+        for cls, h in other.by_status.items():
+            self.by_status.setdefault(cls, LatencyHistogram()).merge(h)
+        self.ttfb.merge(other.ttfb)
+        self.new_connections += other.new_connections
+        self.connect_us += other.connect_us
+        return self
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self.endpoints = {}
+        self.first_started_at = None
+        self.last_finished_at = None
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        key = (timing.method, timing.endpoint)
+        with self._lock:
+            m = self.endpoints.get(key)
+            if m is None:
+                m = self.endpoints[key] = EndpointMetrics()
+            cls = status_class(timing.status)
+            h = m.by_status.get(cls)
+            if h is None:
+                h = m.by_status[cls] = LatencyHistogram()
+            h.record(timing.total_s)
+            if timing.ttfb_s is not None:
+                m.ttfb.record(timing.ttfb_s)
+            if timing.connect_s:
+                m.new_connections += 1
+                m.connect_us += int(timing.connect_s * 1_000_000)
+
+            finished = timing.started_at + timing.total_s
+            if self.first_started_at is None or timing.started_at < self.first_started_at:
+                self.first_started_at = timing.started_at
+            if self.last_finished_at is None or finished > self.last_finished_at:
+                self.last_finished_at = finished
+
+    def merge(self, other):
+        with self._lock:
+            for key, m in other.endpoints.items():
+                self.endpoints.setdefault(key, EndpointMetrics()).merge(m)
+            if other.first_started_at is not None:
+                if self.first_started_at is None or other.first_started_at < self.first_started_at:
+                    self.first_started_at = other.first_started_at
+                if self.last_finished_at is None or other.last_finished_at > self.last_finished_at:
+                    self.last_finished_at = other.last_finished_at
+        return self
+
+    def elapsed_s(self):
+        if self.first_started_at is None:
+            return 0.0
+        return max(self.last_finished_at - self.first_started_at, 1e-9)
+
+    # ========================
+    # REPORTING
+    # ========================
+
+    def report(self):
+        """
+        Summary numbers per endpoint, plus the raw histograms so an exported
+        report can be merged with another one later.
+        """
+        elapsed = self.elapsed_s()
+        endpoints = []
+        for (method, endpoint), m in sorted(self.endpoints.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+            total = m.latency()
+            errors = sum(h.count for cls, h in m.by_status.items() if cls in ("error", "5xx"))
+            endpoints.append({
+                "method": method,
+                "endpoint": endpoint,
+                **_latency_stats(total),
+                "throughput_rps": total.count / elapsed if elapsed else 0.0,
+                "error_rate": errors / total.count if total.count else 0.0,
+                "new_connections": m.new_connections,
+                "connect_avg_s": m.connect_us / m.new_connections / 1_000_000 if m.new_connections else 0.0,
+                "ttfb": {**_latency_stats(m.ttfb), "histogram": m.ttfb.to_dict()},
+                "by_status": {
+                    cls: {**_latency_stats(h), "histogram": h.to_dict()}
+                    for cls, h in sorted(m.by_status.items())
+                },
+            })
+        return {"elapsed_s": elapsed, "endpoints": endpoints}
+
+    def export_json(self, path):
+        with open(path, "w") as f:
+            json.dump(self.report(), f, indent=2)
+
+    @classmethod
+    def from_report(cls, data):
+        registry = cls()
+        for e in data["endpoints"]:
+            m = registry.endpoints[(e["method"], e["endpoint"])] = EndpointMetrics()
+            for status, s in e["by_status"].items():
+                m.by_status[status] = LatencyHistogram.from_dict(s["histogram"])
+            m.ttfb = LatencyHistogram.from_dict(e["ttfb"]["histogram"])
+            m.new_connections = e["new_connections"]
+            m.connect_us = int(e["connect_avg_s"] * e["new_connections"] * 1_000_000)
+        if data["endpoints"]:
+            registry.first_started_at = 0.0
+            registry.last_finished_at = data["elapsed_s"]
+        return registry
+
+    def print_summary(self):
+        report = self.report()
+        if not report["endpoints"]:
+            return
+        print(f"\n========== REQUEST LATENCY (ms) over {report['elapsed_s']:.2f}s ==========")
+        print(
+            f"{'endpoint':42} {'n':>6} {'rps':>7} {'err%':>6} {'conn':>5} {'ttfb50':>7}"
+            f" {'p50':>7} {'p90':>7} {'p99':>7} {'p99.9':>7} {'max':>7}"
+        )
+        for e in report["endpoints"]:
+            print(
+                f"{e['method'] + ' ' + e['endpoint']:42} {e['count']:>6} {e['throughput_rps']:>7.1f}"
+                f" {e['error_rate'] * 100:>6.1f} {e['new_connections']:>5} {e['ttfb']['p50'] * 1000:>7.1f}"
+                + _percentile_columns(e)
+            )
+            if len(e["by_status"]) > 1:
+                for status, s in e["by_status"].items():
+                    print(f"{'  ' + status:42} {s['count']:>6} {'':>7} {'':>6} {'':>5} {'':>7}" + _percentile_columns(s))
+        print("=" * 60)
+
+
+def _latency_stats(h):
+    stats = {"count": h.count, "mean": h.mean(), "max": h.max_us / 1_000_000}
+    for p in PERCENTILES:
+        stats[f"p{p:g}"] = h.percentile(p)
+    return stats
+
+
+def _percentile_columns(stats):
+    return "".join(f" {stats[k] * 1000:>7.1f}" for k in ("p50", "p90", "p99", "p99.9", "max"))
@@ -0,0 +1,206 @@
+"""
+Open-loop (constant arrival rate) load generator.
+
+The closed-loop runners wait for a response before sending the next
+request, so a slow server quietly lowers the offered load and the queueing
+it causes never shows up in the numbers (coordinated omission). Here
+requests are fired on a fixed schedule derived from a rate profile,
+whatever the server is doing:
+
+  - latency is measured from the *intended* send time, so time spent
+    waiting behind a slow server counts;
+  - a request that cannot be sent because `max_in_flight` are already
+    outstanding is dropped and counted, not silently delayed;
+  - a request that goes out more than `late_after_s` behind schedule is
+    counted as late (the generator itself could not keep up).
+
+Results are kept per time window, which is what shows where the server
+saturates as a step or ramp profile pushes the rate up.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.histogram import LatencyHistogram
+
+# ========================
+# RATE PROFILES
+# ========================
+
+PROFILE_HELP = (
+    "constant:RPS | ramp:FROM-TO (over the whole run) | step:START,INCREMENT,EVERY_S"
+    " | spike:BASE,PEAK,AT_S,FOR_S"
+)
+
+
+def parse_profile(spec, duration):
+    """
+    Turn a profile spec (see PROFILE_HELP) into rate(t) -> requests/second.
+    """
+    kind, _, params = spec.partition(":")
+    try:
+        if kind == "constant":
+            rps = float(params)
+            return lambda t: rps
+        if kind == "ramp":
+            low, high = (float(x) for x in params.split("-"))
+            return lambda t: low + (high - low) * min(t / duration, 1.0)
+        if kind == "step":
+            start, increment, every = (float(x) for x in params.split(","))
+            return lambda t: start + increment * int(t // every)
+        if kind == "spike":
+            base, peak, at, length = (float(x) for x in params.split(","))
+            return lambda t: peak if at <= t < at + length else base
+    except ValueError:
+        pass
+    raise ValueError(f"Bad load profile {spec!r}; expected {PROFILE_HELP}")
+
+
+def schedule(rate, duration):
+    """
+    Intended send offsets (seconds from start) for rate(t) over `duration`.
+    """
+    t = 0.0
+    while t < duration:
+        r = rate(t)
+        if r <= 0:
+            t += 0.01
+            continue
+        yield t
+        t += 1.0 / r
+
+
+# ========================
+# GENERATOR
+# ========================
+
+class Window:
+    __slots__ = ("start_s", "target_rps", "offered", "sent", "dropped", "late", "errors", "latency", "service")
+
+    def __init__(self, start_s, target_rps):
+        self.start_s = start_s
+        self.target_rps = target_rps
+        self.offered = 0
+        self.sent = 0
+        self.dropped = 0
+        self.late = 0
+        self.errors = 0
+        self.latency = LatencyHistogram()  # from intended send time
+        self.service = LatencyHistogram()  # from actual send time
+
+
+def run_open_loop(call, rate, duration, max_in_flight=200, window_s=1.0, late_after_s=0.01):
+    """
+    Fire call() -> HTTP status on the schedule of rate(t) for `duration`
+    seconds. Returns the list of Windows, in time order.
+    """
+    windows = {}
+    lock = threading.Lock()
+    in_flight = [0]
+
+    def fire(intended, window):
+        sent = time.perf_counter()
+        try:
+            status = call()
+        except Exception:
+            status = 0
+        done = time.perf_counter()
+        with lock:
+            in_flight[0] -= 1
+            if sent - intended > late_after_s:
+                window.late += 1
+            if not status or status >= 500:
+                window.errors += 1
+            window.latency.record(done - intended)
+            window.service.record(done - sent)
+
+    with ThreadPoolExecutor(max_workers=max_in_flight) as pool:
+        start = time.perf_counter()
+        for offset in schedule(rate, duration):
+            intended = start + offset
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                time.sleep(delay)
+
+            index = int(offset // window_s)
+            window = windows.get(index)
+            if window is None:
+                window = windows[index] = Window(index * window_s, rate(index * window_s))
+            with lock:
+                window.offered += 1
+                if in_flight[0] >= max_in_flight:
+                    window.dropped += 1
+                    continue
+                in_flight[0] += 1
+                window.sent += 1
+            pool.submit(fire, intended, window)
+    return [windows[i] for i in sorted(windows)]
+
+
+def saturation_point(windows, slo_s):
+    """
+    The first window where the server stopped keeping up: requests were
+    dropped, p99 broke the SLO, or fewer than 90% of the offered requests
+    completed without error. None if every window was healthy.
+    """
+    for w in windows:
+        completed = w.latency.count - w.errors
+        if w.dropped or w.latency.percentile(99) > slo_s or completed < 0.9 * w.offered:
+            return w
+    return None
+
+
+# ========================
+# REPORTING
+# ========================
+
+def open_loop_report(windows, window_s, slo_s):
+    saturated = saturation_point(windows, slo_s)
+    return {
+        "window_s": window_s,
+        "slo_s": slo_s,
+        "saturated_at_rps": saturated.target_rps if saturated else None,
+        "windows": [
+            {
+                "start_s": w.start_s,
+                "target_rps": w.target_rps,
+                "offered": w.offered,
+                "sent": w.sent,
+                "dropped": w.dropped,
+                "late": w.late,
+                "errors": w.errors,
+                "achieved_rps": (w.latency.count - w.errors) / window_s,
+                "p50": w.latency.percentile(50),
+                "p99": w.latency.percentile(99),
+                "service_p99": w.service.percentile(99),
+                "max": w.latency.max_us / 1_000_000,
+                "histogram": w.latency.to_dict(),
+            }
+            for w in windows
+        ],
+    }
+
+
+def print_open_loop_summary(report, target):
+    print(f"\n========== OPEN LOOP: {target} (latency from intended send, ms) ==========")
+    print(
+        f"{'t s':>6} {'target':>7} {'offered':>7} {'ok/s':>7} {'p50':>8} {'p99':>8}"
+        f" {'svc p99':>8} {'max':>8} {'late':>5} {'drop':>5} {'err':>5}"
+    )
+    for w in report["windows"]:
+        print(
+            f"{w['start_s']:>6.0f} {w['target_rps']:>7.0f} {w['offered']:>7} {w['achieved_rps']:>7.1f}"
+            f" {w['p50'] * 1000:>8.1f} {w['p99'] * 1000:>8.1f} {w['service_p99'] * 1000:>8.1f}"
+            f" {w['max'] * 1000:>8.1f} {w['late']:>5} {w['dropped']:>5} {w['errors']:>5}"
+        )
+    totals = {k: sum(w[k] for w in report["windows"]) for k in ("offered", "sent", "dropped", "late", "errors")}
+    print(
+        f"\nOffered {totals['offered']}, sent {totals['sent']}, dropped {totals['dropped']},"
+        f" late {totals['late']}, errors {totals['errors']}"
+    )
+    if report["saturated_at_rps"] is None:
+        print(f"No saturation seen (p99 stayed under {report['slo_s'] * 1000:.0f} ms, nothing dropped)")
+    else:
+        print(f"Saturation at ~{report['saturated_at_rps']:.0f} rps (SLO p99 {report['slo_s'] * 1000:.0f} ms)")
+    print("=" * 60)
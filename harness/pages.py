@@ -0,0 +1,106 @@
+"""
+Lazy iteration over the keyset-paginated list endpoints.
+
+Those endpoints answer {"data": [...], "meta": {"limit", "nextCursor"}};
+the next page is requested with ?cursor=<nextCursor> until it is null.
+iter_pages() is a generator, so nothing beyond the page being consumed is
+fetched unless asked for. With prefetch the request for the following page
+is already in flight (on one background thread) while the caller works on
+the current one. Abandoning the generator early waits for at most that one
+outstanding request.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.api import assert_status
+from harness.histogram import LatencyHistogram
+from harness.transport import endpoint_template
+
+
+def iter_pages(http, path, params=None, headers=None, limit=50, prefetch=True, name=None, max_pages=None):
+    """
+    Yield each page's list of items, following meta.nextCursor, for at
+    most `max_pages` pages; nothing is prefetched past the last of them.
+    An endpoint that still returns a bare list is yielded as a single page.
+    """
+    params = dict(params or {}, limit=limit)
+
+    def fetch(cursor):
+        resp = http.get(path, params=dict(params, cursor=cursor) if cursor else params, headers=headers)
+        assert_status(resp, 200, name or path)
+        body = resp.json()
+        if isinstance(body, list):
+            return body, None
+        return body["data"], body["meta"]["nextCursor"]
+
+    if not prefetch:
+        cursor, n = None, 0
+        while True:
+            items, cursor = fetch(cursor)
+            n += 1
+            yield items
+            if not cursor or n == max_pages:
+                return
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="page-prefetch") as pool:
+        future, n = pool.submit(fetch, None), 0
+        while future is not None:
+            items, cursor = future.result()
+            n += 1
+            future = pool.submit(fetch, cursor) if cursor and n != max_pages else None
+            yield items
+
+
+def iter_items(http, path, params=None, headers=None, limit=50, prefetch=True, name=None):
+    """
+    Every item of a paginated endpoint, one at a time.
+    """
+    for page in iter_pages(http, path, params, headers, limit, prefetch, name):
+        yield from page
+
+
+def walk_pages(http, path, params=None, headers=None, limit=50, prefetch=True, max_pages=None):
+    """
+    Fetch every page (or the first `max_pages`) and time them. Returns
+    {"pages", "items", "latency": LatencyHistogram, "first": s, "last": s,
+    "bytes": mean bytes per page}; first/last compare the cost of the first
+    and the deepest page, which keyset pagination should keep level.
+    """
+    timings = []
+    endpoint = endpoint_template(path)
+
+    def record(timing):
+        if timing.endpoint == endpoint and timing.status == 200:
+            timings.append(timing)
+
+    pages = items = 0
+    http.listeners.append(record)
+    try:
+        for page in iter_pages(http, path, params, headers, limit, prefetch, max_pages=max_pages):
+            pages += 1
+            items += len(page)
+    finally:
+        http.listeners.remove(record)
+
+    latency = LatencyHistogram()
+    for timing in timings:
+        latency.record(timing.total_s)
+    return {
+        "pages": pages,
+        "items": items,
+        "latency": latency,
+        "first": timings[0].total_s if timings else 0.0,
+        "last": timings[-1].total_s if timings else 0.0,
+        "bytes": sum(t.bytes for t in timings) // max(len(timings), 1),
+    }
+
+
+def print_walk(path, limit, result):
+    h = result["latency"]
+    print(f"\n========== PAGES: {path} (limit {limit}) ==========")
+    print(f"Pages: {result['pages']}, items: {result['items']}, mean page {result['bytes']} bytes")
+    print(
+        f"Page latency ms: p50 {h.percentile(50) * 1000:.1f}, p99 {h.percentile(99) * 1000:.1f},"
+        f" first {result['first'] * 1000:.1f}, last {result['last'] * 1000:.1f}"
+    )
+    print("=" * 60)
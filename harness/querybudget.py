@@ -0,0 +1,125 @@
+"""
+SQL query budgets per endpoint, checked as the data behind them grows.
+
+With SERVER_TIMING=true the API reports in its Server-Timing header how
+many queries a request ran and how many rows its SELECTs returned (see
+harness/servertiming.py). The suite fires each check a few times at every
+data level and keeps the worst counts, then fails a check when
+
+  - queries or rows exceed its budget at any level, or
+  - the query count rises from the smallest level to the largest: a list
+    that loads a relation per item (N+1) passes at ten rows and falls over
+    at ten thousand, so growth is flagged before the budget is reached.
+
+Rows may grow with the data (a household with more pickups gets fuller
+pages) but stay within the budget as long as lists are paginated.
+Restart the API with QUERY_LOG=true to see which statements a failing
+check repeats.
+"""
+
+import threading
+from collections import namedtuple
+
+from harness.servertiming import db_counts, parse_server_timing
+
+QueryBudget = namedtuple("QueryBudget", ["queries", "rows"])
+
+
+class QueryCounter:
+    """
+    HttpClient listener: the most queries and rows seen per (method,
+    endpoint template) since the last take().
+    """
+
+    def __init__(self):
+        self.with_header = 0
+        self._worst = {}
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        header = getattr(timing, "server_timing", None)
+        if not header:
+            return
+        queries, rows = db_counts(parse_server_timing(header))
+        if queries is None:
+            return
+        key = (timing.method, timing.endpoint)
+        with self._lock:
+            self.with_header += 1
+            worst_queries, worst_rows = self._worst.get(key, (0, 0))
+            self._worst[key] = max(worst_queries, queries), max(worst_rows, rows or 0)
+
+    def take(self):
+        with self._lock:
+            worst, self._worst = self._worst, {}
+        return worst
+
+
+def measure_level(checks, counter, requests):
+    """
+    Fire every check `requests` times; {name: (queries, rows) or None}.
+    `checks` maps a name to (method, endpoint template, call); only the
+    requests to that endpoint count, not the setup a call makes first.
+    """
+    counts = {}
+    for name, (method, endpoint, call) in checks.items():
+        counter.take()
+        for _ in range(requests):
+            call()
+        counts[name] = counter.take().get((method, endpoint))
+    return counts
+
+
+def check_budgets(levels, budgets):
+    """
+    levels: [(level, {name: (queries, rows) or None}), ...] in growing
+    order. Returns a report with every check's counts per level and its
+    problems.
+    """
+    checks = []
+    for name, budget in budgets.items():
+        counts = [(level, measured.get(name)) for level, measured in levels]
+        problems = []
+        seen = [(level, c) for level, c in counts if c is not None]
+        if not seen:
+            problems.append("no Server-Timing db counts (start the API with SERVER_TIMING=true)")
+        for level, (queries, rows) in seen:
+            if queries > budget.queries:
+                problems.append(f"{queries} queries at level {level} (budget {budget.queries})")
+            if rows > budget.rows:
+                problems.append(f"{rows} rows at level {level} (budget {budget.rows})")
+        if len(seen) > 1 and seen[-1][1][0] > seen[0][1][0]:
+            problems.append(
+                f"queries grow with the data: {seen[0][1][0]} at level {seen[0][0]},"
+                f" {seen[-1][1][0]} at level {seen[-1][0]} (N+1?)"
+            )
+        checks.append({
+            "name": name,
+            "budget": budget._asdict(),
+            "counts": {level: None if c is None else {"queries": c[0], "rows": c[1]} for level, c in counts},
+            "problems": problems,
+        })
+    return {"levels": [level for level, _ in levels], "checks": checks}
+
+
+def print_query_budget(report):
+    levels = report["levels"]
+    print("\n========== QUERY BUDGET: queries/rows per request (worst seen) ==========")
+    print(f"{'check':36} {'budget':>9}" + "".join(f" {f'@{level}':>9}" for level in levels))
+    for check in report["checks"]:
+        budget = check["budget"]
+        cells = (check["counts"][level] for level in levels)
+        print(
+            f"{check['name'][:36]:36} {budget['queries']:>4}/{budget['rows']:<4}"
+            + "".join(f" {'-':>9}" if c is None else f" {c['queries']:>4}/{c['rows']:<4}" for c in cells)
+            + ("" if check["problems"] else "  ok")
+        )
+    failing = [check for check in report["checks"] if check["problems"]]
+    if failing:
+        print(f"\n{len(failing)} check(s) over budget:")
+        for check in failing:
+            for problem in check["problems"]:
+                print(f"  {check['name']}: {problem}")
+    else:
+        print("\nEvery check within budget")
+    print("=" * 60)
@@ -0,0 +1,95 @@
+"""
+Rating-history benchmark for POST /pickups/{id}/rating.
+
+One dedicated seed agent is topped up to each target number of ratings
+with the bulk seeder (every seeded pickup completed by that agent and
+rated), then a fresh household books pickups the agent completes, and only
+the rating calls themselves are timed. Updating the agent's average used to
+reread every rating it ever had, so latency grew with its history; with a
+running sum/count it should stay flat from ten ratings to a hundred thousand.
+"""
+
+from datetime import datetime, timedelta
+
+from harness.client import Client
+from harness.histogram import LatencyHistogram
+
+RATING_ENDPOINT = "/pickups/{id}/rating"
+
+
+def agent_rating_count(http, agent_token):
+    return Client(http, agent_token).agents.get_my_stats().total_ratings
+
+
+def measure_ratings(http, household_token, agent_token, requests):
+    """
+    Book, complete and then rate `requests` pickups; returns a
+    LatencyHistogram of the rating calls only.
+    """
+    household = Client(http, household_token)
+    agent = household.with_token(agent_token)
+    tomorrow = (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d")
+    pickup_ids = []
+    for i in range(requests):
+        pickup_id = household.pickups.create({
+            "scheduledDate": tomorrow,
+            "timeWindow": "08:00-10:00",
+            "notes": f"Rating benchmark pickup {i}",
+            "wasteType": "MIXED",
+        }).id
+        agent.pickups.accept(pickup_id)
+        agent.pickups.start(pickup_id)
+        agent.pickups.complete(pickup_id, {
+            "photoProofUrl": "https://example.com/photo.jpg",
+            "notes": "Completed by rating benchmark",
+        })
+        pickup_ids.append(pickup_id)
+
+    latency = LatencyHistogram()
+
+    def record(timing):
+        if timing.endpoint == RATING_ENDPOINT:
+            latency.record(timing.total_s)
+
+    http.listeners.append(record)
+    try:
+        for pickup_id in pickup_ids:
+            household.pickups.rate(pickup_id, {"rating": 4, "comment": "Rating benchmark"})
+    finally:
+        http.listeners.remove(record)
+    return latency
+
+
+def rating_bench_report(levels):
+    """
+    JSON-friendly form of [(target_ratings, actual_ratings, LatencyHistogram), ...].
+    """
+    return {
+        "endpoint": RATING_ENDPOINT,
+        "levels": [
+            {
+                "target_ratings": target,
+                "ratings": ratings,
+                "count": h.count,
+                "mean": h.mean(),
+                "p50": h.percentile(50),
+                "p99": h.percentile(99),
+                "max": h.max_us / 1_000_000,
+                "histogram": h.to_dict(),
+            }
+            for target, ratings, h in levels
+        ],
+    }
+
+
+def print_rating_bench(levels):
+    print(f"\n========== {RATING_ENDPOINT} BY AGENT RATING HISTORY (ms) ==========")
+    print(f"{'ratings':>9} {'mean':>8} {'p50':>8} {'p99':>8} {'max':>8} {'p50 vs first':>13}")
+    first = levels[0][2].percentile(50) if levels else 0
+    for _, ratings, h in levels:
+        ratio = f"{h.percentile(50) / first:.2f}x" if first else "-"
+        print(
+            f"{ratings:>9} {h.mean() * 1000:>8.1f} {h.percentile(50) * 1000:>8.1f}"
+            f" {h.percentile(99) * 1000:>8.1f} {h.max_us / 1000:>8.1f} {ratio:>13}"
+        )
+    print("=" * 60)
@@ -0,0 +1,302 @@
+"""
+Server and database resource sampler, run alongside a load run.
+
+Every `interval` seconds a background thread takes one sample:
+
+  requests  rate, errors and p50/p99 of the harness's own requests that
+            finished in the interval (the sampler is an HttpClient listener;
+            with --processes they run in the workers and are not seen)
+  server    CPU % (utime + stime from /proc/PID/stat), RSS, open file
+            descriptors and threads of a local Nest process
+  loop      event-loop delay mean/p50/p99/max since the previous sample,
+            from the API's GET /health/runtime (needs an admin client)
+  pg        connections by state, tuples read (sequential and by index)
+            and written per interval for pickup_requests, alerts and users,
+            and the statements that spent the most time in the interval
+            (pg_stat_statements deltas; skipped when the extension is off)
+
+so one sample holds what the client saw next to what the server and the
+database were doing at the same moment. Samples go to `on_sample` (the
+event log stores them as {"t": "res"} lines, which `report` reads back)
+and are kept for the end-of-run summary, which ranks the windows by p99.
+
+Postgres needs psycopg2 (pip install psycopg2-binary); the other sources
+need nothing beyond the standard library.
+"""
+
+import os
+import threading
+import time
+
+from harness.client import ApiError
+from harness.histogram import LatencyHistogram
+from harness.statsbench import server_memory_kb
+
+try:
+    import psycopg2
+except ImportError:
+    psycopg2 = None
+
+TABLES = ("pickup_requests", "alerts", "users")
+TOP_STATEMENTS = 3
+SLOWEST_WINDOWS = 10
+
+_CLK_TCK = os.sysconf("SC_CLK_TCK")
+
+_CONNECTIONS_SQL = """
+    SELECT coalesce(state, 'background'), count(*)
+    FROM pg_stat_activity
+    WHERE datname = current_database()
+    GROUP BY 1
+"""
+_TABLES_SQL = """
+    SELECT relname, coalesce(seq_tup_read, 0), coalesce(idx_tup_fetch, 0), n_tup_ins + n_tup_upd + n_tup_del
+    FROM pg_stat_user_tables
+    WHERE relname = ANY(%s)
+"""
+_STATEMENTS_SQL = """
+    SELECT queryid, calls, total_exec_time, left(query, 200)
+    FROM pg_stat_statements
+    WHERE dbid = (SELECT oid FROM pg_database WHERE datname = current_database())
+"""
+
+
+class _Process:
+    def __init__(self, pid):
+        self.pid = pid
+        self._last = self._ticks()
+
+    def _ticks(self):
+        with open(f"/proc/{self.pid}/stat") as f:
+            # the command name may contain spaces; fields resume after its ")"
+            fields = f.read().rsplit(")", 1)[1].split()
+        return time.monotonic(), int(fields[11]) + int(fields[12]), int(fields[17])
+
+    def sample(self):
+        at, ticks, threads = self._ticks()
+        last_at, last_ticks, _ = self._last
+        self._last = at, ticks, threads
+        return {
+            "cpu_pct": round((ticks - last_ticks) / _CLK_TCK / (at - last_at) * 100, 1),
+            "rss_kb": server_memory_kb(self.pid)[0],
+            "fds": len(os.listdir(f"/proc/{self.pid}/fd")),
+            "threads": threads,
+        }
+
+
+class _Postgres:
+    def __init__(self, dsn):
+        if psycopg2 is None:
+            raise RuntimeError("Sampling Postgres needs psycopg2 (pip install psycopg2-binary)")
+        self.conn = psycopg2.connect(dsn)
+        self.conn.autocommit = True
+        self.statements_enabled = True
+        self._tables = {}
+        self._statements = {}
+        self.sample()  # baseline for the first deltas
+
+    def sample(self):
+        with self.conn.cursor() as cur:
+            cur.execute(_CONNECTIONS_SQL)
+            connections = dict(cur.fetchall())
+            cur.execute(_TABLES_SQL, (list(TABLES),))
+            tables = {}
+            for name, *counters in cur.fetchall():
+                last = self._tables.get(name, counters)
+                self._tables[name] = counters
+                seq_read, idx_fetch, written = (now - before for now, before in zip(counters, last))
+                tables[name] = {"seq_read": seq_read, "idx_fetch": idx_fetch, "written": written}
+            statements = self._top_statements(cur) if self.statements_enabled else None
+        return {"connections": connections, "tables": tables, "statements": statements}
+
+    def _top_statements(self, cur):
+        try:
+            cur.execute(_STATEMENTS_SQL)
+        except psycopg2.Error:
+            # Extension not created, or not in shared_preload_libraries
+            self.statements_enabled = False
+            return None
+        deltas = []
+        current = {}
+        for queryid, calls, total_ms, query in cur.fetchall():
+            current[queryid] = calls, total_ms
+            last_calls, last_ms = self._statements.get(queryid, (0, 0.0))
+            if calls > last_calls:
+                deltas.append({"query": " ".join(query.split()), "calls": calls - last_calls,
+                               "ms": round(total_ms - last_ms, 2)})
+        self._statements = current
+        return sorted(deltas, key=lambda s: s["ms"], reverse=True)[:TOP_STATEMENTS]
+
+    def close(self):
+        self.conn.close()
+
+
+class ResourceSampler:
+    """
+    Background sampler; start() and stop() it (or use it as a context
+    manager) around the run and add `record` to the run's HttpClient
+    listeners. `runtime` is a generated harness.client.Client carrying an
+    admin token, for the event-loop delay; `server_pid` and `pg_dsn`
+    enable the other sources.
+    """
+
+    def __init__(self, interval=1.0, server_pid=None, pg_dsn=None, runtime=None, on_sample=None):
+        self.interval = interval
+        self.samples = []
+        self.on_sample = on_sample
+        self._process = _Process(server_pid) if server_pid else None
+        self._postgres = _Postgres(pg_dsn) if pg_dsn else None
+        self._runtime = runtime
+        self._window = LatencyHistogram()
+        self._errors = 0
+        self._window_start = time.monotonic()
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="resource-sampler", daemon=True)
+
+    def record(self, timing):
+        """
+        HttpClient listener.
+        """
+        with self._lock:
+            self._window.record(timing.total_s)
+            if not timing.status or timing.status >= 500:
+                self._errors += 1
+
+    def sample(self):
+        now = time.monotonic()
+        with self._lock:
+            window, errors = self._window, self._errors
+            self._window, self._errors = LatencyHistogram(), 0
+        elapsed, self._window_start = now - self._window_start, now
+        sample = {
+            "at": round(time.time(), 3),
+            "requests": {
+                "count": window.count,
+                "rate": round(window.count / elapsed, 2) if elapsed else 0.0,
+                "errors": errors,
+                "p50": window.percentile(50),
+                "p99": window.percentile(99),
+            },
+        }
+        if self._process is not None:
+            try:
+                sample["server"] = self._process.sample()
+            except OSError:  # the server exited or restarted
+                sample["server"] = None
+        if self._runtime is not None:
+            try:
+                sample["loop"] = self._runtime.health.runtime().to_dict()["eventLoopDelayMs"]
+            except (ApiError, OSError):
+                sample["loop"] = None
+        if self._postgres is not None:
+            try:
+                sample["pg"] = self._postgres.sample()
+            except psycopg2.Error:
+                sample["pg"] = None
+        return sample
+
+    def _loop(self):
+        next_at = time.monotonic() + self.interval
+        while not self._stop.wait(max(next_at - time.monotonic(), 0)):
+            next_at += self.interval
+            sample = self.sample()
+            self.samples.append(sample)
+            if self.on_sample is not None:
+                self.on_sample(sample)
+
+    def start(self):
+        self._window_start = time.monotonic()
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        self._thread.join()
+        if self._postgres is not None:
+            self._postgres.close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+# ========================
+# REPORTING
+# ========================
+
+def _pg_active(s):
+    pg = s.get("pg")
+    return pg["connections"].get("active", 0) if pg else None
+
+
+def _pg_connections(s):
+    pg = s.get("pg")
+    return sum(pg["connections"].values()) if pg else None
+
+
+def _table_reads(table):
+    def read(s):
+        pg = s.get("pg")
+        t = pg["tables"].get(table) if pg else None
+        return t["seq_read"] + t["idx_fetch"] if t else None
+    return read
+
+
+def _field(source, key, scale=1):
+    def read(s):
+        part = s.get(source)
+        value = part.get(key) if part else None
+        return None if value is None else value * scale
+    return read
+
+
+COLUMNS = [
+    ("req/s", lambda s: s["requests"]["rate"]),
+    ("p99 ms", lambda s: s["requests"]["p99"] * 1000 if s["requests"]["count"] else None),
+    ("server CPU %", _field("server", "cpu_pct")),
+    ("server RSS MB", _field("server", "rss_kb", 1 / 1024)),
+    ("server fds", _field("server", "fds")),
+    ("loop p99 ms", _field("loop", "p99")),
+    ("pg connections", _pg_connections),
+    ("pg active", _pg_active),
+    *((f"{table} reads", _table_reads(table)) for table in TABLES),
+]
+
+
+def resource_report(samples):
+    """
+    min/mean/max per column, and the SLOWEST_WINDOWS samples by p99.
+    """
+    columns = {}
+    for label, read in COLUMNS:
+        values = [v for v in (read(s) for s in samples) if v is not None]
+        if values:
+            columns[label] = {"min": min(values), "mean": sum(values) / len(values), "max": max(values)}
+    busy = [s for s in samples if s["requests"]["count"]]
+    slowest = sorted(busy, key=lambda s: s["requests"]["p99"], reverse=True)[:SLOWEST_WINDOWS]
+    return {"samples": len(samples), "columns": columns, "slowest": slowest}
+
+
+def print_resource_summary(samples):
+    if not samples:
+        return
+    report = resource_report(samples)
+    start = samples[0]["at"]
+    print(f"\n========== RESOURCES ({report['samples']} samples) ==========")
+    print(f"{'':24} {'min':>10} {'mean':>10} {'max':>10}")
+    for label, c in report["columns"].items():
+        print(f"{label:24} {c['min']:>10.1f} {c['mean']:>10.1f} {c['max']:>10.1f}")
+
+    labels = [label for label, _ in COLUMNS if label in report["columns"]]
+    reads = dict(COLUMNS)
+    print("\nSlowest windows by p99, with what the server and database were doing:")
+    print(f"{'+s':>7}" + "".join(f" {label[:14]:>14}" for label in labels))
+    for s in report["slowest"]:
+        cells = (reads[label](s) for label in labels)
+        print(f"{s['at'] - start:>7.1f}" + "".join(f" {'-':>14}" if v is None else f" {v:>14.1f}" for v in cells))
+        for statement in (s.get("pg") or {}).get("statements") or []:
+            print(f"{'':>8}{statement['ms']:>9.1f} ms {statement['calls']:>6} calls  {statement['query'][:90]}")
+    print("=" * 60)
@@ -0,0 +1,551 @@
+"""
+Declarative traffic mixes: weighted user journeys read from a YAML or JSON
+scenario file and played by many virtual users at once.
+
+    name: weekday-mix
+    users: 200            # virtual users, split between journeys by weight
+    concurrency: 50       # requests in flight at most
+    duration: 300         # seconds; or `iterations: N` journeys per user
+    ramp_up: 30
+    pools:
+      waste_types: [MIXED, ORGANIC, PLASTIC]
+    journeys:
+      household:
+        weight: 70
+        think: 2-6                      # default pause after each step, s
+        setup:                          # once per user, before the loop
+          - action: register-household
+        steps:
+          - action: create-pickup
+            with: {wasteType: $waste_types}
+            expect: {status: 201}
+          - action: list-pickups
+            repeat: 3
+            think: 5-15
+            expect: {status: 200, max_ms: 500, min_items: 1}
+          - request: GET /pickups/{pickup_id}
+
+A step either names an action (a function the caller registers, taking the
+virtual user and the step's `with` parameters and returning the response
+to check, True when it succeeded without one, e.g. a cached login, or None
+when there was nothing to do) or sends a raw `request` with the
+user's token, `{key}` in the path filled from the user's context. `$name`
+anywhere in the parameters draws a random value from that data pool on
+every use; actions can also hand values to each other through pools at run
+time (ScenarioUser.pools.put/take), e.g. households publishing the pickups
+agents then accept.
+
+Each user is given one journey (a 70/20/10 mix of 100 users is exactly
+70/20/10), runs its setup, then repeats the steps until the duration or
+iteration count is used up. A failed step abandons the rest of that pass,
+and so does a step with nothing to do (an agent finding no pickup to
+accept must not go on to start one); a failed setup retires the user.
+Think times are awaited on the event loop, so thousands of mostly idle
+users need no more threads than `concurrency`.
+"""
+
+import asyncio
+import json
+import random
+import time
+from collections import Counter, deque, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.api import auth_headers
+from harness.histogram import LatencyHistogram
+from harness.load import FlowOutcome
+
+Step = namedtuple("Step", ["name", "action", "request", "params", "think", "repeat", "expect"])
+Journey = namedtuple("Journey", ["name", "weight", "setup", "steps"])
+Scenario = namedtuple(
+    "Scenario",
+    ["name", "journeys", "pools", "users", "concurrency", "duration", "iterations", "ramp_up", "seed"],
+)
+
+_STEP_KEYS = {"name", "action", "request", "with", "think", "repeat", "expect"}
+_EXPECT_KEYS = {"status", "max_ms", "json", "min_items"}
+_METHODS = {"GET", "POST", "PUT", "PATCH", "DELETE"}
+
+
+# ========================
+# LOADING
+# ========================
+
+def load_scenario(path, actions):
+    """
+    Parse and check a scenario file against the registered `actions`
+    ({name: func}); any mistake is a ValueError naming where it is.
+    """
+    with open(path) as f:
+        text = f.read()
+    if path.endswith((".yaml", ".yml")):
+        try:
+            import yaml
+        except ImportError:
+            raise ValueError(f"{path}: YAML scenarios need PyYAML (pip install pyyaml); JSON works without") from None
+        try:
+            spec = yaml.safe_load(text)
+        except yaml.YAMLError as e:
+            raise ValueError(f"{path}: {e}") from None
+    else:
+        try:
+            spec = json.loads(text)
+        except ValueError as e:
+            raise ValueError(f"{path}: {e}") from None
+    return parse_scenario(spec, actions, path)
+
+
+def parse_scenario(spec, actions, where="scenario"):
+    if not isinstance(spec, dict):
+        raise ValueError(f"{where}: expected a mapping at the top level")
+    pools = spec.get("pools") or {}
+    if not isinstance(pools, dict) or not all(isinstance(v, list) and v for v in pools.values()):
+        raise ValueError(f"{where}: pools must map names to non-empty lists")
+    journeys_spec = spec.get("journeys")
+    if not isinstance(journeys_spec, dict) or not journeys_spec:
+        raise ValueError(f"{where}: no journeys")
+
+    journeys = []
+    for name, j in journeys_spec.items():
+        at = f"{where}: journey {name!r}"
+        if not isinstance(j, dict):
+            raise ValueError(f"{at}: expected a mapping")
+        weight = j.get("weight", 1)
+        if not isinstance(weight, (int, float)) or weight < 0:
+            raise ValueError(f"{at}: weight must be a number >= 0")
+        think = _think(j.get("think", 0), at)
+        setup = [_step(s, actions, pools, (0.0, 0.0), f"{at} setup[{i}]") for i, s in enumerate(j.get("setup") or [])]
+        steps = [_step(s, actions, pools, think, f"{at} steps[{i}]") for i, s in enumerate(j.get("steps") or [])]
+        if not steps:
+            raise ValueError(f"{at}: no steps")
+        journeys.append(Journey(name, weight, setup, steps))
+    if not sum(j.weight for j in journeys):
+        raise ValueError(f"{where}: every journey has weight 0")
+
+    duration = spec.get("duration")
+    iterations = spec.get("iterations")
+    if duration is None and iterations is None:
+        iterations = 1
+    return Scenario(
+        name=spec.get("name", where),
+        journeys=journeys,
+        pools=pools,
+        users=int(spec.get("users", 10)),
+        concurrency=int(spec.get("concurrency", 10)),
+        duration=None if duration is None else float(duration),
+        iterations=None if iterations is None else int(iterations),
+        ramp_up=float(spec.get("ramp_up", 0.0)),
+        seed=spec.get("seed"),
+    )
+
+
+def _step(s, actions, pools, default_think, at):
+    if not isinstance(s, dict):
+        raise ValueError(f"{at}: expected a mapping")
+    unknown = set(s) - _STEP_KEYS
+    if unknown:
+        raise ValueError(f"{at}: unknown keys {', '.join(sorted(unknown))}")
+    action, request = s.get("action"), s.get("request")
+    if (action is None) == (request is None):
+        raise ValueError(f"{at}: give exactly one of action or request")
+    if action is not None and action not in actions:
+        raise ValueError(f"{at}: unknown action {action!r} (known: {', '.join(sorted(actions))})")
+    if request is not None:
+        method, _, path = str(request).partition(" ")
+        if method not in _METHODS or not path.startswith("/"):
+            raise ValueError(f"{at}: request must look like 'GET /path'")
+    params = s.get("with") or {}
+    if not isinstance(params, dict):
+        raise ValueError(f"{at}: `with` must be a mapping")
+    for ref in _pool_refs(params):
+        if ref not in pools:
+            raise ValueError(f"{at}: no pool named {ref!r}")
+    expect = s.get("expect") or {}
+    if not isinstance(expect, dict) or set(expect) - _EXPECT_KEYS:
+        raise ValueError(f"{at}: expect takes {', '.join(sorted(_EXPECT_KEYS))}")
+    repeat = s.get("repeat", 1)
+    if not isinstance(repeat, int) or repeat < 1:
+        raise ValueError(f"{at}: repeat must be a positive integer")
+    think = _think(s["think"], at) if "think" in s else default_think
+    return Step(s.get("name") or action or request, action, request, params, think, repeat, expect)
+
+
+def _think(value, at):
+    """
+    2 | "1-5" | [1, 5] -> (low, high) seconds.
+    """
+    try:
+        if isinstance(value, (int, float)):
+            low = high = float(value)
+        elif isinstance(value, str):
+            low, _, high = value.partition("-")
+            low, high = float(low), float(high or low)
+        else:
+            low, high = (float(v) for v in value)
+    except (TypeError, ValueError):
+        raise ValueError(f"{at}: think must be seconds, 'LOW-HIGH' or [LOW, HIGH]") from None
+    if not 0 <= low <= high:
+        raise ValueError(f"{at}: think range must satisfy 0 <= LOW <= HIGH")
+    return low, high
+
+
+def _pool_refs(value):
+    if isinstance(value, str) and value.startswith("$"):
+        yield value[1:]
+    elif isinstance(value, dict):
+        for v in value.values():
+            yield from _pool_refs(v)
+    elif isinstance(value, list):
+        for v in value:
+            yield from _pool_refs(v)
+
+
+def assign_journeys(journeys, users, rng):
+    """
+    One journey per user, proportional to the weights (largest remainder),
+    shuffled so a ramp-up starts every kind of user from the beginning.
+    """
+    total = sum(j.weight for j in journeys)
+    quotas = [users * j.weight / total for j in journeys]
+    counts = [int(q) for q in quotas]
+    by_remainder = sorted(range(len(journeys)), key=lambda i: quotas[i] - counts[i], reverse=True)
+    for i in by_remainder[:users - sum(counts)]:
+        counts[i] += 1
+    assigned = [j for j, n in zip(journeys, counts) for _ in range(n)]
+    rng.shuffle(assigned)
+    return assigned
+
+
+# ========================
+# DATA POOLS
+# ========================
+
+class Pools:
+    """
+    The scenario's static pools (a random pick per `$name`) plus queues
+    actions fill and drain while the run goes on.
+    """
+
+    def __init__(self, static, rng):
+        self.static = static
+        self.rng = rng
+        self._queues = {}
+
+    def pick(self, name):
+        return self.rng.choice(self.static[name])
+
+    def resolve(self, value):
+        if isinstance(value, str) and value.startswith("$"):
+            return self.pick(value[1:])
+        if isinstance(value, dict):
+            return {k: self.resolve(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        return value
+
+    def put(self, name, value):
+        self._queues.setdefault(name, deque()).append(value)
+
+    def take(self, name):
+        """
+        Oldest value put under `name`, or None. Each value goes to one taker.
+        """
+        queue = self._queues.get(name)
+        try:
+            return queue.popleft() if queue else None
+        except IndexError:  # emptied by another taker meanwhile
+            return None
+
+
+class ScenarioUser:
+    """
+    What actions get: like load.VirtualUser (`http`, `context`), plus the
+    shared pools. By convention setup actions leave the user's bearer token
+    in context["token"], which raw `request` steps send.
+    """
+
+    def __init__(self, index, journey, http, pools, context=None):
+        self.index = index
+        self.journey = journey
+        self.http = http
+        self.pools = pools
+        self.context = dict(context or {})
+
+
+# ========================
+# RUNNING
+# ========================
+
+def check(expect, resp, elapsed_s):
+    """
+    "" when `resp` meets the step's expectations, else what it missed.
+    Without an explicit status any 2xx/3xx passes.
+    """
+    status = expect.get("status")
+    allowed = status if isinstance(status, list) else [status] if status is not None else None
+    if resp.status_code not in allowed if allowed is not None else resp.status_code >= 400:
+        return f"status {resp.status_code}, expected {status or '< 400'}" + _error_message(resp)
+    if "max_ms" in expect and elapsed_s * 1000 > expect["max_ms"]:
+        return f"took {elapsed_s * 1000:.0f} ms, limit {expect['max_ms']} ms"
+    if "json" in expect or "min_items" in expect:
+        try:
+            body = resp.json()
+        except ValueError:
+            return "response is not JSON"
+        for key, value in (expect.get("json") or {}).items():
+            actual = body.get(key) if isinstance(body, dict) else None
+            if actual != value:
+                return f"{key} = {actual!r}, expected {value!r}"
+        if "min_items" in expect:
+            items = body.get("data", []) if isinstance(body, dict) else body
+            if len(items) < expect["min_items"]:
+                return f"{len(items)} items, expected at least {expect['min_items']}"
+    return ""
+
+
+def _error_message(resp):
+    # Nest's {"message": ...}, which unlike the whole body rarely carries ids
+    try:
+        body = resp.json()
+    except ValueError:
+        return ""
+    message = body.get("message") if isinstance(body, dict) else None
+    return f": {message}" if message else ""
+
+
+def _send(user, request, params):
+    method, _, path = request.partition(" ")
+    path = path.format_map(user.context)
+    kwargs = {"params": params} if method == "GET" else {"json": params} if params else {}
+    return user.http.request(method, path, headers=auth_headers(user.context.get("token")), **kwargs)
+
+
+def _run_step(user, step, actions):
+    """
+    (ok, message, duration_s); ok is None when the action had nothing to do.
+    """
+    start = time.perf_counter()
+    try:
+        params = user.pools.resolve(step.params)
+        if step.action is not None:
+            resp = actions[step.action](user, params)
+        else:
+            resp = _send(user, step.request, params)
+    except KeyError as e:
+        return False, f"missing {e} in context", time.perf_counter() - start
+    except AssertionError as e:
+        return False, str(e) or "Assertion failed", time.perf_counter() - start
+    except Exception as e:
+        return False, f"Unexpected error: {e}", time.perf_counter() - start
+    duration = time.perf_counter() - start
+    if resp is None:
+        return None, "nothing to do", duration
+    if resp is True:
+        return True, "", duration
+    msg = check(step.expect, resp, duration)
+    return not msg, msg, duration
+
+
+class _StepStats:
+    __slots__ = ("ok", "failed", "skipped", "latency", "errors")
+
+    def __init__(self):
+        self.ok = 0
+        self.failed = 0
+        self.skipped = 0
+        self.latency = LatencyHistogram()
+        self.errors = Counter()
+
+
+class ScenarioResults:
+    """
+    Per journey and step: outcomes, latency and failure messages. Only
+    touched from the event loop thread, so no locking.
+    """
+
+    def __init__(self):
+        self.steps = {}  # (journey, step name, setup?) -> _StepStats
+        self.users = Counter()
+        self.retired = Counter()
+        self.passes = Counter()
+
+    def add(self, journey, step, setup, ok, msg, duration_s):
+        stats = self.steps.get((journey, step, setup))
+        if stats is None:
+            stats = self.steps[(journey, step, setup)] = _StepStats()
+        if ok is None:
+            stats.skipped += 1
+            return
+        stats.latency.record(duration_s)
+        if ok:
+            stats.ok += 1
+        else:
+            stats.failed += 1
+            stats.errors[msg[:120]] += 1
+
+    def merge(self, other):
+        """
+        Fold in another run's results, e.g. a fleet worker's.
+        """
+        for key, s in other.steps.items():
+            stats = self.steps.get(key)
+            if stats is None:
+                stats = self.steps[key] = _StepStats()
+            stats.ok += s.ok
+            stats.failed += s.failed
+            stats.skipped += s.skipped
+            stats.latency.merge(s.latency)
+            stats.errors.update(s.errors)
+        self.users.update(other.users)
+        self.retired.update(other.retired)
+        self.passes.update(other.passes)
+        return self
+
+    def failures(self):
+        return sum(s.failed for s in self.steps.values())
+
+    def report(self, scenario, wall_s):
+        total_weight = sum(j.weight for j in scenario.journeys)
+        requests = Counter()
+        order = {
+            (j.name, step.name, setup): i
+            for i, (j, step, setup) in enumerate(
+                (j, step, setup) for j in scenario.journeys
+                for setup, steps in ((True, j.setup), (False, j.steps)) for step in steps
+            )
+        }
+        steps = []
+        for (journey, name, setup), s in sorted(self.steps.items(), key=lambda kv: order.get(kv[0], len(order))):
+            requests[journey] += s.ok + s.failed
+            steps.append({
+                "journey": journey,
+                "step": name,
+                "setup": setup,
+                "ok": s.ok,
+                "failed": s.failed,
+                "skipped": s.skipped,
+                "rate": (s.ok + s.failed) / wall_s if wall_s else 0.0,
+                "p50": s.latency.percentile(50),
+                "p99": s.latency.percentile(99),
+                "errors": dict(s.errors.most_common(5)),
+            })
+        executed = sum(requests.values())
+        return {
+            "scenario": scenario.name,
+            "wall_s": wall_s,
+            "journeys": [
+                {
+                    "journey": j.name,
+                    "weight": j.weight / total_weight,
+                    "users": self.users[j.name],
+                    "retired": self.retired[j.name],
+                    "passes": self.passes[j.name],
+                    "step_share": requests[j.name] / executed if executed else 0.0,
+                }
+                for j in scenario.journeys
+            ],
+            "steps": steps,
+        }
+
+
+async def _run_user(user, actions, loop, pool, start_delay, deadline, iterations, results, on_outcome, rng):
+    journey = user.journey
+    await asyncio.sleep(start_delay)
+
+    async def play(step, setup):
+        """
+        True when every repeat of the step succeeded, else the first
+        outcome that did not: False (failed) or None (nothing to do).
+        """
+        for _ in range(step.repeat):
+            ok, msg, duration = await loop.run_in_executor(pool, _run_step, user, step, actions)
+            results.add(journey.name, step.name, setup, ok, msg, duration)
+            if on_outcome is not None and ok is not None:
+                on_outcome(FlowOutcome(user.index, f"{journey.name}: {step.name}", ok, msg, duration))
+            if ok is False:
+                return False
+            # Think after a skip as well, so an idle agent polls at its
+            # journey's pace instead of spinning
+            low, high = step.think
+            if high:
+                await asyncio.sleep(rng.uniform(low, high))
+            if ok is None:
+                return None
+        return True
+
+    for step in journey.setup:
+        if await play(step, True) is False:
+            results.retired[journey.name] += 1
+            return
+    done = 0
+    while (iterations is None or done < iterations) and (deadline is None or time.monotonic() < deadline):
+        for step in journey.steps:
+            if deadline is not None and time.monotonic() >= deadline:
+                return
+            if await play(step, False) is not True:
+                break
+        else:
+            results.passes[journey.name] += 1
+        done += 1
+
+
+async def play_scenario(scenario, actions, http, base_context=None, on_outcome=None, first_user=0):
+    """
+    Play `scenario` with its users, numbered from `first_user`; returns
+    ScenarioResults. `on_outcome` gets a load.FlowOutcome per executed step
+    (e.g. an event sink).
+    """
+    rng = random.Random(scenario.seed)
+    pools = Pools(scenario.pools, rng)
+    assigned = assign_journeys(scenario.journeys, scenario.users, rng)
+    results = ScenarioResults()
+    for journey in assigned:
+        results.users[journey.name] += 1
+
+    loop = asyncio.get_running_loop()
+    deadline = None
+    if scenario.duration is not None:
+        deadline = time.monotonic() + scenario.ramp_up + scenario.duration
+    with ThreadPoolExecutor(max_workers=scenario.concurrency) as pool:
+        await asyncio.gather(*(
+            _run_user(
+                ScenarioUser(first_user + i, journey, http, pools, base_context),
+                actions, loop, pool,
+                scenario.ramp_up * i / len(assigned),
+                deadline, scenario.iterations, results, on_outcome, rng,
+            )
+            for i, journey in enumerate(assigned)
+        ))
+    return results
+
+
+def run_scenario(scenario, actions, http, base_context=None, on_outcome=None, first_user=0):
+    """
+    Blocking wrapper around play_scenario; returns (results, wall_time_s).
+    """
+    start = time.perf_counter()
+    results = asyncio.run(play_scenario(scenario, actions, http, base_context, on_outcome, first_user))
+    return results, time.perf_counter() - start
+
+
+def print_scenario_summary(report):
+    print(f"\n========== SCENARIO: {report['scenario']} ({report['wall_s']:.1f}s) ==========")
+    print(f"{'journey':20} {'weight':>7} {'share':>7} {'users':>6} {'retired':>8} {'passes':>7}")
+    for j in report["journeys"]:
+        print(
+            f"{j['journey']:20} {j['weight']:>7.0%} {j['step_share']:>7.0%} {j['users']:>6}"
+            f" {j['retired']:>8} {j['passes']:>7}"
+        )
+    print(f"\n{'journey: step':42} {'ok':>6} {'fail':>6} {'skip':>6} {'req/s':>7} {'p50 ms':>8} {'p99 ms':>8}")
+    for s in report["steps"]:
+        label = f"{s['journey']}: {s['step']}" + (" (setup)" if s["setup"] else "")
+        print(
+            f"{label:42} {s['ok']:>6} {s['failed']:>6} {s['skipped']:>6} {s['rate']:>7.1f}"
+            f" {s['p50'] * 1000:>8.1f} {s['p99'] * 1000:>8.1f}"
+        )
+    errors = [(s, msg, n) for s in report["steps"] for msg, n in s["errors"].items()]
+    if errors:
+        print("\nTop failures:")
+        for s, msg, n in sorted(errors, key=lambda e: e[2], reverse=True)[:10]:
+            print(f"  {n:>5} x {s['journey']}: {s['step']}: {msg}")
+    print("=" * 60)
@@ -0,0 +1,122 @@
+"""
+Dependency-aware parallel scheduler for the smoke suite.
+
+Tests pass data to each other through runner.context. Decorating a test
+with @context_keys(consumes=..., produces=...) makes those edges explicit:
+a test waits for the tests that produce the keys it consumes, independent
+branches run side by side on a thread pool, and a test whose producer
+failed (or finished without setting the key) is skipped, not run into a
+confusing "missing token" failure.
+"""
+
+import io
+import sys
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+def context_keys(consumes=(), produces=()):
+    def decorate(func):
+        func.consumes = tuple(consumes)
+        func.produces = tuple(produces)
+        return func
+    return decorate
+
+
+def build_dependencies(tests):
+    """
+    For each (name, func), the names of the tests it must wait for. A key is
+    taken from the closest earlier test that produces it, so the listed
+    order still decides which producer wins when several exist. Keys nobody
+    produces are returned separately.
+    """
+    deps, missing = {}, {}
+    producer_of = {}
+    for name, func in tests:
+        deps[name] = set()
+        for key in getattr(func, "consumes", ()):
+            if key in producer_of:
+                deps[name].add(producer_of[key])
+            else:
+                missing.setdefault(name, []).append(key)
+        for key in getattr(func, "produces", ()):
+            producer_of[key] = name
+    return deps, missing
+
+
+class _PerThreadStdout(io.TextIOBase):
+    """
+    Routes print() from a test thread into that thread's buffer so each
+    test's output is flushed as one block instead of interleaving.
+    """
+
+    def __init__(self, real):
+        self.real = real
+        self.local = threading.local()
+
+    def write(self, s):
+        buf = getattr(self.local, "buf", None)
+        return (buf or self.real).write(s)
+
+    def flush(self):
+        self.real.flush()
+
+
+def run_parallel(runner, tests, workers):
+    """
+    Run `tests` ([(name, func), ...]) through runner.run with up to
+    `workers` at once, honouring declared context dependencies.
+    """
+    deps, missing = build_dependencies(tests)
+    funcs = dict(tests)
+    done, ok = set(), {}
+    pending = [name for name, _ in tests]
+    stdout = _PerThreadStdout(sys.stdout)
+    lock = threading.Lock()
+
+    def run_buffered(name):
+        stdout.local.buf = io.StringIO()
+        try:
+            result = runner.run(name, funcs[name])
+        finally:
+            out, stdout.local.buf = stdout.local.buf.getvalue(), None
+            with lock:
+                stdout.real.write(out)
+        return result
+
+    def skip_reason(name):
+        if name in missing:
+            return f"no test produces {', '.join(missing[name])}"
+        for dep in sorted(deps[name]):
+            if not ok.get(dep):
+                return f"depends on '{dep}', which did not pass"
+        absent = [k for k in getattr(funcs[name], "consumes", ()) if not runner.context.get(k)]
+        if absent:
+            return f"{', '.join(absent)} not set by its producer"
+        return None
+
+    sys.stdout = stdout
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            running = {}
+            while pending or running:
+                for name in list(pending):
+                    if not deps[name] <= done:
+                        continue
+                    pending.remove(name)
+                    reason = skip_reason(name)
+                    if reason:
+                        runner.skip(name, reason)
+                        ok[name] = False
+                        done.add(name)
+                    else:
+                        running[pool.submit(run_buffered, name)] = name
+                if not running:
+                    continue
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    name = running.pop(future)
+                    ok[name] = future.result()
+                    done.add(name)
+    finally:
+        sys.stdout = stdout.real
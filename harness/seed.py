@@ -0,0 +1,381 @@
+"""
+Bulk data seeder: fills the database through the public API so latency is
+measured against realistic table sizes instead of a near-empty schema.
+
+Households and bins are cut into fixed-size batches. Each batch is one task
+for a process pool, and a JSON checkpoint records every finished batch, so
+an interrupted seed picks up where it stopped. A batch that was cut off
+halfway is simply run again: its households answer 409 on register and log
+in instead, but they do get a second set of pickups and alerts.
+
+Phones come from seed_phone(namespace, index) rather than random_phone().
+They are unique within a run and across resumes, and they are one digit
+longer than random_phone() numbers, so they never clash with the smoke tests.
+"""
+
+import json
+import math
+import os
+import random
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, timedelta
+
+from harness.api import assert_status, auth_headers, extract_tokens_and_user, login
+from harness.tokens import TokenCache
+from harness.transport import HttpClient
+
+SEED_PASSWORD = "Passw0rd!"
+
+# Households use indices below this in each namespace; agents use the ones above
+HOUSEHOLD_LIMIT = 900_000
+
+# City centre (lat, lng) and the radius in km that seeded points fall within
+CITIES = {
+    "douala": (4.0511, 9.7679, 12.0),
+    "yaounde": (3.8480, 11.5021, 10.0),
+}
+KM_PER_DEGREE = 111.32
+
+QUARTERS = (
+    "Akwa", "Bonanjo", "Bonapriso", "Deido", "Bali", "Ndokoti", "Makepe",
+    "Bonamoussadi", "Logbaba", "Kotto", "Bepanda", "New Bell", "Bonaberi",
+)
+TIME_WINDOWS = ("06:00-08:00", "08:00-10:00", "10:00-12:00", "14:00-16:00", "16:00-18:00")
+WASTE_TYPES = ("MIXED", "ORGANIC", "PLASTIC", "PAPER", "GLASS")
+ALERT_TYPES = ("FULL_BIN", "ILLEGAL_DUMPING", "MISSED_PICKUP", "OTHER")
+CAPACITY_LEVELS = ("LOW", "MEDIUM", "HIGH", "FULL")
+
+# Final status of each seeded pickup, weighted towards a mature service
+PICKUP_STATUS_WEIGHTS = {
+    "COMPLETED": 55,
+    "REQUESTED": 15,
+    "ASSIGNED": 10,
+    "ON_GOING": 10,
+    "CANCELED": 10,
+}
+RATED_SHARE = 0.7
+RATING_WEIGHTS = (2, 3, 10, 35, 50)  # 1..5 stars
+
+
+def seed_phone(namespace, index):
+    """
+    +2376NNIIIIII: two namespace digits, then a six digit index.
+    """
+    if not 0 <= namespace < 100 or not 0 <= index < 1_000_000:
+        raise ValueError(f"seed_phone({namespace}, {index}) is out of range")
+    return f"+2376{namespace:02d}{index:06d}"
+
+
+def seed_email(namespace, index):
+    return f"seed{namespace:02d}.{index:06d}@example.com"
+
+
+def city_point(rng, city="douala"):
+    """
+    Uniformly random (lat, lng) within the radius of a city in CITIES.
+    """
+    centre_lat, centre_lng, radius_km = CITIES[city]
+    distance = radius_km * math.sqrt(rng.random())
+    bearing = rng.uniform(0, 2 * math.pi)
+    lat = centre_lat + distance * math.cos(bearing) / KM_PER_DEGREE
+    lng = centre_lng + distance * math.sin(bearing) / (KM_PER_DEGREE * math.cos(math.radians(centre_lat)))
+    return round(lat, 6), round(lng, 6)
+
+
+def create_seed_agents(http, admin_token, namespace, count):
+    """
+    Creates (or, on a resumed seed, reuses) `count` APPROVED agents and
+    returns their (phone, password) accounts.
+    """
+    accounts = []
+    for i in range(count):
+        index = HOUSEHOLD_LIMIT + i
+        phone = seed_phone(namespace, index)
+        resp = http.post(
+            "/agents",
+            json={
+                "name": f"Seed Agent {namespace:02d}-{i}",
+                "phone": phone,
+                "email": seed_email(namespace, index),
+                "password": SEED_PASSWORD,
+                "kycStatus": "APPROVED",
+            },
+            headers=auth_headers(admin_token),
+        )
+        if resp.status_code != 409:
+            assert_status(resp, 201, "create seed agent")
+        accounts.append((phone, SEED_PASSWORD))
+    return accounts
+
+
+# ========================
+# WORKER PROCESSES
+# ========================
+
+class _Worker:
+    """
+    Per-process state: one pooled HttpClient and the access tokens of the
+    accounts it acts as. A token is fetched on first use and again when a
+    request comes back 401, which covers access tokens expiring mid-seed.
+    """
+
+    def __init__(self, base_url, agents, admin, token_cache_path):
+        token_cache = TokenCache(token_cache_path) if token_cache_path else None
+        self.http = HttpClient(base_url, pool_size=2, token_cache=token_cache)
+        self.agents = agents
+        self.admin = admin
+        self.tokens = {}
+
+    def token(self, account, fresh=False):
+        phone, password = account
+        if fresh and self.http.token_cache and phone in self.tokens:
+            self.http.token_cache.invalidate(self.http, phone, self.tokens[phone])
+        if fresh or phone not in self.tokens:
+            self.tokens[phone] = login(self, phone, password, f"login {phone}")[0]
+        return self.tokens[phone]
+
+    def call(self, method, path, account, expected, name, **kwargs):
+        resp = self.http.request(method, path, headers=auth_headers(self.token(account)), **kwargs)
+        if resp.status_code == 401:
+            resp = self.http.request(method, path, headers=auth_headers(self.token(account, fresh=True)), **kwargs)
+        assert_status(resp, expected, name)
+        return resp.json()
+
+
+_worker = None
+
+
+def _init_worker(base_url, agents, admin, token_cache_path):
+    global _worker
+    _worker = _Worker(base_url, agents, admin, token_cache_path)
+
+
+def _batch_range(plan, kind, batch):
+    start = batch * plan["batch_size"]
+    return range(start, min(start + plan["batch_size"], plan[kind]))
+
+
+def _seed_household(w, plan, index, counts):
+    namespace = plan["namespace"]
+    rng = random.Random(namespace * 1_000_000 + index)
+    account = (seed_phone(namespace, index), SEED_PASSWORD)
+    quarter = rng.choice(QUARTERS)
+
+    resp = w.http.post("/auth/register", json={
+        "name": f"Seed Household {namespace:02d}-{index}",
+        "phone": account[0],
+        "password": SEED_PASSWORD,
+        "email": seed_email(namespace, index),
+        "address": f"{quarter}, Douala",
+        "quarter": quarter,
+    })
+    if resp.status_code == 409:
+        # Registered before an interruption; this batch is being re-run
+        try:
+            w.token(account)
+        except AssertionError:
+            raise AssertionError(
+                f"{account[0]} belongs to an account the seeder did not create; use another --namespace"
+            ) from None
+    else:
+        assert_status(resp, 201, "register")
+        w.tokens[account[0]] = extract_tokens_and_user(resp.json())[0]
+    counts["households"] += 1
+
+    agent = w.agents[index % len(w.agents)]
+    statuses, weights = zip(*PICKUP_STATUS_WEIGHTS.items())
+    today = datetime.utcnow().date()
+    for j in range(plan["pickups"]):
+        status = rng.choices(statuses, weights)[0]
+        if plan.get("all_rated"):
+            status = "COMPLETED"
+        pickup = w.call("POST", "/pickups", account, 201, "create pickup", json={
+            "scheduledDate": (today + timedelta(days=rng.randint(-60, 14))).isoformat(),
+            "timeWindow": rng.choice(TIME_WINDOWS),
+            "notes": f"Seeded pickup {j}",
+            "wasteType": rng.choice(WASTE_TYPES),
+        })
+        pickup_id = pickup["id"]
+        if status == "CANCELED":
+            w.call("PATCH", f"/pickups/{pickup_id}/cancel", account, 200, "cancel pickup")
+        elif status != "REQUESTED":
+            w.call("PATCH", f"/pickups/{pickup_id}/accept", agent, 200, "accept pickup")
+            if status in ("ON_GOING", "COMPLETED"):
+                w.call("PATCH", f"/pickups/{pickup_id}/start", agent, 200, "start pickup")
+            if status == "COMPLETED":
+                w.call("PATCH", f"/pickups/{pickup_id}/complete", agent, 200, "complete pickup", json={
+                    "photoProofUrl": "https://example.com/photo.jpg",
+                    "notes": "Completed by seeder",
+                })
+                if rng.random() < RATED_SHARE or plan.get("all_rated"):
+                    w.call("POST", f"/pickups/{pickup_id}/rating", account, 201, "rate pickup", json={
+                        "rating": rng.choices(range(1, 6), RATING_WEIGHTS)[0],
+                        "comment": "Seeded rating",
+                    })
+                    counts["ratings"] += 1
+        counts[f"pickups {status}"] += 1
+
+    for j in range(plan["alerts"]):
+        lat, lng = city_point(rng)
+        w.call("POST", "/alerts", account, 201, "create alert", json={
+            "type": rng.choice(ALERT_TYPES),
+            "description": f"Seeded alert {j} in {quarter}",
+            "photoUrl": "https://example.com/alert_photo.jpg",
+            "gpsLat": lat,
+            "gpsLng": lng,
+        })
+        counts["alerts"] += 1
+
+    # Thousands of households pass through each worker; only agents stay cached
+    w.tokens.pop(account[0], None)
+
+
+def _seed_household_batch(plan, batch):
+    counts = Counter()
+    for index in _batch_range(plan, "households", batch):
+        _seed_household(_worker, plan, index, counts)
+    return counts
+
+
+def _seed_bin_batch(plan, batch):
+    counts = Counter()
+    namespace = plan["namespace"]
+    for index in _batch_range(plan, "bins", batch):
+        rng = random.Random(-(namespace * 1_000_000 + index) - 1)
+        city = rng.choice(plan["bin_cities"]) if plan.get("bin_cities") else "douala"
+        lat, lng = city_point(rng, city)
+        area = rng.choice(QUARTERS) if city == "douala" else city.capitalize()
+        _worker.call("POST", "/bins", _worker.admin, 201, "create bin", json={
+            "locationName": f"{area} bin {namespace:02d}-{index}",
+            "gpsLat": lat,
+            "gpsLng": lng,
+            "capacityLevel": rng.choice(CAPACITY_LEVELS),
+        })
+        counts["bins"] += 1
+    return counts
+
+
+# ========================
+# DRIVER
+# ========================
+
+# Plan entries that may grow between runs; growing them only appends batches
+GROWABLE = ("households", "bins")
+
+
+def _can_grow(old, new):
+    """
+    A checkpoint carries over to a bigger plan only if nothing but the
+    GROWABLE counts changed and no old count ended in a partial batch
+    (that batch would be recorded as done while missing its new tail).
+    """
+    fixed = [k for k in new if k not in GROWABLE]
+    return (
+        all(old.get(k) == new[k] for k in fixed)
+        and all(new[k] >= old[k] and old[k] % new["batch_size"] == 0 for k in GROWABLE)
+    )
+
+
+class Checkpoint:
+    """
+    Finished batches and what they created, rewritten atomically after each
+    batch. A checkpoint resumes the plan it was written for, or one that
+    only adds households or bins on top of it.
+    """
+
+    def __init__(self, path, plan):
+        self.path = path
+        self.plan = plan
+        self.done = {"bins": set(), "households": set()}
+        self.totals = Counter()
+
+    @classmethod
+    def load(cls, path, plan):
+        checkpoint = cls(path, plan)
+        if os.path.exists(path):
+            with open(path) as f:
+                data = json.load(f)
+            if data["plan"] != plan and not _can_grow(data["plan"], plan):
+                raise ValueError(
+                    f"{path} belongs to a different seed plan {data['plan']}; "
+                    "rerun with the same options or pass another --checkpoint"
+                )
+            checkpoint.done = {kind: set(batches) for kind, batches in data["done"].items()}
+            checkpoint.totals = Counter(data["totals"])
+        return checkpoint
+
+    def mark_done(self, kind, batch, counts):
+        self.done[kind].add(batch)
+        self.totals.update(counts)
+        tmp = f"{self.path}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({
+                "plan": self.plan,
+                "done": {kind: sorted(batches) for kind, batches in self.done.items()},
+                "totals": self.totals,
+            }, f)
+        os.replace(tmp, self.path)
+
+
+def run_seed(base_url, plan, agents, admin, workers, checkpoint_path, token_cache_path=None):
+    """
+    Seed `plan` (namespace, households, bins, pickups and alerts per
+    household, batch_size; all_rated=True makes every pickup a completed,
+    rated one; bin_cities spreads bins over those CITIES instead of Douala)
+    on `workers` processes. Bins need the admin
+    account; every household's agent-side pickup steps go to one of
+    `agents`. Returns (checkpoint, failures, wall_s); failed batches stay
+    out of the checkpoint so the next run retries them. Workers share the
+    token cache file at `token_cache_path`, if given.
+    """
+    checkpoint = Checkpoint.load(checkpoint_path, plan)
+    tasks = [
+        (kind, batch, func)
+        for kind, func in (("bins", _seed_bin_batch), ("households", _seed_household_batch))
+        for batch in range(math.ceil(plan[kind] / plan["batch_size"]))
+        if batch not in checkpoint.done[kind]
+    ]
+    skipped = sum(len(batches) for batches in checkpoint.done.values())
+    if skipped:
+        print(f"Resuming from {checkpoint_path}: {skipped} batches already done")
+
+    failures = []
+    start = time.perf_counter()
+    seeded_before = checkpoint.totals["households"]
+    pool = ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(base_url, agents, admin, token_cache_path))
+    try:
+        futures = {pool.submit(func, plan, batch): (kind, batch) for kind, batch, func in tasks}
+        for n, future in enumerate(as_completed(futures), 1):
+            kind, batch = futures[future]
+            try:
+                checkpoint.mark_done(kind, batch, future.result())
+                state = "done"
+            except Exception as e:
+                failures.append((kind, batch, str(e) or type(e).__name__))
+                state = "FAILED"
+            elapsed = time.perf_counter() - start
+            households = checkpoint.totals["households"]
+            print(
+                f"[{n}/{len(tasks)}] {kind} batch {batch} {state}"
+                f" - households {households}/{plan['households']}, bins {checkpoint.totals['bins']}/{plan['bins']}"
+                f" ({(households - seeded_before) / elapsed:.1f} households/s)",
+                flush=True,
+            )
+    finally:
+        # Ctrl-C: drop queued batches; the checkpoint already has the finished ones
+        pool.shutdown(cancel_futures=True)
+    return checkpoint, failures, time.perf_counter() - start
+
+
+def print_seed_summary(checkpoint, failures, wall_s):
+    print("\n========== SEED SUMMARY ==========")
+    print(f"Wall time: {wall_s:.2f}s, checkpoint: {checkpoint.path}")
+    for key, count in sorted(checkpoint.totals.items()):
+        print(f"{key:25} {count:>10}")
+    if failures:
+        print(f"\nFailed batches ({len(failures)}), retried on the next run:")
+        for kind, batch, msg in failures[:10]:
+            print(f"  {kind} batch {batch}: {msg[:120]}")
+    print("==================================")
@@ -0,0 +1,164 @@
+"""
+Bin fill-level sensor simulator: per-bin PATCHes vs batched capacity updates.
+
+Every bin gets a sensor whose fill rises by a random step at each report.
+A full bin (or, now and then, a three-quarters full one) is emptied by a
+collection round: its fill drops to zero and the reading carries
+lastEmptiedAt. Readings come out report round by report round, in a
+shuffled bin order, the way a sensor gateway would forward them.
+
+The same readings are then sent two ways:
+
+  - one PATCH /bins/{id} per reading, as the API allowed so far;
+  - PATCH /bins/capacity with `batch_size` readings per request.
+
+Both run at the same concurrency, so readings per second of wall time
+compare the two directly.
+"""
+
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from harness.api import auth_headers
+from harness.histogram import LatencyHistogram
+
+BATCH_ENDPOINT = "/bins/capacity"
+# Server-side limit (MAX_CAPACITY_READINGS in src/bins/dto/update-bin-capacities.dto.ts)
+MAX_BATCH = 500
+
+# Fill fraction below which each level applies; anything above is FULL
+LEVELS = ((0.25, "LOW"), (0.5, "MEDIUM"), (0.8, "HIGH"))
+
+
+def capacity_level(fill):
+    for bound, level in LEVELS:
+        if fill < bound:
+            return level
+    return "FULL"
+
+
+def sensor_readings(bin_ids, count, interval_s=300, seed=0, start=None):
+    """
+    `count` readings from one sensor per bin, a report round every
+    `interval_s` simulated seconds. Each reading is
+    {"id", "capacityLevel"[, "lastEmptiedAt"]}.
+    """
+    rng = random.Random(seed)
+    fill = {bin_id: rng.random() * 0.5 for bin_id in bin_ids}
+    now = start or datetime.now(timezone.utc) - timedelta(seconds=interval_s * (count // max(len(bin_ids), 1) + 1))
+    order = list(bin_ids)
+    readings = []
+    while len(readings) < count:
+        rng.shuffle(order)
+        for bin_id in order[:count - len(readings)]:
+            reading = {"id": bin_id}
+            level = fill[bin_id] + rng.uniform(0.01, 0.08)
+            if level >= 1.0 or (level >= 0.75 and rng.random() < 0.1):
+                level = 0.0
+                reading["lastEmptiedAt"] = now.isoformat(timespec="seconds").replace("+00:00", "Z")
+            fill[bin_id] = level
+            reading["capacityLevel"] = capacity_level(level)
+            readings.append(reading)
+        now += timedelta(seconds=interval_s)
+    return readings
+
+
+def _send_all(jobs, send, concurrency):
+    """
+    Run send(job) -> (ok, readings applied, detail) over `jobs` on
+    `concurrency` threads; returns the counts, errors and latency.
+    """
+    latency = LatencyHistogram()
+    lock = threading.Lock()
+    counts = {"requests": 0, "readings": 0, "failed": 0}
+    errors = {}
+
+    def run(job):
+        start = time.perf_counter()
+        try:
+            ok, applied, detail = send(job)
+        except Exception as e:
+            ok, applied, detail = False, 0, f"0 {str(e)[:120]}"
+        elapsed = time.perf_counter() - start
+        with lock:
+            counts["requests"] += 1
+            if ok:
+                counts["readings"] += applied
+                latency.record(elapsed)
+            else:
+                counts["failed"] += 1
+                errors[detail] = errors.get(detail, 0) + 1
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        list(pool.map(run, jobs))
+    wall_s = time.perf_counter() - start
+    return {
+        **counts,
+        "errors": errors,
+        "wall_s": wall_s,
+        "readings_per_s": counts["readings"] / wall_s if wall_s else 0.0,
+        "latency": latency,
+    }
+
+
+def run_per_bin(http, token, readings, concurrency):
+    headers = auth_headers(token)
+
+    def send(reading):
+        body = {k: v for k, v in reading.items() if k != "id"}
+        resp = http.patch(f"/bins/{reading['id']}", json=body, headers=headers)
+        return resp.status_code == 200, 1, f"{resp.status_code} {resp.text[:120]}"
+
+    return _send_all(readings, send, concurrency)
+
+
+def run_batched(http, token, readings, batch_size, concurrency):
+    headers = auth_headers(token)
+    not_found = []
+
+    def send(batch):
+        resp = http.patch(BATCH_ENDPOINT, json={"readings": batch}, headers=headers)
+        if resp.status_code != 200:
+            return False, 0, f"{resp.status_code} {resp.text[:120]}"
+        result = resp.json()
+        not_found.extend(result.get("notFound", []))
+        return True, len(batch), ""
+
+    batches = [readings[i:i + batch_size] for i in range(0, len(readings), batch_size)]
+    result = _send_all(batches, send, concurrency)
+    result["not_found"] = len(set(not_found))
+    return result
+
+
+def sensor_report(bins, batch_size, concurrency, results):
+    return {
+        "bins": bins,
+        "batch_size": batch_size,
+        "concurrency": concurrency,
+        "modes": {name: {**r, "latency": r["latency"].to_dict()} for name, r in results.items()},
+    }
+
+
+def print_sensor_summary(bins, batch_size, concurrency, results):
+    print(f"\n========== SENSOR READINGS: {bins} bins, concurrency {concurrency} ==========")
+    print(f"{'mode':22} {'requests':>9} {'readings':>9} {'failed':>7} {'wall s':>8} {'readings/s':>11}"
+          f" {'p50 ms':>8} {'p99 ms':>8}")
+    for name, r in results.items():
+        lat = r["latency"]
+        print(
+            f"{name:22} {r['requests']:>9} {r['readings']:>9} {r['failed']:>7} {r['wall_s']:>8.2f}"
+            f" {r['readings_per_s']:>11.0f} {lat.percentile(50) * 1000:>8.1f} {lat.percentile(99) * 1000:>8.1f}"
+        )
+    per_bin, batched = results.get("per-bin PATCH"), results.get(f"batch of {batch_size}")
+    if per_bin and batched and per_bin["readings_per_s"]:
+        print(f"\nBatched updates apply {batched['readings_per_s'] / per_bin['readings_per_s']:.1f}x the readings per second")
+    for r in results.values():
+        if r.get("not_found"):
+            print(f"  {r['not_found']} bin id(s) in the batches matched no bin")
+        for message, count in list(r["errors"].items())[:5]:
+            print(f"  {count} x {message}")
+    print("=" * 60)
@@ -0,0 +1,189 @@
+"""
+Client-observed vs server-side time, from the API's Server-Timing header.
+
+With SERVER_TIMING=true the server answers every request with
+
+    Server-Timing: auth;dur=0.8, validation;dur=0.1, handler;dur=6.2,
+                   serialize;dur=0.3, db;dur=4.9;desc="3 queries 21 rows", total;dur=7.9
+
+(milliseconds; validation/handler/serialize are missing when a guard
+rejected the request). ServerTimingStats is an HttpClient listener that
+files those phases per endpoint next to the latency the harness saw, so a
+slow p99 can be pinned on the wire (client minus server total), JWT
+checking (auth), the handler and TypeORM hydration (handler minus db) or
+Postgres (db). It also keeps the slowest requests per endpoint with their
+breakdown, since the tail is where the phases usually disagree with the
+median.
+"""
+
+import heapq
+import itertools
+import re
+import threading
+
+from harness.histogram import LatencyHistogram
+
+PHASES = ("auth", "validation", "handler", "serialize", "db")
+TAIL_SIZE = 20
+
+_DB_COUNTS = re.compile(r"^(\d+) quer\w*(?: (\d+) rows)?")
+
+
+def parse_server_timing(header):
+    """
+    {name: (duration_s or None, description)} for one header value.
+    """
+    metrics = {}
+    for entry in header.split(","):
+        name, *params = (part.strip() for part in entry.split(";"))
+        if not name:
+            continue
+        dur, desc = None, ""
+        for param in params:
+            key, _, value = param.partition("=")
+            if key == "dur":
+                try:
+                    dur = float(value) / 1000
+                except ValueError:
+                    pass
+            elif key == "desc":
+                desc = value.strip('"')
+        metrics[name] = (dur, desc)
+    return metrics
+
+
+def db_counts(metrics):
+    """
+    (queries, rows) from a parsed header's db entry; rows is None from a
+    server that only reports the query count, and both are None without
+    a db entry.
+    """
+    match = _DB_COUNTS.match(metrics.get("db", (None, ""))[1])
+    if not match:
+        return None, None
+    return int(match.group(1)), None if match.group(2) is None else int(match.group(2))
+
+
+class _EndpointTiming:
+    __slots__ = ("client", "server", "wire", "phases", "queries", "rows", "tail")
+
+    def __init__(self):
+        self.client = LatencyHistogram()
+        self.server = LatencyHistogram()
+        self.wire = LatencyHistogram()
+        self.phases = {phase: LatencyHistogram() for phase in PHASES}
+        self.queries = 0
+        self.rows = 0
+        self.tail = []  # min-heap of (client_s, seq, server total, {phase: s})
+
+
+class ServerTimingStats:
+    """
+    Listener: only requests that carried a Server-Timing header count.
+    """
+
+    def __init__(self, tail_size=TAIL_SIZE):
+        self.endpoints = {}
+        self.tail_size = tail_size
+        self._seq = itertools.count()
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        header = getattr(timing, "server_timing", None)
+        if not header:
+            return
+        metrics = parse_server_timing(header)
+        server = metrics.get("total", (None, ""))[0]
+        if server is None:
+            return
+        phases = {phase: metrics[phase][0] for phase in PHASES if metrics.get(phase, (None,))[0] is not None}
+        queries, rows = db_counts(metrics)
+
+        with self._lock:
+            e = self.endpoints.get((timing.method, timing.endpoint))
+            if e is None:
+                e = self.endpoints[(timing.method, timing.endpoint)] = _EndpointTiming()
+            e.client.record(timing.total_s)
+            e.server.record(server)
+            e.wire.record(max(timing.total_s - server, 0.0))
+            for phase, seconds in phases.items():
+                e.phases[phase].record(seconds)
+            e.queries += queries or 0
+            e.rows += rows or 0
+            entry = (timing.total_s, next(self._seq), server, phases)
+            if len(e.tail) < self.tail_size:
+                heapq.heappush(e.tail, entry)
+            elif entry[0] > e.tail[0][0]:
+                heapq.heapreplace(e.tail, entry)
+
+    def report(self):
+        endpoints = []
+        for (method, endpoint), e in sorted(self.endpoints.items(), key=lambda kv: (kv[0][1], kv[0][0])):
+            n = e.client.count
+            tail = sorted(e.tail, key=lambda entry: entry[0], reverse=True)
+            endpoints.append({
+                "method": method,
+                "endpoint": endpoint,
+                "count": n,
+                "client": _stats(e.client),
+                "server": _stats(e.server),
+                "wire": _stats(e.wire),
+                "phases": {phase: _stats(h) for phase, h in e.phases.items() if h.count},
+                "queries_per_request": e.queries / n if n else 0.0,
+                "rows_per_request": e.rows / n if n else 0.0,
+                "tail": {
+                    "count": len(tail),
+                    "client_mean": _mean(c for c, _, _, _ in tail),
+                    "wire_mean": _mean(max(c - s, 0.0) for c, _, s, _ in tail),
+                    "phases_mean": {
+                        phase: _mean(p[phase] for _, _, _, p in tail if phase in p)
+                        for phase in PHASES if any(phase in p for _, _, _, p in tail)
+                    },
+                },
+            })
+        return {"endpoints": endpoints}
+
+    def print_summary(self):
+        report = self.report()
+        if not report["endpoints"]:
+            return
+        print("\n========== SERVER TIMING (ms): client vs server, p50 / p99 ==========")
+        print(
+            f"{'endpoint':42} {'n':>6} {'client':>13} {'server':>13} {'wire':>13} {'auth':>13}"
+            f" {'handler':>13} {'db':>13} {'q/req':>6} {'rows/req':>8}"
+        )
+        for e in report["endpoints"]:
+            phases = e["phases"]
+            cells = [e["client"], e["server"], e["wire"], phases.get("auth"), phases.get("handler"), phases.get("db")]
+            print(
+                f"{e['method'] + ' ' + e['endpoint']:42} {e['count']:>6}"
+                + "".join(f" {_pair(c):>13}" for c in cells)
+                + f" {e['queries_per_request']:>6.1f} {e['rows_per_request']:>8.1f}"
+            )
+        print(f"\nSlowest {self.tail_size} requests per endpoint, mean ms:")
+        print(f"{'endpoint':42} {'client':>8} {'wire':>8}" + "".join(f" {phase:>10}" for phase in PHASES))
+        for e in report["endpoints"]:
+            tail = e["tail"]
+            print(
+                f"{e['method'] + ' ' + e['endpoint']:42} {tail['client_mean'] * 1000:>8.1f} {tail['wire_mean'] * 1000:>8.1f}"
+                + "".join(
+                    f" {tail['phases_mean'][phase] * 1000:>10.1f}" if phase in tail["phases_mean"] else f" {'-':>10}"
+                    for phase in PHASES
+                )
+            )
+        print("=" * 60)
+
+
+def _stats(h):
+    return {"count": h.count, "mean": h.mean(), "p50": h.percentile(50), "p99": h.percentile(99)}
+
+
+def _mean(values):
+    values = list(values)
+    return sum(values) / len(values) if values else 0.0
+
+
+def _pair(stats):
+    if not stats:
+        return "-"
+    return f"{stats['p50'] * 1000:.1f}/{stats['p99'] * 1000:.1f}"
@@ -0,0 +1,335 @@
+"""
+Soak mode: the full user journey at a steady rate for hours, watched for
+slow drift.
+
+A new journey (one virtual user running every flow in order) starts every
+1/rate seconds whatever the server is doing; if `max_in_flight` journeys
+are still running the start is skipped and counted. The run is cut into
+windows, and each window reduces to a handful of numbers: per-endpoint
+p95, journeys started/skipped/failed, and the server's RSS and heap read
+at the window's end. A failure counts in the window it happens in, which
+for a long journey may be later than the one it started in. Only the
+current window's histograms are held, so memory stays flat however long
+the run is.
+
+At the end (and from `report` on an event log) every series is tested for
+upward drift after the warm-up windows:
+
+  slope     Theil-Sen (median of pairwise slopes), which a few noisy
+            windows cannot drag around
+  p         one-sided Mann-Kendall trend test; no assumption about the
+            shape of the noise
+  growth    fitted change over the run relative to the fitted start value
+
+A series drifts when p < alpha and growth >= min_growth: memory that keeps
+climbing, or an endpoint whose p95 rises as tables like survey_responses
+and ratings fill up.
+"""
+
+import contextlib
+import math
+import os
+import statistics
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.histogram import LatencyHistogram
+from harness.load import VirtualUser, run_flow
+
+MIN_WINDOW_REQUESTS = 20  # an endpoint's p95 from fewer requests is left out of its series
+MIN_POINTS = 8  # windows after warm-up a series needs before it is tested
+
+
+class SoakWindow:
+    __slots__ = ("index", "start_s", "started", "skipped", "failed", "latency")
+
+    def __init__(self, index, start_s):
+        self.index = index
+        self.start_s = start_s
+        self.started = 0
+        self.skipped = 0
+        self.failed = 0
+        self.latency = {}  # "METHOD /endpoint" -> LatencyHistogram
+
+    def to_dict(self, gauges):
+        return {
+            "window": self.index,
+            "start_s": self.start_s,
+            "started": self.started,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            **gauges,
+            "p95": {e: h.percentile(95) for e, h in sorted(self.latency.items()) if h.count >= MIN_WINDOW_REQUESTS},
+            "requests": {e: h.count for e, h in sorted(self.latency.items())},
+        }
+
+
+class SoakRun:
+    """
+    Drives the journeys and owns the current window. Add `record` to the
+    HttpClient listeners; `probe()` returns the server gauges (e.g.
+    {"rss_mb": ..., "heap_mb": ...}) read as each window closes, and
+    `make_context()` the starting context of each journey, called as it is
+    started so that shared tokens can be renewed over a run of hours.
+    """
+
+    def __init__(self, flows, http, rate, duration, window_s=300.0, max_in_flight=50,
+                 make_context=None, probe=None, on_window=None, on_outcome=None):
+        self.flows = flows
+        self.http = http
+        self.rate = rate
+        self.duration = duration
+        self.window_s = window_s
+        self.max_in_flight = max_in_flight
+        self.make_context = make_context
+        self.probe = probe
+        self.on_window = on_window
+        self.on_outcome = on_outcome
+        self.windows = []
+        self._window = SoakWindow(0, 0.0)
+        self._in_flight = 0
+        self._lock = threading.Lock()
+
+    def record(self, timing):
+        """
+        HttpClient listener.
+        """
+        key = f"{timing.method} {timing.endpoint}"
+        with self._lock:
+            h = self._window.latency.get(key)
+            if h is None:
+                h = self._window.latency[key] = LatencyHistogram()
+            h.record(timing.total_s)
+
+    def _journey(self, user):
+        try:
+            for name, func in self.flows:
+                outcome = run_flow(user, name, func)
+                if self.on_outcome is not None:
+                    self.on_outcome(outcome)
+                if not outcome.ok:
+                    with self._lock:
+                        self._window.failed += 1
+                    break
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    def _close_window(self, next_start_s):
+        with self._lock:
+            window = self._window
+            self._window = SoakWindow(window.index + 1, next_start_s)
+        gauges = {}
+        if self.probe is not None:
+            try:
+                gauges = self.probe()
+            except Exception:  # a missed reading leaves a gap, not a failed run
+                gauges = {}
+        closed = window.to_dict(gauges)
+        self.windows.append(closed)
+        if self.on_window is not None:
+            self.on_window(closed)
+
+    def run(self):
+        """
+        Blocks for `duration` seconds plus the time the last journeys take
+        to finish, and returns the closed windows.
+        """
+        interval = 1.0 / self.rate
+        user = 0
+        with ThreadPoolExecutor(max_workers=self.max_in_flight) as pool:
+            start = time.perf_counter()
+            next_window = self.window_s
+            while True:
+                offset = user * interval
+                if offset >= self.duration:
+                    break
+                while offset >= next_window:
+                    self._sleep_until(start + next_window)
+                    self._close_window(next_window)
+                    next_window += self.window_s
+                self._sleep_until(start + offset)
+                with self._lock:
+                    if self._in_flight >= self.max_in_flight:
+                        self._window.skipped += 1
+                        user += 1
+                        continue
+                    self._in_flight += 1
+                    self._window.started += 1
+                context = self.make_context() if self.make_context is not None else None
+                pool.submit(self._journey, VirtualUser(user, self.http, context))
+                user += 1
+            self._sleep_until(start + min(next_window, self.duration))
+        self._close_window(next_window)
+        return self.windows
+
+    @staticmethod
+    def _sleep_until(at):
+        delay = at - time.perf_counter()
+        if delay > 0:
+            time.sleep(delay)
+
+
+def run_soak_quietly(run):
+    """
+    SoakRun.run with the flows' response printing discarded, and a
+    progress line per closed window on the real stdout. Returns
+    (windows, wall_time_s).
+    """
+    out = sys.stdout
+    on_window = run.on_window
+
+    def progress(window):
+        if on_window is not None:
+            on_window(window)
+        print_window(window, out)
+
+    run.on_window = progress
+    start = time.perf_counter()
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        windows = run.run()
+    return windows, time.perf_counter() - start
+
+
+def _clock(seconds):
+    seconds = int(seconds)
+    return f"{seconds // 3600}:{seconds % 3600 // 60:02}:{seconds % 60:02}"
+
+
+def print_window(window, file=None):
+    memory = "".join(
+        f"  {label} {window[key]:.1f} MB" for key, label in (("rss_mb", "RSS"), ("heap_mb", "heap")) if key in window
+    )
+    slowest = max(window["p95"].items(), key=lambda kv: kv[1], default=None)
+    print(
+        f"[soak] +{_clock(window['start_s'])}: {window['started']} journeys, {window['failed']} failed,"
+        f" {window['skipped']} skipped{memory}"
+        + (f"  slowest p95 {slowest[0]} {slowest[1] * 1000:.0f} ms" if slowest else ""),
+        file=file, flush=True,
+    )
+
+
+# ========================
+# DRIFT DETECTION
+# ========================
+
+def theil_sen(xs, ys):
+    """
+    (slope, intercept): median of the pairwise slopes, and the median of
+    y - slope * x.
+    """
+    slopes = [
+        (ys[j] - ys[i]) / (xs[j] - xs[i])
+        for i in range(len(xs)) for j in range(i + 1, len(xs)) if xs[j] != xs[i]
+    ]
+    slope = statistics.median(slopes) if slopes else 0.0
+    return slope, statistics.median(y - slope * x for x, y in zip(xs, ys))
+
+
+def mann_kendall(ys):
+    """
+    One-sided p-value for an upward trend in `ys` (normal approximation
+    with the tie correction, which holds from about MIN_POINTS up).
+    """
+    n = len(ys)
+    s = sum(
+        (ys[j] > ys[i]) - (ys[j] < ys[i])
+        for i in range(n) for j in range(i + 1, n)
+    )
+    ties = sum(t * (t - 1) * (2 * t + 5) for t in _tie_sizes(ys))
+    variance = (n * (n - 1) * (2 * n + 5) - ties) / 18
+    if variance <= 0 or s <= 0:
+        return 1.0
+    z = (s - 1) / math.sqrt(variance)
+    return 0.5 * math.erfc(z / math.sqrt(2))
+
+
+def _tie_sizes(ys):
+    counts = {}
+    for y in ys:
+        counts[y] = counts.get(y, 0) + 1
+    return [c for c in counts.values() if c > 1]
+
+
+def trend(xs, ys, alpha, min_growth):
+    slope, intercept = theil_sen(xs, ys)
+    first = intercept + slope * xs[0]
+    growth = slope * (xs[-1] - xs[0]) / first if first > 0 else math.inf if slope > 0 else 0.0
+    p = mann_kendall(ys)
+    return {
+        "points": len(ys),
+        "first": first,
+        "last": intercept + slope * xs[-1],
+        "slope_per_h": slope * 3600,
+        "growth": growth,
+        "p": p,
+        "drift": p < alpha and growth >= min_growth,
+    }
+
+
+def _series(windows):
+    series = {}
+    for w in windows:
+        for key, label in (("rss_mb", "server RSS MB"), ("heap_mb", "server heap MB")):
+            if w.get(key) is not None:
+                series.setdefault(label, []).append((w["start_s"], w[key]))
+        for endpoint, p95 in w["p95"].items():
+            series.setdefault(f"p95 ms {endpoint}", []).append((w["start_s"], p95 * 1000))
+    return series
+
+
+def drift_report(windows, warmup=1, alpha=0.01, min_growth=0.1):
+    """
+    Trend of every series over the windows after the first `warmup`.
+    Series with fewer than MIN_POINTS points are listed as too short.
+    """
+    measured = windows[warmup:]
+    trends = {}
+    short = []
+    for label, points in _series(measured).items():
+        if len(points) < MIN_POINTS:
+            short.append(label)
+            continue
+        xs, ys = zip(*points)
+        trends[label] = trend(xs, ys, alpha, min_growth)
+    return {
+        "windows": len(windows),
+        "warmup": warmup,
+        "alpha": alpha,
+        "min_growth": min_growth,
+        "journeys": sum(w["started"] for w in windows),
+        "failed": sum(w["failed"] for w in windows),
+        "skipped": sum(w["skipped"] for w in windows),
+        "trends": trends,
+        "too_short": short,
+        "drifting": sorted(label for label, t in trends.items() if t["drift"]),
+    }
+
+
+def print_soak_summary(report, wall_s=None):
+    print("\n========== SOAK ==========")
+    print(
+        f"Windows: {report['windows']} ({report['warmup']} warm-up), journeys: {report['journeys']},"
+        f" failed: {report['failed']}, skipped: {report['skipped']}"
+        + (f", wall time: {wall_s / 3600:.2f}h" if wall_s is not None else "")
+    )
+    if report["trends"]:
+        print(f"\n{'series':55} {'start':>9} {'end':>9} {'per hour':>9} {'growth':>8} {'p':>8}")
+        ranked = sorted(report["trends"].items(), key=lambda kv: (not kv[1]["drift"], kv[1]["p"]))
+        for label, t in ranked:
+            print(
+                f"{label[:55]:55} {t['first']:>9.1f} {t['last']:>9.1f} {t['slope_per_h']:>+9.1f}"
+                f" {t['growth'] * 100:>7.0f}% {t['p']:>8.4f}" + ("  DRIFT" if t["drift"] else "")
+            )
+    if report["too_short"]:
+        print(f"\nToo few windows with data (< {MIN_POINTS}) to judge: {', '.join(report['too_short'])}")
+    if report["drifting"]:
+        print(
+            f"\n{len(report['drifting'])} series drift upward"
+            f" (p < {report['alpha']}, growth >= {report['min_growth'] * 100:.0f}%)"
+        )
+    else:
+        print("\nNo significant upward drift")
+    print("=" * 60)
@@ -0,0 +1,145 @@
+"""
+Data-scale benchmark for GET /stats/pickups.
+
+For each target row count the database is first topped up with the bulk
+seeder, then the endpoint is called repeatedly for the whole table and for
+a month-long range (what the admin dashboard asks for). Latency goes into a
+LatencyHistogram per range; response size comes from the transport, and
+the API server's resident memory is read from /proc when its pid is given,
+which is where loading every pickup into Node used to show up.
+"""
+
+import math
+from datetime import datetime, timedelta
+
+from harness.api import assert_status, auth_headers
+from harness.histogram import LatencyHistogram
+
+STATS_ENDPOINT = "/stats/pickups"
+
+
+def count_pickups(http, admin_token):
+    resp = http.get("/stats/overview", headers=auth_headers(admin_token))
+    assert_status(resp, 200, "stats overview")
+    return resp.json()["totalPickups"]
+
+
+def households_for(rows, pickups_per_household, batch_size):
+    """
+    Seeded households needed for `rows` pickups, rounded up to whole
+    batches so the next level can grow the same seed checkpoint.
+    """
+    households = math.ceil(rows / pickups_per_household)
+    return math.ceil(households / batch_size) * batch_size
+
+
+def server_memory_kb(pid):
+    """
+    (VmRSS, VmHWM) of a local process in kB, or None without a pid.
+    """
+    if not pid:
+        return None
+    fields = {}
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            key, _, value = line.partition(":")
+            if key in ("VmRSS", "VmHWM"):
+                fields[key] = int(value.split()[0])
+    return fields.get("VmRSS"), fields.get("VmHWM")
+
+
+def stats_ranges():
+    now = datetime.utcnow()
+    return {
+        "all": {},
+        "last 30 days": {"from": (now - timedelta(days=30)).isoformat(), "to": now.isoformat()},
+    }
+
+
+def measure_stats(http, admin_token, requests, server_pid=None):
+    """
+    Call STATS_ENDPOINT `requests` times per range. Returns
+    {range: {"latency": LatencyHistogram, "bytes": int, "total": int,
+    "rss_kb": (before, after) or None, "peak_kb": int or None}}.
+    """
+    timings = []
+
+    def record(timing):
+        if timing.endpoint == STATS_ENDPOINT:
+            timings.append(timing)
+
+    results = {}
+    http.listeners.append(record)
+    try:
+        for name, params in stats_ranges().items():
+            before = server_memory_kb(server_pid)
+            total = 0
+            for _ in range(requests):
+                resp = http.get(STATS_ENDPOINT, params=params, headers=auth_headers(admin_token))
+                assert_status(resp, 200, f"stats pickups ({name})")
+                total = resp.json()["total"]
+            after = server_memory_kb(server_pid)
+            latency = LatencyHistogram()
+            for timing in timings:
+                latency.record(timing.total_s)
+            results[name] = {
+                "latency": latency,
+                "bytes": max((t.bytes for t in timings), default=0),
+                "total": total,
+                "rss_kb": (before[0], after[0]) if before else None,
+                "peak_kb": after[1] if after else None,
+            }
+            timings.clear()
+    finally:
+        http.listeners.remove(record)
+    return results
+
+
+def stats_bench_report(levels):
+    """
+    JSON-friendly form of [(target_rows, actual_rows, results), ...].
+    """
+    return {
+        "endpoint": STATS_ENDPOINT,
+        "levels": [
+            {
+                "target_rows": target,
+                "rows": rows,
+                "ranges": {
+                    name: {
+                        "count": r["latency"].count,
+                        "mean": r["latency"].mean(),
+                        "p50": r["latency"].percentile(50),
+                        "p99": r["latency"].percentile(99),
+                        "max": r["latency"].max_us / 1_000_000,
+                        "matched": r["total"],
+                        "response_bytes": r["bytes"],
+                        "server_rss_kb": r["rss_kb"],
+                        "server_peak_kb": r["peak_kb"],
+                        "histogram": r["latency"].to_dict(),
+                    }
+                    for name, r in results.items()
+                },
+            }
+            for target, rows, results in levels
+        ],
+    }
+
+
+def print_stats_bench(levels):
+    print(f"\n========== {STATS_ENDPOINT} BY DATA SIZE (ms) ==========")
+    print(
+        f"{'rows':>9} {'range':14} {'matched':>9} {'p50':>8} {'p99':>8} {'max':>8}"
+        f" {'bytes':>7} {'rss MB':>8} {'peak MB':>8}"
+    )
+    for _, rows, results in levels:
+        for name, r in results.items():
+            h = r["latency"]
+            rss = f"{r['rss_kb'][1] / 1024:.1f}" if r["rss_kb"] else "-"
+            peak = f"{r['peak_kb'] / 1024:.1f}" if r["peak_kb"] else "-"
+            print(
+                f"{rows:>9} {name:14} {r['total']:>9} {h.percentile(50) * 1000:>8.1f}"
+                f" {h.percentile(99) * 1000:>8.1f} {h.max_us / 1000:>8.1f}"
+                f" {r['bytes']:>7} {rss:>8} {peak:>8}"
+            )
+    print("=" * 60)
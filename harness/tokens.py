@@ -0,0 +1,256 @@
+"""
+On-disk JWT cache, so repeated runs stop paying the server's bcrypt cost
+on every login.
+
+Entries are keyed by phone number under the API base URL. A cached access
+token is reused until REFRESH_MARGIN_S before its `exp` claim; after that
+the cache tries POST /auth/refresh, and only falls back to /auth/login when
+there is no usable refresh token. Passwords are never written: an entry
+stores a salted PBKDF2 digest of the password it was obtained with and is
+dropped when a different password is used. The file holds live access and
+refresh tokens (the admin's included), so it is created readable by its
+owner only.
+
+The file is shared by threads and processes (parallel smoke tests, seeder
+workers). Each account is renewed under its own lock: a thread lock, plus
+a one-byte lockf record lock in <path>.keys.lock across processes. The
+holder re-reads the file before going to the server, so one caller
+refreshes a token and the others pick up the result; refresh rotates the
+server-side refresh token, which is why that matters. Other accounts log
+in meanwhile; only the file rewrite itself takes an exclusive flock.
+"""
+
+import base64
+import contextlib
+import hashlib
+import hmac
+import json
+import os
+import threading
+import time
+
+try:
+    import fcntl
+except ImportError:  # Windows: no cross-process locking, threads still serialise
+    fcntl = None
+
+from harness.api import assert_status, extract_tokens_and_user
+
+REFRESH_MARGIN_S = 60
+# Slows offline guessing from a copied cache file; paid once per password
+# and process, since verified digests are remembered
+PASSWORD_ITERATIONS = 200_000
+# Record lock offsets in the keys lock file; two accounts hashing to the
+# same byte only share a lock
+KEY_LOCK_SLOTS = 1 << 20
+
+
+def jwt_exp(token):
+    """
+    The `exp` claim of a JWT (seconds since the epoch), or 0 if unreadable.
+    The signature is not checked; the server does that.
+    """
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(payload)).get("exp") or 0)
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return 0
+
+
+def _password_digest(password, salt=None):
+    """
+    "pbkdf2_sha256$iterations$salt$digest" for `password`, with a new
+    random salt unless one is given.
+    """
+    salt = salt or os.urandom(16).hex()
+    digest = hashlib.pbkdf2_hmac("sha256", password.encode(), bytes.fromhex(salt), PASSWORD_ITERATIONS).hex()
+    return f"pbkdf2_sha256${PASSWORD_ITERATIONS}${salt}${digest}"
+
+
+class TokenCache:
+    def __init__(self, path, refresh_margin=REFRESH_MARGIN_S):
+        self.path = path
+        self.refresh_margin = refresh_margin
+        self.logins = 0
+        self.refreshes = 0
+        self.hits = 0
+        self._memory = {}
+        self._owners = {}  # access token handed out -> (phone, password), in memory only
+        self._handed = {}  # key -> the access token last handed out for it
+        self._verified = set()  # (stored digest, password) pairs already checked, in memory only
+        self._key_locks = {}
+        self._keys_file = None
+        self._file_lock = threading.Lock()  # the file rewrite, for threads where there is no flock
+        self._lock = threading.Lock()  # the dicts and counters above, never held across I/O
+
+    def _password_matches(self, entry, password):
+        stored = entry.get("password") or ""
+        if (stored, password) in self._verified:
+            return True
+        scheme, iterations, salt, _ = (stored.split("$") + ["", "", "", ""])[:4]
+        # Entries from older versions (a bare SHA-256) never match: one login replaces them
+        if scheme != "pbkdf2_sha256" or iterations != str(PASSWORD_ITERATIONS):
+            return False
+        if not hmac.compare_digest(stored, _password_digest(password, salt)):
+            return False
+        self._verified.add((stored, password))
+        return True
+
+    def _fresh(self, entry, password):
+        return (
+            entry is not None
+            and self._password_matches(entry, password)
+            and jwt_exp(entry["access"]) - self.refresh_margin > time.time()
+        )
+
+    def get(self, http, phone, password, name="login"):
+        """
+        (access, refresh, user_id, user) for `phone`, the same shape as
+        harness.api.login returns.
+        """
+        key = (http.base_url, phone)
+        with self._lock:
+            entry = self._memory.get(key)
+        if self._fresh(entry, password):
+            self._count("hits")
+            return entry["access"], entry["refresh"], entry["user_id"], entry["user"]
+        with self._locked(key):
+            # Another thread or process may have renewed it meanwhile
+            entry = self._read().get(http.base_url, {}).get(phone) or entry
+            if self._fresh(entry, password):
+                self._count("hits")
+            else:
+                entry = self._renew(http, phone, password, name, entry)
+                self._edit(http.base_url, phone, lambda _: entry)
+            with self._lock:
+                self._memory[key] = entry
+                replaced = self._handed.get(key)
+                if replaced != entry["access"]:
+                    self._owners.pop(replaced, None)
+                    self._handed[key] = entry["access"]
+                self._owners[entry["access"]] = (phone, password)
+        return entry["access"], entry["refresh"], entry["user_id"], entry["user"]
+
+    def renew_headers(self, http, headers):
+        """
+        After a 401: if `headers` carry a token this cache handed out,
+        return a copy carrying a renewed one, otherwise None.
+        """
+        auth = (headers or {}).get("Authorization", "")
+        if not auth.startswith("Bearer "):
+            return None
+        rejected = auth[len("Bearer "):]
+        with self._lock:
+            owner = self._owners.get(rejected)
+        if owner is None:
+            return None
+        phone, password = owner
+        self.invalidate(http, phone, rejected)
+        access = self.get(http, phone, password)[0]
+        if access == rejected:
+            return None
+        return dict(headers, Authorization=f"Bearer {access}")
+
+    def invalidate(self, http, phone, access):
+        """
+        Forget `access` after the server rejected it; the refresh token is
+        kept. A newer token another process already stored is left alone.
+        """
+        key = (http.base_url, phone)
+        with self._locked(key):
+            with self._lock:
+                self._memory.pop(key, None)
+            self._edit(http.base_url, phone, lambda e: dict(e, access="") if e and e["access"] == access else e)
+
+    def _count(self, counter):
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    # ========================
+    # LOCKS AND FILE
+    # ========================
+
+    @contextlib.contextmanager
+    def _locked(self, key):
+        """
+        Hold `key`'s lock: its thread lock, and across processes a record
+        lock on one byte of the keys lock file.
+        """
+        with self._lock:
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            if not fcntl:
+                yield
+                return
+            with self._lock:
+                if self._keys_file is None:
+                    # Kept open: closing any descriptor of the file would
+                    # drop all of this process' record locks on it
+                    self._keys_file = open(f"{self.path}.keys.lock", "a")
+            offset = int.from_bytes(hashlib.sha256(repr(key).encode()).digest()[:4], "big") % KEY_LOCK_SLOTS
+            fcntl.lockf(self._keys_file, fcntl.LOCK_EX, 1, offset)
+            try:
+                yield
+            finally:
+                fcntl.lockf(self._keys_file, fcntl.LOCK_UN, 1, offset)
+
+    def _renew(self, http, phone, password, name, entry):
+        usable = entry is not None and self._password_matches(entry, password)
+        if usable and entry["refresh"] and jwt_exp(entry["refresh"]) > time.time():
+            resp = http.post("/auth/refresh", json={"refreshToken": entry["refresh"]})
+            if resp.status_code == 200:
+                access, refresh, _, _ = extract_tokens_and_user(resp.json())
+                self._count("refreshes")
+                return dict(entry, access=access, refresh=refresh or entry["refresh"])
+
+        resp = http.post("/auth/login", json={"phone": phone, "password": password})
+        assert_status(resp, 200, name)
+        access, refresh, user_id, user = extract_tokens_and_user(resp.json())
+        self._count("logins")
+        digest = _password_digest(password)
+        self._verified.add((digest, password))
+        return {
+            "access": access,
+            "refresh": refresh,
+            "user_id": user_id,
+            "user": user,
+            "password": digest,
+        }
+
+    def _edit(self, base_url, phone, change):
+        """
+        Apply change(entry) -> entry to one entry with the file locked.
+        """
+        with self._file_lock, open(f"{self.path}.lock", "a") as lock:
+            if fcntl:
+                fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                data = self._read()
+                entries = data.setdefault(base_url, {})
+                entry = change(entries.get(phone))
+                if entry is None:
+                    entries.pop(phone, None)
+                else:
+                    entries[phone] = entry
+                tmp = f"{self.path}.{os.getpid()}.tmp"
+                # Owner-only from creation, whatever the umask; replacing the
+                # file also tightens one an older version left world-readable
+                fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+                os.chmod(tmp, 0o600)
+                with os.fdopen(fd, "w") as f:
+                    json.dump(data, f)
+                os.replace(tmp, self.path)
+            finally:
+                if fcntl:
+                    fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _read(self):
+        try:
+            with open(self.path) as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            # A corrupt cache is only a cache
+            return {}
@@ -0,0 +1,191 @@
+"""
+Pooled keep-alive HTTP transport with per-request timing.
+
+Every call made through HttpClient reuses a connection from a shared pool
+and produces a RequestTiming record with:
+  - connect_s: time spent opening a new TCP (+TLS) connection, 0 if reused
+  - ttfb_s:    time until the status line and headers were received
+  - total_s:   time until the full body was read
+
+Records are tagged with an endpoint template (e.g. "/pickups/{id}/accept")
+so timings from different ids aggregate under the same endpoint.
+"""
+
+import re
+import threading
+import time
+from collections import namedtuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+DEFAULT_TIMEOUT = 10
+
+# server_timing is the raw Server-Timing response header, when the API sends
+# one (see harness.servertiming)
+RequestTiming = namedtuple(
+    "RequestTiming",
+    ["method", "endpoint", "status", "connect_s", "ttfb_s", "total_s", "bytes", "started_at", "server_timing"],
+    defaults=(None,),
+)
+
+# ========================
+# CONNECT TIMING
+# ========================
+
+# Connect time is accumulated per thread: the pool opens the connection deep
+# inside urllib3, so this is the only place that sees both ends of it.
+_local = threading.local()
+
+
+class _TimedHTTPConnection(HTTPConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect_s = getattr(_local, "connect_s", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPSConnection(HTTPSConnection):
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _local.connect_s = getattr(_local, "connect_s", 0.0) + time.perf_counter() - start
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+# ========================
+# ENDPOINT TEMPLATES
+# ========================
+
+_ID_SEGMENT = re.compile(
+    r"^(?:[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}|\d+)$"
+)
+
+
+def endpoint_template(path):
+    """
+    "/pickups/3f0c...-9a1e/accept?x=1" -> "/pickups/{id}/accept"
+    """
+    path = path.split("?", 1)[0]
+    segments = ["{id}" if _ID_SEGMENT.match(s) else s for s in path.split("/")]
+    return "/".join(segments)
+
+
+# ========================
+# CLIENT
+# ========================
+
+class HttpClient:
+    """
+    Thin wrapper around a pooled requests.Session.
+
+    Paths are relative to base_url (which already includes the API prefix).
+    Every request is reported to the callables in `listeners` as a
+    RequestTiming, including requests that fail before a response arrives
+    (status 0). `token_cache` (a harness.tokens.TokenCache) is used by
+    harness.api.login when set; `recorder` (a harness.cassette.CassetteWriter)
+    receives every response once its body has been read; `cache` (a
+    harness.httpcache.ConditionalCache) turns GETs into conditional ones.
+    """
+
+    def __init__(self, base_url, timeout=DEFAULT_TIMEOUT, pool_size=10, token_cache=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.listeners = []
+        self.token_cache = token_cache
+        self.recorder = None
+        self.cache = None
+
+        self.session = requests.Session()
+        adapter = TimedHTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def request(self, method, path, endpoint=None, **kwargs):
+        kwargs.setdefault("timeout", self.timeout)
+        url = path if path.startswith(("http://", "https://")) else f"{self.base_url}{path}"
+        if endpoint is None:
+            rel = url[len(self.base_url):] if url.startswith(self.base_url) else urlsplit(url).path
+            endpoint = endpoint_template(rel)
+
+        cache_key = None
+        if self.cache is not None and method == "GET":
+            cache_key, kwargs = self.cache.conditional(url, kwargs)
+
+        resp = self._send(method, url, endpoint, kwargs)
+        if resp.status_code == 401 and self.token_cache is not None:
+            # A cached token the server no longer accepts (database reset,
+            # secret rotated): renew it once and repeat the request.
+            headers = self.token_cache.renew_headers(self, kwargs.get("headers"))
+            if headers is not None:
+                resp = self._send(method, url, endpoint, dict(kwargs, headers=headers))
+        if cache_key is not None:
+            resp = self.cache.complete(cache_key, resp)
+        return resp
+
+    def _send(self, method, url, endpoint, kwargs):
+        status, size, ttfb, server_timing = 0, 0, None, None
+        _local.connect_s = 0.0
+        started_at = time.time()
+        start = time.perf_counter()
+        try:
+            # stream=True returns as soon as the headers are parsed, which is
+            # what lets us split TTFB from body transfer.
+            resp = self.session.request(method, url, stream=True, **kwargs)
+            ttfb = time.perf_counter() - start
+            size = len(resp.content)
+            status = resp.status_code
+            server_timing = resp.headers.get("Server-Timing")
+            if self.recorder is not None:
+                self.recorder.record(resp, ttfb, time.perf_counter() - start)
+            return resp
+        finally:
+            total = time.perf_counter() - start
+            self._emit(RequestTiming(
+                method, endpoint, status, _local.connect_s, ttfb, total, size, started_at, server_timing,
+            ))
+
+    def get(self, path, **kwargs):
+        return self.request("GET", path, **kwargs)
+
+    def post(self, path, **kwargs):
+        return self.request("POST", path, **kwargs)
+
+    def put(self, path, **kwargs):
+        return self.request("PUT", path, **kwargs)
+
+    def patch(self, path, **kwargs):
+        return self.request("PATCH", path, **kwargs)
+
+    def delete(self, path, **kwargs):
+        return self.request("DELETE", path, **kwargs)
+
+    def close(self):
+        self.session.close()
+
+    def _emit(self, timing):
+        for listener in self.listeners:
+            listener(timing)
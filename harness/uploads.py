@@ -0,0 +1,196 @@
+"""
+Large-upload benchmark for POST /files/upload.
+
+Each upload is a generated multi-megabyte "photo" streamed as a
+multipart/form-data body: PhotoUpload produces it chunk by chunk and has a
+length, so requests sends a Content-Length header and reads the body as a
+file rather than building it in memory. Many uploads in flight cost the
+harness a few chunks each, not a copy of every photo.
+
+Throughput is counted in request-body megabytes per second of wall time.
+When the API server's pid is given, its RSS is sampled throughout the run,
+which is where an upload path that buffers whole files shows up.
+"""
+
+import random
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from harness.api import auth_headers
+from harness.histogram import LatencyHistogram
+from harness.statsbench import server_memory_kb
+
+UPLOAD_ENDPOINT = "/files/upload"
+CHUNK_SIZE = 64 * 1024
+RSS_SAMPLE_S = 0.1
+
+# JPEG start/end markers around random bytes: looks like a photo to content
+# sniffing and, like a real one, does not compress
+_JPEG_START = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+_JPEG_END = b"\xff\xd9"
+
+
+def photo_chunks(size, seed=0):
+    """
+    `size` bytes of fake JPEG in CHUNK_SIZE pieces.
+    """
+    block = random.Random(seed).randbytes(CHUNK_SIZE)
+    yield _JPEG_START
+    remaining = size - len(_JPEG_START) - len(_JPEG_END)
+    while remaining > 0:
+        n = min(remaining, CHUNK_SIZE)
+        yield block[:n]
+        remaining -= n
+    yield _JPEG_END
+
+
+class PhotoUpload:
+    """
+    Streaming multipart body holding one generated photo in field `field`.
+    Pass as `data=` with `headers={"Content-Type": upload.content_type}`.
+    """
+
+    def __init__(self, size, field="file", filename="proof.jpg", seed=0):
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        self._head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field}"; filename="{filename}"\r\n'
+            "Content-Type: image/jpeg\r\n\r\n"
+        ).encode()
+        self._tail = f"\r\n--{boundary}--\r\n".encode()
+        self._size = max(size, len(_JPEG_START) + len(_JPEG_END))
+        self._parts = self._iter_parts(seed)
+        self._buffer = b""
+
+    def _iter_parts(self, seed):
+        yield self._head
+        yield from photo_chunks(self._size, seed)
+        yield self._tail
+
+    def __len__(self):
+        return len(self._head) + self._size + len(self._tail)
+
+    def read(self, n=-1):
+        while n < 0 or len(self._buffer) < n:
+            part = next(self._parts, None)
+            if part is None:
+                break
+            if not self._buffer and 0 <= n <= len(part):
+                self._buffer = part
+                break
+            self._buffer += part
+        if n < 0:
+            n = len(self._buffer)
+        out, self._buffer = self._buffer[:n], self._buffer[n:]
+        return out
+
+
+class _RssSampler:
+    """
+    Peak VmRSS of `pid`, sampled every RSS_SAMPLE_S on a background thread.
+    """
+
+    def __init__(self, pid):
+        self.pid = pid
+        self.peak_kb = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._loop, name="rss-sampler", daemon=True)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            self.peak_kb = max(self.peak_kb, server_memory_kb(self.pid)[0])
+            self._stop.wait(RSS_SAMPLE_S)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_uploads(http, token, size, uploads, concurrency, server_pid=None):
+    """
+    Upload `uploads` generated photos of `size` bytes, `concurrency` at a
+    time. Returns a report dict; see print_upload_summary.
+    """
+    headers = auth_headers(token)
+    latency = LatencyHistogram()
+    lock = threading.Lock()
+    counts = {"ok": 0, "failed": 0}
+    errors = {}
+
+    def upload(i):
+        body = PhotoUpload(size, filename=f"proof-{i}.jpg", seed=i)
+        start = time.perf_counter()
+        try:
+            resp = http.post(UPLOAD_ENDPOINT, data=body, headers={**headers, "Content-Type": body.content_type})
+            status, detail = resp.status_code, resp.text[:120]
+        except Exception as e:
+            status, detail = 0, str(e)[:120]
+        elapsed = time.perf_counter() - start
+        with lock:
+            if status in (200, 201):
+                counts["ok"] += 1
+                latency.record(elapsed)
+            else:
+                counts["failed"] += 1
+                errors.setdefault(f"{status} {detail}", 0)
+                errors[f"{status} {detail}"] += 1
+
+    before = server_memory_kb(server_pid)
+    sampler = _RssSampler(server_pid) if server_pid else None
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        if sampler is not None:
+            with sampler:
+                list(pool.map(upload, range(uploads)))
+        else:
+            list(pool.map(upload, range(uploads)))
+    wall_s = time.perf_counter() - start
+    after = server_memory_kb(server_pid)
+
+    sent_mb = counts["ok"] * size / (1024 * 1024)
+    return {
+        "size_bytes": size,
+        "uploads": uploads,
+        "concurrency": concurrency,
+        "ok": counts["ok"],
+        "failed": counts["failed"],
+        "errors": errors,
+        "wall_s": wall_s,
+        "mb_per_s": sent_mb / wall_s if wall_s else 0.0,
+        "latency": latency,
+        "rss_kb": (before[0], after[0]) if before else None,
+        "rss_peak_kb": sampler.peak_kb if sampler else None,
+        "hwm_kb": after[1] if after else None,
+    }
+
+
+def upload_report(result):
+    return {**result, "latency": result["latency"].to_dict()}
+
+
+def print_upload_summary(result):
+    lat = result["latency"]
+    print(f"\n========== UPLOADS: {result['size_bytes'] / (1024 * 1024):.1f} MB x {result['uploads']},"
+          f" concurrency {result['concurrency']} ==========")
+    print(f"Uploaded: {result['ok']}, failed: {result['failed']}, wall {result['wall_s']:.1f}s")
+    print(f"Throughput: {result['mb_per_s']:.1f} MB/s")
+    print(
+        f"Latency ms: p50 {lat.percentile(50) * 1000:.0f}, p90 {lat.percentile(90) * 1000:.0f},"
+        f" p99 {lat.percentile(99) * 1000:.0f}, max {lat.max_us / 1000:.0f}"
+    )
+    if result["rss_kb"]:
+        before, after = result["rss_kb"]
+        print(
+            f"Server RSS: {before / 1024:.0f} MB before, {result['rss_peak_kb'] / 1024:.0f} MB peak"
+            f" (+{(result['rss_peak_kb'] - before) / 1024:.0f}), {after / 1024:.0f} MB after"
+        )
+    for message, count in list(result["errors"].items())[:5]:
+        print(f"  {count} x {message}")
+    print("=" * 60)
@@ -147,6 +147,7 @@ export class AgentsService {
       totalPickups,
       completedPickups,
       averageRating: agent.averageRating,
+      totalRatings: agent.ratingCount,
       kycStatus: agent.kycStatus,
     };
   }
@@ -48,6 +48,13 @@ export class PickupAgentProfile {
   @Column({ type: 'decimal', precision: 3, scale: 2, name: 'average_rating', default: 0 })
   averageRating: number;
 
+  // Running totals behind averageRating, updated with each new rating
+  @Column({ name: 'rating_sum', default: 0 })
+  ratingSum: number;
+
+  @Column({ name: 'rating_count', default: 0 })
+  ratingCount: number;
+
   @Column({ name: 'total_completed_pickups', default: 0 })
   totalCompletedPickups: number;
 
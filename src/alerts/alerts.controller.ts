@@ -1,11 +1,13 @@
 import { Controller, Get, Post, Patch, Param, Body, Query, UseGuards } from '@nestjs/common';
-import { ApiTags, ApiOperation, ApiBearerAuth, ApiQuery } from '@nestjs/swagger';
+import { ApiTags, ApiOperation, ApiBearerAuth } from '@nestjs/swagger';
 import { AlertsService } from './alerts.service';
 import { JwtAuthGuard } from '../common/guards/jwt-auth.guard';
 import { CurrentUser } from '../common/decorators/current-user.decorator';
 import { Roles } from '../common/decorators/roles.decorator';
 import { Role } from '../common/enums/role.enum';
-import { AlertStatus } from '../common/enums/alert-status.enum';
+import { BoundingBoxQueryDto, NearbyQueryDto } from '../common/dto/geo-query.dto';
+import { PAGINATED_LIST_DESCRIPTION } from '../common/utils/cursor.util';
+import { ListAlertsQueryDto } from './dto/list-alerts-query.dto';
 
 @ApiTags('Alerts')
 @Controller('alerts')
@@ -22,14 +24,21 @@ export class AlertsController {
   }
 
   @Get()
-  @ApiOperation({ summary: 'Get all alerts' })
-  @ApiQuery({ name: 'status', required: false, enum: AlertStatus })
-  @ApiQuery({ name: 'type', required: false })
-  async findAll(
-    @Query('status') status?: AlertStatus,
-    @Query('type') type?: string,
-  ) {
-    return this.alertsService.findAll(status, type);
+  @ApiOperation({ summary: 'Get all alerts', description: PAGINATED_LIST_DESCRIPTION })
+  async findAll(@Query() query: ListAlertsQueryDto) {
+    return this.alertsService.findAll(query.status, query.type, query.cursor, query.limit);
+  }
+
+  @Get('nearby')
+  @ApiOperation({ summary: 'Nearest alerts to a point, optionally within a radius (meters)' })
+  async findNearby(@Query() query: NearbyQueryDto) {
+    return this.alertsService.findNearby(query);
+  }
+
+  @Get('within')
+  @ApiOperation({ summary: 'Alerts inside a bounding box (map viewport)' })
+  async findWithin(@Query() query: BoundingBoxQueryDto) {
+    return this.alertsService.findWithin(query);
   }
 
   @Get(':id')
@@ -3,6 +3,10 @@ import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { Alert } from './entities/alert.entity';
 import { AlertStatus } from '../common/enums/alert-status.enum';
+import { BoundingBoxQueryDto, NearbyQueryDto } from '../common/dto/geo-query.dto';
+import { CursorPaginatedResult } from '../common/dto/pagination.dto';
+import { paginateByKey } from '../common/utils/cursor.util';
+import { findNearby, findWithin } from '../common/utils/geo.util';
 
 @Injectable()
 export class AlertsService {
@@ -26,16 +30,29 @@ export class AlertsService {
     return this.alertRepository.save(alert);
   }
 
-  async findAll(status?: AlertStatus, type?: string) {
-    const where: any = {};
-    if (status) where.status = status;
-    if (type) where.type = type;
+  async findAll(
+    status?: AlertStatus,
+    type?: string,
+    cursor?: string,
+    limit?: number,
+  ): Promise<Alert[] | CursorPaginatedResult<Alert>> {
+    const queryBuilder = this.alertRepository
+      .createQueryBuilder('alert')
+      .leftJoinAndSelect('alert.createdBy', 'createdBy')
+      .leftJoinAndSelect('alert.bin', 'bin')
+      .leftJoinAndSelect('alert.resolvedBy', 'resolvedBy');
+    if (status) queryBuilder.andWhere('alert.status = :status', { status });
+    if (type) queryBuilder.andWhere('alert.type = :type', { type });
 
-    return this.alertRepository.find({
-      where,
-      relations: ['createdBy', 'bin', 'resolvedBy'],
-      order: { createdAt: 'DESC' },
-    });
+    return paginateByKey(queryBuilder, 'alert', 'createdAt', 'DESC', cursor, limit);
+  }
+
+  async findNearby(query: NearbyQueryDto) {
+    return findNearby(this.alertRepository.createQueryBuilder('alert'), 'alert', query);
+  }
+
+  async findWithin(query: BoundingBoxQueryDto): Promise<Alert[]> {
+    return findWithin(this.alertRepository.createQueryBuilder('alert'), 'alert', query);
   }
 
   async findOne(id: string): Promise<Alert> {
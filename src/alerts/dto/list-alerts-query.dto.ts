@@ -0,0 +1,16 @@
+import { IsEnum, IsOptional, IsString } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { CursorPaginationDto } from '../../common/dto/pagination.dto';
+import { AlertStatus } from '../../common/enums/alert-status.enum';
+
+export class ListAlertsQueryDto extends CursorPaginationDto {
+  @ApiPropertyOptional({ enum: AlertStatus })
+  @IsOptional()
+  @IsEnum(AlertStatus)
+  status?: AlertStatus;
+
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsString()
+  type?: string;
+}
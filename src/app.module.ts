@@ -18,6 +18,7 @@ import { StatsModule } from './stats/stats.module';
 import { NotificationsModule } from './notifications/notifications.module';
 import { FilesModule } from './files/files.module';
 import { HealthModule } from './health/health.module';
+import { ResponseCacheModule } from './common/cache/response-cache.module';
 import { JwtAuthGuard } from './common/guards/jwt-auth.guard';
 import { RolesGuard } from './common/guards/roles.guard';
 
@@ -29,6 +30,7 @@ import { RolesGuard } from './common/guards/roles.guard';
       validationSchema,
     }),
     DatabaseModule,
+    ResponseCacheModule,
     AuthModule,
     UsersModule,
     HouseholdsModule,
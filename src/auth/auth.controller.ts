@@ -7,6 +7,7 @@ import { RegisterAgentDto } from './dto/register-agent.dto';
 import { LoginDto } from './dto/login.dto';
 import { RefreshTokenDto } from './dto/refresh-token.dto';
 import { ChangePasswordDto } from './dto/change-password.dto';
+import { AuthResponseDto, TokenPairDto } from './dto/auth-response.dto';
 import { JwtAuthGuard } from '../common/guards/jwt-auth.guard';
 import { CurrentUser } from '../common/decorators/current-user.decorator';
 import { Public } from '../common/decorators/public.decorator';
@@ -23,7 +24,7 @@ export class AuthController {
   @Public()
   @Post('register')
   @ApiOperation({ summary: 'Register a new household user' })
-  @ApiResponse({ status: 201, description: 'User registered successfully' })
+  @ApiResponse({ status: 201, description: 'User registered successfully', type: AuthResponseDto })
   @ApiResponse({ status: 409, description: 'User already exists' })
   async register(@Body() registerDto: RegisterHouseholdDto) {
     return this.authService.register(registerDto);
@@ -32,7 +33,7 @@ export class AuthController {
   @Public()
   @Post('register-agent')
   @ApiOperation({ summary: 'Register a new agent user (requires feature flag enabled)' })
-  @ApiResponse({ status: 201, description: 'Agent registered successfully' })
+  @ApiResponse({ status: 201, description: 'Agent registered successfully', type: AuthResponseDto })
   @ApiResponse({ status: 403, description: 'Agent self-registration is disabled' })
   @ApiResponse({ status: 409, description: 'User already exists' })
   async registerAgent(@Body() registerDto: RegisterAgentDto) {
@@ -50,7 +51,7 @@ export class AuthController {
   @HttpCode(HttpStatus.OK)
   @UseGuards(AuthGuard('local'))
   @ApiOperation({ summary: 'Login with phone and password' })
-  @ApiResponse({ status: 200, description: 'Login successful' })
+  @ApiResponse({ status: 200, description: 'Login successful', type: AuthResponseDto })
   @ApiResponse({ status: 401, description: 'Invalid credentials' })
   async login(@Body() loginDto: LoginDto, @CurrentUser() user: any) {
     return this.authService.login(user);
@@ -60,7 +61,7 @@ export class AuthController {
   @Post('refresh')
   @HttpCode(HttpStatus.OK)
   @ApiOperation({ summary: 'Refresh access token' })
-  @ApiResponse({ status: 200, description: 'Token refreshed successfully' })
+  @ApiResponse({ status: 200, description: 'Token refreshed successfully', type: TokenPairDto })
   @ApiResponse({ status: 401, description: 'Invalid refresh token' })
   async refresh(@Body() refreshTokenDto: RefreshTokenDto) {
     return this.authService.refreshTokens(refreshTokenDto.refreshToken);
@@ -4,6 +4,7 @@ import { Repository } from 'typeorm';
 import { JwtService } from '@nestjs/jwt';
 import { ConfigService } from '@nestjs/config';
 import * as bcrypt from 'bcrypt';
+import { createHash, timingSafeEqual } from 'crypto';
 import { User } from '../users/entities/user.entity';
 import { HouseholdProfile } from '../households/entities/household-profile.entity';
 import { PickupAgentProfile } from '../agents/entities/pickup-agent-profile.entity';
@@ -62,7 +63,7 @@ export class AuthService {
     const tokens = await this.generateTokens(user);
 
     // Save refresh token
-    user.refreshToken = await bcrypt.hash(tokens.refreshToken, 10);
+    user.refreshToken = this.hashRefreshToken(tokens.refreshToken);
     await this.userRepository.save(user);
 
     return {
@@ -117,7 +118,7 @@ export class AuthService {
     const tokens = await this.generateTokens(user);
 
     // Save refresh token
-    user.refreshToken = await bcrypt.hash(tokens.refreshToken, 10);
+    user.refreshToken = this.hashRefreshToken(tokens.refreshToken);
     await this.userRepository.save(user);
 
     return {
@@ -136,7 +137,7 @@ export class AuthService {
     const tokens = await this.generateTokens(user);
 
     // Save refresh token hash
-    user.refreshToken = await bcrypt.hash(tokens.refreshToken, 10);
+    user.refreshToken = this.hashRefreshToken(tokens.refreshToken);
     await this.userRepository.save(user);
 
     return {
@@ -185,7 +186,7 @@ export class AuthService {
       }
 
       // Verify the refresh token matches the stored hash
-      const isRefreshTokenValid = await bcrypt.compare(refreshToken, user.refreshToken);
+      const isRefreshTokenValid = await this.refreshTokenMatches(refreshToken, user.refreshToken);
 
       if (!isRefreshTokenValid) {
         throw new UnauthorizedException('Invalid refresh token');
@@ -194,8 +195,9 @@ export class AuthService {
       // Generate new tokens
       const tokens = await this.generateTokens(user);
 
-      // Update refresh token hash in database
-      user.refreshToken = await bcrypt.hash(tokens.refreshToken, 10);
+      // Update refresh token hash in database (a bcrypt hash left from before
+      // the switch to SHA-256 is replaced here too)
+      user.refreshToken = this.hashRefreshToken(tokens.refreshToken);
       await this.userRepository.save(user);
 
       return tokens;
@@ -228,6 +230,24 @@ export class AuthService {
     return { message: 'Password changed successfully' };
   }
 
+  // Refresh tokens are signed JWTs, so a fast digest is enough. bcrypt would
+  // also cost as much as a password check on every refresh and only compare
+  // the first 72 bytes, which are the same for every token a user is issued.
+  private hashRefreshToken(refreshToken: string): string {
+    return createHash('sha256').update(refreshToken).digest('hex');
+  }
+
+  private async refreshTokenMatches(refreshToken: string, storedHash: string): Promise<boolean> {
+    // Sessions started before the switch still hold a bcrypt hash; they are
+    // checked the old way once and stored as a digest when the token rotates
+    if (storedHash.startsWith('$2')) {
+      return bcrypt.compare(refreshToken, storedHash);
+    }
+    const expected = Buffer.from(storedHash);
+    const actual = Buffer.from(this.hashRefreshToken(refreshToken));
+    return expected.length === actual.length && timingSafeEqual(expected, actual);
+  }
+
   private async generateTokens(user: User) {
     const payload = {
       sub: user.id,
@@ -0,0 +1,32 @@
+import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
+import { Role } from '../../common/enums/role.enum';
+
+export class TokenPairDto {
+  @ApiProperty()
+  accessToken: string;
+
+  @ApiProperty()
+  refreshToken: string;
+}
+
+export class AuthUserDto {
+  @ApiProperty({ format: 'uuid' })
+  id: string;
+
+  @ApiProperty({ example: 'John Doe' })
+  name: string;
+
+  @ApiPropertyOptional({ example: 'john@example.com', nullable: true })
+  email?: string;
+
+  @ApiProperty({ example: '+237670000000' })
+  phone: string;
+
+  @ApiProperty({ enum: Role })
+  role: Role;
+}
+
+export class AuthResponseDto extends TokenPairDto {
+  @ApiProperty({ type: AuthUserDto })
+  user: AuthUserDto;
+}
@@ -1,10 +1,13 @@
-import { Controller, Get, Post, Patch, Param, Body, UseGuards } from '@nestjs/common';
+import { Controller, Get, Post, Patch, Param, Body, Query, UseGuards } from '@nestjs/common';
 import { ApiTags, ApiOperation, ApiBearerAuth } from '@nestjs/swagger';
 import { BinsService } from './bins.service';
 import { JwtAuthGuard } from '../common/guards/jwt-auth.guard';
 import { Roles } from '../common/decorators/roles.decorator';
 import { Role } from '../common/enums/role.enum';
 import { Public } from '../common/decorators/public.decorator';
+import { Cached } from '../common/decorators/cached.decorator';
+import { BoundingBoxQueryDto, NearbyQueryDto } from '../common/dto/geo-query.dto';
+import { UpdateBinCapacitiesDto } from './dto/update-bin-capacities.dto';
 
 @ApiTags('Bins')
 @Controller('bins')
@@ -22,18 +25,44 @@ export class BinsController {
 
   @Get()
   @Public()
+  @Cached('bins')
   @ApiOperation({ summary: 'Get all bins' })
   async findAll() {
     return this.binsService.findAll();
   }
 
+  @Get('nearby')
+  @Public()
+  @ApiOperation({ summary: 'Nearest bins to a point, optionally within a radius (meters)' })
+  async findNearby(@Query() query: NearbyQueryDto) {
+    return this.binsService.findNearby(query);
+  }
+
+  @Get('within')
+  @Public()
+  @ApiOperation({ summary: 'Bins inside a bounding box (map viewport)' })
+  async findWithin(@Query() query: BoundingBoxQueryDto) {
+    return this.binsService.findWithin(query);
+  }
+
   @Get(':id')
   @Public()
+  @Cached('bins')
   @ApiOperation({ summary: 'Get bin by ID' })
   async findOne(@Param('id') id: string) {
     return this.binsService.findOne(id);
   }
 
+  // Declared before :id so "capacity" is not taken for a bin id
+  @Patch('capacity')
+  @UseGuards(JwtAuthGuard)
+  @Roles(Role.ADMIN, Role.HYSACAM)
+  @ApiBearerAuth()
+  @ApiOperation({ summary: 'Batch capacity level / last emptied update from bin sensors (Admin/HYSACAM)' })
+  async updateCapacities(@Body() updateDto: UpdateBinCapacitiesDto) {
+    return this.binsService.updateCapacities(updateDto.readings);
+  }
+
   @Patch(':id')
   @UseGuards(JwtAuthGuard)
   @Roles(Role.ADMIN, Role.HYSACAM)
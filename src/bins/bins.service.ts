@@ -2,17 +2,24 @@ import { Injectable, NotFoundException } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { CommunityBin } from './entities/community-bin.entity';
+import { BoundingBoxQueryDto, NearbyQueryDto } from '../common/dto/geo-query.dto';
+import { findNearby, findWithin } from '../common/utils/geo.util';
+import { ResponseCacheService } from '../common/cache/response-cache.service';
+import { BinCapacitiesResult, BinCapacityReadingDto } from './dto/update-bin-capacities.dto';
 
 @Injectable()
 export class BinsService {
   constructor(
     @InjectRepository(CommunityBin)
     private binRepository: Repository<CommunityBin>,
+    private responseCache: ResponseCacheService,
   ) {}
 
   async create(createDto: Partial<CommunityBin>): Promise<CommunityBin> {
     const bin = this.binRepository.create(createDto);
-    return await this.binRepository.save(bin);
+    const saved = await this.binRepository.save(bin);
+    this.responseCache.invalidate('bins');
+    return saved;
   }
 
   async findAll(): Promise<CommunityBin[]> {
@@ -21,6 +28,14 @@ export class BinsService {
     });
   }
 
+  async findNearby(query: NearbyQueryDto) {
+    return findNearby(this.binRepository.createQueryBuilder('bin'), 'bin', query);
+  }
+
+  async findWithin(query: BoundingBoxQueryDto): Promise<CommunityBin[]> {
+    return findWithin(this.binRepository.createQueryBuilder('bin'), 'bin', query);
+  }
+
   async findOne(id: string): Promise<CommunityBin> {
     const bin = await this.binRepository.findOne({ where: { id } });
 
@@ -33,6 +48,60 @@ export class BinsService {
 
   async update(id: string, updateDto: any): Promise<CommunityBin> {
     await this.binRepository.update(id, updateDto);
+    this.responseCache.invalidate('bins');
     return this.findOne(id);
   }
+
+  /**
+   * Apply a batch of sensor readings in one transaction. Readings are
+   * grouped by capacity level and each group is a single UPDATE ... FROM
+   * unnest(), so a batch costs one locking SELECT and at most five UPDATEs
+   * however many bins it touches. The level goes in as a parameter typed by
+   * its column, which works whether capacity_level is an enum or a varchar.
+   *
+   * The group UPDATEs lock rows in whatever order readings arrive, so two
+   * concurrent batches sharing bins could each hold a row the other waits
+   * for. Every batch therefore locks all of its rows first, in id order.
+   */
+  async updateCapacities(readings: BinCapacityReadingDto[]): Promise<BinCapacitiesResult> {
+    // Sensors may report a bin twice in one batch; the later reading wins
+    const latest = new Map(readings.map((reading) => [reading.id, reading]));
+    const groups = new Map<string | null, BinCapacityReadingDto[]>();
+    for (const reading of latest.values()) {
+      const level = reading.capacityLevel ?? null;
+      groups.set(level, [...(groups.get(level) ?? []), reading]);
+    }
+
+    const updated = new Set<string>();
+    await this.binRepository.manager.transaction(async (manager) => {
+      await manager.query(
+        `SELECT "id" FROM "community_bins" WHERE "id" = ANY($1::uuid[]) ORDER BY "id" FOR UPDATE`,
+        [[...latest.keys()]],
+      );
+      for (const [level, group] of groups) {
+        const rows: { id: string }[] = await manager.query(
+          `WITH updated AS (
+             UPDATE "community_bins" AS bin
+             SET "capacity_level" = COALESCE($1, bin."capacity_level"),
+                 "last_emptied_at" = COALESCE(r.last_emptied_at, bin."last_emptied_at"),
+                 "updated_at" = now()
+             FROM unnest($2::uuid[], $3::timestamptz[]) AS r(id, last_emptied_at)
+             WHERE bin."id" = r.id
+             RETURNING bin."id"
+           )
+           SELECT "id" FROM updated`,
+          [level, group.map((r) => r.id), group.map((r) => r.lastEmptiedAt ?? null)],
+        );
+        rows.forEach((row) => updated.add(row.id));
+      }
+    });
+
+    if (updated.size) {
+      this.responseCache.invalidate('bins');
+    }
+    return {
+      updated: updated.size,
+      notFound: [...latest.keys()].filter((id) => !updated.has(id)),
+    };
+  }
 }
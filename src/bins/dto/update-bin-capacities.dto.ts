@@ -0,0 +1,75 @@
+import {
+  ArrayMaxSize,
+  ArrayMinSize,
+  IsArray,
+  IsDateString,
+  IsEnum,
+  IsOptional,
+  IsUUID,
+  registerDecorator,
+  ValidateNested,
+  ValidationArguments,
+} from 'class-validator';
+import { Type } from 'class-transformer';
+import { ApiProperty, ApiPropertyOptional } from '@nestjs/swagger';
+import { CapacityLevel } from '../../common/enums/capacity-level.enum';
+
+// 500 readings stay well inside the default 100 kB JSON body limit
+export const MAX_CAPACITY_READINGS = 500;
+
+// A reading with an id alone would change nothing but updated_at, yet count
+// as updated and invalidate the bins cache
+function ChangesCapacity() {
+  return (object: object, propertyName: string) =>
+    registerDecorator({
+      name: 'changesCapacity',
+      target: object.constructor,
+      propertyName,
+      options: { message: 'a reading needs capacityLevel or lastEmptiedAt' },
+      validator: {
+        validate(_value: unknown, args: ValidationArguments) {
+          const reading = args.object as BinCapacityReadingDto;
+          return (reading.capacityLevel ?? reading.lastEmptiedAt ?? null) !== null;
+        },
+      },
+    });
+}
+
+export class BinCapacityReadingDto {
+  @ApiProperty({ format: 'uuid' })
+  @IsUUID()
+  @ChangesCapacity()
+  id: string;
+
+  @ApiPropertyOptional({ enum: CapacityLevel, example: CapacityLevel.HIGH })
+  @IsOptional()
+  @IsEnum(CapacityLevel)
+  capacityLevel?: CapacityLevel;
+
+  @ApiPropertyOptional({ example: '2024-05-01T08:30:00Z' })
+  @IsOptional()
+  @IsDateString()
+  lastEmptiedAt?: string;
+}
+
+export class UpdateBinCapacitiesDto {
+  @ApiProperty({
+    type: [BinCapacityReadingDto],
+    maxItems: MAX_CAPACITY_READINGS,
+    description:
+      'Sensor readings, each with capacityLevel and/or lastEmptiedAt; ' +
+      'a later reading for the same bin wins, omitted fields are left unchanged',
+  })
+  @IsArray()
+  @ArrayMinSize(1)
+  @ArrayMaxSize(MAX_CAPACITY_READINGS)
+  @ValidateNested({ each: true })
+  @Type(() => BinCapacityReadingDto)
+  readings: BinCapacityReadingDto[];
+}
+
+export interface BinCapacitiesResult {
+  updated: number;
+  // Ids of the batch that match no bin
+  notFound: string[];
+}
@@ -0,0 +1,121 @@
+import { Injectable } from '@nestjs/common';
+import { ConfigService } from '@nestjs/config';
+import { createHash } from 'crypto';
+
+export const CACHE_SCOPE_KEY = 'cacheScope';
+
+export interface CachedResponse {
+  body: string;
+  etag: string;
+  lastModified: string;
+  scope: string;
+  version: number;
+}
+
+/**
+ * Serialized JSON of public GET responses, keyed by URL and grouped in
+ * scopes ('bins', 'education', 'surveys'). A write to a scope calls
+ * invalidate(), which drops its entries and moves its Last-Modified on.
+ * Entries are evicted least recently used first once RESPONSE_CACHE_MAX_ENTRIES
+ * or RESPONSE_CACHE_MAX_MB is exceeded.
+ *
+ * The cache lives in this process: with several API instances a write only
+ * invalidates the instance that handled it, so run those with
+ * RESPONSE_CACHE=false.
+ */
+@Injectable()
+export class ResponseCacheService {
+  readonly enabled: boolean;
+  private readonly maxEntries: number;
+  private readonly maxBytes: number;
+  // Map iteration follows insertion order; a hit re-inserts, so the first key is the LRU one
+  private readonly entries = new Map<string, CachedResponse>();
+  private readonly scopes = new Map<string, { version: number; lastModified: string }>();
+  private bytes = 0;
+  hits = 0;
+  misses = 0;
+
+  constructor(configService: ConfigService) {
+    this.enabled = configService.get<boolean>('responseCache.enabled') ?? true;
+    this.maxEntries = configService.get<number>('responseCache.maxEntries') ?? 1000;
+    this.maxBytes = configService.get<number>('responseCache.maxBytes') ?? 64 * 1024 * 1024;
+  }
+
+  version(scope: string): number {
+    return this.scope(scope).version;
+  }
+
+  get(scope: string, url: string): CachedResponse | undefined {
+    const key = `${scope} ${url}`;
+    const entry = this.entries.get(key);
+    if (!entry) {
+      this.misses += 1;
+      return undefined;
+    }
+    this.entries.delete(key);
+    this.entries.set(key, entry);
+    this.hits += 1;
+    return entry;
+  }
+
+  /**
+   * Store a body rendered while the scope was at `version`; returns
+   * undefined, storing nothing, when a write invalidated the scope in the
+   * meantime.
+   */
+  set(scope: string, url: string, body: string, version: number): CachedResponse | undefined {
+    const current = this.scope(scope);
+    if (current.version !== version) {
+      return undefined;
+    }
+    const entry: CachedResponse = {
+      body,
+      etag: `"${createHash('sha1').update(body).digest('base64url')}"`,
+      lastModified: current.lastModified,
+      scope,
+      version,
+    };
+    if (body.length > this.maxBytes) {
+      return entry;
+    }
+    const key = `${scope} ${url}`;
+    this.drop(key);
+    this.entries.set(key, entry);
+    this.bytes += body.length;
+    for (const oldest of this.entries.keys()) {
+      if (this.entries.size <= this.maxEntries && this.bytes <= this.maxBytes) break;
+      this.drop(oldest);
+    }
+    return entry;
+  }
+
+  invalidate(scope: string) {
+    const current = this.scope(scope);
+    current.version += 1;
+    current.lastModified = new Date().toUTCString();
+    for (const [key, entry] of this.entries) {
+      if (entry.scope === scope) this.drop(key);
+    }
+  }
+
+  stats() {
+    return { entries: this.entries.size, bytes: this.bytes, hits: this.hits, misses: this.misses };
+  }
+
+  private scope(scope: string) {
+    let current = this.scopes.get(scope);
+    if (!current) {
+      current = { version: 0, lastModified: new Date().toUTCString() };
+      this.scopes.set(scope, current);
+    }
+    return current;
+  }
+
+  private drop(key: string) {
+    const entry = this.entries.get(key);
+    if (entry) {
+      this.entries.delete(key);
+      this.bytes -= entry.body.length;
+    }
+  }
+}
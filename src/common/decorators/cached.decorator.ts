@@ -0,0 +1,10 @@
+import { SetMetadata, UseInterceptors, applyDecorators } from '@nestjs/common';
+import { CACHE_SCOPE_KEY } from '../cache/response-cache.service';
+import { ResponseCacheInterceptor } from '../interceptors/response-cache.interceptor';
+
+/**
+ * Cache a public GET route's response with ETag/Last-Modified validators;
+ * ResponseCacheService.invalidate(scope) drops it.
+ */
+export const Cached = (scope: string) =>
+  applyDecorators(SetMetadata(CACHE_SCOPE_KEY, scope), UseInterceptors(ResponseCacheInterceptor));
@@ -1,4 +1,4 @@
-import { IsOptional, IsInt, Min, Max } from 'class-validator';
+import { IsOptional, IsInt, IsString, Min, Max } from 'class-validator';
 import { Type } from 'class-transformer';
 import { ApiPropertyOptional } from '@nestjs/swagger';
 
@@ -19,6 +19,23 @@ export class PaginationDto {
   limit?: number = 10;
 }
 
+// No defaults: with neither field set the list endpoints answer their
+// deprecated unpaginated form (see paginateByKey)
+export class CursorPaginationDto {
+  @ApiPropertyOptional({ description: 'meta.nextCursor of the previous page' })
+  @IsOptional()
+  @IsString()
+  cursor?: string;
+
+  @ApiPropertyOptional({ description: 'Page size; 20 when only cursor is given', minimum: 1, maximum: 100 })
+  @IsOptional()
+  @Type(() => Number)
+  @IsInt()
+  @Min(1)
+  @Max(100)
+  limit?: number;
+}
+
 export interface PaginatedResult<T> {
   data: T[];
   meta: {
@@ -28,3 +45,12 @@ export interface PaginatedResult<T> {
     totalPages: number;
   };
 }
+
+export interface CursorPaginatedResult<T> {
+  data: T[];
+  meta: {
+    limit: number;
+    // Pass back as ?cursor= for the next page; null on the last page
+    nextCursor: string | null;
+  };
+}
@@ -0,0 +1,57 @@
+import { CallHandler, ExecutionContext, Injectable, NestInterceptor } from '@nestjs/common';
+import { Reflector } from '@nestjs/core';
+import { instanceToPlain } from 'class-transformer';
+import { Request, Response } from 'express';
+import { Observable, map, of } from 'rxjs';
+import { CACHE_SCOPE_KEY, CachedResponse, ResponseCacheService } from '../cache/response-cache.service';
+
+/**
+ * Serves @Cached GET routes from ResponseCacheService. A hit skips the
+ * handler, the database and the serializer: the stored JSON goes out as a
+ * string, which ClassSerializerInterceptor passes through, and Express
+ * turns it into a bodyless 304 when If-None-Match or If-Modified-Since
+ * still match. A miss serializes the handler's result the way
+ * ClassSerializerInterceptor would and stores it.
+ */
+@Injectable()
+export class ResponseCacheInterceptor implements NestInterceptor {
+  constructor(
+    private reflector: Reflector,
+    private cache: ResponseCacheService,
+  ) {}
+
+  intercept(context: ExecutionContext, next: CallHandler): Observable<any> {
+    const scope = this.reflector.get<string>(CACHE_SCOPE_KEY, context.getHandler());
+    const req = context.switchToHttp().getRequest<Request>();
+    if (!scope || !this.cache.enabled || req.method !== 'GET') {
+      return next.handle();
+    }
+    const res = context.switchToHttp().getResponse<Response>();
+    const hit = this.cache.get(scope, req.originalUrl);
+    if (hit) {
+      setValidators(res, hit);
+      return of(hit.body);
+    }
+    const version = this.cache.version(scope);
+    return next.handle().pipe(
+      map((result) => {
+        const body = JSON.stringify(instanceToPlain(result));
+        const entry = this.cache.set(scope, req.originalUrl, body, version);
+        if (entry) {
+          setValidators(res, entry);
+        } else {
+          res.type('json');
+        }
+        return body;
+      }),
+    );
+  }
+}
+
+function setValidators(res: Response, entry: CachedResponse) {
+  res.type('json');
+  res.setHeader('ETag', entry.etag);
+  res.setHeader('Last-Modified', entry.lastModified);
+  // Clients may keep the body but must revalidate before reusing it
+  res.setHeader('Cache-Control', 'public, no-cache');
+}
@@ -0,0 +1,46 @@
+import {
+  CallHandler,
+  ClassSerializerInterceptor,
+  ExecutionContext,
+  Injectable,
+  NestInterceptor,
+  PlainLiteralObject,
+} from '@nestjs/common';
+import { ClassTransformOptions } from 'class-transformer';
+import { Observable, tap } from 'rxjs';
+import { currentTiming, elapsedMs } from '../utils/server-timing.util';
+
+/**
+ * Outermost global interceptor when SERVER_TIMING is on: guards have run by
+ * the time it is entered, and its tap fires once the handler result has
+ * been through the serializer.
+ */
+@Injectable()
+export class ServerTimingInterceptor implements NestInterceptor {
+  intercept(context: ExecutionContext, next: CallHandler): Observable<any> {
+    const timing = currentTiming();
+    if (!timing) {
+      return next.handle();
+    }
+    timing.guardsDone = process.hrtime.bigint();
+    const done = () => {
+      timing.handlerDone = process.hrtime.bigint();
+    };
+    return next.handle().pipe(tap({ next: done, error: done }));
+  }
+}
+
+export class TimedClassSerializerInterceptor extends ClassSerializerInterceptor {
+  serialize(
+    response: PlainLiteralObject | Array<PlainLiteralObject>,
+    options: ClassTransformOptions,
+  ): PlainLiteralObject | Array<PlainLiteralObject> {
+    const start = process.hrtime.bigint();
+    try {
+      return super.serialize(response, options);
+    } finally {
+      const timing = currentTiming();
+      if (timing) timing.serializeMs += elapsedMs(start);
+    }
+  }
+}
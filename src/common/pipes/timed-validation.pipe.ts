@@ -0,0 +1,17 @@
+import { ArgumentMetadata, ValidationPipe } from '@nestjs/common';
+import { currentTiming, elapsedMs } from '../utils/server-timing.util';
+
+/**
+ * ValidationPipe that adds its time to the request's Server-Timing.
+ */
+export class TimedValidationPipe extends ValidationPipe {
+  async transform(value: any, metadata: ArgumentMetadata) {
+    const start = process.hrtime.bigint();
+    try {
+      return await super.transform(value, metadata);
+    } finally {
+      const timing = currentTiming();
+      if (timing) timing.validationMs += elapsedMs(start);
+    }
+  }
+}
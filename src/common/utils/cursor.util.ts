@@ -0,0 +1,98 @@
+import { BadRequestException } from '@nestjs/common';
+import { isUUID } from 'class-validator';
+import { ObjectLiteral, QueryFailedError, SelectQueryBuilder } from 'typeorm';
+import { CursorPaginatedResult } from '../dto/pagination.dto';
+
+export const DEFAULT_PAGE_LIMIT = 20;
+export const MAX_PAGE_LIMIT = 100;
+
+// Swagger description of the keyset-paginated list endpoints
+export const PAGINATED_LIST_DESCRIPTION =
+  `With \`limit\` (1-${MAX_PAGE_LIMIT}, default ${DEFAULT_PAGE_LIMIT}) or \`cursor\`, answers one page as ` +
+  '`{data, meta: {limit, nextCursor}}`; pass `nextCursor` back as `cursor` for the next page. ' +
+  'Deprecated: without either, answers every row as a bare array; this will be removed in the next API version.';
+
+// Postgres errors for a sort key the column type cannot parse
+const INVALID_VALUE_CODES = new Set(['22P02', '22007', '22008']);
+
+export function encodeCursor(value: string, id: string): string {
+  return Buffer.from(JSON.stringify([value, id])).toString('base64url');
+}
+
+export function decodeCursor(cursor: string): [string, string] {
+  try {
+    const decoded = JSON.parse(Buffer.from(cursor, 'base64url').toString());
+    if (Array.isArray(decoded) && decoded.length === 2 && typeof decoded[0] === 'string' && isUUID(decoded[1])) {
+      return decoded as [string, string];
+    }
+  } catch {
+    // fall through
+  }
+  throw new BadRequestException('Invalid cursor');
+}
+
+/**
+ * One page of `queryBuilder` in (sortProperty, id) order, continuing after
+ * `cursor`. The condition is a row comparison on the same two keys the
+ * (sort_key, id) indexes cover, so every page costs the same however deep
+ * into the table it is, unlike OFFSET. The cursor carries the sort key as
+ * Postgres' own text form, keeping full timestamp precision.
+ *
+ * Only to-one relations may be joined: one raw row per entity is assumed.
+ *
+ * Deprecated: with neither `cursor` nor `limit`, every row comes back as a
+ * bare array in the same order, as these endpoints answered before they were
+ * paginated. Clients should pass `limit` and read `{data, meta}`; the bare
+ * array will be dropped in the next API version.
+ */
+export async function paginateByKey<T extends ObjectLiteral & { id: string }>(
+  queryBuilder: SelectQueryBuilder<T>,
+  alias: string,
+  sortProperty: string,
+  direction: 'ASC' | 'DESC',
+  cursor?: string,
+  limit?: number,
+): Promise<T[] | CursorPaginatedResult<T>> {
+  const sortKey = `${alias}.${sortProperty}`;
+  if (cursor === undefined && limit === undefined) {
+    return queryBuilder.orderBy(sortKey, direction).addOrderBy(`${alias}.id`, direction).getMany();
+  }
+
+  const take = Math.min(Math.max(Math.floor(limit || DEFAULT_PAGE_LIMIT), 1), MAX_PAGE_LIMIT);
+
+  if (cursor) {
+    const [value, id] = decodeCursor(cursor);
+    queryBuilder.andWhere(`(${sortKey}, ${alias}.id) ${direction === 'DESC' ? '<' : '>'} (:cursorValue, :cursorId)`, {
+      cursorValue: value,
+      cursorId: id,
+    });
+  }
+
+  let page: { entities: T[]; raw: any[] };
+  try {
+    page = await queryBuilder
+      .addSelect(`CAST(${sortKey} AS text)`, 'cursor_value')
+      .orderBy(sortKey, direction)
+      .addOrderBy(`${alias}.id`, direction)
+      .limit(take + 1)
+      .getRawAndEntities();
+  } catch (error) {
+    // The sort key of a tampered cursor only fails when Postgres casts it
+    if (cursor && error instanceof QueryFailedError && INVALID_VALUE_CODES.has((error.driverError as any)?.code)) {
+      throw new BadRequestException('Invalid cursor');
+    }
+    throw error;
+  }
+  const { entities, raw } = page;
+
+  const hasMore = entities.length > take;
+  const data = entities.slice(0, take);
+  const last = data[data.length - 1];
+  return {
+    data,
+    meta: {
+      limit: take,
+      nextCursor: hasMore && last ? encodeCursor(raw[take - 1].cursor_value, last.id) : null,
+    },
+  };
+}
@@ -0,0 +1,89 @@
+import { SelectQueryBuilder } from 'typeorm';
+import { BoundingBoxQueryDto, NearbyQueryDto } from '../dto/geo-query.dto';
+
+const EARTH_RADIUS_M = 6371000;
+const METERS_PER_DEGREE = 111320;
+
+type Located = { gpsLat: number; gpsLng: number };
+
+/**
+ * The (lng, lat) point the GiST indexes from the GeoIndexes migration are
+ * built on; queries must use this exact expression for the index to apply.
+ */
+export function locationOf(alias: string): string {
+  return `point("${alias}"."gps_lng"::float8, "${alias}"."gps_lat"::float8)`;
+}
+
+/**
+ * Great-circle distance in meters.
+ */
+export function distanceMeters(lat1: number, lng1: number, lat2: number, lng2: number): number {
+  const toRad = (deg: number) => (deg * Math.PI) / 180;
+  const dLat = toRad(lat2 - lat1);
+  const dLng = toRad(lng2 - lng1);
+  const a = Math.sin(dLat / 2) ** 2 + Math.cos(toRad(lat1)) * Math.cos(toRad(lat2)) * Math.sin(dLng / 2) ** 2;
+  return 2 * EARTH_RADIUS_M * Math.asin(Math.sqrt(a));
+}
+
+/**
+ * Nearest rows first, optionally only within `radius` meters, each with its
+ * distanceMeters. The index does the work twice: a bounding box around the
+ * radius (<@) and k-nearest ordering (<->). Ordering is by planar distance
+ * in degrees, which this close to the equator matches true distance to
+ * within a few percent; the exact radius check runs on the returned rows.
+ */
+export async function findNearby<T extends Located>(
+  queryBuilder: SelectQueryBuilder<T>,
+  alias: string,
+  query: NearbyQueryDto,
+): Promise<Array<T & { distanceMeters: number }>> {
+  const { lat, lng, radius, limit = 20 } = query;
+  const location = locationOf(alias);
+
+  if (radius) {
+    const dLat = radius / METERS_PER_DEGREE;
+    const dLng = radius / (METERS_PER_DEGREE * Math.cos((lat * Math.PI) / 180));
+    queryBuilder.andWhere(`${location} <@ box(point(:minLng, :minLat), point(:maxLng, :maxLat))`, {
+      minLng: lng - dLng,
+      minLat: lat - dLat,
+      maxLng: lng + dLng,
+      maxLat: lat + dLat,
+    });
+  }
+
+  const rows = await queryBuilder
+    .andWhere(`"${alias}"."gps_lat" IS NOT NULL AND "${alias}"."gps_lng" IS NOT NULL`)
+    .addSelect(`${location} <-> point(:lng, :lat)`, 'geo_distance')
+    .setParameters({ lng, lat })
+    .orderBy('geo_distance', 'ASC')
+    .limit(limit)
+    .getMany();
+
+  return rows
+    .map((row) =>
+      Object.assign(row, {
+        distanceMeters: Math.round(distanceMeters(lat, lng, Number(row.gpsLat), Number(row.gpsLng))),
+      }),
+    )
+    .filter((row) => !radius || row.distanceMeters <= radius);
+}
+
+/**
+ * Rows inside a map viewport.
+ */
+export function findWithin<T extends Located>(
+  queryBuilder: SelectQueryBuilder<T>,
+  alias: string,
+  query: BoundingBoxQueryDto,
+): Promise<T[]> {
+  return queryBuilder
+    .andWhere(`"${alias}"."gps_lat" IS NOT NULL AND "${alias}"."gps_lng" IS NOT NULL`)
+    .andWhere(`${locationOf(alias)} <@ box(point(:minLng, :minLat), point(:maxLng, :maxLat))`, {
+      minLng: query.minLng,
+      minLat: query.minLat,
+      maxLng: query.maxLng,
+      maxLat: query.maxLat,
+    })
+    .limit(query.limit ?? 500)
+    .getMany();
+}
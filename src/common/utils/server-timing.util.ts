@@ -0,0 +1,152 @@
+import { AsyncLocalStorage } from 'async_hooks';
+import { Logger } from '@nestjs/common';
+import { NextFunction, Request, Response } from 'express';
+import { PostgresQueryRunner } from 'typeorm/driver/postgres/PostgresQueryRunner';
+
+/**
+ * Where one request's time went. Filled in along the request pipeline
+ * (middleware -> guards -> interceptors -> pipes -> handler -> serializer)
+ * and written as a Server-Timing header when the response headers go out:
+ *
+ *   auth       guards, i.e. JWT verification plus the JwtStrategy user lookup
+ *   validation ValidationPipe
+ *   handler    controller and service, database included
+ *   serialize  ClassSerializerInterceptor
+ *   db         time inside TypeORM queries, with the number of queries and
+ *              of rows they returned (SELECTs only)
+ *   total      request start to headers, including JSON encoding
+ *
+ * db overlaps auth and handler, and can exceed them when a request runs
+ * queries concurrently.
+ */
+export class RequestTiming {
+  readonly start = process.hrtime.bigint();
+  guardsDone?: bigint;
+  handlerDone?: bigint;
+  validationMs = 0;
+  serializeMs = 0;
+  dbMs = 0;
+  dbQueries = 0;
+  dbRows = 0;
+  // SQL text -> times run; only kept when QUERY_LOG is on
+  statements?: Map<string, number>;
+
+  header(): string {
+    const now = process.hrtime.bigint();
+    const guardsDone = this.guardsDone ?? now;
+    const metrics: string[] = [`auth;dur=${ms(guardsDone - this.start)}`];
+    if (this.guardsDone !== undefined) {
+      const inside = Number((this.handlerDone ?? now) - this.guardsDone) / 1e6;
+      metrics.push(
+        `validation;dur=${round(this.validationMs)}`,
+        `handler;dur=${round(Math.max(inside - this.validationMs - this.serializeMs, 0))}`,
+        `serialize;dur=${round(this.serializeMs)}`,
+      );
+    }
+    metrics.push(
+      `db;dur=${round(this.dbMs)};desc="${this.dbQueries} queries ${this.dbRows} rows"`,
+      `total;dur=${ms(now - this.start)}`,
+    );
+    return metrics.join(', ');
+  }
+
+  queryLog(request: string): string {
+    const lines = [`${request}: ${this.dbQueries} queries, ${this.dbRows} rows, ${round(this.dbMs)} ms`];
+    const statements = [...(this.statements ?? new Map<string, number>())].sort((a, b) => b[1] - a[1]);
+    for (const [sql, count] of statements) {
+      lines.push(`  ${count}x ${sql.replace(/\s+/g, ' ').slice(0, 300)}`);
+    }
+    return lines.join('\n');
+  }
+}
+
+const storage = new AsyncLocalStorage<RequestTiming>();
+
+export function currentTiming(): RequestTiming | undefined {
+  return storage.getStore();
+}
+
+export function elapsedMs(since: bigint): number {
+  return Number(process.hrtime.bigint() - since) / 1e6;
+}
+
+function ms(ns: bigint): number {
+  return round(Number(ns) / 1e6);
+}
+
+function round(value: number): number {
+  return Math.round(value * 100) / 100;
+}
+
+/**
+ * Express middleware opening the timing context for a request; it must be
+ * registered before the routes so that guards run inside it.
+ */
+export function serverTimingMiddleware(req: Request, res: Response, next: NextFunction) {
+  const timing = new RequestTiming();
+  const writeHead = res.writeHead;
+  res.writeHead = function (this: Response, ...args: any[]) {
+    if (!this.headersSent) {
+      this.setHeader('Server-Timing', timing.header());
+    }
+    return (writeHead as (...params: any[]) => Response).apply(this, args);
+  } as typeof res.writeHead;
+  storage.run(timing, next);
+}
+
+const queryLogger = new Logger('Queries');
+
+/**
+ * With QUERY_LOG=true, registered after serverTimingMiddleware: logs every
+ * request's statements with how often each ran once the response is sent.
+ * The same statement repeated once per row of a list is the N+1 signature.
+ */
+export function queryLogMiddleware(req: Request, res: Response, next: NextFunction) {
+  const timing = currentTiming();
+  if (timing) {
+    timing.statements = new Map();
+    res.on('finish', () => queryLogger.log(timing.queryLog(`${req.method} ${req.originalUrl} ${res.statusCode}`)));
+  }
+  next();
+}
+
+function fetchedRows(sql: unknown, result: any): number {
+  // Only reads count; writes come back as [rows, affected] or undefined
+  if (typeof sql !== 'string' || !/^\s*(select|with)\b/i.test(sql)) {
+    return 0;
+  }
+  // Repository and query builder reads call query(sql, params, true) and get
+  // a QueryResult back; raw manager.query() calls get the rows array itself
+  const records = Array.isArray(result) ? result : result?.records;
+  return Array.isArray(records) ? records.length : 0;
+}
+
+/**
+ * Count and time every query TypeORM sends to Postgres on behalf of the
+ * current request, with the rows each SELECT returned. Code after an await
+ * keeps the caller's async context, so the wrapper always finds the
+ * request that issued the query.
+ */
+export function instrumentQueryRunner() {
+  const query = PostgresQueryRunner.prototype.query;
+  PostgresQueryRunner.prototype.query = async function (this: PostgresQueryRunner, ...args: any[]) {
+    const timing = currentTiming();
+    if (!timing) {
+      return (query as (...params: any[]) => Promise<any>).apply(this, args);
+    }
+    const start = process.hrtime.bigint();
+    let rows = 0;
+    try {
+      const result = await (query as (...params: any[]) => Promise<any>).apply(this, args);
+      rows = fetchedRows(args[0], result);
+      return result;
+    } finally {
+      timing.dbMs += elapsedMs(start);
+      timing.dbQueries += 1;
+      timing.dbRows += rows;
+      if (timing.statements) {
+        timing.statements.set(args[0], (timing.statements.get(args[0]) ?? 0) + 1);
+      }
+    }
+  } as typeof query;
+}
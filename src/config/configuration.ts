@@ -2,6 +2,14 @@ export default () => ({
   nodeEnv: process.env.NODE_ENV || 'development',
   port: parseInt(process.env.PORT || '3000', 10),
   apiPrefix: process.env.API_PREFIX || 'api/v1',
+  serverTiming: process.env.SERVER_TIMING === 'true',
+  queryLog: process.env.QUERY_LOG === 'true',
+
+  responseCache: {
+    enabled: process.env.RESPONSE_CACHE !== 'false',
+    maxEntries: parseInt(process.env.RESPONSE_CACHE_MAX_ENTRIES || '1000', 10),
+    maxBytes: parseInt(process.env.RESPONSE_CACHE_MAX_MB || '64', 10) * 1024 * 1024,
+  },
   
   database: {
     host: process.env.DB_HOST || 'localhost',
@@ -6,6 +6,11 @@ export const validationSchema = Joi.object({
     .default('development'),
   PORT: Joi.number().default(3000),
   API_PREFIX: Joi.string().default('api/v1'),
+  SERVER_TIMING: Joi.boolean().default(false),
+  QUERY_LOG: Joi.boolean().default(false),
+  RESPONSE_CACHE: Joi.boolean().default(true),
+  RESPONSE_CACHE_MAX_ENTRIES: Joi.number().default(1000),
+  RESPONSE_CACHE_MAX_MB: Joi.number().default(64),
   
   DB_HOST: Joi.string().required(),
   DB_PORT: Joi.number().default(5432),
@@ -0,0 +1,16 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class PickupStatsIndex1700000000001 implements MigrationInterface {
+  name = 'PickupStatsIndex1700000000001';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // Lets GET /stats/pickups count a created_at range per status from the index alone
+    await queryRunner.query(
+      `CREATE INDEX "IDX_pickup_requests_created_at_status" ON "pickup_requests" ("created_at", "status")`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP INDEX "IDX_pickup_requests_created_at_status"`);
+  }
+}
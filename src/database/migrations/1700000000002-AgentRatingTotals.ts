@@ -0,0 +1,31 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class AgentRatingTotals1700000000002 implements MigrationInterface {
+  name = 'AgentRatingTotals1700000000002';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // Running sum/count so a new rating updates the average without rereading every rating
+    await queryRunner.query(`
+      ALTER TABLE "pickup_agent_profiles"
+      ADD "rating_sum" integer NOT NULL DEFAULT 0,
+      ADD "rating_count" integer NOT NULL DEFAULT 0
+    `);
+    await queryRunner.query(`
+      UPDATE "pickup_agent_profiles" agent
+      SET "rating_sum" = totals.sum,
+          "rating_count" = totals.count,
+          "average_rating" = ROUND(totals.sum::numeric / totals.count, 2)
+      FROM (
+        SELECT "agent_id", SUM("rating") AS sum, COUNT(*) AS count
+        FROM "ratings"
+        GROUP BY "agent_id"
+      ) totals
+      WHERE agent."id" = totals.agent_id
+    `);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`ALTER TABLE "pickup_agent_profiles" DROP COLUMN "rating_count"`);
+    await queryRunner.query(`ALTER TABLE "pickup_agent_profiles" DROP COLUMN "rating_sum"`);
+  }
+}
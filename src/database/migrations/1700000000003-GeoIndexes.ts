@@ -0,0 +1,21 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class GeoIndexes1700000000003 implements MigrationInterface {
+  name = 'GeoIndexes1700000000003';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // GiST on a (lng, lat) point: bounding-box (<@) and nearest-first (<->) lookups
+    // for the /nearby and /within endpoints; the expression matches locationOf()
+    await queryRunner.query(
+      `CREATE INDEX "IDX_community_bins_location" ON "community_bins" USING gist (point("gps_lng"::float8, "gps_lat"::float8))`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX "IDX_alerts_location" ON "alerts" USING gist (point("gps_lng"::float8, "gps_lat"::float8)) WHERE "gps_lat" IS NOT NULL AND "gps_lng" IS NOT NULL`,
+    );
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP INDEX "IDX_alerts_location"`);
+    await queryRunner.query(`DROP INDEX "IDX_community_bins_location"`);
+  }
+}
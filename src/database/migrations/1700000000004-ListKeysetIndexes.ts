@@ -0,0 +1,36 @@
+import { MigrationInterface, QueryRunner } from 'typeorm';
+
+export class ListKeysetIndexes1700000000004 implements MigrationInterface {
+  name = 'ListKeysetIndexes1700000000004';
+
+  public async up(queryRunner: QueryRunner): Promise<void> {
+    // (sort key, id) indexes behind the keyset-paginated list endpoints (see paginateByKey)
+    await queryRunner.query(
+      `CREATE INDEX "IDX_pickup_requests_scheduled_date_id" ON "pickup_requests" ("scheduled_date", "id")`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX "IDX_pickup_requests_household_scheduled_date_id" ON "pickup_requests" ("household_id", "scheduled_date", "id")`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX "IDX_pickup_requests_agent_scheduled_date_id" ON "pickup_requests" ("agent_id", "scheduled_date", "id")`,
+    );
+    await queryRunner.query(
+      `CREATE INDEX "IDX_pickup_requests_available" ON "pickup_requests" ("scheduled_date", "id") WHERE "status" = 'REQUESTED' AND "agent_id" IS NULL`,
+    );
+    await queryRunner.query(`CREATE INDEX "IDX_alerts_created_at_id" ON "alerts" ("created_at", "id")`);
+    await queryRunner.query(
+      `CREATE INDEX "IDX_educational_content_created_at_id" ON "educational_content" ("created_at", "id")`,
+    );
+    await queryRunner.query(`CREATE INDEX "IDX_survey_responses_survey_id" ON "survey_responses" ("survey_id")`);
+  }
+
+  public async down(queryRunner: QueryRunner): Promise<void> {
+    await queryRunner.query(`DROP INDEX "IDX_survey_responses_survey_id"`);
+    await queryRunner.query(`DROP INDEX "IDX_educational_content_created_at_id"`);
+    await queryRunner.query(`DROP INDEX "IDX_alerts_created_at_id"`);
+    await queryRunner.query(`DROP INDEX "IDX_pickup_requests_available"`);
+    await queryRunner.query(`DROP INDEX "IDX_pickup_requests_agent_scheduled_date_id"`);
+    await queryRunner.query(`DROP INDEX "IDX_pickup_requests_household_scheduled_date_id"`);
+    await queryRunner.query(`DROP INDEX "IDX_pickup_requests_scheduled_date_id"`);
+  }
+}
@@ -0,0 +1,15 @@
+import { IsOptional, IsString } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { CursorPaginationDto } from '../../common/dto/pagination.dto';
+
+export class ListEducationQueryDto extends CursorPaginationDto {
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsString()
+  audience?: string;
+
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsString()
+  language?: string;
+}
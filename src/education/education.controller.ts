@@ -5,6 +5,9 @@ import { JwtAuthGuard } from '../common/guards/jwt-auth.guard';
 import { Roles } from '../common/decorators/roles.decorator';
 import { Role } from '../common/enums/role.enum';
 import { Public } from '../common/decorators/public.decorator';
+import { Cached } from '../common/decorators/cached.decorator';
+import { PAGINATED_LIST_DESCRIPTION } from '../common/utils/cursor.util';
+import { ListEducationQueryDto } from './dto/list-education-query.dto';
 
 @ApiTags('Education')
 @Controller('education')
@@ -13,16 +16,15 @@ export class EducationController {
 
   @Get()
   @Public()
-  @ApiOperation({ summary: 'Get educational content' })
-  async findAll(
-    @Query('audience') audience?: string,
-    @Query('language') language?: string,
-  ) {
-    return this.educationService.findAll(audience, language);
+  @Cached('education')
+  @ApiOperation({ summary: 'Get educational content', description: PAGINATED_LIST_DESCRIPTION })
+  async findAll(@Query() query: ListEducationQueryDto) {
+    return this.educationService.findAll(query.audience, query.language, query.cursor, query.limit);
   }
 
   @Get(':id')
   @Public()
+  @Cached('education')
   @ApiOperation({ summary: 'Get educational content by ID' })
   async findOne(@Param('id') id: string) {
     return this.educationService.findOne(id);
@@ -2,28 +2,38 @@ import { Injectable, NotFoundException } from '@nestjs/common';
 import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { EducationalContent } from './entities/educational-content.entity';
+import { CursorPaginatedResult } from '../common/dto/pagination.dto';
+import { paginateByKey } from '../common/utils/cursor.util';
+import { ResponseCacheService } from '../common/cache/response-cache.service';
 
 @Injectable()
 export class EducationService {
   constructor(
     @InjectRepository(EducationalContent)
     private educationRepository: Repository<EducationalContent>,
+    private responseCache: ResponseCacheService,
   ) {}
 
   async create(createDto: Partial<EducationalContent>): Promise<EducationalContent> {
     const content = this.educationRepository.create(createDto);
-    return await this.educationRepository.save(content);
+    const saved = await this.educationRepository.save(content);
+    this.responseCache.invalidate('education');
+    return saved;
   }
 
-  async findAll(audience?: string, language?: string): Promise<EducationalContent[]> {
-    const where: any = { isPublished: true };
-    if (audience) where.targetAudience = audience;
-    if (language) where.language = language;
-
-    return this.educationRepository.find({
-      where,
-      order: { createdAt: 'DESC' },
-    });
+  async findAll(
+    audience?: string,
+    language?: string,
+    cursor?: string,
+    limit?: number,
+  ): Promise<EducationalContent[] | CursorPaginatedResult<EducationalContent>> {
+    const queryBuilder = this.educationRepository
+      .createQueryBuilder('content')
+      .where('content.isPublished = :isPublished', { isPublished: true });
+    if (audience) queryBuilder.andWhere('content.targetAudience = :audience', { audience });
+    if (language) queryBuilder.andWhere('content.language = :language', { language });
+
+    return paginateByKey(queryBuilder, 'content', 'createdAt', 'DESC', cursor, limit);
   }
 
   async findOne(id: string): Promise<EducationalContent> {
@@ -38,10 +48,12 @@ export class EducationService {
 
   async update(id: string, updateDto: any): Promise<EducationalContent> {
     await this.educationRepository.update(id, updateDto);
+    this.responseCache.invalidate('education');
     return this.findOne(id);
   }
 
   async remove(id: string): Promise<void> {
     await this.educationRepository.delete(id);
+    this.responseCache.invalidate('education');
   }
 }
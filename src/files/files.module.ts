@@ -1,8 +1,36 @@
 import { Module } from '@nestjs/common';
+import { ConfigModule, ConfigService } from '@nestjs/config';
+import { MulterModule } from '@nestjs/platform-express';
+import { diskStorage, memoryStorage } from 'multer';
+import { randomBytes } from 'crypto';
+import * as path from 'path';
 import { FilesService } from './files.service';
 import { UploadController } from './upload.controller';
 
 @Module({
+  imports: [
+    // Local uploads are streamed straight to disk as they arrive, so server
+    // memory stays flat however many photos are in flight at once.
+    MulterModule.registerAsync({
+      imports: [ConfigModule],
+      inject: [ConfigService],
+      useFactory: (configService: ConfigService) => {
+        const destination = configService.get<string>('upload.destination') || './uploads';
+        const storageProvider = configService.get<string>('upload.storageProvider') || 'local';
+        return {
+          storage:
+            storageProvider === 'local'
+              ? diskStorage({
+                  destination,
+                  filename: (req, file, cb) =>
+                    cb(null, `${Date.now()}-${randomBytes(4).toString('hex')}-${path.basename(file.originalname)}`),
+                })
+              : memoryStorage(),
+          limits: { fileSize: configService.get<number>('upload.maxFileSize') },
+        };
+      },
+    }),
+  ],
   controllers: [UploadController],
   providers: [FilesService],
   exports: [FilesService],
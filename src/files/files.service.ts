@@ -15,10 +15,15 @@ export class FilesService {
     const storageProvider = this.configService.get<string>('upload.storageProvider') || 'local';
 
     if (storageProvider === 'local') {
+      if (file.path) {
+        // Already streamed to disk by the multer storage in FilesModule
+        return `/uploads/${file.filename}`;
+      }
+
       // Ensure upload directory exists
       await fs.mkdir(uploadDir, { recursive: true });
 
-      const filename = `${Date.now()}-${file.originalname}`;
+      const filename = `${Date.now()}-${path.basename(file.originalname)}`;
       const filepath = path.join(uploadDir, filename);
 
       await fs.writeFile(filepath, file.buffer);
@@ -1,15 +1,25 @@
 import { Controller, Get } from '@nestjs/common';
 import { HealthCheck, HealthCheckService, TypeOrmHealthIndicator } from '@nestjs/terminus';
-import { ApiTags, ApiOperation } from '@nestjs/swagger';
+import { ApiTags, ApiOperation, ApiBearerAuth } from '@nestjs/swagger';
+import { monitorEventLoopDelay } from 'perf_hooks';
 import { Public } from '../common/decorators/public.decorator';
+import { Roles } from '../common/decorators/roles.decorator';
+import { Role } from '../common/enums/role.enum';
+import { ResponseCacheService } from '../common/cache/response-cache.service';
 
 @ApiTags('Health')
 @Controller('health')
 export class HealthController {
+  // Sampled every 10 ms; read and reset by GET /health/runtime
+  private readonly loopDelay = monitorEventLoopDelay({ resolution: 10 });
+
   constructor(
     private health: HealthCheckService,
     private db: TypeOrmHealthIndicator,
-  ) {}
+    private responseCache: ResponseCacheService,
+  ) {
+    this.loopDelay.enable();
+  }
 
   @Get()
   @Public()
@@ -18,4 +28,26 @@ export class HealthController {
   check() {
     return this.health.check([() => this.db.pingCheck('database')]);
   }
+
+  @Get('runtime')
+  @Roles(Role.ADMIN)
+  @ApiBearerAuth()
+  @ApiOperation({ summary: 'Event-loop delay since the previous call, memory, response cache and uptime (Admin)' })
+  runtime() {
+    const delay = this.loopDelay;
+    const ms = (ns: number) => Math.round(ns / 1e4) / 100;
+    const stats = {
+      eventLoopDelayMs: {
+        mean: ms(delay.mean),
+        p50: ms(delay.percentile(50)),
+        p99: ms(delay.percentile(99)),
+        max: ms(delay.max),
+      },
+      memory: process.memoryUsage(),
+      responseCache: this.responseCache.stats(),
+      uptimeS: process.uptime(),
+    };
+    delay.reset();
+    return stats;
+  }
 }
@@ -4,6 +4,9 @@ import { SwaggerModule, DocumentBuilder } from '@nestjs/swagger';
 import { ConfigService } from '@nestjs/config';
 import { Reflector } from '@nestjs/core';
 import { AppModule } from './app.module';
+import { ServerTimingInterceptor, TimedClassSerializerInterceptor } from './common/interceptors/server-timing.interceptor';
+import { TimedValidationPipe } from './common/pipes/timed-validation.pipe';
+import { instrumentQueryRunner, queryLogMiddleware, serverTimingMiddleware } from './common/utils/server-timing.util';
 
 async function bootstrap() {
   const app = await NestFactory.create(AppModule);
@@ -21,20 +24,39 @@ async function bootstrap() {
     credentials: true,
   });
 
+  // Server-Timing headers (auth, validation, handler, serialize, db, total), off unless SERVER_TIMING=true;
+  // QUERY_LOG=true also logs each request's SQL statements
+  const serverTiming = configService.get<boolean>('serverTiming');
+  if (serverTiming) {
+    app.use(serverTimingMiddleware);
+    if (configService.get<boolean>('queryLog')) {
+      app.use(queryLogMiddleware);
+    }
+    instrumentQueryRunner();
+  }
+
   // Global validation pipe
+  const validationOptions = {
+    whitelist: true,
+    forbidNonWhitelisted: true,
+    transform: true,
+    transformOptions: {
+      enableImplicitConversion: true,
+    },
+  };
   app.useGlobalPipes(
-    new ValidationPipe({
-      whitelist: true,
-      forbidNonWhitelisted: true,
-      transform: true,
-      transformOptions: {
-        enableImplicitConversion: true,
-      },
-    }),
+    serverTiming ? new TimedValidationPipe(validationOptions) : new ValidationPipe(validationOptions),
   );
 
   // Global serialization interceptor
-  app.useGlobalInterceptors(new ClassSerializerInterceptor(app.get(Reflector)));
+  if (serverTiming) {
+    app.useGlobalInterceptors(
+      new ServerTimingInterceptor(),
+      new TimedClassSerializerInterceptor(app.get(Reflector)),
+    );
+  } else {
+    app.useGlobalInterceptors(new ClassSerializerInterceptor(app.get(Reflector)));
+  }
 
   // Swagger documentation
   const config = new DocumentBuilder()
@@ -0,0 +1,15 @@
+import { IsOptional, IsString } from 'class-validator';
+import { ApiPropertyOptional } from '@nestjs/swagger';
+import { CursorPaginationDto } from '../../common/dto/pagination.dto';
+
+export class ListPickupsQueryDto extends CursorPaginationDto {
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsString()
+  scope?: string;
+
+  @ApiPropertyOptional()
+  @IsOptional()
+  @IsString()
+  status?: string;
+}
@@ -1,10 +1,13 @@
 import { Controller, Get, Post, Patch, Param, Body, Query, UseGuards } from '@nestjs/common';
-import { ApiTags, ApiOperation, ApiBearerAuth, ApiQuery } from '@nestjs/swagger';
+import { ApiTags, ApiOperation, ApiBearerAuth } from '@nestjs/swagger';
 import { PickupsService } from './pickups.service';
 import { JwtAuthGuard } from '../common/guards/jwt-auth.guard';
 import { CurrentUser } from '../common/decorators/current-user.decorator';
 import { Roles } from '../common/decorators/roles.decorator';
 import { Role } from '../common/enums/role.enum';
+import { CursorPaginationDto } from '../common/dto/pagination.dto';
+import { PAGINATED_LIST_DESCRIPTION } from '../common/utils/cursor.util';
+import { ListPickupsQueryDto } from './dto/list-pickups-query.dto';
 
 @ApiTags('Pickups')
 @Controller('pickups')
@@ -21,23 +24,20 @@ export class PickupsController {
   }
 
   @Get()
-  @ApiOperation({ summary: 'Get all pickups' })
-  @ApiQuery({ name: 'scope', required: false })
-  @ApiQuery({ name: 'status', required: false })
+  @ApiOperation({ summary: 'Get all pickups', description: PAGINATED_LIST_DESCRIPTION })
   async findAll(
     @CurrentUser('sub') userId: string,
     @CurrentUser('role') userRole: Role,
-    @Query('scope') scope?: string,
-    @Query('status') status?: string,
+    @Query() query: ListPickupsQueryDto,
   ) {
-    return this.pickupsService.findAll(userId, userRole, scope, status);
+    return this.pickupsService.findAll(userId, userRole, query.scope, query.status, query.cursor, query.limit);
   }
 
   @Get('available')
   @Roles(Role.AGENT)
-  @ApiOperation({ summary: 'Get available pickups (Agent)' })
-  async findAvailable() {
-    return this.pickupsService.findAvailable();
+  @ApiOperation({ summary: 'Get available pickups (Agent)', description: PAGINATED_LIST_DESCRIPTION })
+  async findAvailable(@Query() query: CursorPaginationDto) {
+    return this.pickupsService.findAvailable(query.cursor, query.limit);
   }
 
   @Get(':id')
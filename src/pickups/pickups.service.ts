@@ -7,6 +7,8 @@ import { HouseholdProfile } from '../households/entities/household-profile.entit
 import { PickupAgentProfile } from '../agents/entities/pickup-agent-profile.entity';
 import { PickupStatus } from '../common/enums/pickup-status.enum';
 import { Role } from '../common/enums/role.enum';
+import { CursorPaginatedResult } from '../common/dto/pagination.dto';
+import { paginateByKey } from '../common/utils/cursor.util';
 
 @Injectable()
 export class PickupsService {
@@ -42,7 +44,14 @@ export class PickupsService {
     return this.pickupRepository.save(pickup);
   }
 
-  async findAll(userId: string, userRole: Role, scope?: string, status?: string) {
+  async findAll(
+    userId: string,
+    userRole: Role,
+    scope?: string,
+    status?: string,
+    cursor?: string,
+    limit?: number,
+  ): Promise<PickupRequest[] | CursorPaginatedResult<PickupRequest>> {
     const queryBuilder = this.pickupRepository
       .createQueryBuilder('pickup')
       .leftJoinAndSelect('pickup.household', 'household')
@@ -72,17 +81,18 @@ export class PickupsService {
       queryBuilder.andWhere('pickup.status = :status', { status });
     }
 
-    queryBuilder.orderBy('pickup.scheduledDate', 'DESC');
-
-    return queryBuilder.getMany();
+    return paginateByKey(queryBuilder, 'pickup', 'scheduledDate', 'DESC', cursor, limit);
   }
 
-  async findAvailable(): Promise<PickupRequest[]> {
-    return this.pickupRepository.find({
-      where: { status: PickupStatus.REQUESTED, agentId: null as any },
-      relations: ['household', 'household.user'],
-      order: { scheduledDate: 'ASC' },
-    });
+  async findAvailable(cursor?: string, limit?: number): Promise<PickupRequest[] | CursorPaginatedResult<PickupRequest>> {
+    const queryBuilder = this.pickupRepository
+      .createQueryBuilder('pickup')
+      .leftJoinAndSelect('pickup.household', 'household')
+      .leftJoinAndSelect('household.user', 'householdUser')
+      .where('pickup.status = :status', { status: PickupStatus.REQUESTED })
+      .andWhere('pickup.agentId IS NULL');
+
+    return paginateByKey(queryBuilder, 'pickup', 'scheduledDate', 'ASC', cursor, limit);
   }
 
   async findOne(id: string): Promise<PickupRequest> {
@@ -99,7 +109,6 @@ export class PickupsService {
   }
 
   async acceptPickup(pickupId: string, userId: string): Promise<PickupRequest> {
-    const pickup = await this.findOne(pickupId);
     const agent = await this.agentRepository.findOne({ where: { userId } });
 
     if (!agent) {
@@ -111,14 +120,24 @@ export class PickupsService {
       throw new BadRequestException('Your account is pending KYC approval. Please contact an administrator.');
     }
 
-    if (pickup.status !== PickupStatus.REQUESTED) {
+    // Claim the pickup with a single conditional UPDATE. When several agents
+    // race for the same request only the first one still matches
+    // status = REQUESTED, so a pickup can never be assigned twice.
+    const result = await this.pickupRepository
+      .createQueryBuilder()
+      .update(PickupRequest)
+      .set({ agentId: agent.id, status: PickupStatus.ASSIGNED })
+      .where('id = :pickupId', { pickupId })
+      .andWhere('status = :status', { status: PickupStatus.REQUESTED })
+      .execute();
+
+    if (!result.affected) {
+      // Throws 404 if the pickup does not exist; otherwise someone else won.
+      await this.findOne(pickupId);
       throw new BadRequestException('Pickup is not available for acceptance');
     }
 
-    pickup.agentId = agent.id;
-    pickup.status = PickupStatus.ASSIGNED;
-
-    return this.pickupRepository.save(pickup);
+    return this.findOne(pickupId);
   }
 
   async startPickup(pickupId: string, userId: string): Promise<PickupRequest> {
@@ -224,26 +243,30 @@ export class PickupsService {
       comment: ratingDto.comment,
     });
 
-    const savedRating = await this.ratingRepository.save(rating);
+    // Store the rating and fold it into the agent's running sum/count in one
+    // transaction. The UPDATE reads the current totals itself, so concurrent
+    // ratings for the same agent cannot overwrite each other, and the cost no
+    // longer depends on how many ratings the agent already has.
+    const savedRating = await this.ratingRepository.manager.transaction(async (manager) => {
+      const saved = await manager.save(rating);
+
+      if (pickup.agentId) {
+        await manager
+          .createQueryBuilder()
+          .update(PickupAgentProfile)
+          .set({
+            ratingSum: () => 'rating_sum + :rating',
+            ratingCount: () => 'rating_count + 1',
+            averageRating: () => 'ROUND((rating_sum + :rating)::numeric / (rating_count + 1), 2)',
+          })
+          .where('id = :agentId', { agentId: pickup.agentId })
+          .setParameter('rating', ratingDto.rating)
+          .execute();
+      }
 
-    // Update agent average rating
-    const agent = await this.agentRepository.findOne({
-      where: { id: pickup.agentId },
-      relations: ['ratings'],
+      return saved;
     });
 
-    if (agent) {
-      const ratings = await this.ratingRepository.find({
-        where: { agentId: agent.id },
-      });
-
-      if (ratings.length > 0) {
-        const avgRating = ratings.reduce((sum, r) => sum + r.rating, 0) / ratings.length;
-        agent.averageRating = Math.round(avgRating * 100) / 100;
-        await this.agentRepository.save(agent);
-      }
-    }
-
     return savedRating;
   }
 }
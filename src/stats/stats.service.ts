@@ -48,15 +48,23 @@ export class StatsService {
       queryBuilder.andWhere('pickup.createdAt <= :to', { to });
     }
 
-    const pickups = await queryBuilder.getMany();
+    // Count in the database: one row per status instead of every pickup in the range
+    const rows = await queryBuilder
+      .select('pickup.status', 'status')
+      .addSelect('COUNT(*)', 'count')
+      .groupBy('pickup.status')
+      .getRawMany();
 
-    const byStatus = pickups.reduce((acc, pickup) => {
-      acc[pickup.status] = (acc[pickup.status] || 0) + 1;
+    let total = 0;
+    const byStatus = rows.reduce((acc, row) => {
+      const count = parseInt(row.count, 10);
+      acc[row.status] = count;
+      total += count;
       return acc;
     }, {});
 
     return {
-      total: pickups.length,
+      total,
       byStatus,
     };
   }
@@ -6,6 +6,10 @@ import { CurrentUser } from '../common/decorators/current-user.decorator';
 import { Roles } from '../common/decorators/roles.decorator';
 import { Role } from '../common/enums/role.enum';
 import { Public } from '../common/decorators/public.decorator';
+import { Cached } from '../common/decorators/cached.decorator';
+import { CursorPaginationDto } from '../common/dto/pagination.dto';
+import { PAGINATED_LIST_DESCRIPTION } from '../common/utils/cursor.util';
+
 
 @ApiTags('Surveys')
 @Controller('surveys')
@@ -14,6 +18,7 @@ export class SurveysController {
 
   @Get()
   @Public()
+  @Cached('surveys')
   @ApiOperation({ summary: 'Get all surveys' })
   async findAll(
     @Query('targetGroup') targetGroup?: string,
@@ -24,6 +29,7 @@ export class SurveysController {
 
   @Get(':id')
   @Public()
+  @Cached('surveys')
   @ApiOperation({ summary: 'Get survey by ID' })
   async findOne(@Param('id') id: string) {
     return this.surveysService.findOne(id);
@@ -54,8 +60,8 @@ export class SurveysController {
   @UseGuards(JwtAuthGuard)
   @Roles(Role.ADMIN, Role.HYSACAM, Role.COUNCIL)
   @ApiBearerAuth()
-  @ApiOperation({ summary: 'Get survey responses (Admin/HYSACAM/Council)' })
-  async getResponses(@Param('id') surveyId: string) {
-    return this.surveysService.getResponses(surveyId);
+  @ApiOperation({ summary: 'Get survey responses (Admin/HYSACAM/Council)', description: PAGINATED_LIST_DESCRIPTION })
+  async getResponses(@Param('id') surveyId: string, @Query() query: CursorPaginationDto) {
+    return this.surveysService.getResponses(surveyId, query.cursor, query.limit);
   }
 }
@@ -3,6 +3,9 @@ import { InjectRepository } from '@nestjs/typeorm';
 import { Repository } from 'typeorm';
 import { Survey } from './entities/survey.entity';
 import { SurveyResponse } from './entities/survey-response.entity';
+import { CursorPaginatedResult } from '../common/dto/pagination.dto';
+import { paginateByKey } from '../common/utils/cursor.util';
+import { ResponseCacheService } from '../common/cache/response-cache.service';
 
 @Injectable()
 export class SurveysService {
@@ -11,12 +14,14 @@ export class SurveysService {
     private surveyRepository: Repository<Survey>,
     @InjectRepository(SurveyResponse)
     private responseRepository: Repository<SurveyResponse>,
+    private responseCache: ResponseCacheService,
   ) {}
 
   async createSurvey(createDto: any): Promise<Survey> {
     const survey = this.surveyRepository.create(createDto);
     // TypeORM save returns the saved entity
     const saved = await this.surveyRepository.save(survey);
+    this.responseCache.invalidate('surveys');
     return Array.isArray(saved) ? saved[0] : saved;
   }
 
@@ -47,11 +52,16 @@ export class SurveysService {
     return this.responseRepository.save(response);
   }
 
-  async getResponses(surveyId: string): Promise<SurveyResponse[]> {
-    return this.responseRepository.find({
-      where: { surveyId },
-      relations: ['user'],
-      order: { submittedAt: 'DESC' },
-    });
+  async getResponses(
+    surveyId: string,
+    cursor?: string,
+    limit?: number,
+  ): Promise<SurveyResponse[] | CursorPaginatedResult<SurveyResponse>> {
+    const queryBuilder = this.responseRepository
+      .createQueryBuilder('response')
+      .leftJoinAndSelect('response.user', 'user')
+      .where('response.surveyId = :surveyId', { surveyId });
+
+    return paginateByKey(queryBuilder, 'response', 'submittedAt', 'DESC', cursor, limit);
   }
 }
@@ -1,12 +1,56 @@
 import os
 import sys
+import argparse
+import base64
+import threading
 import time
 import json
+import math
+import contextlib
 import random
-import string
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
-import requests
+from harness.api import (
+    assert_status,
+    auth_headers,
+    extract_tokens_and_user,
+    login,
+    random_email,
+    random_phone,
+)
+from harness.bench import compare, load_baseline, print_comparison, run_scenarios, save_baseline
+from harness.cassette import Cassette, CassetteWriter, ReplayAdapter
+from harness.client import Client
+from harness.contention import print_contention_summary, run_accept_contention
+from harness.events import EventReport, EventSink
+from harness.fleet import print_fleet_errors, run_fleet
+from harness.geobench import count_bins, geo_bench_report, print_geo_bench, run_geo_workload
+from harness.load import LoadSummary, VirtualUser, print_load_summary, run_load_quietly
+from harness.metrics import MetricsRegistry
+from harness.openloop import PROFILE_HELP, open_loop_report, parse_profile, print_open_loop_summary, run_open_loop
+from harness.pages import iter_pages, print_walk, walk_pages
+from harness.querybudget import QueryBudget, QueryCounter, check_budgets, measure_level, print_query_budget
+from harness.ratingbench import agent_rating_count, measure_ratings, print_rating_bench, rating_bench_report
+from harness.resources import ResourceSampler, print_resource_summary
+from harness.scenario import ScenarioResults, load_scenario, print_scenario_summary, run_scenario
+from harness.scheduler import context_keys, run_parallel
+from harness.seed import create_seed_agents, print_seed_summary, run_seed
+from harness.sensors import MAX_BATCH, print_sensor_summary, run_batched, run_per_bin, sensor_readings, sensor_report
+from harness.servertiming import ServerTimingStats
+from harness.soak import SoakRun, drift_report, print_soak_summary, run_soak_quietly
+from harness.statsbench import (
+    count_pickups,
+    households_for,
+    measure_stats,
+    print_stats_bench,
+    server_memory_kb,
+    stats_bench_report,
+)
+from harness.httpcache import ConditionalCache
+from harness.tokens import TokenCache
+from harness.uploads import print_upload_summary, run_uploads, upload_report
+from harness.transport import HttpClient
 
 # ========================
 # CONFIG
@@ -22,118 +66,252 @@ AGENT_PASSWORD = os.getenv("AGENT_PASSWORD")
 
 API_PREFIX = "/api/v1"
 
+# Access/refresh tokens are reused across runs from this file; empty disables it
+TOKEN_CACHE = os.getenv("TOKEN_CACHE", ".token-cache.json")
+
+# Set from --record / --replay: every api_client() records to, or is served from, this cassette
+RECORDER = None
+REPLAY = None
+REPLAY_LATENCY = 0.0
+
+# Set from --events: requests, test results and load flows stream to this log
+EVENTS = None
+
+# Set from --sample-*: server and database resources sampled during the run
+SAMPLER = None
+
+# Set from --http-cache: conditional GET cache shared by every api_client()
+HTTP_CACHE = None
+
 # ========================
 # TEST RUNNER
 # ========================
 
 class TestRunner:
-    def __init__(self):
+    def __init__(self, http=None):
         self.passed = 0
         self.failed = 0
+        self.skipped = 0
         self.tests = []
         self.context = {}
+        # Tests may run on several threads (see --parallel)
+        self._lock = threading.Lock()
+        # One pooled keep-alive transport shared by every test; each call
+        # it makes lands in a per-endpoint latency histogram.
+        self.http = http or api_client()
+        self.metrics = MetricsRegistry()
+        self.http.listeners.append(self.metrics.record)
+        # Filled only when the server sends Server-Timing (SERVER_TIMING=true)
+        self.server_timing = ServerTimingStats()
+        self.http.listeners.append(self.server_timing.record)
 
     def log(self, msg):
         print(msg)
 
     def run(self, name, func):
         self.log(f"\n=== {name} ===")
+        start = time.perf_counter()
         try:
             func(self)
-            self.passed += 1
-            self.tests.append((name, True, ""))
+            self._record(name, True, "", time.perf_counter() - start)
             self.log(f"[PASS] {name}")
+            return True
         except AssertionError as e:
-            self.failed += 1
             msg = str(e) or "Assertion failed"
-            self.tests.append((name, False, msg))
+            self._record(name, False, msg, time.perf_counter() - start)
             self.log(f"[FAIL] {name}: {msg}")
         except Exception as e:
-            self.failed += 1
             msg = f"Unexpected error: {e}"
-            self.tests.append((name, False, msg))
+            self._record(name, False, msg, time.perf_counter() - start)
             self.log(f"[ERROR] {name}: {msg}")
-
-    def summary(self):
+        return False
+
+    def skip(self, name, reason):
+        with self._lock:
+            self.skipped += 1
+            self.tests.append((name, None, reason))
+        if EVENTS is not None:
+            EVENTS.test(name, None, reason)
+        self.log(f"\n[SKIP] {name}: {reason}")
+
+    def _record(self, name, ok, msg, duration_s):
+        with self._lock:
+            if ok:
+                self.passed += 1
+            else:
+                self.failed += 1
+            self.tests.append((name, ok, msg))
+        if EVENTS is not None:
+            EVENTS.test(name, ok, msg, round(duration_s, 6))
+
+    def summary(self, metrics_json=None):
         print("\n========== TEST SUMMARY ==========")
         for name, ok, msg in self.tests:
-            status = "PASS" if ok else "FAIL"
+            status = "SKIP" if ok is None else "PASS" if ok else "FAIL"
             print(f"{status:4} - {name}" + ("" if ok or not msg else f" -> {msg}"))
         print("==================================")
-        print(f"Total: {len(self.tests)}, Passed: {self.passed}, Failed: {self.failed}")
+        print(f"Total: {len(self.tests)}, Passed: {self.passed}, Failed: {self.failed}, Skipped: {self.skipped}")
+        self.metrics.print_summary()
+        self.server_timing.print_summary()
+        cache = self.http.token_cache
+        if cache is not None:
+            print(f"Token cache: {cache.hits} reused, {cache.refreshes} refreshed, {cache.logins} logins")
+        if metrics_json:
+            self.metrics.export_json(metrics_json)
+            print(f"Latency metrics written to {metrics_json}")
         if self.failed > 0:
             sys.exit(1)
 
+def api_client(pool_size=10):
+    """
+    Pooled client for the API; logins go through the token cache unless
+    TOKEN_CACHE is empty, and a --record/--replay cassette and the
+    --http-cache are attached.
+    """
+    cache = TokenCache(TOKEN_CACHE) if TOKEN_CACHE else None
+    http = HttpClient(f"{BASE_URL}{API_PREFIX}", pool_size=pool_size, token_cache=cache)
+    http.recorder = RECORDER
+    http.cache = HTTP_CACHE
+    if EVENTS is not None:
+        http.listeners.append(EVENTS.request)
+    if SAMPLER is not None:
+        http.listeners.append(SAMPLER.record)
+    if REPLAY is not None:
+        adapter = ReplayAdapter(REPLAY, REPLAY_LATENCY)
+        http.session.mount("http://", adapter)
+        http.session.mount("https://", adapter)
+    return http
+
 
 # ========================
-# HELPERS
+# REQUESTS
 # ========================
+# Calls shared by the tests and the scenario actions; they return the
+# response and leave checking it to the caller.
 
-def random_phone():
-    # Cameroon-style +2376XXXXXXXX
-    return "+2376" + "".join(random.choice(string.digits) for _ in range(7))
+def register_household(r, phone, password):
+    payload = {
+        "name": "Test Household User",
+        "phone": phone,
+        "password": password,
+        "email": random_email(),
+        "address": "Ndokoti, Douala",
+        "quarter": "Ndokoti"
+    }
+    return r.http.post("/auth/register", json=payload)
 
-def random_email():
-    return "test_" + "".join(random.choice(string.ascii_lowercase) for _ in range(8)) + "@example.com"
 
-def assert_status(resp, expected, name=""):
-    if resp.status_code != expected:
-        try:
-            body = resp.json()
-        except Exception:
-            body = resp.text
-        raise AssertionError(f"{name} expected {expected}, got {resp.status_code}, body={body}")
+def create_pickup(r, token, days_ahead=1, **fields):
+    payload = {
+        "scheduledDate": (datetime.utcnow() + timedelta(days=days_ahead)).strftime("%Y-%m-%d"),
+        "timeWindow": "08:00-10:00",
+        "notes": "Test pickup from script",
+        "wasteType": "MIXED",
+        **fields,
+    }
+    return r.http.post("/pickups", json=payload, headers=auth_headers(token))
+
 
-def extract_tokens_and_user(data):
+def pickup_transition(r, token, pickup_id, action, **fields):
     """
-    Tries to be flexible with token/user field names.
+    PATCH /pickups/{id}/accept|start|cancel; complete goes through complete_pickup.
     """
-    if not isinstance(data, dict):
-        raise AssertionError("Login response is not a JSON object")
+    return r.http.patch(f"/pickups/{pickup_id}/{action}", json=fields or None, headers=auth_headers(token))
+
+
+def complete_pickup(r, token, pickup_id, **fields):
+    # Minimal body; adjust if backend expects more
+    payload = {
+        "photoProofUrl": "https://example.com/photo.jpg",
+        "binId": None,  # replace with a real binId if required
+        "notes": "Completed by test script",
+        **fields,
+    }
+    return r.http.patch(f"/pickups/{pickup_id}/complete", json=payload, headers=auth_headers(token))
+
+
+def create_alert(r, token, **fields):
+    payload = {
+        "type": "ILLEGAL_DUMPING",
+        "description": "Test alert from script",
+        "photoUrl": "https://example.com/alert_photo.jpg",
+        "gpsLat": 4.05,
+        "gpsLng": 9.70,
+        **fields,
+    }
+    return r.http.post("/alerts", json=payload, headers=auth_headers(token))
+
+
+def update_alert(r, token, alert_id, status="RESOLVED", notes="Resolved by admin test script."):
+    payload = {
+        "status": status,
+        "resolutionNotes": notes
+    }
+    return r.http.patch(f"/alerts/{alert_id}", json=payload, headers=auth_headers(token))
+
+
+def update_bin_capacities(r, token, readings):
+    return r.http.patch("/bins/capacity", json={"readings": readings}, headers=auth_headers(token))
+
 
-    access = data.get("accessToken") or data.get("access_token") or data.get("token")
-    refresh = data.get("refreshToken") or data.get("refresh_token")
-    user = data.get("user") or data.get("profile") or {}
+def create_survey(r, token, **fields):
+    payload = {
+        "title": "Household Feedback Survey",
+        "targetGroup": "HOUSEHOLDS",
+        "questions": [
+            {"id": "q1", "text": "How satisfied are you with the pickup service?", "type": "rating"},
+            {"id": "q2", "text": "Any suggestions for improvement?", "type": "text"}
+        ],
+        "isActive": True,
+        **fields,
+    }
+    return r.http.post("/surveys", json=payload, headers=auth_headers(token))
 
-    if not access:
-        raise AssertionError(f"Could not find access token in response: {data}")
-    if not refresh:
-        # Some implementations may not send refresh token on login; we allow None
-        refresh = None
 
-    user_id = user.get("id") or user.get("userId") or user.get("user_id")
-    return access, refresh, user_id, user
+def submit_survey_response(r, token, survey_id):
+    payload = {
+        "answers": {
+            "q1": 5,
+            "q2": "Everything works well so far."
+        }
+    }
+    return r.http.post(f"/surveys/{survey_id}/responses", json=payload, headers=auth_headers(token))
 
-def auth_headers(token):
-    return {"Authorization": f"Bearer {token}"} if token else {}
+
+def pickup_stats(r, token, days=7):
+    today = datetime.utcnow().date()
+    params = {"from": (today - timedelta(days=days)).isoformat(), "to": today.isoformat()}
+    return r.http.get("/stats/pickups", params=params, headers=auth_headers(token))
+
+
+def runtime_client():
+    """
+    Admin client for GET /health/runtime on a connection of its own, so
+    the sampler's polling stays out of the run's metrics.
+    """
+    cache = TokenCache(TOKEN_CACHE) if TOKEN_CACHE else None
+    http = HttpClient(f"{BASE_URL}{API_PREFIX}", pool_size=1, token_cache=cache)
+    token = login(VirtualUser(-1, http), ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+    return Client(http, token)
 
 
 # ========================
 # INDIVIDUAL TESTS
 # ========================
 
+@context_keys()
 def test_health(r: TestRunner):
-    url = f"{BASE_URL}{API_PREFIX}/health"
-    resp = requests.get(url, timeout=10)
+    resp = r.http.get("/health")
     assert resp.status_code in (200, 503), f"Unexpected health status: {resp.status_code}"
     print("Health response:", resp.status_code, resp.text[:200])
 
 
+@context_keys(produces=["household_phone", "household_password", "household_access", "household_refresh", "household_id"])
 def test_household_auth_flow(r: TestRunner):
     # 1. Register
     phone = random_phone()
     password = "Passw0rd!"  # >= 6 chars
-    email = random_email()
-    url = f"{BASE_URL}{API_PREFIX}/auth/register"
-    payload = {
-        "name": "Test Household User",
-        "phone": phone,
-        "password": password,
-        "email": email,
-        "address": "Ndokoti, Douala",
-        "quarter": "Ndokoti"
-    }
-    resp = requests.post(url, json=payload, timeout=10)
+    resp = register_household(r, phone, password)
     # Either 201 (first time) or 409 (already exists) is acceptable logic.
     if resp.status_code == 409:
         print("User already exists (unexpected for random phone, but continuing).")
@@ -141,8 +319,7 @@ def test_household_auth_flow(r: TestRunner):
         assert_status(resp, 201, "register")
 
     # 2. Login
-    url = f"{BASE_URL}{API_PREFIX}/auth/login"
-    resp = requests.post(url, json={"phone": phone, "password": password}, timeout=10)
+    resp = r.http.post("/auth/login", json={"phone": phone, "password": password})
     assert_status(resp, 200, "login")
     data = resp.json()
     access, refresh, user_id, user = extract_tokens_and_user(data)
@@ -157,8 +334,7 @@ def test_household_auth_flow(r: TestRunner):
 
     # 3. Refresh token (if available)
     if refresh:
-        url = f"{BASE_URL}{API_PREFIX}/auth/refresh"
-        resp = requests.post(url, json={"refreshToken": refresh}, timeout=10)
+        resp = r.http.post("/auth/refresh", json={"refreshToken": refresh})
         assert_status(resp, 200, "refresh")
         data = resp.json()
         new_access, new_refresh, _, _ = extract_tokens_and_user(data)
@@ -167,13 +343,11 @@ def test_household_auth_flow(r: TestRunner):
         print("Refreshed tokens OK.")
 
     # 4. Change password
-    url = f"{BASE_URL}{API_PREFIX}/auth/change-password"
     new_password = "NewPassw0rd!"
-    resp = requests.patch(
-        url,
+    resp = r.http.patch(
+        "/auth/change-password",
         json={"currentPassword": password, "newPassword": new_password},
-        headers=auth_headers(r.context["household_access"]),
-        timeout=10
+        headers=auth_headers(r.context["household_access"])
     )
     if resp.status_code == 400:
         print("Change password failed with 400 (maybe currentPassword mismatch) -> skipping re-login test.")
@@ -181,8 +355,7 @@ def test_household_auth_flow(r: TestRunner):
     assert_status(resp, 200, "change-password")
 
     # 5. Re-login with new password
-    url = f"{BASE_URL}{API_PREFIX}/auth/login"
-    resp = requests.post(url, json={"phone": phone, "password": new_password}, timeout=10)
+    resp = r.http.post("/auth/login", json={"phone": phone, "password": new_password})
     assert_status(resp, 200, "re-login")
     data = resp.json()
     access, refresh, user_id, _ = extract_tokens_and_user(data)
@@ -192,13 +365,13 @@ def test_household_auth_flow(r: TestRunner):
     print("Re-login with new password OK.")
 
 
+@context_keys(consumes=["household_access"], produces=["household_profile_id"])
 def test_household_profile_and_stats(r: TestRunner):
     token = r.context.get("household_access")
     assert token, "No household_access token in context"
 
     # GET /households/me
-    url = f"{BASE_URL}{API_PREFIX}/households/me"
-    resp = requests.get(url, headers=auth_headers(token), timeout=10)
+    resp = r.http.get("/households/me", headers=auth_headers(token))
     assert_status(resp, 200, "households/me")
     profile = resp.json()
     print("Household profile:", profile)
@@ -210,23 +383,22 @@ def test_household_profile_and_stats(r: TestRunner):
     r.context["household_profile_id"] = household_profile_id
 
     # PUT /households/me
-    url = f"{BASE_URL}{API_PREFIX}/households/me"
     payload = {
         "householdSize": 4,
         "preferredPickupDays": ["MONDAY", "THURSDAY"],
         "address": "Updated Address Ndokoti"
     }
-    resp = requests.put(url, json=payload, headers=auth_headers(token), timeout=10)
+    resp = r.http.put("/households/me", json=payload, headers=auth_headers(token))
     # Even if server ignores some fields, we just expect 200
     assert_status(resp, 200, "update household profile")
     print("Updated household profile")
 
     # GET /households/me/stats
-    url = f"{BASE_URL}{API_PREFIX}/households/me/stats"
-    resp = requests.get(url, headers=auth_headers(token), timeout=10)
+    resp = r.http.get("/households/me/stats", headers=auth_headers(token))
     assert_status(resp, 200, "households/me/stats")
     print("Household stats:", resp.json())
 
+@context_keys(consumes=["household_access", "household_profile_id", "subscription_id"])
 def test_subscription_me_household(r: TestRunner):
     token = r.context.get("household_access")
     household_profile_id = r.context.get("household_profile_id")
@@ -235,8 +407,7 @@ def test_subscription_me_household(r: TestRunner):
     assert household_profile_id, "household_profile_id missing"
 
     # GET /subscriptions/me
-    url = f"{BASE_URL}{API_PREFIX}/subscriptions/me"
-    resp = requests.get(url, headers=auth_headers(token), timeout=10)
+    resp = r.http.get("/subscriptions/me", headers=auth_headers(token))
     assert_status(resp, 200, "subscriptions/me")
 
     data = resp.json()
@@ -252,34 +423,30 @@ def test_subscription_me_household(r: TestRunner):
             assert hid == household_profile_id, "Subscription does not belong to logged-in household"
 
 
+@context_keys(produces=["agent_access", "agent_refresh", "agent_user_id"])
 def test_agent_auth_and_stats(r: TestRunner):
     if not (AGENT_PHONE and AGENT_PASSWORD):
         raise AssertionError("AGENT_PHONE or AGENT_PASSWORD not set; cannot run agent tests")
 
-    # Login as agent
-    url = f"{BASE_URL}{API_PREFIX}/auth/login"
-    resp = requests.post(url, json={"phone": AGENT_PHONE, "password": AGENT_PASSWORD}, timeout=10)
-    assert_status(resp, 200, "agent login")
-    data = resp.json()
-    access, refresh, user_id, _ = extract_tokens_and_user(data)
+    # Login as agent (reuses a cached token when one is still valid)
+    access, refresh, user_id, _ = login(r, AGENT_PHONE, AGENT_PASSWORD, "agent login")
     r.context["agent_access"] = access
     r.context["agent_refresh"] = refresh
     r.context["agent_user_id"] = user_id
     print("Agent logged in:", user_id)
 
     # GET /agents/me
-    url = f"{BASE_URL}{API_PREFIX}/agents/me"
-    resp = requests.get(url, headers=auth_headers(access), timeout=10)
+    resp = r.http.get("/agents/me", headers=auth_headers(access))
     assert_status(resp, 200, "agents/me")
     print("Agent profile:", resp.json())
 
     # GET /agents/me/stats
-    url = f"{BASE_URL}{API_PREFIX}/agents/me/stats"
-    resp = requests.get(url, headers=auth_headers(access), timeout=10)
+    resp = r.http.get("/agents/me/stats", headers=auth_headers(access))
     assert_status(resp, 200, "agents/me/stats")
     print("Agent stats:", resp.json())
 
 
+@context_keys(consumes=["household_access", "agent_access"], produces=["pickup_id"])
 def test_pickup_flow_household_agent(r: TestRunner):
     """
     Household: create pickup
@@ -292,15 +459,7 @@ def test_pickup_flow_household_agent(r: TestRunner):
     assert agent_token, "No agent_access token"
 
     # Household creates pickup
-    url = f"{BASE_URL}{API_PREFIX}/pickups"
-    tomorrow = (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d")
-    payload = {
-        "scheduledDate": tomorrow,
-        "timeWindow": "08:00-10:00",
-        "notes": "Test pickup from script",
-        "wasteType": "MIXED"
-    }
-    resp = requests.post(url, json=payload, headers=auth_headers(household_token), timeout=10)
+    resp = create_pickup(r, household_token)
     assert_status(resp, 201, "create pickup")
     pickup = resp.json()
     pickup_id = pickup.get("id") or pickup.get("pickupId")
@@ -310,61 +469,44 @@ def test_pickup_flow_household_agent(r: TestRunner):
     print("Created pickup:", pickup_id)
 
     # Agent: get available
-    url = f"{BASE_URL}{API_PREFIX}/pickups/available"
-    resp = requests.get(url, headers=auth_headers(agent_token), timeout=10)
+    resp = r.http.get("/pickups/available", params={"limit": 20}, headers=auth_headers(agent_token))
     assert_status(resp, 200, "pickups/available")
     available = resp.json()
-    print("Available pickups:", available)
+    print("Available pickups on first page:", len(available["data"]))
 
     # Try to find our pickup in available list
     # Depending on implementation, might include or not; we try to accept directly anyway.
-    url = f"{BASE_URL}{API_PREFIX}/pickups/{pickup_id}/accept"
-    resp = requests.patch(url, headers=auth_headers(agent_token), timeout=10)
+    resp = pickup_transition(r, agent_token, pickup_id, "accept")
     assert_status(resp, 200, "accept pickup")
 
     # Start pickup
-    url = f"{BASE_URL}{API_PREFIX}/pickups/{pickup_id}/start"
-    resp = requests.patch(url, headers=auth_headers(agent_token), timeout=10)
+    resp = pickup_transition(r, agent_token, pickup_id, "start")
     assert_status(resp, 200, "start pickup")
 
-    # Complete pickup (minimal body; adjust if backend expects more)
-    url = f"{BASE_URL}{API_PREFIX}/pickups/{pickup_id}/complete"
-    payload = {
-        "photoProofUrl": "https://example.com/photo.jpg",
-        "binId": None,  # replace with a real binId if required
-        "notes": "Completed by test script"
-    }
-    resp = requests.patch(url, json=payload, headers=auth_headers(agent_token), timeout=10)
+    # Complete pickup
+    resp = complete_pickup(r, agent_token, pickup_id)
     if resp.status_code not in (200, 201):
         print("Complete pickup may require specific DTO, response:", resp.status_code, resp.text)
         raise AssertionError("complete pickup failed")
     print("Completed pickup:", resp.json())
 
     # Household rates pickup
-    url = f"{BASE_URL}{API_PREFIX}/pickups/{pickup_id}/rating"
     payload = {
         "rating": 5,
         "comment": "Excellent service from automated test."
     }
-    resp = requests.post(url, json=payload, headers=auth_headers(household_token), timeout=10)
+    resp = r.http.post(f"/pickups/{pickup_id}/rating", json=payload, headers=auth_headers(household_token))
     assert_status(resp, 201, "rate pickup")
     print("Rated pickup:", resp.json())
 
 
+@context_keys(consumes=["household_access"], produces=["alert_id"])
 def test_alerts_flow(r: TestRunner):
     household_token = r.context.get("household_access")
     assert household_token, "No household_access token"
 
     # Create alert as household
-    url = f"{BASE_URL}{API_PREFIX}/alerts"
-    payload = {
-        "type": "ILLEGAL_DUMPING",
-        "description": "Test alert from script",
-        "photoUrl": "https://example.com/alert_photo.jpg",
-        "gpsLat": 4.05,
-        "gpsLng": 9.70
-    }
-    resp = requests.post(url, json=payload, headers=auth_headers(household_token), timeout=10)
+    resp = create_alert(r, household_token)
     assert_status(resp, 201, "create alert")
     alert = resp.json()
     alert_id = alert.get("id")
@@ -374,60 +516,78 @@ def test_alerts_flow(r: TestRunner):
     print("Created alert:", alert_id)
 
     # List alerts (as same household; depending on implementation might show all or subset)
-    url = f"{BASE_URL}{API_PREFIX}/alerts"
-    resp = requests.get(url, headers=auth_headers(household_token), timeout=10)
+    resp = r.http.get("/alerts", params={"limit": 20}, headers=auth_headers(household_token))
     assert_status(resp, 200, "alerts list")
-    print("Alerts list length:", len(resp.json()) if isinstance(resp.json(), list) else "unknown")
+    print("Alerts on first page:", len(resp.json()["data"]))
+
+    # Without limit or cursor the deprecated unpaginated form is still a bare array
+    resp = r.http.get("/alerts", headers=auth_headers(household_token))
+    assert_status(resp, 200, "alerts list (unpaginated)")
+    if not isinstance(resp.json(), list):
+        raise AssertionError(f"Expected a bare array without limit/cursor: {resp.text[:200]}")
+
+    # Follow the cursor for a few small pages; keyset pages must not repeat rows
+    ids = []
+    pages = iter_pages(r.http, "/alerts", headers=auth_headers(household_token), limit=5, name="alerts page", max_pages=3)
+    for page in pages:
+        ids.extend(a["id"] for a in page)
+    if len(ids) != len(set(ids)):
+        raise AssertionError(f"Alert pages overlap: {ids}")
+
+    # A tampered cursor is the client's error, not a failed query
+    forged = base64.urlsafe_b64encode(json.dumps(["x", "y"]).encode()).decode().rstrip("=")
+    resp = r.http.get("/alerts", params={"cursor": forged}, headers=auth_headers(household_token))
+    assert_status(resp, 400, "alerts page with a forged cursor")
+    for limit in ("abc", 0, 1000):
+        resp = r.http.get("/alerts", params={"limit": limit}, headers=auth_headers(household_token))
+        assert_status(resp, 400, f"alerts page with limit={limit}")
 
     # Get by id
-    url = f"{BASE_URL}{API_PREFIX}/alerts/{alert_id}"
-    resp = requests.get(url, headers=auth_headers(household_token), timeout=10)
+    resp = r.http.get(f"/alerts/{alert_id}", headers=auth_headers(household_token))
     assert_status(resp, 200, "get alert")
     print("Alert detail:", resp.json())
 
 
-def test_alerts_admin_update_status(r: TestRunner):
+@context_keys(produces=["admin_access", "admin_user_id"])
+def test_admin_login(r: TestRunner):
     if not (ADMIN_PHONE and ADMIN_PASSWORD):
-        raise AssertionError("ADMIN_PHONE or ADMIN_PASSWORD not set; cannot test admin alert updates")
-    alert_id = r.context.get("alert_id")
-    if not alert_id:
-        raise AssertionError("No alert_id in context; run test_alerts_flow first")
+        raise AssertionError("ADMIN_PHONE or ADMIN_PASSWORD not set; cannot run admin tests")
 
-    # Login as admin
-    url = f"{BASE_URL}{API_PREFIX}/auth/login"
-    resp = requests.post(url, json={"phone": ADMIN_PHONE, "password": ADMIN_PASSWORD}, timeout=10)
-    assert_status(resp, 200, "admin login")
-    data = resp.json()
-    admin_token, _, admin_user_id, _ = extract_tokens_and_user(data)
+    admin_token, _, admin_user_id, _ = login(r, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")
     r.context["admin_access"] = admin_token
     r.context["admin_user_id"] = admin_user_id
     print("Admin logged in:", admin_user_id)
 
+
+@context_keys(consumes=["admin_access", "alert_id"])
+def test_alerts_admin_update_status(r: TestRunner):
+    admin_token = r.context.get("admin_access")
+    if not admin_token:
+        raise AssertionError("No admin_access in context; run test_admin_login first")
+    alert_id = r.context.get("alert_id")
+    if not alert_id:
+        raise AssertionError("No alert_id in context; run test_alerts_flow first")
+
     # Update alert status
-    url = f"{BASE_URL}{API_PREFIX}/alerts/{alert_id}"
-    payload = {
-        "status": "RESOLVED",
-        "resolutionNotes": "Resolved by admin test script."
-    }
-    resp = requests.patch(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = update_alert(r, admin_token, alert_id)
     assert_status(resp, 200, "update alert status")
     print("Updated alert status:", resp.json())
 
 
+@context_keys(consumes=["admin_access"], produces=["bin_id"])
 def test_bins_admin(r: TestRunner):
     admin_token = r.context.get("admin_access")
     if not admin_token:
         raise AssertionError("No admin_access in context; run admin login test first")
 
     # Create bin
-    url = f"{BASE_URL}{API_PREFIX}/bins"
     payload = {
         "locationName": "Test Bin Location",
         "gpsLat": 4.05,
         "gpsLng": 9.70,
         "capacityLevel": "LOW"
     }
-    resp = requests.post(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.post("/bins", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 201, "create bin")
     bin_data = resp.json()
     bin_id = bin_data.get("id")
@@ -437,32 +597,85 @@ def test_bins_admin(r: TestRunner):
     print("Created bin:", bin_id)
 
     # List bins
-    url = f"{BASE_URL}{API_PREFIX}/bins"
-    resp = requests.get(url, timeout=10)
+    resp = r.http.get("/bins")
     assert_status(resp, 200, "list bins")
     print("Bins list:", resp.json())
 
     # Get bin by id
-    url = f"{BASE_URL}{API_PREFIX}/bins/{bin_id}"
-    resp = requests.get(url, timeout=10)
+    resp = r.http.get(f"/bins/{bin_id}")
     assert_status(resp, 200, "get bin")
     print("Single bin detail:", resp.json())
 
     # Update bin
-    url = f"{BASE_URL}{API_PREFIX}/bins/{bin_id}"
     payload = {"capacityLevel": "FULL"}
-    resp = requests.patch(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.patch(f"/bins/{bin_id}", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 200, "update bin")
     print("Updated bin:", resp.json())
 
 
+CAPACITY_LEVELS = ["LOW", "MEDIUM", "HIGH", "FULL"]
+
+
+@context_keys(consumes=["admin_access"])
+def test_bin_capacity_batches(r: TestRunner, bins=8, batches=8):
+    """
+    Overlapping sensor batches sent at once, each covering every test bin
+    in its own shuffled order with mixed levels: none may fail (a deadlock
+    surfaces as a 500), and the bins must end up as one batch left them.
+    """
+    admin_token = r.context.get("admin_access")
+    if not admin_token:
+        raise AssertionError("No admin_access in context")
+
+    bin_ids = []
+    for i in range(bins):
+        payload = {"locationName": f"Sensor Test Bin {i}", "gpsLat": 4.05, "gpsLng": 9.70}
+        resp = r.http.post("/bins", json=payload, headers=auth_headers(admin_token))
+        assert_status(resp, 201, "create bin")
+        bin_ids.append(resp.json()["id"])
+
+    rng = random.Random(0)
+    sent = []
+    for b in range(batches):
+        emptied = (datetime(2024, 1, 1) + timedelta(hours=b)).isoformat() + "Z"
+        readings = [
+            {"id": bin_id, "capacityLevel": CAPACITY_LEVELS[(b + j) % len(CAPACITY_LEVELS)], "lastEmptiedAt": emptied}
+            for j, bin_id in enumerate(bin_ids)
+        ]
+        rng.shuffle(readings)
+        sent.append(readings)
+
+    with ThreadPoolExecutor(max_workers=batches) as pool:
+        responses = list(pool.map(lambda readings: update_bin_capacities(r, admin_token, readings), sent))
+    for resp in responses:
+        assert_status(resp, 200, "batch capacity update")
+        if resp.json().get("updated") != bins:
+            raise AssertionError(f"Expected {bins} bins updated: {resp.json()}")
+
+    final = {}
+    for bin_id in bin_ids:
+        resp = r.http.get(f"/bins/{bin_id}")
+        assert_status(resp, 200, "get bin")
+        final[bin_id] = resp.json()
+    if len({b["lastEmptiedAt"] for b in final.values()}) != 1:
+        raise AssertionError(f"Bins mix readings of different batches: {final}")
+    levels = {bin_id: b["capacityLevel"] for bin_id, b in final.items()}
+    if not any(levels == {x["id"]: x["capacityLevel"] for x in readings} for readings in sent):
+        raise AssertionError(f"Bin levels match no single batch: {levels}")
+
+    # A reading that changes nothing is rejected rather than counted as updated
+    resp = update_bin_capacities(r, admin_token, [{"id": bin_ids[0]}])
+    assert_status(resp, 400, "batch with an empty reading")
+    print(f"{batches} overlapping batches over {bins} bins applied; final state from one batch")
+
+
+@context_keys(consumes=["admin_access"], produces=["education_id"])
 def test_education_admin_and_public(r: TestRunner):
     admin_token = r.context.get("admin_access")
     if not admin_token:
         raise AssertionError("No admin_access in context")
 
     # Create educational content
-    url = f"{BASE_URL}{API_PREFIX}/education"
     payload = {
         "title": "Safe Waste Disposal Basics",
         "contentType": "ARTICLE",
@@ -470,7 +683,7 @@ def test_education_admin_and_public(r: TestRunner):
         "language": "EN",
         "targetAudience": "HOUSEHOLD"
     }
-    resp = requests.post(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.post("/education", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 201, "create education")
     edu = resp.json()
     edu_id = edu.get("id")
@@ -480,26 +693,24 @@ def test_education_admin_and_public(r: TestRunner):
     print("Created educational content:", edu_id)
 
     # List educational content (public)
-    url = f"{BASE_URL}{API_PREFIX}/education"
     params = {"audience": "HOUSEHOLD", "language": "EN"}
-    resp = requests.get(url, params=params, timeout=10)
+    resp = r.http.get("/education", params=params)
     assert_status(resp, 200, "list education")
     print("Education list:", resp.json())
 
     # Get by id
-    url = f"{BASE_URL}{API_PREFIX}/education/{edu_id}"
-    resp = requests.get(url, timeout=10)
+    resp = r.http.get(f"/education/{edu_id}")
     assert_status(resp, 200, "get education")
     print("Education detail:", resp.json())
 
     # Update
-    url = f"{BASE_URL}{API_PREFIX}/education/{edu_id}"
     payload = {"title": "Updated Safe Waste Disposal", "language": "EN", "targetAudience": "HOUSEHOLD"}
-    resp = requests.put(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.put(f"/education/{edu_id}", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 200, "update education")
     print("Updated education:", resp.json())
 
 
+@context_keys(consumes=["admin_access", "household_access"], produces=["survey_id"])
 def test_surveys_flow(r: TestRunner):
     admin_token = r.context.get("admin_access")
     household_token = r.context.get("household_access")
@@ -509,17 +720,7 @@ def test_surveys_flow(r: TestRunner):
         raise AssertionError("No household_access in context")
 
     # Create survey
-    url = f"{BASE_URL}{API_PREFIX}/surveys"
-    payload = {
-        "title": "Household Feedback Survey",
-        "targetGroup": "HOUSEHOLDS",
-        "questions": [
-            {"id": "q1", "text": "How satisfied are you with the pickup service?", "type": "rating"},
-            {"id": "q2", "text": "Any suggestions for improvement?", "type": "text"}
-        ],
-        "isActive": True
-    }
-    resp = requests.post(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = create_survey(r, admin_token)
     assert_status(resp, 201, "create survey")
     survey = resp.json()
     survey_id = survey.get("id")
@@ -529,38 +730,29 @@ def test_surveys_flow(r: TestRunner):
     print("Created survey:", survey_id)
 
     # GET survey by ID (new endpoint)
-    url = f"{BASE_URL}{API_PREFIX}/surveys/{survey_id}"
-    resp = requests.get(url, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get(f"/surveys/{survey_id}", headers=auth_headers(admin_token))
     assert_status(resp, 200, "get single survey")
     print("Single survey detail:", resp.json())
 
 
     # List surveys
-    url = f"{BASE_URL}{API_PREFIX}/surveys"
     params = {"targetGroup": "HOUSEHOLDS", "active": True}
-    resp = requests.get(url, params=params, timeout=10)
+    resp = r.http.get("/surveys", params=params)
     assert_status(resp, 200, "list surveys")
     print("Surveys list:", resp.json())
 
     # Submit survey response as household
-    url = f"{BASE_URL}{API_PREFIX}/surveys/{survey_id}/responses"
-    payload = {
-        "answers": {
-            "q1": 5,
-            "q2": "Everything works well so far."
-        }
-    }
-    resp = requests.post(url, json=payload, headers=auth_headers(household_token), timeout=10)
+    resp = submit_survey_response(r, household_token, survey_id)
     assert_status(resp, 201, "submit survey response")
     print("Submitted survey response:", resp.json())
 
     # Get survey responses as admin
-    url = f"{BASE_URL}{API_PREFIX}/surveys/{survey_id}/responses"
-    resp = requests.get(url, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get(f"/surveys/{survey_id}/responses", params={"limit": 20}, headers=auth_headers(admin_token))
     assert_status(resp, 200, "get survey responses")
-    print("Survey responses:", resp.json())
+    print("Survey responses:", resp.json()["data"])
 
 
+@context_keys(consumes=["admin_access", "household_profile_id"], produces=["subscription_id"])
 def test_subscriptions_admin(r: TestRunner):
     admin_token = r.context.get("admin_access")
     # This is the HOUSEHOLD PROFILE ID we stored earlier
@@ -572,7 +764,6 @@ def test_subscriptions_admin(r: TestRunner):
         raise AssertionError("No household_profile_id in context; make sure test_household_profile_and_stats ran successfully")
 
     # Create subscription
-    url = f"{BASE_URL}{API_PREFIX}/subscriptions"
     start = datetime.utcnow().strftime("%Y-%m-%d")
     end = (datetime.utcnow() + timedelta(days=30)).strftime("%Y-%m-%d")
     payload = {
@@ -582,46 +773,41 @@ def test_subscriptions_admin(r: TestRunner):
         "endDate": end,
         "status": "ACTIVE"
     }
-    resp = requests.post(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.post("/subscriptions", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 201, "create subscription")
     sub = resp.json()
+    r.context["subscription_id"] = sub.get("id")
     print("Created subscription:", sub)
 
     # Get subscriptions for that household
-    url = f"{BASE_URL}{API_PREFIX}/subscriptions"
     params = {"householdId": household_profile_id}
-    resp = requests.get(url, params=params, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get("/subscriptions", params=params, headers=auth_headers(admin_token))
     assert_status(resp, 200, "list subscriptions by household")
     print("Subscriptions for household:", resp.json())
 
 
+@context_keys(consumes=["admin_access"])
 def test_stats_admin(r: TestRunner):
     admin_token = r.context.get("admin_access")
     if not admin_token:
         raise AssertionError("No admin_access in context")
 
     # Overview
-    url = f"{BASE_URL}{API_PREFIX}/stats/overview"
-    resp = requests.get(url, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get("/stats/overview", headers=auth_headers(admin_token))
     assert_status(resp, 200, "stats overview")
     print("Overview stats:", resp.json())
 
     # Pickup stats
-    today = datetime.utcnow().date()
-    start = (today - timedelta(days=7)).isoformat()
-    end = today.isoformat()
-    url = f"{BASE_URL}{API_PREFIX}/stats/pickups"
-    params = {"from": start, "to": end}
-    resp = requests.get(url, params=params, headers=auth_headers(admin_token), timeout=10)
+    resp = pickup_stats(r, admin_token, days=7)
     assert_status(resp, 200, "pickup stats")
     print("Pickup stats:", resp.json())
 
     # Agent performance
-    url = f"{BASE_URL}{API_PREFIX}/stats/agents/performance"
-    resp = requests.get(url, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get("/stats/agents/performance", headers=auth_headers(admin_token))
     assert_status(resp, 200, "agent performance stats")
     print("Agent performance stats:", resp.json())
 
+@context_keys(consumes=["admin_access", "household_id"])
 def test_admin_update_user(r: TestRunner):
     admin_token = r.context.get("admin_access")
     household_user_id = r.context.get("household_id")
@@ -630,18 +816,16 @@ def test_admin_update_user(r: TestRunner):
     assert household_user_id, "household_id missing"
 
     # PATCH /users/:id
-    url = f"{BASE_URL}{API_PREFIX}/users/{household_user_id}"
     payload = {
         "name": "Updated Household User",
         "isActive": True
     }
-    resp = requests.patch(url, json=payload, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.patch(f"/users/{household_user_id}", json=payload, headers=auth_headers(admin_token))
     assert_status(resp, 200, "PATCH /users/:id")
     print("Updated user (admin):", resp.json())
 
     # GET to confirm
-    url = f"{BASE_URL}{API_PREFIX}/users/{household_user_id}"
-    resp = requests.get(url, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.get(f"/users/{household_user_id}", headers=auth_headers(admin_token))
     assert_status(resp, 200, "GET updated user")
     data = resp.json()
 
@@ -649,16 +833,16 @@ def test_admin_update_user(r: TestRunner):
     print("User update confirmed:", data)
 
 
+@context_keys(consumes=["admin_access"])
 def test_file_upload(r: TestRunner):
     admin_token = r.context.get("admin_access") or r.context.get("household_access")
     if not admin_token:
         raise AssertionError("Need at least one authenticated user for file upload")
 
-    url = f"{BASE_URL}{API_PREFIX}/files/upload"
     files = {
         "file": ("test.txt", b"Hello from automated test", "text/plain")
     }
-    resp = requests.post(url, files=files, headers=auth_headers(admin_token), timeout=10)
+    resp = r.http.post("/files/upload", files=files, headers=auth_headers(admin_token))
     if resp.status_code not in (200, 201):
         raise AssertionError(f"File upload failed: {resp.status_code} {resp.text}")
     print("File upload response:", resp.json())
@@ -668,40 +852,1292 @@ def test_file_upload(r: TestRunner):
 # MAIN
 # ========================
 
-if __name__ == "__main__":
-    runner = TestRunner()
-
-    print(f"Using BASE_URL = {BASE_URL}")
-    if not BASE_URL.startswith("http"):
-        print("WARNING: BASE_URL should include http:// or https://")
-
+def smoke_suite():
     # Basic health + household flows
-    runner.run("Health check", test_health)
-    runner.run("Household auth flow", test_household_auth_flow)
-    runner.run("Household profile & stats", test_household_profile_and_stats)
+    tests = [
+        ("Health check", test_health),
+        ("Household auth flow", test_household_auth_flow),
+        ("Household profile & stats", test_household_profile_and_stats),
+    ]
 
     # Agent flows (if credentials provided)
     if AGENT_PHONE and AGENT_PASSWORD:
-        runner.run("Agent auth & stats", test_agent_auth_and_stats)
-        runner.run("Pickup flow household→agent", test_pickup_flow_household_agent)
+        tests += [
+            ("Agent auth & stats", test_agent_auth_and_stats),
+            ("Pickup flow household→agent", test_pickup_flow_household_agent),
+        ]
     else:
         print("\n[SKIP] Agent tests (AGENT_PHONE / AGENT_PASSWORD not set)")
 
     # Alerts basic
-    runner.run("Alerts basic flow (household)", test_alerts_flow)
+    tests.append(("Alerts basic flow (household)", test_alerts_flow))
 
     # Admin-dependent tests
     if ADMIN_PHONE and ADMIN_PASSWORD:
-        runner.run("Admin updates alert status", test_alerts_admin_update_status)
-        runner.run("Admin bins management", test_bins_admin)
-        runner.run("Education admin & public", test_education_admin_and_public)
-        runner.run("Surveys flow", test_surveys_flow)
-        runner.run("Subscriptions admin", test_subscriptions_admin)
-        runner.run("Subscriptions /me (household)", test_subscription_me_household)
-        runner.run("Admin update user", test_admin_update_user)
-        runner.run("Stats admin", test_stats_admin)
-        runner.run("File upload", test_file_upload)
+        tests += [
+            ("Admin login", test_admin_login),
+            ("Admin updates alert status", test_alerts_admin_update_status),
+            ("Admin bins management", test_bins_admin),
+            ("Concurrent bin capacity batches", test_bin_capacity_batches),
+            ("Education admin & public", test_education_admin_and_public),
+            ("Surveys flow", test_surveys_flow),
+            ("Subscriptions admin", test_subscriptions_admin),
+            ("Subscriptions /me (household)", test_subscription_me_household),
+            ("Admin update user", test_admin_update_user),
+            ("Stats admin", test_stats_admin),
+            ("File upload", test_file_upload),
+        ]
     else:
         print("\n[SKIP] Admin tests (ADMIN_PHONE / ADMIN_PASSWORD not set)")
 
-    runner.summary()
+    return tests
+
+
+def run_smoke(runner: TestRunner, metrics_json=None, parallel=1):
+    tests = smoke_suite()
+    if parallel > 1:
+        run_parallel(runner, tests, parallel)
+    else:
+        for name, func in tests:
+            runner.run(name, func)
+    runner.summary(metrics_json)
+
+
+def load_flows():
+    flows = [("Household auth flow", test_household_auth_flow)]
+    if AGENT_PHONE and AGENT_PASSWORD:
+        flows.append(("Pickup flow household→agent", test_pickup_flow_household_agent))
+    flows.append(("Alerts basic flow (household)", test_alerts_flow))
+    return flows
+
+
+def run_load_mode(args):
+    """
+    N synthetic households each register, book and rate a pickup and raise
+    an alert, with at most C of them in flight at once. The agent logs in
+    once and its tokens are shared by every virtual user.
+    """
+    processes = args.processes or os.cpu_count()
+    if processes > 1:
+        return run_load_fleet(args, processes)
+    runner = TestRunner(http=api_client(pool_size=args.concurrency))
+
+    if AGENT_PHONE and AGENT_PASSWORD:
+        runner.run("Agent auth & stats", test_agent_auth_and_stats)
+        if runner.failed:
+            runner.summary()
+    else:
+        print("\n[SKIP] Pickup flow (AGENT_PHONE / AGENT_PASSWORD not set)")
+
+    print(f"\n=== Load: {args.users} users, concurrency {args.concurrency} ===")
+    summary, wall_s = run_load_quietly(
+        load_flows(), args.users, args.concurrency, runner.http,
+        base_context=runner.context, ramp_up=args.ramp_up,
+        on_outcome=EVENTS.flow if EVENTS is not None else None,
+    )
+    print_load_summary(summary, args.users, args.concurrency, wall_s)
+    runner.metrics.print_summary()
+    runner.server_timing.print_summary()
+    if args.metrics_json:
+        runner.metrics.export_json(args.metrics_json)
+        print(f"Latency metrics written to {args.metrics_json}")
+    if summary.failures:
+        sys.exit(1)
+
+
+def load_worker(share, metrics, args):
+    """
+    One fleet process of the load mode: its slice of the users, with the
+    same slice of the concurrency, and its own agent login.
+    """
+    concurrency = max(1, math.ceil(args.concurrency * share.users / args.users))
+    http = api_client(pool_size=concurrency)
+    http.listeners.append(metrics.record)
+    setup = VirtualUser(-1, http)
+    if AGENT_PHONE and AGENT_PASSWORD:
+        test_agent_auth_and_stats(setup)
+    summary, _ = run_load_quietly(
+        load_flows(), share.users, concurrency, http,
+        base_context=setup.context, ramp_up=args.ramp_up,
+        on_outcome=metrics.flow, first_user=share.first_user,
+    )
+    return summary
+
+
+def run_load_fleet(args, processes):
+    """
+    The load mode spread over worker processes (see harness/fleet.py).
+    """
+    print(f"\n=== Load: {args.users} users, concurrency {args.concurrency}, {processes} processes ===")
+    fleet = run_fleet(load_worker, args.users, processes, args)
+    print_fleet_errors(fleet.errors)
+    summary = LoadSummary()
+    for part in fleet.results:
+        summary.merge(part)
+    print_load_summary(summary, args.users, args.concurrency, fleet.wall_s)
+    fleet.metrics.print_summary()
+    if args.metrics_json:
+        fleet.metrics.export_json(args.metrics_json)
+        print(f"Latency metrics written to {args.metrics_json}")
+    if summary.failures or fleet.errors:
+        sys.exit(1)
+
+
+@context_keys(consumes=["household_access", "admin_access", "survey_id"])
+def soak_survey_response(r):
+    """
+    The household answers the soak's one survey and the admin reads its
+    responses back, so getResponses runs against a table that keeps growing.
+    """
+    survey_id = r.context["survey_id"]
+    resp = submit_survey_response(r, r.context["household_access"], survey_id)
+    assert_status(resp, 201, "submit survey response")
+    resp = r.http.get(
+        f"/surveys/{survey_id}/responses", params={"limit": 20}, headers=auth_headers(r.context["admin_access"])
+    )
+    assert_status(resp, 200, "get survey responses")
+
+
+def soak_flows():
+    """
+    The smoke suite's household journey: register, profile, pickup
+    lifecycle and rating, alert, survey response.
+    """
+    flows = [
+        ("Household auth flow", test_household_auth_flow),
+        ("Household profile & stats", test_household_profile_and_stats),
+    ]
+    if AGENT_PHONE and AGENT_PASSWORD:
+        flows.append(("Pickup flow household→agent", test_pickup_flow_household_agent))
+    flows.append(("Alerts basic flow (household)", test_alerts_flow))
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        flows.append(("Survey response", soak_survey_response))
+    return flows
+
+
+def soak_context(runner: TestRunner, max_age_s=600):
+    """
+    Context factory for SoakRun. Access tokens expire after 15 minutes and
+    a soak lasts hours, so the agent and admin tokens shared by the
+    journeys are logged in again (through the token cache when it is on)
+    once older than `max_age_s`, rather than captured once and then
+    answered with a 401 and a retry on every request.
+    """
+    accounts = {}
+    if AGENT_PHONE and AGENT_PASSWORD:
+        accounts["agent_access"] = (AGENT_PHONE, AGENT_PASSWORD, "agent login")
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        accounts["admin_access"] = (ADMIN_PHONE, ADMIN_PASSWORD, "admin login")
+    base = {k: runner.context[k] for k in ("survey_id",) if k in runner.context}
+    tokens = {}
+    renewed_at = None
+
+    def make_context():
+        nonlocal renewed_at
+        if renewed_at is None or time.monotonic() - renewed_at >= max_age_s:
+            for key, (phone, password, name) in accounts.items():
+                try:
+                    tokens[key] = login(runner, phone, password, name)[0]
+                except AssertionError as e:
+                    # Keep the previous token; its journeys fail and are counted
+                    print(f"[soak] {e}", file=sys.__stdout__)
+            renewed_at = time.monotonic()
+        return {**base, **tokens}
+
+    return make_context
+
+
+def server_memory_probe(server_pid):
+    """
+    RSS and V8 heap from GET /health/runtime when admin credentials are
+    set, else RSS of a local server from /proc; None if neither is known.
+    """
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        client = runtime_client()
+
+        def probe():
+            memory = client.health.runtime().to_dict()["memory"]
+            return {"rss_mb": memory["rss"] / 2**20, "heap_mb": memory["heapUsed"] / 2**20}
+        return probe
+    if server_pid:
+        return lambda: {"rss_mb": server_memory_kb(server_pid)[0] / 1024}
+    return None
+
+
+def run_soak_mode(args):
+    """
+    Start the household journey at a steady rate for hours and test the
+    server's memory and every endpoint's p95 for upward drift.
+    """
+    runner = TestRunner(http=api_client(pool_size=args.max_in_flight))
+    if AGENT_PHONE and AGENT_PASSWORD:
+        runner.run("Agent auth & stats", test_agent_auth_and_stats)
+    else:
+        print("\n[SKIP] Pickup flow (AGENT_PHONE / AGENT_PASSWORD not set)")
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        # One survey for the whole run: its responses pile up like production's
+        runner.run("Household auth flow", test_household_auth_flow)
+        runner.run("Admin login", test_admin_login)
+        runner.run("Surveys flow", test_surveys_flow)
+    else:
+        print("\n[SKIP] Survey responses (ADMIN_PHONE / ADMIN_PASSWORD not set)")
+    if runner.failed:
+        runner.summary()
+
+    probe = server_memory_probe(args.server_pid)
+    if probe is None:
+        print("\n[SKIP] Server memory trend (set ADMIN_PHONE / ADMIN_PASSWORD or --server-pid)")
+    soak = SoakRun(
+        soak_flows(), runner.http, args.rate, args.duration, args.window, args.max_in_flight,
+        make_context=soak_context(runner), probe=probe,
+        on_window=EVENTS.soak if EVENTS is not None else None,
+        on_outcome=EVENTS.flow if EVENTS is not None else None,
+    )
+    runner.http.listeners.append(soak.record)
+
+    print(
+        f"\n=== Soak: {args.rate:g} journeys/s for {args.duration / 3600:.2f}h,"
+        f" {args.window:.0f}s windows, {args.warmup} warm-up ==="
+    )
+    windows, wall_s = run_soak_quietly(soak)
+    report = drift_report(windows, args.warmup, args.alpha, args.min_growth)
+    print_soak_summary(report, wall_s)
+    runner.metrics.print_summary()
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump({"drift": report, "windows": windows}, f, indent=2)
+        print(f"Soak report written to {args.metrics_json}")
+    if report["drifting"]:
+        sys.exit(1)
+
+
+def run_accept_contention_mode(args):
+    """
+    One household seeds the pickups; K agents then race to accept them.
+    With admin credentials, K fresh APPROVED agents are created so every
+    racer is a distinct account; otherwise all K share AGENT_PHONE.
+    """
+    runner = TestRunner(http=api_client(pool_size=max(args.agents, 10)))
+    runner.run("Household auth flow", test_household_auth_flow)
+    if runner.failed:
+        runner.summary()
+
+    agent_tokens = []
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        admin_token, _, _, _ = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")
+        for i in range(args.agents):
+            phone, password = random_phone(), "Passw0rd!"
+            resp = runner.http.post(
+                "/agents",
+                json={
+                    "name": f"Contention Agent {i}",
+                    "phone": phone,
+                    "email": random_email(),
+                    "password": password,
+                    "kycStatus": "APPROVED",
+                },
+                headers=auth_headers(admin_token),
+            )
+            assert_status(resp, 201, "create agent")
+            agent_tokens.append(login(runner, phone, password, "agent login")[0])
+    elif AGENT_PHONE and AGENT_PASSWORD:
+        print("ADMIN_PHONE not set: all racers share the AGENT_PHONE account")
+        token = login(runner, AGENT_PHONE, AGENT_PASSWORD, "agent login")[0]
+        agent_tokens = [token] * args.agents
+    else:
+        print("Accept contention needs ADMIN_PHONE/ADMIN_PASSWORD or AGENT_PHONE/AGENT_PASSWORD")
+        sys.exit(1)
+
+    result = run_accept_contention(runner.http, runner.context["household_access"], agent_tokens, args.pickups)
+    print_contention_summary(result)
+    if args.metrics_json:
+        result["latency"].export_json(args.metrics_json)
+        print(f"Latency metrics written to {args.metrics_json}")
+    if result["double_assigned"] or result["errors"]:
+        sys.exit(1)
+
+
+def run_seed_mode(args):
+    """
+    Bulk-seed households, pickups, ratings, alerts and bins. With admin
+    credentials the seeder creates its own APPROVED agents and the bins;
+    otherwise every pickup goes through AGENT_PHONE and no bins are made.
+    """
+    runner = TestRunner()
+    admin = None
+    if ADMIN_PHONE and ADMIN_PASSWORD:
+        admin = (ADMIN_PHONE, ADMIN_PASSWORD)
+        admin_token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+        agents = create_seed_agents(runner.http, admin_token, args.namespace, args.agents)
+    elif AGENT_PHONE and AGENT_PASSWORD:
+        print("ADMIN_PHONE not set: pickups go through the AGENT_PHONE account and no bins are seeded")
+        agents = [(AGENT_PHONE, AGENT_PASSWORD)]
+        args.bins = 0
+    else:
+        print("Seeding needs ADMIN_PHONE/ADMIN_PASSWORD or AGENT_PHONE/AGENT_PASSWORD")
+        sys.exit(1)
+
+    plan = {
+        "namespace": args.namespace,
+        "households": args.households,
+        "bins": args.bins,
+        "pickups": args.pickups_per_household,
+        "alerts": args.alerts_per_household,
+        "batch_size": args.batch_size,
+    }
+    checkpoint_path = args.checkpoint or f"seed-{args.namespace:02d}.checkpoint.json"
+    print(f"\n=== Seed: {plan} on {args.workers} processes ===")
+    try:
+        checkpoint, failures, wall_s = run_seed(
+            f"{BASE_URL}{API_PREFIX}", plan, agents, admin, args.workers, checkpoint_path, TOKEN_CACHE,
+        )
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    print_seed_summary(checkpoint, failures, wall_s)
+    if failures:
+        sys.exit(1)
+
+
+def run_stats_bench_mode(args):
+    """
+    Time GET /stats/pickups at each --rows level, seeding up to the level
+    first (same namespace and checkpoint, so each level grows the last).
+    """
+    if not (ADMIN_PHONE and ADMIN_PASSWORD):
+        print("stats-bench needs ADMIN_PHONE/ADMIN_PASSWORD")
+        sys.exit(1)
+    runner = TestRunner()
+    admin = (ADMIN_PHONE, ADMIN_PASSWORD)
+    admin_token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+    agents = create_seed_agents(runner.http, admin_token, args.namespace, args.agents)
+    checkpoint_path = args.checkpoint or f"seed-{args.namespace:02d}.checkpoint.json"
+
+    levels = []
+    for target in sorted(args.rows):
+        rows = count_pickups(runner.http, admin_token)
+        if rows < target:
+            plan = {
+                "namespace": args.namespace,
+                "households": households_for(target, args.pickups_per_household, args.batch_size),
+                "bins": 0,
+                "pickups": args.pickups_per_household,
+                "alerts": 0,
+                "batch_size": args.batch_size,
+            }
+            print(f"\n=== Seeding towards {target} pickups ({rows} now): {plan} ===")
+            try:
+                checkpoint, failures, wall_s = run_seed(
+                    f"{BASE_URL}{API_PREFIX}", plan, agents, admin, args.workers, checkpoint_path, TOKEN_CACHE,
+                )
+            except ValueError as e:
+                print(e)
+                sys.exit(1)
+            if failures:
+                print_seed_summary(checkpoint, failures, wall_s)
+                sys.exit(1)
+            rows = count_pickups(runner.http, admin_token)
+        # A fresh token per level: seeding a level can outlast the access token
+        admin_token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+        print(f"\n=== {rows} pickups: {args.requests} requests per range ===")
+        levels.append((target, rows, measure_stats(runner.http, admin_token, args.requests, args.server_pid)))
+
+    print_stats_bench(levels)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(stats_bench_report(levels), f, indent=2)
+        print(f"Stats benchmark written to {args.metrics_json}")
+
+
+def run_rating_bench_mode(args):
+    """
+    Time POST /pickups/{id}/rating for one agent at each --ratings level,
+    seeding rated pickups for that agent up to the level first.
+    """
+    if not (ADMIN_PHONE and ADMIN_PASSWORD):
+        print("rating-bench needs ADMIN_PHONE/ADMIN_PASSWORD")
+        sys.exit(1)
+    runner = TestRunner()
+    admin = (ADMIN_PHONE, ADMIN_PASSWORD)
+    admin_token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+    agents = create_seed_agents(runner.http, admin_token, args.namespace, 1)
+    checkpoint_path = args.checkpoint or f"seed-{args.namespace:02d}.checkpoint.json"
+    if not runner.run("Household auth flow", test_household_auth_flow):
+        runner.summary()
+
+    levels = []
+    for target in sorted(args.ratings):
+        agent_token = login(runner, *agents[0], "agent login")[0]
+        ratings = agent_rating_count(runner.http, agent_token)
+        if ratings < target:
+            plan = {
+                "namespace": args.namespace,
+                "households": households_for(target, args.ratings_per_household, args.batch_size),
+                "bins": 0,
+                "pickups": args.ratings_per_household,
+                "alerts": 0,
+                "batch_size": args.batch_size,
+                "all_rated": True,
+            }
+            print(f"\n=== Seeding towards {target} ratings ({ratings} now): {plan} ===")
+            try:
+                checkpoint, failures, wall_s = run_seed(
+                    f"{BASE_URL}{API_PREFIX}", plan, agents, admin, args.workers, checkpoint_path, TOKEN_CACHE,
+                )
+            except ValueError as e:
+                print(e)
+                sys.exit(1)
+            if failures:
+                print_seed_summary(checkpoint, failures, wall_s)
+                sys.exit(1)
+            agent_token = login(runner, *agents[0], "agent login")[0]
+            ratings = agent_rating_count(runner.http, agent_token)
+        # Seeding a level can outlast the household's access token
+        household_token = login(
+            runner, runner.context["household_phone"], runner.context["household_password"], "household login",
+        )[0]
+        print(f"\n=== Agent with {ratings} ratings: {args.requests} ratings timed ===")
+        levels.append((target, ratings, measure_ratings(runner.http, household_token, agent_token, args.requests)))
+
+    print_rating_bench(levels)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(rating_bench_report(levels), f, indent=2)
+        print(f"Rating benchmark written to {args.metrics_json}")
+
+
+def run_geo_bench_mode(args):
+    """
+    Seed --bins bins around Douala and Yaoundé, then send the map screen's
+    queries from random agent positions: the full list vs nearest, radius
+    and viewport lookups.
+    """
+    if not (ADMIN_PHONE and ADMIN_PASSWORD):
+        print("geo-bench needs ADMIN_PHONE/ADMIN_PASSWORD")
+        sys.exit(1)
+    runner = TestRunner()
+    admin = (ADMIN_PHONE, ADMIN_PASSWORD)
+    checkpoint_path = args.checkpoint or f"seed-{args.namespace:02d}.checkpoint.json"
+
+    bins = count_bins(runner.http)
+    if bins < args.bins:
+        plan = {
+            "namespace": args.namespace,
+            "households": 0,
+            "bins": math.ceil(args.bins / args.batch_size) * args.batch_size,
+            "pickups": 0,
+            "alerts": 0,
+            "batch_size": args.batch_size,
+            "bin_cities": ["douala", "yaounde"],
+        }
+        print(f"\n=== Seeding towards {args.bins} bins ({bins} now): {plan} ===")
+        try:
+            checkpoint, failures, wall_s = run_seed(
+                f"{BASE_URL}{API_PREFIX}", plan, [], admin, args.workers, checkpoint_path, TOKEN_CACHE,
+            )
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        if failures:
+            print_seed_summary(checkpoint, failures, wall_s)
+            sys.exit(1)
+        bins = count_bins(runner.http)
+
+    admin_token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+    print(f"\n=== Geo workload: {args.requests} agent positions over {bins} bins ===")
+    results = run_geo_workload(
+        runner.http, args.requests, k=args.k, radius_m=args.radius, viewport_km=args.viewport_km, token=admin_token,
+    )
+    print_geo_bench(bins, results)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(geo_bench_report(bins, results), f, indent=2)
+        print(f"Geo benchmark written to {args.metrics_json}")
+
+
+def run_pages_mode(args):
+    """
+    Walk one keyset-paginated list endpoint to the end (or --max-pages)
+    and compare the first page's latency with the deepest one's.
+    """
+    path, role = PAGED_ENDPOINTS[args.endpoint]
+    runner = TestRunner()
+    headers = {}
+    if role == "agent" and AGENT_PHONE and AGENT_PASSWORD:
+        headers = auth_headers(login(runner, AGENT_PHONE, AGENT_PASSWORD, "agent login")[0])
+    elif role and ADMIN_PHONE and ADMIN_PASSWORD:
+        headers = auth_headers(login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0])
+    elif role:
+        print(f"pages {args.endpoint} needs {role.upper()}_PHONE/{role.upper()}_PASSWORD")
+        sys.exit(1)
+
+    result = walk_pages(runner.http, path, headers=headers, limit=args.limit,
+                        prefetch=not args.no_prefetch, max_pages=args.max_pages)
+    print_walk(path, args.limit, result)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump({**result, "endpoint": path, "limit": args.limit, "latency": result["latency"].to_dict()},
+                      f, indent=2)
+        print(f"Page walk written to {args.metrics_json}")
+
+
+def run_upload_bench_mode(args):
+    """
+    Stream generated photos to /files/upload at a fixed concurrency, as an
+    agent uploading proof photos when AGENT_PHONE is set.
+    """
+    runner = TestRunner(http=api_client(pool_size=args.concurrency))
+    if AGENT_PHONE and AGENT_PASSWORD:
+        token = login(runner, AGENT_PHONE, AGENT_PASSWORD, "agent login")[0]
+    elif ADMIN_PHONE and ADMIN_PASSWORD:
+        token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+    else:
+        if not runner.run("Household auth flow", test_household_auth_flow):
+            runner.summary()
+        token = runner.context["household_access"]
+
+    size = int(args.size_mb * 1024 * 1024)
+    print(f"\n=== Upload bench: {args.uploads} x {args.size_mb} MB, concurrency {args.concurrency} ===")
+    result = run_uploads(runner.http, token, size, args.uploads, args.concurrency, args.server_pid)
+    print_upload_summary(result)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(upload_report(result), f, indent=2)
+        print(f"Upload benchmark written to {args.metrics_json}")
+    if result["failed"]:
+        sys.exit(1)
+
+
+def run_sensor_sim_mode(args):
+    """
+    Simulated fill-level sensors on up to --bins existing bins: the same
+    readings sent as one PATCH per bin, then in batches to /bins/capacity.
+    """
+    if not (ADMIN_PHONE and ADMIN_PASSWORD):
+        print("sensor-sim needs ADMIN_PHONE/ADMIN_PASSWORD")
+        sys.exit(1)
+    runner = TestRunner(http=api_client(pool_size=args.sensor_concurrency))
+    resp = runner.http.get("/bins")
+    assert_status(resp, 200, "bins")
+    bin_ids = [b["id"] for b in resp.json()][:args.bins]
+    if not bin_ids:
+        print("No bins to report for: seed some first (seed --bins N)")
+        sys.exit(1)
+    token = login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0]
+
+    readings = sensor_readings(bin_ids, args.readings, args.interval)
+    results = {}
+    if not args.batched_only:
+        print(f"\n=== {len(readings)} readings as per-bin PATCHes, concurrency {args.sensor_concurrency} ===")
+        results["per-bin PATCH"] = run_per_bin(runner.http, token, readings, args.sensor_concurrency)
+    print(f"\n=== {len(readings)} readings in batches of {args.batch_size}, concurrency {args.sensor_concurrency} ===")
+    results[f"batch of {args.batch_size}"] = run_batched(
+        runner.http, token, readings, args.batch_size, args.sensor_concurrency,
+    )
+    print_sensor_summary(len(bin_ids), args.batch_size, args.sensor_concurrency, results)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(sensor_report(len(bin_ids), args.batch_size, args.sensor_concurrency, results), f, indent=2)
+        print(f"Sensor simulation written to {args.metrics_json}")
+    if any(r["failed"] for r in results.values()):
+        sys.exit(1)
+
+
+def completed_pickup(r, household_token, agent_token):
+    """
+    A new pickup taken through accept/start/complete; returns its id.
+    """
+    resp = create_pickup(r, household_token)
+    assert_status(resp, 201, "create pickup")
+    pickup_id = resp.json()["id"]
+    for action in ("accept", "start"):
+        assert_status(pickup_transition(r, agent_token, pickup_id, action), 200, f"{action} pickup")
+    assert_status(complete_pickup(r, agent_token, pickup_id), 200, "complete pickup")
+    return pickup_id
+
+
+def grow_query_data(runner: TestRunner, level):
+    """
+    Bring the suite household up to `level` pickups (every fifth left
+    REQUESTED, the rest completed and rated), alerts and survey responses.
+    """
+    ctx = runner.context
+    household, agent = ctx["household_access"], ctx["agent_access"]
+    grown = ctx.setdefault("grown", {"pickups": 0, "alerts": 0, "responses": 0})
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        while grown["pickups"] < level:
+            if grown["pickups"] % 5 == 4:
+                assert_status(create_pickup(runner, household), 201, "create pickup")
+            else:
+                pickup_id = completed_pickup(runner, household, agent)
+                resp = runner.http.post(f"/pickups/{pickup_id}/rating", json={"rating": 4}, headers=auth_headers(household))
+                assert_status(resp, 201, "rate pickup")
+                ctx["pickup_id"] = pickup_id
+            grown["pickups"] += 1
+        while grown["alerts"] < level:
+            assert_status(create_alert(runner, household), 201, "create alert")
+            grown["alerts"] += 1
+        while grown["responses"] < level:
+            assert_status(submit_survey_response(runner, household, ctx["survey_id"]), 201, "submit survey response")
+            grown["responses"] += 1
+
+
+def query_checks(runner: TestRunner):
+    """
+    {name: (method, endpoint template, call)} for every QUERY_BUDGETS entry.
+    """
+    ctx = runner.context
+    household, agent, admin = (auth_headers(ctx[k]) for k in ("household_access", "agent_access", "admin_access"))
+    page = {"limit": 20}
+
+    def get(path, headers, **params):
+        return lambda: runner.http.get(path, params={**page, **params}, headers=headers)
+
+    def rate():
+        pickup_id = completed_pickup(runner, ctx["household_access"], ctx["agent_access"])
+        runner.http.post(f"/pickups/{pickup_id}/rating", json={"rating": 5}, headers=household)
+
+    return {
+        "pickups (household)": ("GET", "/pickups", get("/pickups", household)),
+        "pickups (agent, mine)": ("GET", "/pickups", get("/pickups", agent, scope="mine")),
+        "pickups (admin)": ("GET", "/pickups", get("/pickups", admin)),
+        "pickup detail": ("GET", "/pickups/{id}", lambda: runner.http.get(f"/pickups/{ctx['pickup_id']}", headers=household)),
+        "pickups available": ("GET", "/pickups/available", get("/pickups/available", agent)),
+        "alerts": ("GET", "/alerts", get("/alerts", admin)),
+        "survey responses": ("GET", "/surveys/{id}/responses", get(f"/surveys/{ctx['survey_id']}/responses", admin)),
+        "rate pickup": ("POST", "/pickups/{id}/rating", rate),
+        "household stats": ("GET", "/households/me/stats", lambda: runner.http.get("/households/me/stats", headers=household)),
+        "agent stats": ("GET", "/agents/me/stats", lambda: runner.http.get("/agents/me/stats", headers=agent)),
+        "stats overview": ("GET", "/stats/overview", lambda: runner.http.get("/stats/overview", headers=admin)),
+    }
+
+
+def run_query_budget_mode(args):
+    """
+    Count the SQL queries and rows behind each QUERY_BUDGETS check at every
+    --levels data size; exits 1 when one is over budget or its query count
+    grows with the data.
+    """
+    if not (ADMIN_PHONE and ADMIN_PASSWORD and AGENT_PHONE and AGENT_PASSWORD):
+        print("query-budget needs ADMIN_PHONE/ADMIN_PASSWORD and AGENT_PHONE/AGENT_PASSWORD")
+        sys.exit(1)
+    runner = TestRunner()
+    counter = QueryCounter()
+    runner.http.listeners.append(counter.record)
+    for name, func in (
+        ("Household auth flow", test_household_auth_flow),
+        ("Agent auth & stats", test_agent_auth_and_stats),
+        ("Admin login", test_admin_login),
+    ):
+        if not runner.run(name, func):
+            runner.summary()
+    resp = create_survey(runner, runner.context["admin_access"], title="Query budget survey")
+    assert_status(resp, 201, "create survey")
+    runner.context["survey_id"] = resp.json()["id"]
+
+    levels = []
+    for level in sorted(args.levels):
+        print(f"\n=== Query budget: {level} pickups/alerts/survey responses ===")
+        grow_query_data(runner, level)
+        levels.append((level, measure_level(query_checks(runner), counter, args.requests)))
+        if not counter.with_header:
+            print("No Server-Timing db counts; start the API with SERVER_TIMING=true")
+            sys.exit(1)
+
+    report = check_budgets(levels, QUERY_BUDGETS)
+    print_query_budget(report)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Query budget report written to {args.metrics_json}")
+    if any(check["problems"] for check in report["checks"]):
+        sys.exit(1)
+
+
+def request_catalog(runner: TestRunner, target):
+    """
+    Single requests the open-loop generator and the benchmarks can fire,
+    taken from the calls the tests make. Each returns a zero-argument
+    callable -> HTTP status; whatever it needs (an account, a token) is set
+    up once beforehand and shared between targets.
+    """
+    if target == "health":
+        return lambda: runner.http.get("/health").status_code
+    if target == "bins":
+        return lambda: runner.http.get("/bins").status_code
+    if target in ("login", "create-pickup", "list-alerts", "household-profile"):
+        # One fresh household; every login request is a real login (bcrypt and all)
+        if "household_access" not in runner.context and not runner.run("Household auth flow", test_household_auth_flow):
+            runner.summary()
+        if target == "login":
+            body = {"phone": runner.context["household_phone"], "password": runner.context["household_password"]}
+            return lambda: runner.http.post("/auth/login", json=body).status_code
+        headers = auth_headers(runner.context["household_access"])
+        if target == "create-pickup":
+            body = {
+                "scheduledDate": (datetime.utcnow() + timedelta(days=1)).strftime("%Y-%m-%d"),
+                "timeWindow": "08:00-10:00",
+                "notes": "Benchmark pickup",
+                "wasteType": "MIXED",
+            }
+            return lambda: runner.http.post("/pickups", json=body, headers=headers).status_code
+        if target == "list-alerts":
+            return lambda: runner.http.get("/alerts", params={"limit": 20}, headers=headers).status_code
+        return lambda: runner.http.get("/households/me", headers=headers).status_code
+    if target == "pickups-available":
+        if not (AGENT_PHONE and AGENT_PASSWORD):
+            print(f"{target} needs AGENT_PHONE/AGENT_PASSWORD")
+            sys.exit(1)
+        headers = auth_headers(login(runner, AGENT_PHONE, AGENT_PASSWORD, "agent login")[0])
+        return lambda: runner.http.get("/pickups/available", params={"limit": 20}, headers=headers).status_code
+    if target == "stats-overview":
+        if not (ADMIN_PHONE and ADMIN_PASSWORD):
+            print(f"{target} needs ADMIN_PHONE/ADMIN_PASSWORD")
+            sys.exit(1)
+        headers = auth_headers(login(runner, ADMIN_PHONE, ADMIN_PASSWORD, "admin login")[0])
+        return lambda: runner.http.get("/stats/overview", headers=headers).status_code
+    raise ValueError(f"Unknown request target {target!r}")
+
+
+# --endpoint choices of the pages mode: (path, role whose token is sent)
+PAGED_ENDPOINTS = {
+    "pickups": ("/pickups", "admin"),
+    "pickups-available": ("/pickups/available", "agent"),
+    "alerts": ("/alerts", "admin"),
+    "education": ("/education", None),
+}
+
+REQUEST_TARGETS = (
+    "pickups-available", "login", "health", "bins",
+    "create-pickup", "list-alerts", "household-profile", "stats-overview",
+)
+
+# Most queries and SELECTed rows one request of each query-budget check may
+# cost, at 20 items a page: what the services issue today plus one query
+# of headroom. Counted: the JwtStrategy user lookup, the extra id query
+# TypeORM runs for findOne with relations, and BEGIN/COMMIT of transactions.
+QUERY_BUDGETS = {
+    "pickups (household)": QueryBudget(queries=4, rows=23),
+    "pickups (agent, mine)": QueryBudget(queries=4, rows=23),
+    "pickups (admin)": QueryBudget(queries=3, rows=22),
+    "pickup detail": QueryBudget(queries=4, rows=3),
+    "pickups available": QueryBudget(queries=3, rows=22),
+    "alerts": QueryBudget(queries=3, rows=22),
+    "survey responses": QueryBudget(queries=3, rows=22),
+    "rate pickup": QueryBudget(queries=10, rows=4),
+    "household stats": QueryBudget(queries=6, rows=5),
+    "agent stats": QueryBudget(queries=6, rows=5),
+    "stats overview": QueryBudget(queries=7, rows=6),
+}
+
+
+# ========================
+# SCENARIO ACTIONS
+# ========================
+# What a scenario file's `action:` steps can name. Each takes the virtual
+# user (harness.scenario.ScenarioUser) and the step's `with` parameters
+# and returns the response for the step's `expect` to check. Setup actions
+# leave the user's token in u.context["token"]; pickups and alerts created
+# are offered to other journeys through the "pickups" and "alerts" pools.
+
+def action_register_household(u, params):
+    phone, password = random_phone(), params.get("password", "Passw0rd!")
+    resp = register_household(u, phone, password)
+    assert_status(resp, 201, "register")
+    resp = u.http.post("/auth/login", json={"phone": phone, "password": password})
+    if resp.status_code == 200:
+        access, _, user_id, _ = extract_tokens_and_user(resp.json())
+        u.context.update(token=access, user_id=user_id)
+    return resp
+
+
+def action_login(phone, password, name):
+    def action(u, params):
+        if not (phone and password):
+            raise AssertionError(f"{name} needs credentials; see the environment variables at the top of the script")
+        access, _, user_id, _ = login(u, phone, password, name)
+        u.context.update(token=access, user_id=user_id)
+        return True
+    return action
+
+
+def action_create_pickup(u, params):
+    params = dict(params)
+    resp = create_pickup(u, u.context["token"], days_ahead=params.pop("daysAhead", 1), **params)
+    if resp.status_code == 201:
+        u.context["pickup_id"] = resp.json()["id"]
+        u.pools.put("pickups", u.context["pickup_id"])
+    return resp
+
+
+def action_accept_pickup(u, params):
+    """
+    Accept a pickup a household journey created, else one off the first
+    page of /pickups/available (contended with the other agents).
+    """
+    pickup_id = u.pools.take("pickups")
+    if pickup_id is None:
+        resp = u.http.get("/pickups/available", params={"limit": 20}, headers=auth_headers(u.context["token"]))
+        assert_status(resp, 200, "pickups/available")
+        available = resp.json()["data"]
+        if not available:
+            return None
+        pickup_id = u.pools.rng.choice(available)["id"]
+    u.context["pickup_id"] = pickup_id
+    return pickup_transition(u, u.context["token"], pickup_id, "accept")
+
+
+def action_create_alert(u, params):
+    resp = create_alert(u, u.context["token"], **params)
+    if resp.status_code == 201:
+        u.context["alert_id"] = resp.json()["id"]
+        u.pools.put("alerts", u.context["alert_id"])
+    return resp
+
+
+def action_update_alert(u, params):
+    alert_id = u.pools.take("alerts")
+    if alert_id is None:
+        return None
+    return update_alert(u, u.context["token"], alert_id, **params)
+
+
+def action_get(path):
+    return lambda u, params: u.http.get(path, params=params or None, headers=auth_headers(u.context.get("token")))
+
+
+SCENARIO_ACTIONS = {
+    "register-household": action_register_household,
+    "login-agent": action_login(AGENT_PHONE, AGENT_PASSWORD, "agent login"),
+    "login-admin": action_login(ADMIN_PHONE, ADMIN_PASSWORD, "admin login"),
+    "create-pickup": action_create_pickup,
+    "list-pickups": action_get("/pickups"),
+    "available-pickups": action_get("/pickups/available"),
+    "accept-pickup": action_accept_pickup,
+    "start-pickup": lambda u, params: pickup_transition(u, u.context["token"], u.context["pickup_id"], "start"),
+    "complete-pickup": lambda u, params: complete_pickup(u, u.context["token"], u.context["pickup_id"], **params),
+    "create-alert": action_create_alert,
+    "list-alerts": action_get("/alerts"),
+    "update-alert": action_update_alert,
+    "stats-overview": action_get("/stats/overview"),
+    "stats-pickups": lambda u, params: pickup_stats(u, u.context["token"], **params),
+    "agent-performance": action_get("/stats/agents/performance"),
+    "health": action_get("/health"),
+}
+
+
+def run_open_loop_mode(args):
+    """
+    Offer load to one endpoint on a fixed schedule and report, per window,
+    latency from the intended send time, drops, late sends and errors.
+    """
+    try:
+        rate = parse_profile(args.profile, args.duration)
+    except ValueError as e:
+        print(e)
+        sys.exit(1)
+    runner = TestRunner(http=api_client(pool_size=args.max_in_flight))
+    call = request_catalog(runner, args.target)
+
+    print(f"\n=== Open loop: {args.target}, {args.profile} for {args.duration:.0f}s ===")
+    windows = run_open_loop(call, rate, args.duration, args.max_in_flight, args.window)
+    report = open_loop_report(windows, args.window, args.slo_ms / 1000)
+    print_open_loop_summary(report, args.target)
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Open-loop report written to {args.metrics_json}")
+
+
+def run_bench_mode(args):
+    """
+    Time each named scenario sequentially, then either save the samples as
+    the new baseline or compare against the saved one; a statistically
+    significant p99 regression fails the run.
+    """
+    scenarios = args.scenarios or [
+        name for name in REQUEST_TARGETS
+        if not (name == "pickups-available" and not (AGENT_PHONE and AGENT_PASSWORD))
+        and not (name == "stats-overview" and not (ADMIN_PHONE and ADMIN_PASSWORD))
+    ]
+    runner = TestRunner()
+    calls = {name: request_catalog(runner, name) for name in scenarios}
+
+    print(f"\n=== Bench: {len(calls)} scenarios x {args.iterations} iterations ({args.warmup} warm-up) ===")
+    results = run_scenarios(calls, args.iterations, args.warmup)
+    errors = sum(r["errors"] for r in results.values())
+
+    rows = []
+    if args.save_baseline:
+        save_baseline(args.baseline, results, base_url=BASE_URL, iterations=args.iterations)
+        print(f"Baseline written to {args.baseline}")
+    elif os.path.exists(args.baseline):
+        try:
+            baseline = load_baseline(args.baseline)
+        except ValueError as e:
+            print(e)
+            sys.exit(1)
+        rows = compare(baseline, results, args.confidence, args.threshold)
+        print_comparison(rows, baseline, args.confidence)
+    else:
+        print(f"No baseline at {args.baseline}; record one with --save-baseline")
+
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump({"results": results, "comparison": rows}, f, indent=2)
+        print(f"Bench results written to {args.metrics_json}")
+    regressed = [r["scenario"] for r in rows if r["verdict"] == "REGRESSION"]
+    if regressed:
+        print(f"p99 regression in: {', '.join(regressed)}")
+    if regressed or errors:
+        sys.exit(1)
+
+
+def run_scenario_mode(args):
+    """
+    Play the weighted journeys of a scenario file (see harness/scenario.py)
+    with many virtual users; options given here override the file.
+    """
+    try:
+        scenario = load_scenario(args.file, SCENARIO_ACTIONS)
+    except (OSError, ValueError) as e:
+        print(e)
+        sys.exit(1)
+    if args.duration is not None:
+        scenario = scenario._replace(duration=args.duration, iterations=None)
+    if args.iterations is not None:
+        scenario = scenario._replace(iterations=args.iterations, duration=None)
+    for name in ("users", "concurrency", "ramp_up"):
+        if getattr(args, f"scenario_{name}") is not None:
+            scenario = scenario._replace(**{name: getattr(args, f"scenario_{name}")})
+    processes = args.processes or os.cpu_count()
+
+    length = f"{scenario.duration:.0f}s" if scenario.duration is not None else f"{scenario.iterations} passes each"
+    mix = ", ".join(f"{j.name} {j.weight}" for j in scenario.journeys)
+    print(f"\n=== Scenario {scenario.name}: {scenario.users} users ({mix}), {length} ===")
+    if processes > 1:
+        fleet = run_fleet(scenario_worker, scenario.users, processes, scenario)
+        print_fleet_errors(fleet.errors)
+        results = ScenarioResults()
+        for part in fleet.results:
+            results.merge(part)
+        metrics, server_timing, wall_s = fleet.metrics, None, fleet.wall_s
+    else:
+        runner = TestRunner(http=api_client(pool_size=scenario.concurrency))
+        results, wall_s = run_scenario(
+            scenario, SCENARIO_ACTIONS, runner.http,
+            on_outcome=EVENTS.flow if EVENTS is not None else None,
+        )
+        metrics, server_timing = runner.metrics, runner.server_timing
+    report = results.report(scenario, wall_s)
+    print_scenario_summary(report)
+    metrics.print_summary()
+    if server_timing is not None:
+        server_timing.print_summary()
+    if args.metrics_json:
+        with open(args.metrics_json, "w") as f:
+            json.dump(report, f, indent=2)
+        print(f"Scenario report written to {args.metrics_json}")
+    if results.failures() or processes > 1 and fleet.errors:
+        sys.exit(1)
+
+
+def scenario_worker(share, metrics, scenario):
+    """
+    One fleet process of the scenario mode. Its users get the journey mix
+    and the data pools to themselves, and a seed of its own.
+    """
+    part = scenario._replace(
+        users=share.users,
+        concurrency=max(1, math.ceil(scenario.concurrency * share.users / scenario.users)),
+        seed=None if scenario.seed is None else f"{scenario.seed}:{share.worker}",
+    )
+    http = api_client(pool_size=part.concurrency)
+    http.listeners.append(metrics.record)
+    results, _ = run_scenario(part, SCENARIO_ACTIONS, http, on_outcome=metrics.flow, first_user=share.first_user)
+    return results
+
+
+def run_report_mode(args):
+    """
+    Rebuild the summary tables from an --events log, reading it lazily.
+    """
+    report = EventReport.from_file(args.log)
+    report.print_summary()
+    if args.metrics_json:
+        report.metrics.export_json(args.metrics_json)
+        print(f"Latency metrics written to {args.metrics_json}")
+    if report.failed():
+        sys.exit(1)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Smoke tests and load runs against the Waste Management API")
+    parser.add_argument("--users", type=int, default=0,
+                        help="run the concurrent load mode with this many virtual users instead of the smoke suite")
+    parser.add_argument("--concurrency", type=int, default=10,
+                        help="maximum virtual users in flight at once (load mode)")
+    parser.add_argument("--ramp-up", type=float, default=0.0,
+                        help="seconds over which to start the virtual users (load mode)")
+    parser.add_argument("--processes", type=int, default=1, metavar="N",
+                        help="spread the load or scenario users over N worker processes (0 = one per core)")
+    parser.add_argument("--parallel", type=int, default=1, metavar="N",
+                        help="run independent smoke tests on N threads, following their declared context keys")
+    parser.add_argument("--metrics-json", metavar="PATH",
+                        help="also write per-endpoint latency percentiles and histograms to PATH")
+    parser.add_argument("--no-token-cache", action="store_true",
+                        help="log in from scratch instead of reusing tokens from TOKEN_CACHE")
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument("--record", metavar="CASSETTE",
+                          help="save every request/response pair of this run to CASSETTE")
+    cassette.add_argument("--replay", metavar="CASSETTE",
+                          help="serve every request from CASSETTE instead of a server")
+    parser.add_argument("--replay-latency", type=float, default=0.0, metavar="SCALE",
+                        help="with --replay, wait the recorded latency times SCALE (1 = as recorded)")
+    parser.add_argument("--http-cache", type=int, default=0, metavar="N",
+                        help="keep up to N GET responses and revalidate them with If-None-Match (0 = off)")
+    parser.add_argument("--events", metavar="PATH",
+                        help="stream one JSON line per request, test and load flow to PATH (.gz to compress)")
+    sampling = parser.add_argument_group("resource sampling", "server and database state next to the latency data")
+    sampling.add_argument("--sample-pid", type=int, metavar="PID",
+                          help="pid of a local API server: CPU, RSS, open fds and threads from /proc")
+    sampling.add_argument("--sample-loop", action="store_true",
+                          help="event-loop delay from GET /health/runtime (needs ADMIN_PHONE/ADMIN_PASSWORD)")
+    sampling.add_argument("--sample-pg", metavar="DSN", default=os.getenv("SAMPLE_PG_DSN"),
+                          help="Postgres to sample (connections, table tuple reads, pg_stat_statements); needs psycopg2")
+    sampling.add_argument("--sample-interval", type=float, default=1.0, metavar="S", help="seconds between samples")
+
+    commands = parser.add_subparsers(dest="command")
+    contention = commands.add_parser("accept-contention",
+                                     help="K agents race to accept the same M pickups; reports double assignments")
+    contention.add_argument("--pickups", type=int, default=50, help="pickups to seed (M)")
+    contention.add_argument("--agents", type=int, default=8, help="agents accepting concurrently (K)")
+
+    seed = commands.add_parser("seed",
+                               help="bulk-create households, pickups in every status, ratings, alerts and bins")
+    seed.add_argument("--households", type=int, default=10_000)
+    seed.add_argument("--pickups-per-household", type=int, default=3)
+    seed.add_argument("--alerts-per-household", type=int, default=1)
+    seed.add_argument("--bins", type=int, default=500)
+    seed.add_argument("--agents", type=int, default=20, help="seed agents to spread pickups over (needs admin)")
+    seed.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="worker processes")
+    seed.add_argument("--batch-size", type=int, default=100,
+                      help="households or bins per task; also the checkpoint granularity")
+    # +237600... (namespace 0) and +237670... (70) hold the documented admin and agent accounts
+    seed.add_argument("--namespace", type=int, default=10, choices=range(100), metavar="0-99",
+                      help="phone number block +2376NN......; separate namespaces never collide")
+    seed.add_argument("--checkpoint", metavar="PATH",
+                      help="progress file used to resume (default seed-NN.checkpoint.json)")
+
+    stats = commands.add_parser("stats-bench",
+                                help="time /stats/pickups at growing row counts, seeding as needed (needs admin)")
+    stats.add_argument("--rows", type=int, nargs="+", default=[10_000, 100_000, 1_000_000],
+                       help="pickup counts to measure at")
+    stats.add_argument("--requests", type=int, default=20, help="requests per level and date range")
+    stats.add_argument("--server-pid", type=int,
+                       help="pid of a local API server; its RSS is read from /proc around each level")
+    stats.add_argument("--pickups-per-household", type=int, default=5)
+    stats.add_argument("--agents", type=int, default=20)
+    stats.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    stats.add_argument("--batch-size", type=int, default=100)
+    stats.add_argument("--namespace", type=int, default=11, choices=range(100), metavar="0-99")
+    stats.add_argument("--checkpoint", metavar="PATH")
+
+    rating = commands.add_parser("rating-bench",
+                                 help="time pickup ratings for an agent with 10/1k/100k ratings, seeding as needed (needs admin)")
+    rating.add_argument("--ratings", type=int, nargs="+", default=[10, 1_000, 100_000],
+                        help="agent rating counts to measure at")
+    rating.add_argument("--requests", type=int, default=50, help="ratings timed per level")
+    rating.add_argument("--ratings-per-household", type=int, default=10)
+    rating.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    rating.add_argument("--batch-size", type=int, default=1,
+                        help="households per seed task; small so low levels are not overshot")
+    rating.add_argument("--namespace", type=int, default=12, choices=range(100), metavar="0-99")
+    rating.add_argument("--checkpoint", metavar="PATH")
+
+    geo = commands.add_parser("geo-bench",
+                              help="seed bins around Douala/Yaoundé; full bin list vs nearest/radius/viewport (needs admin)")
+    geo.add_argument("--bins", type=int, default=50_000, help="bins to seed up to")
+    geo.add_argument("--requests", type=int, default=200, help="agent positions to query from")
+    geo.add_argument("--k", type=int, default=20, help="bins asked for by the nearest query")
+    geo.add_argument("--radius", type=float, default=1000.0, help="meters, for the radius query")
+    geo.add_argument("--viewport-km", type=float, default=2.0, help="side of the viewport box")
+    geo.add_argument("--workers", type=int, default=os.cpu_count() or 4)
+    geo.add_argument("--batch-size", type=int, default=500)
+    geo.add_argument("--namespace", type=int, default=13, choices=range(100), metavar="0-99")
+    geo.add_argument("--checkpoint", metavar="PATH")
+
+    pages = commands.add_parser("pages", help="follow a keyset-paginated list to the end; per-page latency by depth")
+    pages.add_argument("--endpoint", choices=PAGED_ENDPOINTS, default="pickups")
+    pages.add_argument("--limit", type=int, default=100, help="page size (server maximum 100)")
+    pages.add_argument("--max-pages", type=int, help="stop after this many pages")
+    pages.add_argument("--no-prefetch", action="store_true", help="fetch the next page only once one is consumed")
+
+    uploads = commands.add_parser("upload-bench",
+                                  help="stream generated photos to /files/upload; MB/s, latency, server RSS")
+    uploads.add_argument("--size-mb", type=float, default=4.0, help="size of each photo (server limit MAX_FILE_SIZE)")
+    uploads.add_argument("--uploads", type=int, default=400)
+    uploads.add_argument("--concurrency", type=int, default=200)
+    uploads.add_argument("--server-pid", type=int,
+                         help="pid of a local API server; its RSS is sampled during the run")
+
+    sensors = commands.add_parser("sensor-sim",
+                                  help="simulated bin fill sensors: per-bin PATCHes vs batched /bins/capacity (needs admin)")
+    sensors.add_argument("--bins", type=int, default=1000, help="existing bins to put sensors on, at most")
+    sensors.add_argument("--readings", type=int, default=5000, help="readings sent each way")
+    sensors.add_argument("--batch-size", type=int, default=200,
+                         help=f"readings per batched request (server maximum {MAX_BATCH})")
+    sensors.add_argument("--concurrency", type=int, default=8, dest="sensor_concurrency", help="requests in flight")
+    sensors.add_argument("--interval", type=float, default=300.0, help="simulated seconds between sensor reports")
+    sensors.add_argument("--batched-only", action="store_true", help="skip the per-bin PATCH baseline")
+
+    open_loop = commands.add_parser("open-loop",
+                                    help="constant-arrival-rate load on one endpoint; finds its saturation point")
+    open_loop.add_argument("--target", choices=REQUEST_TARGETS, default="pickups-available")
+    open_loop.add_argument("--profile", default="step:25,25,10", help=PROFILE_HELP)
+    open_loop.add_argument("--duration", type=float, default=60.0, help="seconds")
+    open_loop.add_argument("--max-in-flight", type=int, default=200,
+                           help="outstanding requests before new ones are dropped")
+    open_loop.add_argument("--window", type=float, default=1.0, help="seconds per report row")
+    open_loop.add_argument("--slo-ms", type=float, default=500.0,
+                           help="p99 above this marks the saturation point")
+
+    bench = commands.add_parser("bench",
+                                help="time named scenarios and compare them with a saved baseline")
+    bench.add_argument("--scenarios", nargs="+", choices=REQUEST_TARGETS,
+                       help="default: every scenario the configured credentials allow")
+    bench.add_argument("--iterations", type=int, default=300, help="timed requests per scenario")
+    bench.add_argument("--warmup", type=int, default=20, help="untimed requests per scenario first")
+    bench.add_argument("--baseline", default="bench-baseline.json", metavar="PATH")
+    bench.add_argument("--save-baseline", action="store_true",
+                       help="store this run as the baseline instead of comparing against it")
+    bench.add_argument("--confidence", type=float, default=0.95, help="confidence level of the p99 interval")
+    bench.add_argument("--threshold", type=float, default=0.10,
+                       help="relative p99 increase below which a significant change is still accepted")
+
+    scenario = commands.add_parser("scenario",
+                                   help="weighted user journeys from a YAML/JSON scenario file, many users at once")
+    scenario.add_argument("file", help="scenario file, e.g. scenarios/weekday-mix.yaml")
+    scenario.add_argument("--users", type=int, dest="scenario_users", help="virtual users (overrides the file)")
+    scenario.add_argument("--concurrency", type=int, dest="scenario_concurrency",
+                          help="requests in flight at most (overrides the file)")
+    scenario.add_argument("--ramp-up", type=float, dest="scenario_ramp_up", help="seconds (overrides the file)")
+    length = scenario.add_mutually_exclusive_group()
+    length.add_argument("--duration", type=float, help="seconds to run for (overrides the file)")
+    length.add_argument("--iterations", type=int, help="passes through its journey per user (overrides the file)")
+
+    budget = commands.add_parser("query-budget",
+                                 help="SQL queries/rows per endpoint against budgets as data grows; flags N+1 (needs "
+                                      "SERVER_TIMING=true, admin and agent)")
+    budget.add_argument("--levels", type=int, nargs="+", default=[1, 25, 100],
+                        help="pickups, alerts and survey responses of the suite household to measure at")
+    budget.add_argument("--requests", type=int, default=3, help="requests per check and level")
+
+    soak = commands.add_parser("soak",
+                               help="the household journey at a steady rate for hours; flags memory and p95 drift")
+    soak.add_argument("--rate", type=float, default=0.5, help="journeys started per second")
+    soak.add_argument("--duration", type=float, default=4 * 3600, help="seconds (default 4 hours)")
+    soak.add_argument("--window", type=float, default=300.0, help="seconds per trend point")
+    soak.add_argument("--warmup", type=int, default=1, help="leading windows left out of the trends")
+    soak.add_argument("--max-in-flight", type=int, default=50,
+                      help="journeys running at once before new starts are skipped")
+    soak.add_argument("--alpha", type=float, default=0.01, help="significance level of the trend test")
+    soak.add_argument("--min-growth", type=float, default=0.10,
+                      help="relative rise over the run below which a significant trend is still accepted")
+    soak.add_argument("--server-pid", type=int,
+                      help="pid of a local API server; its RSS is used when admin credentials are not set")
+
+    report = commands.add_parser("report", help="summary tables from an --events log")
+    report.add_argument("log", help="JSONL event log, optionally .gz")
+
+    args = parser.parse_args(argv)
+    if (args.record or args.replay) and args.command in ("seed", "stats-bench", "rating-bench", "geo-bench"):
+        parser.error(f"--record/--replay cover in-process runs; {args.command} uses worker processes")
+    if args.command == "sensor-sim" and not 1 <= args.batch_size <= MAX_BATCH:
+        parser.error(f"--batch-size must be between 1 and {MAX_BATCH}")
+    if args.processes != 1 and (args.record or args.replay or args.events or args.http_cache):
+        parser.error("--record/--replay/--events/--http-cache cover in-process runs; drop --processes")
+    return args
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    if args.no_token_cache or args.record or args.replay:
+        # A cassette has to see every login, in the same order each time
+        TOKEN_CACHE = ""
+    if args.record:
+        RECORDER = CassetteWriter(args.record)
+    if args.replay:
+        REPLAY = Cassette(args.replay)
+        REPLAY_LATENCY = args.replay_latency
+        print(f"Replaying {len(REPLAY)} recorded responses from {args.replay}")
+    if args.http_cache:
+        HTTP_CACHE = ConditionalCache(args.http_cache)
+    if args.events:
+        EVENTS = EventSink(
+            args.events, command=args.command or ("load" if args.users else "smoke"),
+            base_url=BASE_URL, argv=sys.argv[1:], started=datetime.utcnow().isoformat(),
+        )
+
+    print(f"Using BASE_URL = {BASE_URL}")
+    if not BASE_URL.startswith("http"):
+        print("WARNING: BASE_URL should include http:// or https://")
+    if args.sample_pid or args.sample_loop or args.sample_pg:
+        if args.sample_loop and not (ADMIN_PHONE and ADMIN_PASSWORD):
+            print("--sample-loop needs ADMIN_PHONE/ADMIN_PASSWORD")
+            sys.exit(1)
+        try:
+            SAMPLER = ResourceSampler(
+                args.sample_interval, args.sample_pid, args.sample_pg,
+                runtime=runtime_client() if args.sample_loop else None,
+                on_sample=EVENTS.resources if EVENTS is not None else None,
+            ).start()
+        except Exception as e:
+            print(f"Cannot sample resources: {e}")
+            sys.exit(1)
+
+    try:
+        if args.command == "accept-contention":
+            run_accept_contention_mode(args)
+        elif args.command == "seed":
+            run_seed_mode(args)
+        elif args.command == "stats-bench":
+            run_stats_bench_mode(args)
+        elif args.command == "rating-bench":
+            run_rating_bench_mode(args)
+        elif args.command == "geo-bench":
+            run_geo_bench_mode(args)
+        elif args.command == "pages":
+            run_pages_mode(args)
+        elif args.command == "upload-bench":
+            run_upload_bench_mode(args)
+        elif args.command == "sensor-sim":
+            run_sensor_sim_mode(args)
+        elif args.command == "open-loop":
+            run_open_loop_mode(args)
+        elif args.command == "bench":
+            run_bench_mode(args)
+        elif args.command == "scenario":
+            run_scenario_mode(args)
+        elif args.command == "query-budget":
+            run_query_budget_mode(args)
+        elif args.command == "soak":
+            run_soak_mode(args)
+        elif args.command == "report":
+            run_report_mode(args)
+        elif args.users:
+            run_load_mode(args)
+        else:
+            run_smoke(TestRunner(), args.metrics_json, args.parallel)
+    finally:
+        if SAMPLER is not None:
+            SAMPLER.stop()
+            print_resource_summary(SAMPLER.samples)
+        if HTTP_CACHE is not None:
+            HTTP_CACHE.print_summary()
+        if RECORDER is not None:
+            RECORDER.close()
+            print(f"Recorded {len(RECORDER.index)} responses to {args.record}")
+        if EVENTS is not None:
+            EVENTS.close()
+            print(f"Wrote {EVENTS.written} events to {args.events}")